@@ -8,21 +8,33 @@ Modules and Classes:
 --------------------
 - **controller**: Handles the control mechanisms for language strings.
 - **converter**: Provides utilities for converting language strings between different formats.
+- **corpus_validation**: Reports all the literals of a collection violating the text and language rules.
+- **external_merge**: Merges duplicated language strings of collections larger than the available memory.
 - **flags**: Defines various flag classes used for global settings and specific types of language strings.
     - `GlobalFlag`: A flag for global settings affecting all language string types.
     - `LangStringFlag`: A flag specific to single language strings.
     - `SetLangStringFlag`: A flag specific to sets of language strings.
     - `MultiLangStringFlag`: A flag specific to multi-language strings.
+- **instrumentation**: Records opt-in call counters and latency histograms of the public methods.
 - **langstring**: Represents a single language string, encapsulating its properties and behaviors.
+- **language_filter**: Selects the languages matching a list of language ranges across collections of multi-language
+  strings.
+- **language_tag**: Parses BCP 47 language tags and matches them against RFC 4647 language ranges.
 - **multilangstring**: Represents a string in multiple langs, providing methods to manage and manipulate the different
   language variants.
+- **renormalizer**: Reapplies the current flags to existing language strings in place.
 - **setlangstring**: Represents a set of language strings, facilitating operations on groups of multilingual texts.
+- **setlangstring_view**: Provides a read-only live view of the texts of one language of a multi-language string.
+- **storage**: Persists multi-language strings, keyed by identifier, in a local SQLite database.
+- **text_pool**: Shares a single string object among equal texts, when enabled.
 
 Package Contents:
 -----------------
 The package exports the following classes and flags for use in external modules:
 
 - LangString
+- LanguageTag
+- LanguageRangeFilter
 - SetLangString
 - MultiLangString
 - Controller
@@ -31,6 +43,15 @@ The package exports the following classes and flags for use in external modules:
 - SetLangStringFlag
 - MultiLangStringFlag
 - Converter
+- CorpusValidator
+- AsyncPipeline
+- LangStringBatch
+- SetLangStringView
+- MultiLangStringStore
+- ExternalMerger
+- Instrumentation
+- Renormalizer
+- TextPool
 
 Language Tag Handling:
 ----------------------
@@ -46,20 +67,96 @@ Usage:
 To use this package, import the necessary classes and flags as follows::
 
     from langstring import (
-        LangString, MultiLangString, SetLangString, Controller,
-        GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag, Converter
+        LangString, LanguageTag, LanguageRangeFilter, MultiLangString, SetLangString, Controller,
+        GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag, Converter, CorpusValidator, AsyncPipeline,
+        LangStringBatch, SetLangStringView, MultiLangStringStore, ExternalMerger,
+        Instrumentation, Renormalizer, TextPool
     )
 """
 
-from .controller import Controller
-from .converter import Converter
-from .flags import GlobalFlag
-from .flags import LangStringFlag
-from .flags import MultiLangStringFlag
-from .flags import SetLangStringFlag
-from .langstring import LangString
-from .multilangstring import MultiLangString
-from .setlangstring import SetLangString
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_pipeline import AsyncPipeline
+    from .controller import Controller
+    from .converter import Converter
+    from .corpus_validation import CorpusValidator
+    from .external_merge import ExternalMerger
+    from .flags import GlobalFlag
+    from .flags import LangStringFlag
+    from .flags import MultiLangStringFlag
+    from .flags import SetLangStringFlag
+    from .instrumentation import Instrumentation
+    from .langstring import LangString
+    from .langstring_batch import LangStringBatch
+    from .language_filter import LanguageRangeFilter
+    from .language_tag import LanguageTag
+    from .multilangstring import MultiLangString
+    from .renormalizer import Renormalizer
+    from .setlangstring import SetLangString
+    from .setlangstring_view import SetLangStringView
+    from .storage import MultiLangStringStore
+    from .text_pool import TextPool
+
+"""
+The public names of the package are loaded lazily (PEP 562): each module is only imported when one of its names is
+first accessed, so, e.g., `from langstring import LangString` does not import the modules needed by the `Converter`,
+the `AsyncPipeline` (asyncio), or the `MultiLangStringStore` (sqlite3).
+"""
+_LAZY_NAMES: dict[str, str] = {
+    "AsyncPipeline": ".async_pipeline",
+    "Controller": ".controller",
+    "Converter": ".converter",
+    "CorpusValidator": ".corpus_validation",
+    "ExternalMerger": ".external_merge",
+    "GlobalFlag": ".flags",
+    "LangStringFlag": ".flags",
+    "MultiLangStringFlag": ".flags",
+    "SetLangStringFlag": ".flags",
+    "Instrumentation": ".instrumentation",
+    "LangString": ".langstring",
+    "LangStringBatch": ".langstring_batch",
+    "LanguageRangeFilter": ".language_filter",
+    "LanguageTag": ".language_tag",
+    "MultiLangString": ".multilangstring",
+    "Renormalizer": ".renormalizer",
+    "SetLangString": ".setlangstring",
+    "SetLangStringView": ".setlangstring_view",
+    "MultiLangStringStore": ".storage",
+    "TextPool": ".text_pool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load a public name of the package on first access.
+
+    :param name: The name of the attribute.
+    :type name: str
+    :return: The class or flag with the given name.
+    :rtype: Any
+    :raises AttributeError: If the name is not a public name of the package.
+    """
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache the value, so that this function is not called again for the same name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the attributes of the package, including the public names not loaded yet.
+
+    :return: The sorted attribute names.
+    :rtype: list[str]
+    """
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
 
 """
 The __all__ variable defines the public interface of the module.
@@ -71,6 +168,8 @@ This helps to control the namespace and avoids importing unnecessary components.
 """
 __all__ = [
     "LangString",
+    "LanguageTag",
+    "LanguageRangeFilter",
     "SetLangString",
     "MultiLangString",
     "Controller",
@@ -79,4 +178,13 @@ __all__ = [
     "SetLangStringFlag",
     "MultiLangStringFlag",
     "Converter",
+    "CorpusValidator",
+    "AsyncPipeline",
+    "LangStringBatch",
+    "SetLangStringView",
+    "MultiLangStringStore",
+    "ExternalMerger",
+    "Instrumentation",
+    "Renormalizer",
+    "TextPool",
 ]
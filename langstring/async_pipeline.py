@@ -0,0 +1,417 @@
+"""
+Asynchronous streaming variants of the `Converter` parse and conversion paths.
+
+Calling the synchronous `Converter` methods on large lists from an asyncio application blocks the event loop until the
+whole list is processed. The `AsyncPipeline` methods instead consume (synchronous or asynchronous) iterables lazily, in
+bounded-size chunks, and give control back to the event loop after every chunk. Optionally, the processing of each
+chunk can be offloaded to a `concurrent.futures` executor, in which case the current `Controller` flags are applied in
+the executor before the chunk is processed.
+
+Key Features:
+    - **Bounded Chunks**: Inputs are never fully materialized. At most `chunk_size` items are read before being
+      processed, and at most `max_pending` chunks are processed concurrently when an executor is used.
+    - **Backpressure**: Results are produced by asynchronous generators, so new input is only read when the consumer
+      requests more results.
+    - **Cooperative Scheduling**: Control is given back to the event loop between chunks.
+    - **Ordering Guarantees**: Results are always produced in the order of the input, even when chunks are processed
+      concurrently in an executor.
+    - **Consistent Results**: The produced objects are the same as those obtained with the corresponding `Converter`
+      methods.
+
+Classes:
+    - **AsyncPipeline**: Provides asynchronous streaming methods for converting strings and LangStrings.
+
+**Example**::
+
+    >>> async def main():
+    >>>     langstrings = AsyncPipeline.strings_to_langstrings(["Hello@en", "Bonjour@fr", "Hi@en"])
+    >>>     mls = await AsyncPipeline.langstrings_to_multilangstring(langstrings)
+    >>>     print(mls)  # Output: {'Hello', 'Hi'}@en, {'Bonjour'}@fr
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+
+from .controller import Controller
+from .converter import Converter
+from .langstring import LangString
+from .multilangstring import MultiLangString
+from .utils.non_instantiable import NonInstantiable
+from .utils.parallel import ParallelRunner
+from .utils.validators import TypeValidator
+
+# Generic type variables used for the items and keys of the processed streams
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class AsyncPipeline(metaclass=NonInstantiable):
+    """
+    A utility class providing asynchronous streaming conversions of strings and LangStrings.
+
+    All its sources can be synchronous or asynchronous iterables, which allows consuming, e.g., lists, generators, or
+    asynchronous readers of a queue.
+
+    :cvar DEFAULT_CHUNK_SIZE: The default maximum number of items processed at once.
+    :vartype DEFAULT_CHUNK_SIZE: int
+    :cvar DEFAULT_MAX_PENDING: The default maximum number of chunks submitted to an executor and not yet consumed.
+    :vartype DEFAULT_MAX_PENDING: int
+
+    **Example**::
+
+        >>> async def main():
+        >>>     async for langstring in AsyncPipeline.strings_to_langstrings(["Hello@en", "Bonjour@fr"]):
+        >>>         print(langstring)  # Output: "Hello"@en
+        >>>                            #         "Bonjour"@fr
+        >>> asyncio.run(main())
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 1000
+    DEFAULT_MAX_PENDING: int = 2
+
+    @staticmethod
+    async def chunked(
+        source: Union[Iterable[T], AsyncIterable[T]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[list[T]]:
+        """
+        Read a synchronous or asynchronous iterable in consecutive chunks of at most `chunk_size` items.
+
+        Control is given back to the event loop after each chunk read from a synchronous iterable. Asynchronous
+        iterables already do so when awaiting their items.
+
+        :param source: The iterable to be read.
+        :type source: Union[Iterable[T], AsyncIterable[T]]
+        :param chunk_size: The maximum number of items in each chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        :type chunk_size: int
+        :return: An asynchronous iterator over the chunks, in the order of the source.
+        :rtype: AsyncIterator[list[T]]
+        :raises TypeError: If chunk_size is not an integer.
+        :raises ValueError: If chunk_size is lower than one.
+
+        **Example**::
+
+            >>> async def main():
+            >>>     async for chunk in AsyncPipeline.chunked(range(5), 2):
+            >>>         print(chunk)  # Output: [0, 1]
+            >>>                       #         [2, 3]
+            >>>                       #         [4]
+            >>> asyncio.run(main())
+        """
+        AsyncPipeline._validate_positive(chunk_size, "chunk_size")
+
+        chunk: list[T] = []
+        if isinstance(source, AsyncIterable):
+            async for item in source:
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+        else:
+            for item in source:
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+                    await asyncio.sleep(0)
+        if chunk:
+            yield chunk
+
+    @classmethod
+    async def strings_to_langstrings(
+        cls,
+        source: Union[Iterable[str], AsyncIterable[str]],
+        method: str = "parse",
+        lang: Optional[str] = None,
+        separator: str = "@",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> AsyncIterator[LangString]:
+        """
+        Convert a stream of strings to a stream of LangStrings using the specified method.
+
+        The strings are converted in chunks with `Converter.from_strings_to_langstrings`. If an executor is given,
+        the chunks are converted in it, with up to `max_pending` chunks being processed while the consumer handles the
+        results of the previous ones.
+
+        :param source: The synchronous or asynchronous iterable of strings to be converted.
+        :type source: Union[Iterable[str], AsyncIterable[str]]
+        :param method: The method to use for conversion ('manual' or 'parse'). Defaults to 'parse'.
+        :type method: str
+        :param lang: The language code for 'manual' method.
+        :type lang: Optional[str]
+        :param separator: The separator used in 'parse' method.
+        :type separator: str
+        :param chunk_size: The maximum number of strings converted at once. Defaults to DEFAULT_CHUNK_SIZE.
+        :type chunk_size: int
+        :param executor: Opt-in executor used to convert the chunks. If None (default), the chunks are converted in the
+                         event loop's thread.
+        :type executor: Optional[Executor]
+        :param max_pending: The maximum number of chunks submitted to the executor and not yet consumed.
+                            Defaults to DEFAULT_MAX_PENDING.
+        :type max_pending: int
+        :return: An asynchronous iterator over the LangStrings, in the order of the source.
+        :rtype: AsyncIterator[LangString]
+        :raises ValueError: If an unknown method is specified or if chunk_size or max_pending are lower than one.
+        :raises TypeError: If the input types are incorrect.
+
+        **Example**::
+
+            >>> async def main():
+            >>>     strings = ["Hello", "Hi"]
+            >>>     async for langstring in AsyncPipeline.strings_to_langstrings(strings, "manual", lang="en"):
+            >>>         print(langstring)  # Output: "Hello"@en
+            >>>                            #         "Hi"@en
+            >>> asyncio.run(main())
+        """
+        TypeValidator.validate_type_single(method, str)
+        TypeValidator.validate_type_single(lang, str, optional=True)
+        TypeValidator.validate_type_single(separator, str)
+
+        convert = partial(Converter.from_strings_to_langstrings, method, lang=lang, separator=separator)
+        async for langstrings in cls._map_chunks(convert, cls.chunked(source, chunk_size), executor, max_pending):
+            for langstring in langstrings:
+                yield langstring
+
+    @classmethod
+    async def langstrings_to_multilangstring(
+        cls,
+        source: Union[Iterable[LangString], AsyncIterable[LangString]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> MultiLangString:
+        """
+        Collect a stream of LangStrings into a single MultiLangString.
+
+        The LangStrings are added in the order of the source, so the resulting MultiLangString is the same as the one
+        obtained by adding them one by one (e.g., as in `Converter.from_strings_to_multilangstring`). If an executor is
+        given, partial MultiLangStrings are built for each chunk in it and merged in order.
+
+        :param source: The synchronous or asynchronous iterable of LangStrings to be collected.
+        :type source: Union[Iterable[LangString], AsyncIterable[LangString]]
+        :param chunk_size: The maximum number of LangStrings added at once. Defaults to DEFAULT_CHUNK_SIZE.
+        :type chunk_size: int
+        :param executor: Opt-in executor used to build the partial MultiLangStrings. If None (default), the
+                         LangStrings are added in the event loop's thread.
+        :type executor: Optional[Executor]
+        :param max_pending: The maximum number of chunks submitted to the executor and not yet merged.
+                            Defaults to DEFAULT_MAX_PENDING.
+        :type max_pending: int
+        :return: A MultiLangString containing all LangStrings of the source.
+        :rtype: MultiLangString
+        :raises TypeError: If the source contains elements that are not LangStrings.
+        :raises ValueError: If chunk_size or max_pending are lower than one.
+
+        **Example**::
+
+            >>> async def main():
+            >>>     langstrings = [LangString("Hello", "en"), LangString("Bonjour", "fr")]
+            >>>     mls = await AsyncPipeline.langstrings_to_multilangstring(langstrings)
+            >>>     print(mls)  # Output: {'Hello'}@en, {'Bonjour'}@fr
+            >>> asyncio.run(main())
+        """
+        multilangstrings = [MultiLangString()]
+        chunks = cls.chunked(source, chunk_size)
+        async for partial_mls in cls._map_chunks(cls._build_multilangstring, chunks, executor, max_pending):
+            multilangstrings.append(partial_mls)
+        return MultiLangString.merge_multilangstrings(multilangstrings)
+
+    @classmethod
+    async def group_langstrings(
+        cls,
+        source: Union[Iterable[tuple[K, LangString]], AsyncIterable[tuple[K, LangString]]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[K, MultiLangString]]:
+        """
+        Group consecutive LangStrings sharing the same key into MultiLangStrings.
+
+        The source is a stream of (key, LangString) pairs, e.g., the subject and the literal of RDF statements sorted
+        by subject. A (key, MultiLangString) pair is produced as soon as the key changes, so groups are produced in the
+        order in which their keys first appear. A key appearing again after a different one starts a new group.
+
+        :param source: The synchronous or asynchronous iterable of (key, LangString) pairs.
+        :type source: Union[Iterable[tuple[K, LangString]], AsyncIterable[tuple[K, LangString]]]
+        :param chunk_size: The maximum number of pairs read at once. Defaults to DEFAULT_CHUNK_SIZE.
+        :type chunk_size: int
+        :return: An asynchronous iterator over the (key, MultiLangString) pairs.
+        :rtype: AsyncIterator[tuple[K, MultiLangString]]
+        :raises TypeError: If the source contains LangStrings of invalid types.
+        :raises ValueError: If chunk_size is lower than one.
+
+        **Example**::
+
+            >>> async def main():
+            >>>     pairs = [("s1", LangString("Hi", "en")), ("s1", LangString("Oi", "pt")),
+            >>>              ("s2", LangString("Yo", "en"))]
+            >>>     async for key, mls in AsyncPipeline.group_langstrings(pairs):
+            >>>         print(key, mls)  # Output: s1 {'Hi'}@en, {'Oi'}@pt
+            >>>                          #         s2 {'Yo'}@en
+            >>> asyncio.run(main())
+        """
+        current_key: Any = None
+        current_mls: Optional[MultiLangString] = None
+
+        async for chunk in cls.chunked(source, chunk_size):
+            for key, langstring in chunk:
+                if current_mls is None or key != current_key:
+                    if current_mls is not None:
+                        yield current_key, current_mls
+                    current_key, current_mls = key, MultiLangString()
+                current_mls.add_langstring(langstring)
+
+        if current_mls is not None:
+            yield current_key, current_mls
+
+    @classmethod
+    async def strings_to_multilangstring(
+        cls,
+        source: Union[Iterable[str], AsyncIterable[str]],
+        method: str = "parse",
+        lang: Optional[str] = None,
+        separator: str = "@",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> MultiLangString:
+        """
+        Convert a stream of strings to a single MultiLangString using the specified method.
+
+        This is the asynchronous counterpart of `Converter.from_strings_to_multilangstring`, producing the same result.
+
+        :param source: The synchronous or asynchronous iterable of strings to be converted.
+        :type source: Union[Iterable[str], AsyncIterable[str]]
+        :param method: The method to use for conversion ('manual' or 'parse'). Defaults to 'parse'.
+        :type method: str
+        :param lang: The language code for 'manual' method.
+        :type lang: Optional[str]
+        :param separator: The separator used in 'parse' method.
+        :type separator: str
+        :param chunk_size: The maximum number of strings converted at once. Defaults to DEFAULT_CHUNK_SIZE.
+        :type chunk_size: int
+        :param executor: Opt-in executor used to convert the chunks. If None (default), the chunks are converted in the
+                         event loop's thread.
+        :type executor: Optional[Executor]
+        :param max_pending: The maximum number of chunks submitted to the executor and not yet consumed.
+                            Defaults to DEFAULT_MAX_PENDING.
+        :type max_pending: int
+        :return: A MultiLangString containing all converted strings.
+        :rtype: MultiLangString
+        :raises ValueError: If an unknown method is specified or if chunk_size or max_pending are lower than one.
+        :raises TypeError: If the input types are incorrect.
+
+        **Example**::
+
+            >>> async def main():
+            >>>     mls = await AsyncPipeline.strings_to_multilangstring(["Hello@en", "Bonjour@fr"])
+            >>>     print(mls)  # Output: {'Hello'}@en, {'Bonjour'}@fr
+            >>> asyncio.run(main())
+        """
+        TypeValidator.validate_type_single(method, str)
+        TypeValidator.validate_type_single(lang, str, optional=True)
+        TypeValidator.validate_type_single(separator, str)
+
+        convert = partial(Converter.from_strings_to_multilangstring, method, lang=lang, separator=separator)
+        multilangstrings = [MultiLangString()]
+        chunks = cls.chunked(source, chunk_size)
+        async for partial_mls in cls._map_chunks(convert, chunks, executor, max_pending):
+            multilangstrings.append(partial_mls)
+        return MultiLangString.merge_multilangstrings(multilangstrings)
+
+    # --------------------------------------------------
+    # Private Methods
+    # --------------------------------------------------
+
+    @staticmethod
+    def _build_multilangstring(langstrings: list[LangString]) -> MultiLangString:
+        """
+        Build a MultiLangString by adding the given LangStrings in order.
+
+        :param langstrings: The LangStrings to add.
+        :type langstrings: list[LangString]
+        :return: The new MultiLangString.
+        :rtype: MultiLangString
+        """
+        multilangstring = MultiLangString()
+        for langstring in langstrings:
+            multilangstring.add_langstring(langstring)
+        return multilangstring
+
+    @classmethod
+    async def _map_chunks(
+        cls,
+        func: Callable[[list[Any]], T],
+        chunks: AsyncIterator[list[Any]],
+        executor: Optional[Executor],
+        max_pending: int,
+    ) -> AsyncIterator[T]:
+        """
+        Apply a function to a stream of chunks, producing the results in the order of the chunks.
+
+        Without an executor, each chunk is processed in the event loop's thread and control is given back to the loop
+        after each result is consumed. With an executor, up to `max_pending` chunks are submitted before waiting for
+        the oldest result. Pending chunks are cancelled if the consumer stops iterating.
+
+        :param func: The function to apply to each chunk.
+        :type func: Callable[[list[Any]], T]
+        :param chunks: The asynchronous iterator over the chunks.
+        :type chunks: AsyncIterator[list[Any]]
+        :param executor: The executor used to process the chunks, or None.
+        :type executor: Optional[Executor]
+        :param max_pending: The maximum number of chunks submitted to the executor and not yet consumed.
+        :type max_pending: int
+        :return: An asynchronous iterator over the results.
+        :rtype: AsyncIterator[T]
+        """
+        cls._validate_positive(max_pending, "max_pending")
+        TypeValidator.validate_type_single(executor, Executor, optional=True)
+
+        if executor is None:
+            async for chunk in chunks:
+                yield func(chunk)
+                await asyncio.sleep(0)
+            return
+
+        loop = asyncio.get_running_loop()
+        pid = os.getpid()
+        pending: deque[asyncio.Future[T]] = deque()
+        try:
+            async for chunk in chunks:
+                flags = Controller.get_flags()
+                pending.append(loop.run_in_executor(executor, ParallelRunner.run_chunk, pid, flags, func, chunk))
+                if len(pending) >= max_pending:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _validate_positive(value: int, name: str) -> None:
+        """
+        Validate that a size argument is a positive integer.
+
+        :param value: The value to validate.
+        :type value: int
+        :param name: The name of the argument, used in the error message.
+        :type name: str
+        :raises TypeError: If value is not an integer.
+        :raises ValueError: If value is lower than one.
+        """
+        TypeValidator.validate_type_single(value, int)
+        if value < 1:
+            raise ValueError(f"Invalid value '{value}' for '{name}'. The value must be at least 1.")
@@ -48,8 +48,10 @@ class Controller(metaclass=NonInstantiable):
 
     :cvar _DEFAULT_FLAGS: The default state of each flag.
     :vartype DEFAULT_FLAGS: dict[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], bool]
-    :cvar flags: Stores the current state of each flag.
+    :cvar flags: Stores the current state of each flag. It must only be changed through the Controller's methods.
     :vartype flags: dict[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], bool]
+    :cvar _flags_version: A counter incremented every time the flags may have changed.
+    :vartype _flags_version: int
 
     **Example**::
 
@@ -89,6 +91,7 @@ class Controller(metaclass=NonInstantiable):
         GlobalFlag.METHODS_MATCH_TYPES: False,
         GlobalFlag.PRINT_WITH_LANG: True,
         GlobalFlag.PRINT_WITH_QUOTES: True,
+        GlobalFlag.SORTED_TEXTS: False,
         GlobalFlag.STRIP_LANG: False,
         GlobalFlag.STRIP_TEXT: False,
         GlobalFlag.VALID_LANG: False,
@@ -118,6 +121,7 @@ class Controller(metaclass=NonInstantiable):
         MultiLangStringFlag.LOWERCASE_LANG: False,
         MultiLangStringFlag.PRINT_WITH_LANG: True,
         MultiLangStringFlag.PRINT_WITH_QUOTES: True,
+        MultiLangStringFlag.SORTED_TEXTS: False,
         MultiLangStringFlag.STRIP_LANG: False,
         MultiLangStringFlag.STRIP_TEXT: False,
         MultiLangStringFlag.VALID_LANG: False,
@@ -126,6 +130,9 @@ class Controller(metaclass=NonInstantiable):
     # Mutable copy of default flag values to track the current state of flags.
     flags: dict[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], bool] = _DEFAULT_FLAGS.copy()
 
+    # Version of the flags' state, used to invalidate values cached under previous flag states.
+    _flags_version: int = 0
+
     @classmethod
     def set_flag(
         cls, flag: Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], state: bool
@@ -164,6 +171,7 @@ class Controller(metaclass=NonInstantiable):
         else:
             # Set the state for the specific flag
             cls.flags[flag] = state
+        cls._flags_version += 1
 
     @classmethod
     def get_flag(cls, flag: Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]) -> bool:
@@ -216,6 +224,42 @@ class Controller(metaclass=NonInstantiable):
         """
         return cls.flags.copy()
 
+    @classmethod
+    def _apply_flags(
+        cls, flags: dict[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], bool]
+    ) -> None:
+        """
+        Replace the state of all flags by a state obtained with `get_flags`.
+
+        This is used by worker processes to process data with the flags of the process that submitted it. The flags
+        and their version are only changed if the state differs from the current one.
+
+        :param flags: A dictionary mapping each flag to its boolean state.
+        :type flags: dict[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag], bool]
+        """
+        if cls.flags != flags:
+            cls.flags = flags.copy()
+            cls._flags_version += 1
+
+    @classmethod
+    def get_flags_version(cls) -> int:
+        """
+        Retrieve the version of the flags' state.
+
+        The version is incremented every time a flag is set or reset, so values computed under a given state of the
+        flags, such as cached conversions, can be recognized as stale.
+
+        :return: The current version of the flags' state.
+        :rtype: int
+
+        **Example**::
+
+            >>> version = Controller.get_flags_version()
+            >>> Controller.set_flag(GlobalFlag.LOWERCASE_LANG, True)
+            >>> print(Controller.get_flags_version() > version)  # Output: True
+        """
+        return cls._flags_version
+
     @classmethod
     def print_flag(cls, flag: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]) -> None:
         """
@@ -312,6 +356,7 @@ class Controller(metaclass=NonInstantiable):
                     cls.flags[matching_flag] = cls._DEFAULT_FLAGS[matching_flag]
         else:
             cls.flags[flag] = cls._DEFAULT_FLAGS[flag]
+        cls._flags_version += 1
 
     @classmethod
     def reset_flags(cls, flag_type: Optional[type] = GlobalFlag) -> None:
@@ -344,3 +389,4 @@ class Controller(metaclass=NonInstantiable):
             for flag, default_value in cls._DEFAULT_FLAGS.items():
                 if isinstance(flag, flag_type):
                     cls.flags[flag] = default_value
+        cls._flags_version += 1
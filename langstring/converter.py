@@ -32,6 +32,24 @@ Usage:
     >>> multilangstring = Converter.from_setlangstring_to_multilangstring(setlangstring)
     >>> print(multilangstring)  #Output: {'Hello', 'Hi'}@en
 
+Batch Conversions:
+    The `LangStringBatch` conversion methods convert between the columnar `LangStringBatch` container and lists of
+    `LangString`, lists of `SetLangString`, or `MultiLangString` objects, with the same merging semantics as the
+    corresponding methods for lists of `LangString`.
+
+Parse Cache:
+    Label dumps are often highly repetitive. An opt-in bounded LRU cache of the results of
+    `from_string_to_langstring_parse`, which is also used by the 'parse' method of the list conversions, can be enabled
+    with `enable_parse_cache`. Cached results are keyed by the input string, the separator, and the version of the
+    `Controller` flags, so changing a flag never returns results obtained with the previous flags.
+
+Parallel Processing:
+    The methods converting lists accept an opt-in `workers` argument. When provided, the input is split into ordered
+    chunks that are processed by worker processes (or by a given `concurrent.futures.Executor`) using the current
+    `Controller` flags, and the partial results are combined deterministically, i.e., producing the same result as the
+    sequential processing. Inputs and outputs must be transferred between processes, so this option pays off only for
+    large inputs.
+
 Note:
     The module assumes that the argument objects are well-formed instances of their respective classes. Error handling
     is provided for type mismatches, but not for malformed objects.
@@ -40,12 +58,26 @@ This module is part of a larger package dealing with language processing and RDF
 foundational tools for handling multilingual text data in various formats.
 """
 
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable
 from typing import Optional
+from typing import Union
 
+from .controller import Controller
+from .flags import MultiLangStringFlag
+from .flags import SetLangStringFlag
 from .langstring import LangString
+from .langstring_batch import LangStringBatch
 from .multilangstring import MultiLangString
 from .setlangstring import SetLangString
+from .utils.grouping import LangGroup
+from .utils.grouping import LangGrouper
+from .utils.lru_cache import CacheInfo
+from .utils.lru_cache import LRUCache
 from .utils.non_instantiable import NonInstantiable
+from .utils.parallel import ParallelRunner
+from .utils.validators import FlagValidator
 from .utils.validators import TypeValidator
 
 
@@ -56,6 +88,11 @@ class Converter(metaclass=NonInstantiable):
     This class provides methods to convert between `LangString`, `SetLangString`, and `MultiLangString` types.
     It is designed to be non-instantiable as it serves as a utility class with class methods only.
 
+    The methods converting lists accept an opt-in `workers` argument, the number of worker processes or a
+    `concurrent.futures.Executor`. When it is given, the input is split into ordered chunks processed in parallel with
+    the current flags, and the result is the same as the one of the sequential processing. When it is None (default),
+    the input is processed in the calling process.
+
     **Example**::
 
         # Convert a string to a LangString using the 'manual' method:
@@ -72,8 +109,17 @@ class Converter(metaclass=NonInstantiable):
         >>> setlangstring = SetLangString({"Hello", "Hi"}, "en")
         >>> multilangstring = Converter.from_setlangstring_to_multilangstring(setlangstring)
         >>> print(multilangstring)  #Output: {'Hello', 'Hi'}@en
+
+    :cvar DEFAULT_PARSE_CACHE_SIZE: The default maximum number of entries of the parse cache.
+    :vartype DEFAULT_PARSE_CACHE_SIZE: int
     """
 
+    DEFAULT_PARSE_CACHE_SIZE: int = 65536
+
+    # The opt-in cache of parsed strings, mapping (input string, separator, flags version) to (text, lang). None when
+    # disabled.
+    _parse_cache: Optional[LRUCache[tuple[str, str]]] = None
+
     # ---------------------------------------------
     # Strings' Conversion Methods
     # ---------------------------------------------
@@ -151,6 +197,9 @@ class Converter(metaclass=NonInstantiable):
         specified separator. If the separator is not found, the entire string is considered as text and lang is set
         to "" (empty string).
 
+        If the parse cache is enabled (see `enable_parse_cache`), strings already parsed with the same separator and
+        flags return a new LangString with the cached text and language, without being split and validated again.
+
         :param input_string: The text to be converted.
         :type input_string: str
         :param separator: The separator used to split the text and language.
@@ -168,6 +217,13 @@ class Converter(metaclass=NonInstantiable):
             >>> langstring = Converter.from_string_to_langstring_parse("Hello", "@")
             >>> print(langstring)  # Output: "Hello"@
         """
+        cache = Converter._parse_cache
+        if cache is not None:
+            key = (input_string, separator, Controller.get_flags_version())
+            cached = cache.get(key)
+            if cached is not None:
+                return LangString._from_state(*cached)
+
         if separator not in input_string:
             text, lang = input_string, ""
         elif separator == "":
@@ -175,11 +231,19 @@ class Converter(metaclass=NonInstantiable):
         else:
             text, lang = input_string.rsplit(separator, 1)
 
-        return LangString(text=text, lang=lang)
+        langstring = LangString(text=text, lang=lang)
+        if cache is not None:
+            cache.put(key, (langstring.text, langstring.lang))
+        return langstring
 
     @classmethod
     def from_strings_to_langstrings(
-        cls, method: str, strings: list[str], lang: Optional[str] = None, separator: str = "@"
+        cls,
+        method: str,
+        strings: list[str],
+        lang: Optional[str] = None,
+        separator: str = "@",
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[LangString]:
         """
         Convert a list of strings to a list of LangStrings using the specified method.
@@ -192,6 +256,8 @@ class Converter(metaclass=NonInstantiable):
         :type lang: Optional[str]
         :param separator: The separator used in 'parse' method.
         :type separator: str
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of LangString objects.
         :rtype: list[LangString]
         :raises ValueError: If an unknown method is specified.
@@ -216,6 +282,12 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_single(lang, str, optional=True)
         TypeValidator.validate_type_single(separator, str)
 
+        if workers is not None:
+            chunk_results = ParallelRunner.map_chunks(
+                partial(cls.from_strings_to_langstrings, method, lang=lang, separator=separator), strings, workers
+            )
+            return [langstring for chunk_result in chunk_results for langstring in chunk_result]
+
         langstrings = []
         for string in strings:
             langstring = cls.from_string_to_langstring(method, string, lang, separator)
@@ -248,7 +320,12 @@ class Converter(metaclass=NonInstantiable):
 
     @classmethod
     def from_strings_to_multilangstring(
-        cls, method: str, strings: list[str], lang: Optional[str] = None, separator: str = "@"
+        cls,
+        method: str,
+        strings: list[str],
+        lang: Optional[str] = None,
+        separator: str = "@",
+        workers: Optional[Union[int, Executor]] = None,
     ) -> MultiLangString:
         """
         Convert a list of strings to a MultiLangString using the specified method.
@@ -261,6 +338,8 @@ class Converter(metaclass=NonInstantiable):
         :type lang: Optional[str]
         :param separator: Separator for the "parse" method. Default is "@".
         :type separator: str
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A MultiLangString object.
         :rtype: MultiLangString
 
@@ -280,6 +359,12 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_single(lang, str, optional=True)
         TypeValidator.validate_type_single(separator, str)
 
+        if workers is not None:
+            chunk_results = ParallelRunner.map_chunks(
+                partial(cls.from_strings_to_multilangstring, method, lang=lang, separator=separator), strings, workers
+            )
+            return MultiLangString.merge_multilangstrings(chunk_results)
+
         multilangstring = MultiLangString()
 
         for string in strings:
@@ -288,6 +373,67 @@ class Converter(metaclass=NonInstantiable):
 
         return multilangstring
 
+    # ---------------------------------------------
+    # Parse Cache Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """
+        Remove all entries of the parse cache and reset its statistics. Nothing is done if the cache is disabled.
+        """
+        if cls._parse_cache is not None:
+            cls._parse_cache.clear()
+
+    @classmethod
+    def disable_parse_cache(cls) -> None:
+        """
+        Disable the parse cache, discarding its entries.
+        """
+        cls._parse_cache = None
+
+    @classmethod
+    def enable_parse_cache(cls, maxsize: Optional[int] = None) -> None:
+        """
+        Enable a new, empty parse cache for `from_string_to_langstring_parse`.
+
+        The cache keeps the text and language of the most recently parsed strings, keyed by the input string, the
+        separator, and the version of the Controller flags. Cache hits return new LangStrings, so modifying a returned
+        LangString never affects other results. The cache belongs to the current process: worker processes used by the
+        `workers` argument of the list conversions do not share it.
+
+        :param maxsize: The maximum number of cached strings. Defaults to DEFAULT_PARSE_CACHE_SIZE.
+        :type maxsize: Optional[int]
+        :raises TypeError: If maxsize is not an integer.
+        :raises ValueError: If maxsize is not positive.
+
+        **Example**::
+
+            >>> Converter.enable_parse_cache(maxsize=100000)
+            >>> langstrings = Converter.from_strings_to_langstrings("parse", ["Yes@en", "Yes@en", "Oui@fr"])
+            >>> print(Converter.get_parse_cache_info().hit_rate)  # Output: 0.3333333333333333
+        """
+        TypeValidator.validate_type_single(maxsize, int, optional=True)
+        cls._parse_cache = LRUCache(cls.DEFAULT_PARSE_CACHE_SIZE if maxsize is None else maxsize)
+
+    @classmethod
+    def get_parse_cache_info(cls) -> Optional[CacheInfo]:
+        """
+        Get the statistics of the parse cache.
+
+        :return: The hits, misses, maximum size, and current size of the cache, or None if the cache is disabled. The
+                 `hit_rate` property of the result gives the fraction of parsed strings found in the cache.
+        :rtype: Optional[CacheInfo]
+
+        **Example**::
+
+            >>> Converter.enable_parse_cache()
+            >>> Converter.from_string_to_langstring_parse("Paris@fr")
+            >>> Converter.from_string_to_langstring_parse("Paris@fr")
+            >>> print(Converter.get_parse_cache_info()[:2])  # Output: (1, 1)
+        """
+        return None if cls._parse_cache is None else cls._parse_cache.info()
+
     # ---------------------------------------------
     # LangStrings' Conversion Methods
     # ---------------------------------------------
@@ -331,6 +477,7 @@ class Converter(metaclass=NonInstantiable):
         print_quotes: Optional[bool] = None,
         separator: str = "@",
         print_lang: Optional[bool] = None,
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[str]:
         """
         Convert a list of LangStrings to a list of strings.
@@ -343,6 +490,8 @@ class Converter(metaclass=NonInstantiable):
         :type separator: str
         :param print_lang: Whether to include the language in the output.
         :type print_lang: Optional[bool]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of string representations of the LangStrings.
         :rtype: list[str]
 
@@ -367,6 +516,19 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_single(separator, str)
         TypeValidator.validate_type_single(print_lang, bool, optional=True)
 
+        if workers is not None:
+            chunk_results = ParallelRunner.map_chunks(
+                partial(
+                    Converter.from_langstrings_to_strings,
+                    print_quotes=print_quotes,
+                    separator=separator,
+                    print_lang=print_lang,
+                ),
+                arg,
+                workers,
+            )
+            return [string for chunk_result in chunk_results for string in chunk_result]
+
         strings = []
         for langstring in arg:
             strings.append(langstring.to_string(print_quotes=print_quotes, separator=separator, print_lang=print_lang))
@@ -437,7 +599,9 @@ class Converter(metaclass=NonInstantiable):
         return SetLangString(texts=new_texts, lang=final_lang)
 
     @classmethod
-    def from_langstrings_to_setlangstrings(cls, arg: list[LangString]) -> list[SetLangString]:
+    def from_langstrings_to_setlangstrings(
+        cls, arg: list[LangString], workers: Optional[Union[int, Executor]] = None
+    ) -> list[SetLangString]:
         """
         Convert a list of LangStrings to a list of SetLangStrings.
 
@@ -446,6 +610,8 @@ class Converter(metaclass=NonInstantiable):
 
         :param arg: The list of LangStrings to be converted.
         :type arg: list[LangString]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of SetLangStrings, each containing texts of a specific language from the LangStrings.
         :rtype: list[SetLangString]
         :raises TypeError: If the input types are incorrect.
@@ -461,13 +627,16 @@ class Converter(metaclass=NonInstantiable):
         """
         TypeValidator.validate_type_iterable(arg, list, LangString)
 
-        merged_lagnstrings = LangString.merge_langstrings(arg)
-
-        setlangstrings = []
-        for langstring in merged_lagnstrings:
-            setlangstrings.append(cls.from_langstrings_to_setlangstring([langstring]))
+        if workers is not None:
+            # The merged LangStrings are unique, so each chunk can be converted independently and merged afterward.
+            merged_langstrings = LangString.merge_langstrings(arg)
+            chunk_results = ParallelRunner.map_chunks(
+                cls.from_langstrings_to_setlangstrings, merged_langstrings, workers
+            )
+            return SetLangString.merge_setlangstrings([sls for chunk_result in chunk_results for sls in chunk_result])
 
-        return SetLangString.merge_setlangstrings(setlangstrings)
+        groups = LangGrouper.group_texts((langstring.lang, (langstring.text,)) for langstring in arg)
+        return cls._setlangstrings_from_groups(list(groups.values()))
 
     @TypeValidator.validate_type_decorator
     @staticmethod
@@ -495,7 +664,9 @@ class Converter(metaclass=NonInstantiable):
         return MultiLangString(mls_dict=new_mls_dict, pref_lang=arg.lang)
 
     @staticmethod
-    def from_langstrings_to_multilangstring(arg: list[LangString]) -> MultiLangString:
+    def from_langstrings_to_multilangstring(
+        arg: list[LangString], workers: Optional[Union[int, Executor]] = None
+    ) -> MultiLangString:
         """
         Convert a list of LangStrings to a MultiLangString.
 
@@ -504,6 +675,8 @@ class Converter(metaclass=NonInstantiable):
 
         :param arg: The list of LangStrings to be converted.
         :type arg: list[LangString]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A MultiLangString containing the texts and languages from the list of LangStrings.
         :rtype: MultiLangString
         :raises TypeError: If the input types are incorrect.
@@ -516,13 +689,19 @@ class Converter(metaclass=NonInstantiable):
             >>> print(multilangstring)  # Output: {'Hello'}@en, {'Bonjour'}@fr
         """
         TypeValidator.validate_type_iterable(arg, list, LangString)
-        new_mls = MultiLangString()
-        merged_langstrings = LangString.merge_langstrings(arg)
 
-        for langstring in merged_langstrings:
-            new_mls.add_langstring(langstring)
+        if workers is not None:
+            merged_langstrings = LangString.merge_langstrings(arg)
+            chunk_results = ParallelRunner.map_chunks(
+                Converter.from_langstrings_to_multilangstring, merged_langstrings, workers
+            )
+            return MultiLangString.merge_multilangstrings(chunk_results)
 
-        return new_mls
+        # Each language keeps the tag that LangString.merge_langstrings gives to its first text
+        groups = LangGrouper.group_texts((langstring.lang, (langstring.text,)) for langstring in arg)
+        return Converter._multilangstring_from_entries(
+            (group.first_text_lang, group.texts) for group in groups.values()
+        )
 
     # ---------------------------------------------
     # SetLangStrings' Conversion Methods
@@ -591,6 +770,7 @@ class Converter(metaclass=NonInstantiable):
         print_quotes: Optional[bool] = None,
         separator: str = "@",
         print_lang: Optional[bool] = None,
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[str]:
         """
         Convert a list of SetLangStrings to a list of strings.
@@ -603,6 +783,8 @@ class Converter(metaclass=NonInstantiable):
         :type separator: str
         :param print_lang: Whether to include the language in the output.
         :type print_lang: Optional[bool]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of string representations of the SetLangStrings.
         :rtype: list[str]
 
@@ -629,6 +811,19 @@ class Converter(metaclass=NonInstantiable):
 
         merged_setlangstrings = SetLangString.merge_setlangstrings(arg)
 
+        if workers is not None:
+            chunk_results = ParallelRunner.map_chunks(
+                partial(
+                    Converter.from_setlangstrings_to_strings,
+                    print_quotes=print_quotes,
+                    separator=separator,
+                    print_lang=print_lang,
+                ),
+                merged_setlangstrings,
+                workers,
+            )
+            return [string for chunk_result in chunk_results for string in chunk_result]
+
         strings = []
         for setlangstring in merged_setlangstrings:
             strings.extend(
@@ -666,7 +861,9 @@ class Converter(metaclass=NonInstantiable):
         return arg.to_langstrings()
 
     @staticmethod
-    def from_setlangstrings_to_langstrings(arg: list[SetLangString]) -> list[LangString]:
+    def from_setlangstrings_to_langstrings(
+        arg: list[SetLangString], workers: Optional[Union[int, Executor]] = None
+    ) -> list[LangString]:
         """
         Convert a list of SetLangStrings to a list of LangStrings.
 
@@ -675,6 +872,8 @@ class Converter(metaclass=NonInstantiable):
 
         :param arg: The list of SetLangStrings to be converted.
         :type arg: list[SetLangString]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of LangStrings, each corresponding to a text in the SetLangStrings.
         :rtype: list[LangString]
         :raises TypeError: If the input types are incorrect.
@@ -691,6 +890,12 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_iterable(arg, list, SetLangString)
         merged_setlangstrings = SetLangString.merge_setlangstrings(arg)
 
+        if workers is not None:
+            chunk_results = ParallelRunner.map_chunks(
+                Converter.from_setlangstrings_to_langstrings, merged_setlangstrings, workers
+            )
+            return [langstring for chunk_result in chunk_results for langstring in chunk_result]
+
         langstrings = []
         for setlangstring in merged_setlangstrings:
             langstrings.extend(setlangstring.to_langstrings())
@@ -723,7 +928,9 @@ class Converter(metaclass=NonInstantiable):
         return new_mls
 
     @staticmethod
-    def from_setlangstrings_to_multilangstring(arg: list[SetLangString]) -> MultiLangString:
+    def from_setlangstrings_to_multilangstring(
+        arg: list[SetLangString], workers: Optional[Union[int, Executor]] = None
+    ) -> MultiLangString:
         """
         Convert a list of SetLangString objects to a MultiLangString object.
 
@@ -732,6 +939,8 @@ class Converter(metaclass=NonInstantiable):
 
         :param arg: List of SetLangString instances to be converted.
         :type arg: list[SetLangString]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A MultiLangString instance with aggregated texts under normalized language tags.
         :rtype: MultiLangString
         :raises TypeError: If the input types are incorrect.
@@ -744,12 +953,16 @@ class Converter(metaclass=NonInstantiable):
             >>> print(multilangstring)  # Output: {'Hello'}@en, {'Bonjour'}@fr
         """
         TypeValidator.validate_type_iterable(arg, list, SetLangString)
-        merged_setlangstrings = SetLangString.merge_setlangstrings(arg)
 
-        multilangstring = MultiLangString()
-        for setlangstring in merged_setlangstrings:
-            multilangstring.add_setlangstring(setlangstring)
-        return multilangstring
+        if workers is not None:
+            merged_setlangstrings = SetLangString.merge_setlangstrings(arg)
+            chunk_results = ParallelRunner.map_chunks(
+                Converter.from_setlangstrings_to_multilangstring, merged_setlangstrings, workers
+            )
+            return MultiLangString.merge_multilangstrings(chunk_results)
+
+        groups = LangGrouper.group_texts((setlangstring.lang, setlangstring.texts) for setlangstring in arg)
+        return Converter._multilangstring_from_entries((group.merged_lang, group.texts) for group in groups.values())
 
     # ---------------------------------------------
     # MultiLangStrings' Conversion Methods
@@ -832,6 +1045,7 @@ class Converter(metaclass=NonInstantiable):
         print_quotes: bool = True,
         separator: str = "@",
         print_lang: bool = True,
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[str]:
         """
         Convert a list of MultiLangStrings to a list of strings.
@@ -848,6 +1062,8 @@ class Converter(metaclass=NonInstantiable):
         :type separator: str
         :param print_lang: Whether to include the language in the output.
         :type print_lang: bool
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of string representations of the MultiLangStrings.
         :rtype: list[str]
 
@@ -878,7 +1094,7 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_iterable(arg, list, MultiLangString)
         # Other argument types are already validated in the 'to_strings' method.
 
-        unified_mls = MultiLangString.merge_multilangstrings(arg)
+        unified_mls = Converter._merge_multilangstrings(arg, workers)
 
         return unified_mls.to_strings(
             langs=languages, print_quotes=print_quotes, separator=separator, print_lang=print_lang
@@ -921,7 +1137,9 @@ class Converter(metaclass=NonInstantiable):
 
     @staticmethod
     def from_multilangstrings_to_langstrings(
-        arg: list[MultiLangString], languages: Optional[list[str]] = None
+        arg: list[MultiLangString],
+        languages: Optional[list[str]] = None,
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[LangString]:
         """
         Convert a list of MultiLangStrings to a list of LangStrings.
@@ -933,6 +1151,8 @@ class Converter(metaclass=NonInstantiable):
         :type arg: list[MultiLangString]
         :param languages: List of languages to include in the output. If None, all languages are included.
         :type languages: Optional[list[str]]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of LangStrings, each corresponding to a text in the MultiLangStrings.
         :rtype: list[LangString]
         :raises TypeError: If any of the arguments are not of the expected type.
@@ -954,7 +1174,7 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_iterable(arg, list, MultiLangString)
         TypeValidator.validate_type_iterable(languages, list, str, optional=True)
 
-        unified_mls = MultiLangString.merge_multilangstrings(arg)
+        unified_mls = Converter._merge_multilangstrings(arg, workers)
 
         return unified_mls.to_langstrings(langs=languages)
 
@@ -994,7 +1214,9 @@ class Converter(metaclass=NonInstantiable):
 
     @staticmethod
     def from_multilangstrings_to_setlangstrings(
-        arg: list[MultiLangString], languages: Optional[list[str]] = None
+        arg: list[MultiLangString],
+        languages: Optional[list[str]] = None,
+        workers: Optional[Union[int, Executor]] = None,
     ) -> list[SetLangString]:
         """
         Convert a list of MultiLangString objects to a list of SetLangString objects.
@@ -1006,6 +1228,8 @@ class Converter(metaclass=NonInstantiable):
         :type arg: list[MultiLangString]
         :param languages: List of languages to include in the output. If None, all languages are included.
         :type languages: Optional[list[str]]
+        :param workers: The number of worker processes, or an executor, for parallel processing (see `Converter`).
+        :type workers: Optional[Union[int, Executor]]
         :return: A list of SetLangStrings, each containing texts of a single language from the merged MultiLangStrings.
         :rtype: list[SetLangString]
         :raises TypeError: If any of the arguments are not of the expected type.
@@ -1026,6 +1250,222 @@ class Converter(metaclass=NonInstantiable):
         TypeValidator.validate_type_iterable(arg, list, MultiLangString)
         TypeValidator.validate_type_iterable(languages, list, str, optional=True)
 
-        unified_mls = MultiLangString.merge_multilangstrings(arg)
+        unified_mls = Converter._merge_multilangstrings(arg, workers)
 
         return unified_mls.to_setlangstrings(langs=languages)
+
+    # ---------------------------------------------
+    # LangStringBatches' Conversion Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def from_langstrings_to_langstringbatch(arg: list[LangString]) -> LangStringBatch:
+        """
+        Convert a list of LangStrings to a LangStringBatch.
+
+        The items of the batch keep the order of the LangStrings in the list. Duplicates are not removed.
+
+        :param arg: List of LangStrings to be converted.
+        :type arg: list[LangString]
+        :return: A LangStringBatch with the texts and languages of the LangStrings.
+        :rtype: LangStringBatch
+        :raises TypeError: If the input types are incorrect.
+
+        **Example**::
+
+            >>> langstrings = [LangString("Hello", "en"), LangString("Bonjour", "fr")]
+            >>> batch = Converter.from_langstrings_to_langstringbatch(langstrings)
+            >>> print(batch.get_texts())  # Output: ['Hello', 'Bonjour']
+        """
+        TypeValidator.validate_type_iterable(arg, list, LangString)
+        return LangStringBatch([langstring.text for langstring in arg], [langstring.lang for langstring in arg])
+
+    @staticmethod
+    def from_setlangstrings_to_langstringbatch(arg: list[SetLangString]) -> LangStringBatch:
+        """
+        Convert a list of SetLangStrings to a LangStringBatch.
+
+        Each text of each SetLangString becomes an item of the batch. The SetLangStrings are not merged, and the
+        texts of each SetLangString are added in their iteration order.
+
+        :param arg: List of SetLangStrings to be converted.
+        :type arg: list[SetLangString]
+        :return: A LangStringBatch with the texts and languages of the SetLangStrings.
+        :rtype: LangStringBatch
+        :raises TypeError: If the input types are incorrect.
+
+        **Example**::
+
+            >>> setlangstrings = [SetLangString({"Hello"}, "en"), SetLangString({"Bonjour"}, "fr")]
+            >>> batch = Converter.from_setlangstrings_to_langstringbatch(setlangstrings)
+            >>> print(batch.get_langs())  # Output: ['en', 'fr']
+        """
+        TypeValidator.validate_type_iterable(arg, list, SetLangString)
+        texts: list[str] = []
+        langs: list[str] = []
+        for setlangstring in arg:
+            texts.extend(setlangstring.texts)
+            langs.extend([setlangstring.lang] * len(setlangstring.texts))
+        return LangStringBatch(texts, langs)
+
+    @staticmethod
+    def from_multilangstring_to_langstringbatch(arg: MultiLangString) -> LangStringBatch:
+        """
+        Convert a MultiLangString to a LangStringBatch.
+
+        Each text of each language of the MultiLangString becomes an item of the batch.
+
+        :param arg: The MultiLangString to be converted.
+        :type arg: MultiLangString
+        :return: A LangStringBatch with the texts and languages of the MultiLangString.
+        :rtype: LangStringBatch
+        :raises TypeError: If the arg is not of type MultiLangString.
+
+        **Example**::
+
+            >>> multilangstring = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+            >>> batch = Converter.from_multilangstring_to_langstringbatch(multilangstring)
+            >>> print(len(batch))  # Output: 2
+        """
+        TypeValidator.validate_type_single(arg, MultiLangString)
+        texts: list[str] = []
+        langs: list[str] = []
+        for lang, lang_texts in arg._mls_dict.items():
+            texts.extend(lang_texts)
+            langs.extend([lang] * len(lang_texts))
+        return LangStringBatch(texts, langs)
+
+    @staticmethod
+    def from_langstringbatch_to_langstrings(arg: LangStringBatch) -> list[LangString]:
+        """
+        Convert a LangStringBatch to a list of LangStrings, in the order of the batch.
+
+        :param arg: The LangStringBatch to be converted.
+        :type arg: LangStringBatch
+        :return: A list of LangStrings, one for each item of the batch.
+        :rtype: list[LangString]
+        :raises TypeError: If the arg is not of type LangStringBatch.
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Bonjour"], ["en", "fr"])
+            >>> for ls in Converter.from_langstringbatch_to_langstrings(batch):
+            >>>     print(ls)  # Output: "Hello"@en
+            >>>                #         "Bonjour"@fr
+        """
+        TypeValidator.validate_type_single(arg, LangStringBatch)
+        return list(arg)
+
+    @classmethod
+    def from_langstringbatch_to_setlangstrings(cls, arg: LangStringBatch) -> list[SetLangString]:
+        """
+        Convert a LangStringBatch to a list of SetLangStrings, one for each case-insensitive language.
+
+        The result is the same as the one of `from_langstrings_to_setlangstrings` for the items of the batch.
+
+        :param arg: The LangStringBatch to be converted.
+        :type arg: LangStringBatch
+        :return: A list of SetLangStrings grouping the texts of the batch by language.
+        :rtype: list[SetLangString]
+        :raises TypeError: If the arg is not of type LangStringBatch.
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Hi", "Bonjour"], ["en", "en", "fr"])
+            >>> for sls in Converter.from_langstringbatch_to_setlangstrings(batch):
+            >>>     print(sls)  # Output: {'Hello', 'Hi'}@en
+            >>>                 #         {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_single(arg, LangStringBatch)
+        return cls.from_langstrings_to_setlangstrings(cls.from_langstringbatch_to_langstrings(arg.dedupe()))
+
+    @classmethod
+    def from_langstringbatch_to_multilangstring(cls, arg: LangStringBatch) -> MultiLangString:
+        """
+        Convert a LangStringBatch to a MultiLangString.
+
+        The result is the same as the one of `from_langstrings_to_multilangstring` for the items of the batch.
+
+        :param arg: The LangStringBatch to be converted.
+        :type arg: LangStringBatch
+        :return: A MultiLangString containing all texts of the batch.
+        :rtype: MultiLangString
+        :raises TypeError: If the arg is not of type LangStringBatch.
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Bonjour"], ["en", "fr"])
+            >>> print(Converter.from_langstringbatch_to_multilangstring(batch))  # Output: {'Hello'}@en, {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_single(arg, LangStringBatch)
+        return cls.from_langstrings_to_multilangstring(cls.from_langstringbatch_to_langstrings(arg.dedupe()))
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def _merge_multilangstrings(
+        arg: list[MultiLangString], workers: Optional[Union[int, Executor]] = None
+    ) -> MultiLangString:
+        """
+        Merge a list of MultiLangStrings, optionally merging ordered chunks of the list in parallel.
+
+        When workers are used, each chunk is merged by a worker and the partial results are merged in the order of the
+        chunks, which keeps the language casing of the first occurrence, as in a sequential merge.
+
+        :param arg: The list of MultiLangStrings to merge.
+        :type arg: list[MultiLangString]
+        :param workers: The number of worker processes, or an executor. If None, the merge is sequential.
+        :type workers: Optional[Union[int, Executor]]
+        :return: The merged MultiLangString.
+        :rtype: MultiLangString
+        """
+        if workers is None:
+            return MultiLangString.merge_multilangstrings(arg)
+
+        chunk_results = ParallelRunner.map_chunks(MultiLangString.merge_multilangstrings, arg, workers)
+        return MultiLangString.merge_multilangstrings(chunk_results)
+
+    @staticmethod
+    def _multilangstring_from_entries(entries: Iterable[tuple[str, set[str]]]) -> MultiLangString:
+        """
+        Build a MultiLangString from (language tag, texts) entries, as if the entries were added to it in order.
+
+        As in `MultiLangString.add_entry`, entries whose validated language tags match case-insensitively are stored
+        under the tag of the first of them. The MultiLangString is created only once, from the complete dictionary.
+
+        :param entries: The (language tag, texts) entries, in order.
+        :type entries: Iterable[tuple[str, set[str]]]
+        :return: The new MultiLangString.
+        :rtype: MultiLangString
+        """
+        mls_dict: dict[str, set[str]] = {}
+        registered_langs: dict[str, str] = {}
+        for lang, texts in entries:
+            validated_lang = FlagValidator.validate_flags_lang(MultiLangStringFlag, lang)
+            registered_lang = registered_langs.setdefault(validated_lang.casefold(), validated_lang)
+            mls_dict.setdefault(registered_lang, set()).update(texts)
+        return MultiLangString(mls_dict=mls_dict)
+
+    @staticmethod
+    def _setlangstrings_from_groups(groups: list[LangGroup]) -> list[SetLangString]:
+        """
+        Build one SetLangString for each group of texts, with the language tag given by `merge_setlangstrings`.
+
+        When language flags are enabled, the groups are merged again by their validated tags, which may coincide even
+        if the original tags do not (e.g., when the STRIP_LANG flag is enabled).
+
+        :param groups: The groups of texts, in order of first appearance.
+        :type groups: list[LangGroup]
+        :return: The list of SetLangStrings, one for each (merged) group.
+        :rtype: list[SetLangString]
+        """
+        if FlagValidator.lang_flags_enabled(SetLangStringFlag):
+            entries = (
+                (FlagValidator.validate_flags_lang(SetLangStringFlag, group.merged_lang), group.texts)
+                for group in groups
+            )
+            groups = list(LangGrouper.group_texts(entries).values())
+
+        return [SetLangString(texts=group.texts, lang=group.merged_lang) for group in groups]
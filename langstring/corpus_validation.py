@@ -0,0 +1,249 @@
+"""
+Single-pass validation of literal collections against the `DEFINED_TEXT`, `DEFINED_LANG`, and `VALID_LANG` rules.
+
+Creating `LangString` objects with the corresponding flags enabled stops at the first invalid literal. When a new
+dataset is onboarded, all its problems should be known at once instead. The `CorpusValidator` streams through strings,
+`LangString`, `SetLangString`, and `MultiLangString` objects, checking each rule regardless of the flags currently
+enabled, and summarizes the violations in a compact report.
+
+Key Features:
+    - **Single Pass**: The records are iterated once, so generators over files or databases can be validated.
+    - **Bounded Memory**: Only counters, a capped number of offending indices per rule, and a capped number of tag
+      statistics are kept, however many records are validated.
+    - **Memoization**: The language rules are checked once per distinct tag, which matters for `VALID_LANG`, whose
+      check with the 'langcodes' library is much slower than the others.
+
+Classes:
+    - **CorpusValidator**: Validates collections of literals.
+    - **TagStatistics**: The statistics of one language tag.
+    - **ValidationReport**: The result of a validation.
+
+**Example**::
+
+    >>> report = CorpusValidator.validate(["Hello@en", "@fr", "Bonjour@xx-invalid-tag"])
+    >>> print(report.violations)  # Output: {'DEFINED_TEXT': 1, 'DEFINED_LANG': 0, 'VALID_LANG': 1}
+    >>> print(report.offending_indices["VALID_LANG"])  # Output: [2]
+"""
+
+from typing import Iterable
+from typing import NamedTuple
+from typing import Union
+
+from .langstring import LangString
+from .multilangstring import MultiLangString
+from .setlangstring import SetLangString
+from .utils.lru_cache import LRUCache
+from .utils.non_instantiable import NonInstantiable
+from .utils.validators import FlagValidator
+from .utils.validators import TypeValidator
+
+
+class TagStatistics(NamedTuple):
+    """
+    The statistics of the literals with one language tag.
+
+    :ivar literals: The number of literals with the tag.
+    :vartype literals: int
+    :ivar undefined_texts: The number of these literals violating the `DEFINED_TEXT` rule.
+    :vartype undefined_texts: int
+    :ivar valid_tag: Whether the tag satisfies the `VALID_LANG` rule.
+    :vartype valid_tag: bool
+    """
+
+    literals: int
+    undefined_texts: int
+    valid_tag: bool
+
+
+class ValidationReport(NamedTuple):
+    """
+    The result of the validation of a collection of literals.
+
+    :ivar records: The number of validated records.
+    :vartype records: int
+    :ivar literals: The number of validated literals. A `SetLangString` or `MultiLangString` record contains one literal
+                    per text.
+    :vartype literals: int
+    :ivar violations: For each rule, the number of literals violating it.
+    :vartype violations: dict[str, int]
+    :ivar offending_indices: For each rule, the indices of the first records containing a literal violating it, in
+                             increasing order and capped to the `max_indices` argument of the validation.
+    :vartype offending_indices: dict[str, list[int]]
+    :ivar tag_statistics: The statistics of each language tag, for the first `max_tags` distinct tags found.
+    :vartype tag_statistics: dict[str, TagStatistics]
+    :ivar untracked_literals: The number of literals whose tag is not in `tag_statistics`.
+    :vartype untracked_literals: int
+    """
+
+    records: int
+    literals: int
+    violations: dict[str, int]
+    offending_indices: dict[str, list[int]]
+    tag_statistics: dict[str, TagStatistics]
+    untracked_literals: int
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Check whether no literal violates any rule.
+
+        :return: True if there is no violation, otherwise False.
+        :rtype: bool
+        """
+        return not any(self.violations.values())
+
+
+class CorpusValidator(metaclass=NonInstantiable):
+    """
+    A utility class validating collections of literals against the `DEFINED_TEXT`, `DEFINED_LANG`, and `VALID_LANG`
+    rules.
+
+    The rules are checked on the texts and language tags as given, regardless of the flags currently enabled:
+        - `DEFINED_TEXT`: The text contains non-space characters.
+        - `DEFINED_LANG`: The language tag contains non-space characters.
+        - `VALID_LANG`: The language tag is valid according to the 'langcodes' library. If the library is not
+          installed, a warning is issued and all tags are considered valid, unless `GlobalFlag.ENFORCE_EXTRA_DEPEND`
+          is enabled, in which case an ImportError is raised.
+
+    A literal with an empty language tag violates both `DEFINED_LANG` and `VALID_LANG`.
+
+    :cvar RULES: The names of the checked rules.
+    :vartype RULES: tuple[str, ...]
+    :cvar DEFAULT_MAX_INDICES: The default maximum number of offending indices kept per rule.
+    :vartype DEFAULT_MAX_INDICES: int
+    :cvar DEFAULT_MAX_TAGS: The default maximum number of distinct tags with statistics.
+    :vartype DEFAULT_MAX_TAGS: int
+
+    **Example**::
+
+        >>> mls = MultiLangString({"en": {"Hello", " "}, "": {"Hallo"}})
+        >>> report = CorpusValidator.validate([mls, LangString("Hi", "en")])
+        >>> print(report.violations)  # Output: {'DEFINED_TEXT': 1, 'DEFINED_LANG': 1, 'VALID_LANG': 1}
+        >>> print(report.tag_statistics["en"])  # Output: TagStatistics(literals=3, undefined_texts=1, valid_tag=True)
+    """
+
+    RULES: tuple[str, ...] = ("DEFINED_TEXT", "DEFINED_LANG", "VALID_LANG")
+    DEFAULT_MAX_INDICES: int = 1000
+    DEFAULT_MAX_TAGS: int = 10_000
+
+    @classmethod
+    def validate(
+        cls,
+        records: Iterable[Union[str, LangString, SetLangString, MultiLangString]],
+        separator: str = "@",
+        max_indices: int = DEFAULT_MAX_INDICES,
+        max_tags: int = DEFAULT_MAX_TAGS,
+    ) -> ValidationReport:
+        """
+        Validate a collection of literals, iterating over it once.
+
+        Strings are split into text and language tag as done by `Converter.from_string_to_langstring_parse`: at the
+        last occurrence of the separator, the tag being empty if the separator is not found.
+
+        :param records: The records to be validated.
+        :type records: Iterable[Union[str, LangString, SetLangString, MultiLangString]]
+        :param separator: The separator between the text and the language tag of the string records.
+        :type separator: str
+        :param max_indices: The maximum number of offending indices kept per rule.
+        :type max_indices: int
+        :param max_tags: The maximum number of distinct tags with statistics, also bounding the number of tags whose
+                         language rule results are memoized.
+        :type max_tags: int
+        :return: The report of the validation.
+        :rtype: ValidationReport
+        :raises TypeError: If a record is not a str, LangString, SetLangString, or MultiLangString, or if an argument is
+                           of an invalid type.
+        :raises ValueError: If max_indices is negative or max_tags is not positive.
+        :raises ImportError: If the 'langcodes' library is not installed and `ENFORCE_EXTRA_DEPEND` is enabled.
+
+        **Example**::
+
+            >>> report = CorpusValidator.validate(open("labels.txt", encoding="utf-8").read().splitlines())
+            >>> print(report.is_valid)  # Output: True
+        """
+        TypeValidator.validate_type_single(separator, str)
+        TypeValidator.validate_type_single(max_indices, int)
+        TypeValidator.validate_type_single(max_tags, int)
+        if max_indices < 0:
+            raise ValueError(f"Invalid 'max_indices' value received ('{max_indices}'). Expected a non-negative int.")
+        if max_tags < 1:
+            raise ValueError(f"Invalid 'max_tags' value received ('{max_tags}'). Expected a positive int.")
+
+        violations = dict.fromkeys(cls.RULES, 0)
+        offending_indices: dict[str, list[int]] = {rule: [] for rule in cls.RULES}
+        # For each tag: [literals, undefined texts, satisfies VALID_LANG]
+        tag_counts: dict[str, list[int]] = {}
+        # For each tag: (satisfies DEFINED_LANG, satisfies VALID_LANG)
+        tag_rules: LRUCache[tuple[bool, bool]] = LRUCache(max_tags)
+        untracked_literals = 0
+        literals = 0
+        records_count = 0
+
+        def record_violation(rule: str, index: int, count: int) -> None:
+            violations[rule] += count
+            indices = offending_indices[rule]
+            if len(indices) < max_indices and (not indices or indices[-1] != index):
+                indices.append(index)
+
+        for index, record in enumerate(records):
+            records_count += 1
+            groups: Iterable[tuple[str, Iterable[str]]]
+            if isinstance(record, str):
+                if separator and separator in record:
+                    text, lang = record.rsplit(separator, 1)
+                else:
+                    text, lang = record, ""
+                groups = ((lang, (text,)),)
+            elif isinstance(record, LangString):
+                groups = ((record.lang, (record.text,)),)
+            elif isinstance(record, SetLangString):
+                groups = ((record.lang, record.texts),)
+            elif isinstance(record, MultiLangString):
+                groups = record._mls_dict.items()
+            else:
+                raise TypeError(
+                    f"Invalid record at index {index}. Expected 'str', 'LangString', 'SetLangString', or "
+                    f"'MultiLangString', but got '{type(record).__name__}'."
+                )
+
+            for lang, texts in groups:
+                count = 0
+                undefined_texts = 0
+                for text in texts:
+                    count += 1
+                    if not text.strip():
+                        undefined_texts += 1
+                if not count:
+                    continue
+                literals += count
+
+                rules = tag_rules.get(lang)
+                if rules is None:
+                    rules = (bool(lang.strip()), FlagValidator._tag_is_valid(lang))
+                    tag_rules.put(lang, rules)
+                if undefined_texts:
+                    record_violation("DEFINED_TEXT", index, undefined_texts)
+                if not rules[0]:
+                    record_violation("DEFINED_LANG", index, count)
+                if not rules[1]:
+                    record_violation("VALID_LANG", index, count)
+
+                counts = tag_counts.get(lang)
+                if counts is None:
+                    if len(tag_counts) >= max_tags:
+                        untracked_literals += count
+                        continue
+                    counts = tag_counts[lang] = [0, 0, rules[1]]
+                counts[0] += count
+                counts[1] += undefined_texts
+
+        return ValidationReport(
+            records=records_count,
+            literals=literals,
+            violations=violations,
+            offending_indices=offending_indices,
+            tag_statistics={
+                lang: TagStatistics(counts[0], counts[1], bool(counts[2])) for lang, counts in tag_counts.items()
+            },
+            untracked_literals=untracked_literals,
+        )
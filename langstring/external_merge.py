@@ -0,0 +1,340 @@
+"""
+Merging of duplicated `LangString` and `SetLangString` objects in collections larger than the available memory.
+
+`LangString.merge_langstrings` and `SetLangString.merge_setlangstrings` keep all distinct items in memory. The
+`ExternalMerger` produces the same results from (possibly unbounded) iterables: when the input exceeds its memory
+budget, items are partitioned by a hash of their casefolded key into temporary spill files, each partition is merged in
+memory on its own, and the merged items of all partitions are streamed back in the order of their first occurrence in
+the input.
+
+Key Features:
+    - **Bounded Memory**: At most `memory_limit` items are buffered before being spilled to disk, and only one
+      partition is merged in memory at a time.
+    - **Streaming**: Inputs are consumed lazily and results are produced by generators.
+    - **Same Semantics**: Results are equal to those of `merge_langstrings` and `merge_setlangstrings`, including the
+      language tag casing rules and the order of the results.
+    - **Automatic Cleanup**: Spill files are created in a temporary directory that is removed when the results are
+      exhausted or the generator is closed.
+
+Classes:
+    - **ExternalMerger**: Merges duplicated LangStrings and SetLangStrings using temporary spill files.
+
+**Example**::
+
+    >>> merger = ExternalMerger(memory_limit=1_000_000, partitions=64)
+    >>> for langstring in merger.merge_langstrings(read_literals("dump.nt")):
+    >>>     write(langstring)
+"""
+
+import pickle
+import tempfile
+from heapq import merge
+from operator import itemgetter
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from .langstring import LangString
+from .setlangstring import SetLangString
+from .utils.validators import TypeValidator
+
+# Spilled LangString records: (sequence number, text, language tag)
+_LangStringRecord = tuple[int, str, str]
+# Spilled SetLangString records: (sequence number, texts, language tag)
+_SetLangStringRecord = tuple[int, list[str], str]
+
+
+class ExternalMerger:
+    """
+    Merges duplicated LangStrings and SetLangStrings of collections that may not fit in memory.
+
+    Inputs with at most `memory_limit` items are merged entirely in memory. Larger inputs are split into `partitions`
+    spill files by a hash of the casefolded key of each item, so that all duplicates of an item are in the same
+    partition. The number of partitions should be chosen so that the distinct items of one partition fit in memory.
+
+    :cvar DEFAULT_MEMORY_LIMIT: The default maximum number of items buffered in memory before spilling.
+    :vartype DEFAULT_MEMORY_LIMIT: int
+    :cvar DEFAULT_PARTITIONS: The default number of spill partitions.
+    :vartype DEFAULT_PARTITIONS: int
+
+    **Example**::
+
+        >>> merger = ExternalMerger(memory_limit=2, partitions=4)
+        >>> langstrings = [LangString("Hello", "en"), LangString("Hello", "EN"), LangString("Hi", "en")]
+        >>> print(list(merger.merge_langstrings(langstrings)))  # Output: [LangString(text='Hello', lang='en'), ...]
+    """
+
+    DEFAULT_MEMORY_LIMIT: int = 1_000_000
+    DEFAULT_PARTITIONS: int = 64
+
+    def __init__(
+        self,
+        memory_limit: Optional[int] = None,
+        partitions: Optional[int] = None,
+        temp_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize a new merger.
+
+        :param memory_limit: The maximum number of items buffered in memory before spilling. For SetLangStrings, each
+                             text counts as an item. Defaults to DEFAULT_MEMORY_LIMIT.
+        :type memory_limit: Optional[int]
+        :param partitions: The number of spill partitions. Defaults to DEFAULT_PARTITIONS.
+        :type partitions: Optional[int]
+        :param temp_dir: The directory in which the temporary spill directories are created. If None (default), the
+                         default temporary directory of the system is used.
+        :type temp_dir: Optional[Union[str, Path]]
+        :raises TypeError: If the arguments have invalid types.
+        :raises ValueError: If memory_limit or partitions are not positive.
+        """
+        TypeValidator.validate_type_single(memory_limit, int, optional=True)
+        TypeValidator.validate_type_single(partitions, int, optional=True)
+        if temp_dir is not None and not isinstance(temp_dir, (str, Path)):
+            raise TypeError(
+                f"Invalid argument with value '{temp_dir}'. Expected one of 'str' or 'Path', "
+                f"but got '{type(temp_dir).__name__}'."
+            )
+
+        memory_limit = self.DEFAULT_MEMORY_LIMIT if memory_limit is None else memory_limit
+        partitions = self.DEFAULT_PARTITIONS if partitions is None else partitions
+        if memory_limit < 1:
+            raise ValueError(f"Invalid memory_limit. Expected a positive integer, got '{memory_limit}'.")
+        if partitions < 1:
+            raise ValueError(f"Invalid partitions. Expected a positive integer, got '{partitions}'.")
+
+        self.memory_limit = memory_limit
+        self.partitions = partitions
+        self.temp_dir = temp_dir
+
+    # ---------------------------------------------
+    # Merge Methods
+    # ---------------------------------------------
+
+    def merge_langstrings(self, langstrings: Iterable[LangString]) -> Iterator[LangString]:
+        """
+        Merge duplicated LangStrings, producing the same LangStrings as `LangString.merge_langstrings`.
+
+        LangStrings are duplicated if they have the same text and the same casefolded language tag. The first
+        occurrence is kept, with its original language tag, unless a duplicate uses a different casing, in which case
+        the casefolded tag is used. Results are new LangStrings, produced in the order of their first occurrence.
+
+        :param langstrings: The LangStrings to be merged. They are consumed lazily.
+        :type langstrings: Iterable[LangString]
+        :return: An iterator over the merged LangStrings.
+        :rtype: Iterator[LangString]
+        :raises TypeError: If an item is not a LangString.
+
+        **Example**::
+
+            >>> merged = ExternalMerger().merge_langstrings([LangString("Hi", "en"), LangString("Hi", "EN")])
+            >>> print(list(merged))  # Output: [LangString(text='Hi', lang='en')]
+        """
+        records = ((langstring.text, langstring.lang) for langstring in self._validated(langstrings, LangString))
+        for _, text, lang in self._merge(records, lambda record: (record[1], record[2].casefold()), self._merge_texts):
+            yield LangString._from_validated(text, lang)
+
+    def merge_setlangstrings(self, setlangstrings: Iterable[SetLangString]) -> Iterator[SetLangString]:
+        """
+        Merge SetLangStrings with the same casefolded language tag, as `SetLangString.merge_setlangstrings`.
+
+        The texts of SetLangStrings with the same casefolded language tag are united. The original language tag is
+        kept, unless a SetLangString of the same language uses a different casing, in which case the casefolded tag is
+        used. Results are new SetLangStrings, produced in the order of the first occurrence of their language. All texts
+        of one language are merged in memory.
+
+        :param setlangstrings: The SetLangStrings to be merged. They are consumed lazily.
+        :type setlangstrings: Iterable[SetLangString]
+        :return: An iterator over the merged SetLangStrings.
+        :rtype: Iterator[SetLangString]
+        :raises TypeError: If an item is not a SetLangString.
+        """
+        records = (
+            (list(setlangstring.texts), setlangstring.lang)
+            for setlangstring in self._validated(setlangstrings, SetLangString)
+        )
+        for _, texts, lang in self._merge(records, lambda record: record[2].casefold(), self._merge_sets):
+            yield SetLangString._from_validated(set(texts), lang)
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    def _merge(
+        self,
+        items: Iterator[tuple[Any, str]],
+        partition_key: Callable[[tuple[int, Any, str]], Hashable],
+        merge_partition: Callable[[Iterable[tuple[int, Any, str]]], list[tuple[int, Any, str]]],
+    ) -> Iterator[tuple[int, Any, str]]:
+        """
+        Number the items, merge them in memory or through spill files, and produce the merged records in input order.
+
+        :param items: The (value, language tag) pairs to be merged.
+        :type items: Iterator[tuple[Any, str]]
+        :param partition_key: Returns the key whose hash selects the partition of a record.
+        :type partition_key: Callable[[tuple[int, Any, str]], Hashable]
+        :param merge_partition: Merges the records of a partition, returning them sorted by sequence number.
+        :type merge_partition: Callable[[Iterable[tuple[int, Any, str]]], list[tuple[int, Any, str]]]
+        :return: An iterator over the merged records.
+        :rtype: Iterator[tuple[int, Any, str]]
+        """
+        buffer: list[tuple[int, Any, str]] = []
+        buffered_size = 0
+        for seq, (value, lang) in enumerate(items):
+            buffer.append((seq, value, lang))
+            buffered_size += len(value) + 1 if isinstance(value, list) else 1
+            if buffered_size > self.memory_limit:
+                yield from self._merge_spilled(buffer, items, seq + 1, partition_key, merge_partition)
+                return
+        yield from merge_partition(buffer)
+
+    def _merge_spilled(
+        self,
+        buffer: list[tuple[int, Any, str]],
+        items: Iterator[tuple[Any, str]],
+        start: int,
+        partition_key: Callable[[tuple[int, Any, str]], Hashable],
+        merge_partition: Callable[[Iterable[tuple[int, Any, str]]], list[tuple[int, Any, str]]],
+    ) -> Iterator[tuple[int, Any, str]]:
+        """
+        Spill the buffered and remaining items to partition files, merge each partition, and merge the sorted results.
+
+        :param buffer: The records already read.
+        :type buffer: list[tuple[int, Any, str]]
+        :param items: The remaining (value, language tag) pairs.
+        :type items: Iterator[tuple[Any, str]]
+        :param start: The sequence number of the first remaining item.
+        :type start: int
+        :param partition_key: Returns the key whose hash selects the partition of a record.
+        :type partition_key: Callable[[tuple[int, Any, str]], Hashable]
+        :param merge_partition: Merges the records of a partition, returning them sorted by sequence number.
+        :type merge_partition: Callable[[Iterable[tuple[int, Any, str]]], list[tuple[int, Any, str]]]
+        :return: An iterator over the merged records.
+        :rtype: Iterator[tuple[int, Any, str]]
+        """
+        partitions = self.partitions
+        flush_size = max(1, self.memory_limit // partitions)
+        with tempfile.TemporaryDirectory(prefix="langstring-merge-", dir=self.temp_dir) as directory:
+            spill_paths = [Path(directory, f"partition-{index}.spill") for index in range(partitions)]
+            spill_files = [path.open("wb") for path in spill_paths]
+            try:
+                pending: list[list[tuple[int, Any, str]]] = [[] for _ in range(partitions)]
+                records = (
+                    record
+                    for chunk in (buffer, ((seq, value, lang) for seq, (value, lang) in enumerate(items, start)))
+                    for record in chunk
+                )
+                for record in records:
+                    index = hash(partition_key(record)) % partitions
+                    partition = pending[index]
+                    partition.append(record)
+                    if len(partition) >= flush_size:
+                        pickle.dump(partition, spill_files[index], pickle.HIGHEST_PROTOCOL)
+                        partition.clear()
+                buffer.clear()
+                for spill_file, partition in zip(spill_files, pending):
+                    if partition:
+                        pickle.dump(partition, spill_file, pickle.HIGHEST_PROTOCOL)
+            finally:
+                for spill_file in spill_files:
+                    spill_file.close()
+
+            result_paths = []
+            for spill_path in spill_paths:
+                merged = merge_partition(self._read_records(spill_path))
+                spill_path.unlink()
+                result_path = spill_path.with_suffix(".merged")
+                with result_path.open("wb") as result_file:
+                    for offset in range(0, len(merged), flush_size):
+                        end = offset + flush_size
+                        pickle.dump(merged[offset:end], result_file, pickle.HIGHEST_PROTOCOL)
+                result_paths.append(result_path)
+
+            yield from merge(*(self._read_records(path) for path in result_paths), key=itemgetter(0))
+
+    @staticmethod
+    def _merge_sets(records: Iterable[_SetLangStringRecord]) -> list[_SetLangStringRecord]:
+        """
+        Merge SetLangString records in memory, with the rules of `SetLangString.merge_setlangstrings`.
+
+        :param records: The (sequence number, texts, language tag) records to be merged.
+        :type records: Iterable[_SetLangStringRecord]
+        :return: The merged records, sorted by sequence number.
+        :rtype: list[_SetLangStringRecord]
+        """
+        merged: dict[str, tuple[int, set[str], list[str]]] = {}
+        for seq, texts, lang in records:
+            key = lang.casefold()
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = (seq, set(texts), [lang])
+            else:
+                entry[1].update(texts)
+                if lang != entry[2][0]:
+                    entry[2][0] = key
+        result = [(seq, list(texts), langs[0]) for seq, texts, langs in merged.values()]
+        result.sort(key=itemgetter(0))
+        return result
+
+    @staticmethod
+    def _merge_texts(records: Iterable[_LangStringRecord]) -> list[_LangStringRecord]:
+        """
+        Merge LangString records in memory, with the rules of `LangString.merge_langstrings`.
+
+        :param records: The (sequence number, text, language tag) records to be merged.
+        :type records: Iterable[_LangStringRecord]
+        :return: The merged records, sorted by sequence number.
+        :rtype: list[_LangStringRecord]
+        """
+        merged: dict[tuple[str, str], list[Any]] = {}
+        for seq, text, lang in records:
+            key = (text, lang.casefold())
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [seq, text, lang, lang]
+            elif lang != entry[3]:
+                entry[2] = key[1]
+        result: list[_LangStringRecord] = [(seq, text, lang) for seq, text, lang, _ in merged.values()]
+        result.sort(key=itemgetter(0))
+        return result
+
+    @staticmethod
+    def _read_records(path: Path) -> Iterator[Any]:
+        """
+        Read the records of a spill file, one chunk at a time.
+
+        :param path: The path of the spill file.
+        :type path: Path
+        :return: An iterator over the records of the file.
+        :rtype: Iterator[Any]
+        """
+        spill_file: IO[bytes]
+        with path.open("rb") as spill_file:
+            while True:
+                try:
+                    chunk = pickle.load(spill_file)
+                except EOFError:
+                    return
+                yield from chunk
+
+    @staticmethod
+    def _validated(items: Iterable[Any], expected_type: type) -> Iterator[Any]:
+        """
+        Check the type of each item of an iterable, lazily.
+
+        :param items: The items to be checked.
+        :type items: Iterable[Any]
+        :param expected_type: The expected type of the items.
+        :type expected_type: type
+        :return: An iterator over the checked items.
+        :rtype: Iterator[Any]
+        :raises TypeError: If an item is not of the expected type.
+        """
+        for item in items:
+            TypeValidator.validate_type_single(item, expected_type)
+            yield item
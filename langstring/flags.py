@@ -52,6 +52,8 @@ class GlobalFlag(Enum):
     :vartype PRINT_WITH_LANG: Enum
     :cvar PRINT_WITH_QUOTES: Wraps text entries in quotes when printing multilingual text.
     :vartype PRINT_WITH_QUOTES: Enum
+    :cvar SORTED_TEXTS: Stores texts in sorted order in the classes that support it (i.e., MultiLangString).
+    :vartype SORTED_TEXTS: Enum
     :cvar STRIP_LANG: Removes leading and trailing whitespace from language codes.
     :vartype STRIP_LANG: Enum
     :cvar STRIP_TEXT: Removes leading and trailing whitespace from text entries.
@@ -67,6 +69,7 @@ class GlobalFlag(Enum):
     METHODS_MATCH_TYPES = auto()
     PRINT_WITH_LANG = auto()
     PRINT_WITH_QUOTES = auto()
+    SORTED_TEXTS = auto()
     STRIP_LANG = auto()
     STRIP_TEXT = auto()
     VALID_LANG = auto()
@@ -170,6 +173,8 @@ class MultiLangStringFlag(Enum):
     :vartype PRINT_WITH_LANG: Enum
     :cvar PRINT_WITH_QUOTES: Wraps text entries in quotes when printing a MultiLangString.
     :vartype PRINT_WITH_QUOTES: Enum
+    :cvar SORTED_TEXTS: Stores the texts of each language of a MultiLangString in sorted order.
+    :vartype SORTED_TEXTS: Enum
     :cvar STRIP_LANG: Removes leading and trailing whitespace from language codes within a MultiLangString.
     :vartype STRIP_LANG: Enum
     :cvar STRIP_TEXT: Removes leading and trailing whitespace from text entries within a MultiLangString.
@@ -183,6 +188,7 @@ class MultiLangStringFlag(Enum):
     LOWERCASE_LANG = auto()
     PRINT_WITH_LANG = auto()
     PRINT_WITH_QUOTES = auto()
+    SORTED_TEXTS = auto()
     STRIP_LANG = auto()
     STRIP_TEXT = auto()
     VALID_LANG = auto()
@@ -0,0 +1,303 @@
+"""
+Opt-in recording of how often and how long the public methods of the `langstring` classes are called.
+
+When enabled, the public methods of `LangString`, `SetLangString`, `MultiLangString`, and `Converter` (and their
+constructors) are replaced by wrappers recording the number of calls, the number of calls ending with an exception, the
+cumulative time, and a latency histogram of each method. The flag validations of `FlagValidator` are counted as well,
+together with the number of values they reject. When disabled, the original methods are restored, so instrumentation
+has no overhead at all unless it is enabled.
+
+Key Features:
+    - **Opt-In**: Nothing is recorded, and no method is wrapped, until `Instrumentation.enable` is called.
+    - **Latency Histograms**: Call durations are counted in buckets with fixed upper bounds, from 1 microsecond to 1
+      second.
+    - **Validation Counters**: Calls to `FlagValidator.validate_flags_text` and `validate_flags_lang`, and the values
+      they reject, are counted.
+    - **Exportable Snapshots**: `Instrumentation.snapshot` returns a dictionary of plain numbers and strings, ready to
+      be serialized or fed into a monitoring system.
+
+Classes:
+    - **Instrumentation**: Enables, disables, resets, and exports the recorded metrics.
+
+**Example**::
+
+    >>> Instrumentation.enable()
+    >>> LangString("Hello", "en").upper()
+    >>> metrics = Instrumentation.snapshot()
+    >>> print(metrics["methods"]["LangString.upper"]["calls"])  # Output: 1
+    >>> Instrumentation.disable()
+"""
+
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any
+from typing import Callable
+
+from .converter import Converter
+from .langstring import LangString
+from .multilangstring import MultiLangString
+from .setlangstring import SetLangString
+from .utils.non_instantiable import NonInstantiable
+from .utils.validators import FlagValidator
+
+
+class Instrumentation(metaclass=NonInstantiable):
+    """
+    A utility class recording call counters, cumulative times, and latency histograms of the library's methods.
+
+    Metrics are recorded in the current process only: worker processes used by the `workers` argument of the `Converter`
+    list conversions are not instrumented.
+
+    :cvar INSTRUMENTED_CLASSES: The classes whose public methods are instrumented.
+    :vartype INSTRUMENTED_CLASSES: tuple[type, ...]
+    :cvar HISTOGRAM_BOUNDS_NS: The upper bounds, in nanoseconds, of the latency histogram buckets. Durations above the
+                               last bound are counted in a final overflow bucket.
+    :vartype HISTOGRAM_BOUNDS_NS: tuple[int, ...]
+
+    **Example**::
+
+        >>> Instrumentation.enable()
+        >>> Converter.from_strings_to_langstrings("parse", ["Hello@en", "Bonjour@fr"])
+        >>> print(Instrumentation.snapshot()["validators"]["FlagValidator.validate_flags_lang"]["calls"])  # Output: 2
+        >>> Instrumentation.disable()
+    """
+
+    INSTRUMENTED_CLASSES: tuple[type, ...] = (LangString, SetLangString, MultiLangString, Converter)
+    HISTOGRAM_BOUNDS_NS: tuple[int, ...] = tuple(
+        base * 10**exponent for exponent in range(3, 10) for base in (1, 2, 5) if base * 10**exponent <= 10**9
+    )
+
+    _VALIDATORS: tuple[str, ...] = ("validate_flags_lang", "validate_flags_text")
+
+    # The original descriptors of the wrapped attributes, used to restore them. Empty when disabled.
+    _originals: dict[tuple[type, str], Any] = {}
+    # For each method: [calls, errors, total time in ns, histogram bucket counts...]
+    _method_stats: dict[str, list[int]] = {}
+    # For each validator: [calls, failures]
+    _validator_stats: dict[str, list[int]] = {}
+    _lock = Lock()
+
+    # ---------------------------------------------
+    # Control Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Stop recording metrics, restoring the original methods. The metrics recorded so far are kept.
+        """
+        with cls._lock:
+            for (owner, name), original in cls._originals.items():
+                setattr(owner, name, original)
+            cls._originals = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Start recording metrics, wrapping the public methods of the instrumented classes. Calling it again while
+        instrumentation is enabled has no effect.
+
+        **Example**::
+
+            >>> Instrumentation.enable()
+            >>> print(Instrumentation.is_enabled())  # Output: True
+        """
+        with cls._lock:
+            if cls._originals:
+                return
+            originals: dict[tuple[type, str], Any] = {}
+            for owner in cls.INSTRUMENTED_CLASSES:
+                for name, attribute in list(vars(owner).items()):
+                    if name.startswith("_") and name != "__init__":
+                        continue
+                    wrapped = cls._wrap_descriptor(attribute, f"{owner.__name__}.{name}", cls._wrap_method)
+                    if wrapped is not None:
+                        originals[(owner, name)] = attribute
+                        setattr(owner, name, wrapped)
+            for name in cls._VALIDATORS:
+                attribute = vars(FlagValidator)[name]
+                wrapped = cls._wrap_descriptor(attribute, f"FlagValidator.{name}", cls._wrap_validator)
+                originals[(FlagValidator, name)] = attribute
+                setattr(FlagValidator, name, wrapped)
+            cls._originals = originals
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Check whether metrics are being recorded.
+
+        :return: True if instrumentation is enabled, otherwise False.
+        :rtype: bool
+        """
+        return bool(cls._originals)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discard all recorded metrics. Instrumentation stays enabled or disabled.
+        """
+        with cls._lock:
+            cls._method_stats = {}
+            cls._validator_stats = {}
+
+    @classmethod
+    def snapshot(cls) -> dict[str, Any]:
+        """
+        Export the recorded metrics as a dictionary of plain values.
+
+        The dictionary has the following keys:
+            - "enabled": Whether instrumentation is enabled.
+            - "histogram_bounds_ns": The upper bounds of the histogram buckets, in nanoseconds.
+            - "methods": For each called method (e.g., "LangString.upper"), a dictionary with the number of "calls",
+              the number of calls that raised an exception ("errors"), the cumulative time in seconds ("total_time"),
+              and the "histogram" of durations: a list with the count of each bucket, plus the overflow bucket.
+            - "validators": For each called validator (e.g., "FlagValidator.validate_flags_lang"), a dictionary with
+              the number of "calls" and the number of rejected values ("failures").
+
+        :return: A new dictionary with the recorded metrics.
+        :rtype: dict[str, Any]
+
+        **Example**::
+
+            >>> metrics = Instrumentation.snapshot()
+            >>> slowest = max(metrics["methods"].items(), key=lambda item: item[1]["total_time"])
+        """
+        with cls._lock:
+            methods = {
+                name: {
+                    "calls": stats[0],
+                    "errors": stats[1],
+                    "total_time": stats[2] / 1e9,
+                    "histogram": stats[3:],
+                }
+                for name, stats in sorted(cls._method_stats.items())
+            }
+            validators = {
+                name: {"calls": stats[0], "failures": stats[1]} for name, stats in sorted(cls._validator_stats.items())
+            }
+        return {
+            "enabled": cls.is_enabled(),
+            "histogram_bounds_ns": list(cls.HISTOGRAM_BOUNDS_NS),
+            "methods": methods,
+            "validators": validators,
+        }
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def _record_method(cls, name: str, elapsed: int, failed: bool) -> None:
+        """
+        Record a call to a method.
+
+        :param name: The qualified name of the method.
+        :type name: str
+        :param elapsed: The duration of the call, in nanoseconds.
+        :type elapsed: int
+        :param failed: Whether the call raised an exception.
+        :type failed: bool
+        """
+        bucket = 3 + bisect_left(cls.HISTOGRAM_BOUNDS_NS, elapsed)
+        with cls._lock:
+            stats = cls._method_stats.get(name)
+            if stats is None:
+                stats = cls._method_stats[name] = [0] * (4 + len(cls.HISTOGRAM_BOUNDS_NS))
+            stats[0] += 1
+            stats[1] += failed
+            stats[2] += elapsed
+            stats[bucket] += 1
+
+    @classmethod
+    def _record_validator(cls, name: str, failed: bool) -> None:
+        """
+        Record a call to a validator.
+
+        :param name: The qualified name of the validator.
+        :type name: str
+        :param failed: Whether the validated value was rejected.
+        :type failed: bool
+        """
+        with cls._lock:
+            stats = cls._validator_stats.setdefault(name, [0, 0])
+            stats[0] += 1
+            stats[1] += failed
+
+    @classmethod
+    def _wrap_descriptor(
+        cls, attribute: Any, name: str, wrap: Callable[[Callable[..., Any], str], Callable[..., Any]]
+    ) -> Any:
+        """
+        Wrap a function, static method, or class method, keeping its kind.
+
+        :param attribute: The attribute of a class.
+        :type attribute: Any
+        :param name: The qualified name under which calls are recorded.
+        :type name: str
+        :param wrap: The function creating the wrapper of a plain function.
+        :type wrap: Callable[[Callable[..., Any], str], Callable[..., Any]]
+        :return: The wrapped attribute, or None if the attribute is not a method (e.g., a property or a constant).
+        :rtype: Any
+        """
+        if isinstance(attribute, staticmethod):
+            return staticmethod(wrap(attribute.__func__, name))
+        if isinstance(attribute, classmethod):
+            return classmethod(wrap(attribute.__func__, name))
+        if callable(attribute) and not isinstance(attribute, type):
+            return wrap(attribute, name)
+        return None
+
+    @classmethod
+    def _wrap_method(cls, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """
+        Create a wrapper recording the calls and durations of a method.
+
+        :param func: The function to be wrapped.
+        :type func: Callable[..., Any]
+        :param name: The qualified name under which calls are recorded.
+        :type name: str
+        :return: The wrapper.
+        :rtype: Callable[..., Any]
+        """
+        record = cls._record_method
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(name, perf_counter_ns() - start, True)
+                raise
+            record(name, perf_counter_ns() - start, False)
+            return result
+
+        return wrapper
+
+    @classmethod
+    def _wrap_validator(cls, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """
+        Create a wrapper counting the calls of a flag validator and the values it rejects.
+
+        :param func: The validator to be wrapped.
+        :type func: Callable[..., Any]
+        :param name: The qualified name under which calls are recorded.
+        :type name: str
+        :return: The wrapper.
+        :rtype: Callable[..., Any]
+        """
+        record = cls._record_validator
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                result = func(*args, **kwargs)
+            except ValueError:
+                record(name, True)
+                raise
+            record(name, False)
+            return result
+
+        return wrapper
@@ -38,6 +38,8 @@ matching language tags, and merging LangString objects.
 Modules:
     controller: Provides control flags that influence the behavior of the LangString class.
     flags: Defines the LangStringFlag class with various control flags for the LangString class.
+    text_pool: Provides the TextPool class, used to share equal texts when enabled.
+    utils.lru_cache: Provides the LRUCache class used by the opt-in flyweight cache.
     utils.validators: Provides validation methods used within the LangString class.
 """
 
@@ -45,11 +47,15 @@ from typing import Any
 from typing import Iterable
 from typing import Iterator
 from typing import Optional
+from typing import SupportsIndex
 from typing import Union
 
 
 from .controller import Controller
 from .flags import LangStringFlag
+from .text_pool import TextPool
+from .utils.lru_cache import CacheInfo
+from .utils.lru_cache import LRUCache
 from .utils.validators import FlagValidator
 from .utils.validators import TypeValidator
 
@@ -73,8 +79,18 @@ class LangString:
     :vartype lang: str
     :raises ValueError: If control flags enforce non-empty text and the text is empty.
     :raises TypeError: If the types of parameters are incorrect based on validation.
+    :cvar DEFAULT_FLYWEIGHT_CACHE_SIZE: The default maximum number of entries of the flyweight cache.
+    :vartype DEFAULT_FLYWEIGHT_CACHE_SIZE: int
     """
 
+    DEFAULT_FLYWEIGHT_CACHE_SIZE: int = 65536
+
+    # The opt-in cache of frozen LangStrings, mapping (text, lang, flags version) to a frozen LangString. None when
+    # disabled.
+    _flyweight_cache: Optional[LRUCache["LangString"]] = None
+    # True only for the frozen LangStrings created by `flyweight`, which may be shared and cannot be modified
+    _frozen: bool = False
+
     def __init__(self, text: str = "", lang: str = "") -> None:
         """
         Initialize a new LangString object with text and an optional language tag.
@@ -114,16 +130,19 @@ class LangString:
         Set the text string.
 
         If the provided text is None, it defaults to an empty string.
-        This method also validates the type and the text based on control flags.
+        This method also validates the type and the text based on control flags. If the `TextPool` is enabled, the
+        stored text is the pooled string equal to the validated text.
 
         :param new_text: The new text string.
         :type new_text: Optional[str]
         :raises TypeError: If the new text is not of type str or None.
         :raises ValueError: If the control flags enforce non-empty text and the new text is empty.
+        :raises AttributeError: If the LangString is frozen.
         """
+        self._check_not_frozen()
         TypeValidator.validate_type_single(new_text, str, optional=True)
         new_text = new_text or ""
-        self._text = FlagValidator.validate_flags_text(LangStringFlag, new_text)
+        self._text = TextPool.intern(FlagValidator.validate_flags_text(LangStringFlag, new_text))
 
     @property
     def lang(self) -> str:
@@ -147,11 +166,25 @@ class LangString:
         :type new_lang: Optional[str]
         :raises TypeError: If the new language tag is not of type str or None.
         :raises ValueError: If the control flags enforce valid language tags and the new language tag is invalid.
+        :raises AttributeError: If the LangString is frozen.
         """
+        self._check_not_frozen()
         TypeValidator.validate_type_single(new_lang, str, optional=True)
         new_lang = new_lang or ""
         self._lang = FlagValidator.validate_flags_lang(LangStringFlag, new_lang)
 
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Check whether the LangString is frozen, i.e., its text and language tag cannot be modified.
+
+        Only the LangStrings returned by `flyweight` are frozen. Copies of a frozen LangString are not frozen.
+
+        :return: True if the LangString is frozen, otherwise False.
+        :rtype: bool
+        """
+        return self._frozen
+
     # ---------------------------------------------
     # Overwritten String's Built-in Regular Methods
     # ---------------------------------------------
@@ -171,7 +204,7 @@ class LangString:
             >>> capitalized_lang_str = lang_str.capitalize()
             >>> print(capitalized_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString(self.text.capitalize(), self.lang)
+        return LangString._from_validated(self.text.capitalize(), self.lang)
 
     def casefold(self) -> "LangString":
         """
@@ -188,7 +221,7 @@ class LangString:
             >>> casefolded_lang_str = lang_str.casefold()
             >>> print(casefolded_lang_str)  # Output: "hello, world!"@en
         """
-        return LangString(self.text.casefold(), self.lang)
+        return LangString._from_validated(self.text.casefold(), self.lang)
 
     def center(self, width: int, fillchar: str = " ") -> "LangString":
         """
@@ -211,7 +244,7 @@ class LangString:
             >>> centered_lang_str = lang_str.center(11, "*")
             >>> print(centered_lang_str)  # Output: "***hello***"@en
         """
-        return LangString(self.text.center(width, fillchar), self.lang)
+        return LangString._from_validated(self.text.center(width, fillchar), self.lang)
 
     def count(self, sub: str, start: int = 0, end: Optional[int] = None) -> int:
         """
@@ -276,7 +309,7 @@ class LangString:
             >>> expanded_lang_str = lang_str.expandtabs(4)
             >>> print(expanded_lang_str)  # Output: "hello   world"@en
         """
-        return LangString(self.text.expandtabs(tabsize), self.lang)
+        return LangString._from_validated(self.text.expandtabs(tabsize), self.lang)
 
     def find(self, sub: str, start: int = 0, end: Optional[int] = None) -> int:
         """
@@ -320,7 +353,7 @@ class LangString:
             >>> formatted_lang_str = lang_str.format("world")
             >>> print(formatted_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString(self.text.format(*args, **kwargs), self.lang)
+        return LangString._from_validated(self.text.format(*args, **kwargs), self.lang)
 
     def format_map(self, mapping: dict[Any, Any]) -> "LangString":
         """
@@ -342,7 +375,7 @@ class LangString:
         """
         TypeValidator.validate_type_single(mapping, dict)
 
-        return LangString(self.text.format_map(mapping), self.lang)
+        return LangString._from_validated(self.text.format_map(mapping), self.lang)
 
     def index(self, sub: str, start: int = 0, end: Optional[int] = None) -> int:
         """
@@ -638,7 +671,7 @@ class LangString:
             >>> print(joined_lang_str)  # Output: "Hello, world"@en
         """
         joined_text = self.text.join(iterable)
-        return LangString(joined_text, self.lang)
+        return LangString._from_validated(joined_text, self.lang)
 
     def ljust(self, width: int, fillchar: str = " ") -> "LangString":
         """
@@ -662,7 +695,7 @@ class LangString:
             >>> print(left_justified_lang_str)  # Output: "hello*****"@en
         """
         justified_text = self.text.ljust(width, fillchar)
-        return LangString(justified_text, self.lang)
+        return LangString._from_validated(justified_text, self.lang)
 
     def lower(self) -> "LangString":
         """
@@ -679,7 +712,7 @@ class LangString:
             >>> lower_lang_str = lang_str.lower()
             >>> print(lower_lang_str)  # Output: "hello, world!"@en
         """
-        return LangString(self.text.lower(), self.lang)
+        return LangString._from_validated(self.text.lower(), self.lang)
 
     def lstrip(self, chars: Optional[str] = None) -> "LangString":
         """
@@ -703,7 +736,7 @@ class LangString:
             >>> stripped_lang_str = lang_str.lstrip(".")
             >>> print(stripped_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString(self.text.lstrip(chars), self.lang)
+        return LangString._from_validated(self.text.lstrip(chars), self.lang)
 
     def partition(self, sep: str) -> tuple["LangString", "LangString", "LangString"]:
         """
@@ -727,7 +760,11 @@ class LangString:
             >>> print(after)   # Output: "world!"@en
         """
         before, sep, after = self.text.partition(sep)
-        return LangString(before, self.lang), LangString(sep, self.lang), LangString(after, self.lang)
+        return (
+            LangString._from_validated(before, self.lang),
+            LangString._from_validated(sep, self.lang),
+            LangString._from_validated(after, self.lang),
+        )
 
     def replace(self, old: str, new: str, count: int = -1) -> "LangString":
         """
@@ -754,7 +791,7 @@ class LangString:
             >>> replaced_lang_str = lang_str.replace("ab", "cd", 2)
             >>> print(replaced_lang_str)  # Output: "cdcdabab"@en
         """
-        return LangString(self.text.replace(old, new, count), self.lang)
+        return LangString._from_validated(self.text.replace(old, new, count), self.lang)
 
     def removeprefix(self, prefix: str) -> "LangString":
         """
@@ -780,7 +817,7 @@ class LangString:
             >>> removed_prefix_lang_str = lang_str.removeprefix("Goodbye, ")
             >>> print(removed_prefix_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString((self.text).removeprefix(prefix), self.lang)
+        return LangString._from_validated((self.text).removeprefix(prefix), self.lang)
 
     def removesuffix(self, suffix: str) -> "LangString":
         """
@@ -806,7 +843,7 @@ class LangString:
             >>> removed_suffix_lang_str = lang_str.removesuffix("planet")
             >>> print(removed_suffix_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString((self.text).removesuffix(suffix), self.lang)
+        return LangString._from_validated((self.text).removesuffix(suffix), self.lang)
 
     def rfind(self, sub: str, start: int = 0, end: Optional[int] = None) -> int:
         """
@@ -889,7 +926,7 @@ class LangString:
             >>> print(right_justified_lang_str)  # Output: "*****hello"@en
         """
         justified_text = self.text.rjust(width, fillchar)
-        return LangString(justified_text, self.lang)
+        return LangString._from_validated(justified_text, self.lang)
 
     def rpartition(self, sep: str) -> tuple["LangString", "LangString", "LangString"]:
         """
@@ -913,7 +950,11 @@ class LangString:
             >>> print(after)   # Output: ", universe!"@en
         """
         before, sep, after = self.text.rpartition(sep)
-        return LangString(before, self.lang), LangString(sep, self.lang), LangString(after, self.lang)
+        return (
+            LangString._from_validated(before, self.lang),
+            LangString._from_validated(sep, self.lang),
+            LangString._from_validated(after, self.lang),
+        )
 
     def rsplit(self, sep: Optional[str] = None, maxsplit: int = -1) -> list["LangString"]:
         """
@@ -950,7 +991,7 @@ class LangString:
             >>> #         "three"@en
         """
         split_texts = self.text.rsplit(sep, maxsplit)
-        return [LangString(part, self.lang) for part in split_texts]
+        return [LangString._from_validated(part, self.lang) for part in split_texts]
 
     def rstrip(self, chars: Optional[str] = None) -> "LangString":
         """
@@ -974,7 +1015,7 @@ class LangString:
             >>> stripped_lang_str = lang_str.rstrip("!")
             >>> print(stripped_lang_str)  # Output: "Hello, world"@en
         """
-        return LangString(self.text.rstrip(chars), self.lang)
+        return LangString._from_validated(self.text.rstrip(chars), self.lang)
 
     def split(self, sep: Optional[str] = None, maxsplit: int = -1) -> list["LangString"]:
         """
@@ -1010,7 +1051,7 @@ class LangString:
             >>> #         "three"@en
         """
         split_texts = self.text.split(sep, maxsplit)
-        return [LangString(part, self.lang) for part in split_texts]
+        return [LangString._from_validated(part, self.lang) for part in split_texts]
 
     @TypeValidator.validate_type_decorator
     def splitlines(self, keepends: bool = False) -> list["LangString"]:
@@ -1038,7 +1079,7 @@ class LangString:
             # Output: [LangString(text='Hello\n', lang='en'), LangString(text='world', lang='en')]
         """
         lines = self.text.splitlines(keepends)
-        return [LangString(line, self.lang) for line in lines]
+        return [LangString._from_validated(line, self.lang) for line in lines]
 
     def startswith(self, prefix: str, start: int = 0, end: Optional[int] = None) -> bool:
         """
@@ -1089,7 +1130,7 @@ class LangString:
             >>> stripped_lang_str = lang_str.strip("*")
             >>> print(stripped_lang_str)  # Output: "Hello, world!"@en
         """
-        return LangString(self.text.strip(chars), self.lang)
+        return LangString._from_validated(self.text.strip(chars), self.lang)
 
     def swapcase(self) -> "LangString":
         """
@@ -1106,7 +1147,7 @@ class LangString:
             >>> swapcase_lang_str = lang_str.swapcase()
             >>> print(swapcase_lang_str)  # Output: "hELLO, world!"@en
         """
-        return LangString(self.text.swapcase(), self.lang)
+        return LangString._from_validated(self.text.swapcase(), self.lang)
 
     def title(self) -> "LangString":
         """
@@ -1124,7 +1165,7 @@ class LangString:
             >>> title_lang_str = lang_str.title()
             >>> print(title_lang_str)  # Output: "Hello World"@en
         """
-        return LangString(self.text.title(), self.lang)
+        return LangString._from_validated(self.text.title(), self.lang)
 
     def translate(self, table: dict[int, str]) -> "LangString":
         """
@@ -1144,7 +1185,7 @@ class LangString:
             >>> translated_lang_str = lang_str.translate(translation_table)
             >>> print(translated_lang_str) # Output: "h2ll4 w4rld"@en
         """
-        return LangString(self.text.translate(table), self.lang)
+        return LangString._from_validated(self.text.translate(table), self.lang)
 
     def upper(self) -> "LangString":
         """
@@ -1161,7 +1202,7 @@ class LangString:
             >>> upper_lang_str = lang_str.upper()
             >>> print(upper_lang_str)  # Output: "HELLO WORLD"@en
         """
-        return LangString(self.text.upper(), self.lang)
+        return LangString._from_validated(self.text.upper(), self.lang)
 
     def zfill(self, width: int) -> "LangString":
         """
@@ -1180,7 +1221,7 @@ class LangString:
             >>> zfilled_lang_str = lang_str.zfill(5)
             >>> print(zfilled_lang_str)  # Output: "00042"@en
         """
-        return LangString(self.text.zfill(width), self.lang)
+        return LangString._from_validated(self.text.zfill(width), self.lang)
 
     # ---------------------------------------------
     # LangString's Regular Methods
@@ -1295,10 +1336,10 @@ class LangString:
         self._validate_match_langs(other)
 
         if isinstance(other, LangString):
-            return LangString(self.text + other.text, self.lang)
+            return LangString._from_validated(self.text + other.text, self.lang)
 
         # No need to check 'isinstance(other, str)' as type validation assures that
-        return LangString(self.text + other, self.lang)
+        return LangString._from_validated(self.text + other, self.lang)
 
     @TypeValidator.validate_type_decorator
     def __contains__(self, item: str) -> bool:
@@ -1321,6 +1362,40 @@ class LangString:
         """
         return item in self.text
 
+    def __copy__(self) -> "LangString":
+        """
+        Create a shallow copy of the LangString.
+
+        The copy is created directly from the already validated text and language tag, which are not validated again.
+        This method is used by `copy.copy`.
+
+        :return: A new LangString with the same text and language tag.
+        :rtype: LangString
+
+        **Example**::
+
+            >>> lang_str = LangString("Hello", "en")
+            >>> copied_lang_str = copy.copy(lang_str)
+            >>> print(copied_lang_str == lang_str, copied_lang_str is lang_str)  # Output: True False
+        """
+        return self.__class__._from_state(self._text, self._lang)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "LangString":
+        """
+        Create a deep copy of the LangString.
+
+        As the text and the language tag are immutable strings, the deep copy is created exactly as the shallow copy,
+        without validating them again. This method is used by `copy.deepcopy`.
+
+        :param memo: The dictionary of objects already copied during the current copying pass.
+        :type memo: dict[int, Any]
+        :return: A new LangString with the same text and language tag.
+        :rtype: LangString
+        """
+        new_langstring = self.__copy__()
+        memo[id(self)] = new_langstring
+        return new_langstring
+
     def __eq__(self, other: object) -> bool:
         """
         Check equality of this LangString with another object.
@@ -1413,10 +1488,10 @@ class LangString:
         if isinstance(key, slice):
             # Handle slicing
             sliced_text = self.text[key]
-            return LangString(sliced_text, self.lang)
+            return LangString._from_validated(sliced_text, self.lang)
 
         # Handle single index access
-        return LangString(self.text[key], self.lang)
+        return LangString._from_validated(self.text[key], self.lang)
 
     def __gt__(self, other: object) -> bool:
         """
@@ -1637,7 +1712,7 @@ class LangString:
             >>> multiplied_lang_str = lang_str * 3
             >>> print(multiplied_lang_str)  # Output: "hellohellohello"@en
         """
-        return LangString(self.text * other, self.lang)
+        return LangString._from_validated(self.text * other, self.lang)
 
     @TypeValidator.validate_type_decorator
     def __radd__(self, other: str) -> str:
@@ -1662,6 +1737,20 @@ class LangString:
         """
         return other + self.text
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """
+        Support pickling by rebuilding the LangString from its already validated text and language tag.
+
+        Unpickling does not validate the text and the language tag again, which avoids the validation cost when, e.g.,
+        transferring LangStrings between processes.
+
+        :param protocol: The pickle protocol version.
+        :type protocol: SupportsIndex
+        :return: A tuple with the function used to rebuild the LangString and its arguments.
+        :rtype: tuple[Any, ...]
+        """
+        return self.__class__._from_state, (self._text, self._lang)
+
     def __repr__(self) -> str:
         """
         Return an unambiguous string representation of the LangString.
@@ -1696,7 +1785,7 @@ class LangString:
             >>> multiplied_lang_str = 3 * lang_str
             >>> print(multiplied_lang_str)  # Output: "hellohellohello"@en
         """
-        return LangString(self.text * other, self.lang)
+        return LangString._from_validated(self.text * other, self.lang)
 
     def __str__(self) -> str:
         """
@@ -1718,6 +1807,100 @@ class LangString:
 
         return text_representation + lang_representation
 
+    # ---------------------------------------------
+    # Flyweight Cache Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def clear_flyweight_cache(cls) -> None:
+        """
+        Remove all entries of the flyweight cache and reset its statistics. Nothing is done if the cache is disabled.
+        """
+        if cls._flyweight_cache is not None:
+            cls._flyweight_cache.clear()
+
+    @classmethod
+    def disable_flyweight_cache(cls) -> None:
+        """
+        Disable the flyweight cache, discarding its entries. LangStrings already returned remain frozen.
+        """
+        cls._flyweight_cache = None
+
+    @classmethod
+    def enable_flyweight_cache(cls, maxsize: Optional[int] = None) -> None:
+        """
+        Enable a new, empty flyweight cache for `flyweight`.
+
+        While the cache is enabled, `flyweight` returns the same frozen LangString for repeated texts and language
+        tags, and the methods that export many LangStrings from the other classes (`MultiLangString.get_langstring`,
+        `MultiLangString.to_langstrings`, and `SetLangString.to_langstrings`) return frozen LangStrings obtained from
+        `flyweight` instead of new LangStrings. Entries are keyed by the text, the language tag, and the version of the
+        Controller flags, so a change of flags never returns a LangString validated with the previous flags. The cache
+        belongs to the current process.
+
+        :param maxsize: The maximum number of cached LangStrings. Defaults to DEFAULT_FLYWEIGHT_CACHE_SIZE.
+        :type maxsize: Optional[int]
+        :raises TypeError: If maxsize is not an integer.
+        :raises ValueError: If maxsize is not positive.
+
+        **Example**::
+
+            >>> LangString.enable_flyweight_cache(maxsize=100000)
+            >>> mls = MultiLangString({"en": {"Hello"}})
+            >>> print(mls.to_langstrings()[0] is mls.to_langstrings()[0])  # Output: True
+        """
+        TypeValidator.validate_type_single(maxsize, int, optional=True)
+        cls._flyweight_cache = LRUCache(cls.DEFAULT_FLYWEIGHT_CACHE_SIZE if maxsize is None else maxsize)
+
+    @classmethod
+    def flyweight(cls, text: str = "", lang: str = "") -> "LangString":
+        """
+        Get a frozen LangString with the given text and language tag, shared with other callers if possible.
+
+        The result is equal to `LangString(text, lang)`, but frozen: setting its text or language tag raises an
+        AttributeError, so it can be safely shared. If the flyweight cache is enabled (see `enable_flyweight_cache`),
+        the same instance is returned for the same text and language tag while the flags are unchanged. Otherwise, a
+        new frozen LangString is returned. Use `copy.copy` to obtain a LangString that can be modified.
+
+        :param text: The text string.
+        :type text: str
+        :param lang: The language tag of the text.
+        :type lang: str
+        :return: A frozen LangString.
+        :rtype: LangString
+        :raises TypeError: If the provided text or lang is not a string.
+        :raises ValueError: If the enabled flags reject the text or the language tag.
+
+        **Example**::
+
+            >>> LangString.enable_flyweight_cache()
+            >>> print(LangString.flyweight("Hello", "en") is LangString.flyweight("Hello", "en"))  # Output: True
+            >>> LangString.flyweight("Hello", "en").text = "Hi"  # Raises AttributeError
+        """
+        cache = cls._flyweight_cache
+        if cache is None:
+            new_langstring = cls(text, lang)
+            new_langstring._frozen = True
+            return new_langstring
+
+        key = (text, lang, Controller.get_flags_version())
+        cached = cache.get(key)
+        if cached is None:
+            cached = cls(text, lang)
+            cached._frozen = True
+            cache.put(key, cached)
+        return cached
+
+    @classmethod
+    def get_flyweight_cache_info(cls) -> Optional[CacheInfo]:
+        """
+        Get the statistics of the flyweight cache.
+
+        :return: The hits, misses, maximum size, and current size of the cache, or None if the cache is disabled.
+        :rtype: Optional[CacheInfo]
+        """
+        return None if cls._flyweight_cache is None else cls._flyweight_cache.info()
+
     # ---------------------------------------------
     # Static Methods
     # ---------------------------------------------
@@ -1803,6 +1986,63 @@ class LangString:
     # Private Methods
     # ---------------------------------------------
 
+    def _check_not_frozen(self) -> None:
+        """
+        Ensure that the LangString can be modified.
+
+        :raises AttributeError: If the LangString is frozen.
+        """
+        if self._frozen:
+            raise AttributeError(
+                "Cannot modify a frozen LangString, which may be shared. Use 'copy.copy' to obtain a modifiable copy."
+            )
+
+    @classmethod
+    def _from_state(cls, text: str, lang: str) -> "LangString":
+        """
+        Create a LangString from the internal state of an existing LangString, without any check or validation.
+
+        This is the construction path used when copying and unpickling LangStrings.
+
+        :param text: The already validated text string.
+        :type text: str
+        :param lang: The already validated language tag.
+        :type lang: str
+        :return: The new LangString.
+        :rtype: LangString
+        """
+        new_langstring = cls.__new__(cls)
+        new_langstring._text = text
+        new_langstring._lang = lang
+        return new_langstring
+
+    @classmethod
+    def _from_validated(cls, text: str, lang: str) -> "LangString":
+        """
+        Create a LangString from a text and a language tag that are known to be strings, skipping redundant checks.
+
+        This is the construction path used by the methods that derive new LangStrings from existing ones. The types of
+        the arguments are not checked, and the flag validations are only performed when a flag that may transform or
+        reject the values is enabled, so the result is always the same as the one of the public constructor. As in the
+        constructor, the text is pooled if the `TextPool` is enabled.
+
+        :param text: The text string.
+        :type text: str
+        :param lang: The language tag of the text.
+        :type lang: str
+        :return: The new LangString.
+        :rtype: LangString
+        :raises ValueError: If the enabled flags reject the text or the language tag.
+        """
+        new_langstring = cls.__new__(cls)
+        if FlagValidator.text_flags_enabled(LangStringFlag):
+            text = FlagValidator.validate_flags_text(LangStringFlag, text)
+        if FlagValidator.lang_flags_enabled(LangStringFlag):
+            lang = FlagValidator.validate_flags_lang(LangStringFlag, lang)
+        new_langstring._text = TextPool.intern(text)
+        new_langstring._lang = lang
+        return new_langstring
+
     @TypeValidator.validate_type_decorator
     def _validate_match_types(self, other: Union[object, str, "LangString"], overwrite_strict: bool = False) -> None:
         """
@@ -0,0 +1,448 @@
+"""
+A columnar container for large collections of language-tagged texts.
+
+Holding millions of `LangString` objects in a list costs one Python object and two string objects per item. A
+`LangStringBatch` stores the same information in columns: all texts are concatenated in a single string buffer,
+delimited by an array of offsets, and languages are stored as small integer codes into a shared table of language
+tags. The per-item overhead is thus reduced to a few bytes, and operations such as filtering by language or casefolding
+language tags are performed once per distinct tag instead of once per item.
+
+The texts and language tags stored in a batch are validated and transformed according to the `LangStringFlag` flags,
+exactly as when creating `LangString` objects. All operations return new batches, leaving the original one unchanged.
+Conversions between batches and `LangString`, `SetLangString`, and `MultiLangString` objects are provided by the
+`Converter` class.
+
+Key Features:
+    - **Compact Storage**: Texts are kept in one contiguous buffer with an offsets array, and languages as integer
+      codes into a table of distinct tags.
+    - **Batch Operations**: Filtering by language, casefolding languages, stripping texts, and removing duplicates are
+      applied to the whole batch at once.
+    - **Consistent Semantics**: Language comparisons are case-insensitive and duplicates are merged as in
+      `LangString.merge_langstrings`.
+
+Classes:
+    - **LangStringBatch**: A columnar container of texts and their language tags.
+
+**Example**::
+
+    >>> batch = LangStringBatch(["Hello", "Bonjour", "Hi"], ["en", "fr", "EN"])
+    >>> print(batch.filter_by_lang("en").get_texts())  # Output: ['Hello', 'Hi']
+    >>> print(batch.casefold_langs().get_tags())  # Output: ['en', 'fr']
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from .flags import LangStringFlag
+from .langstring import LangString
+from .utils.validators import FlagValidator
+from .utils.validators import TypeValidator
+
+
+class LangStringBatch:
+    """
+    A columnar container of texts and their language tags.
+
+    Each item of the batch corresponds to a LangString, and indexing or iterating over a batch produces LangString
+    objects. Internally, the texts are stored in a single string buffer and each item's language is stored as an
+    integer code referring to a table of distinct language tags.
+
+    :ivar _buffer: The concatenation of all texts of the batch.
+    :vartype _buffer: str
+    :ivar _offsets: The start position of each text in the buffer, followed by the buffer's length.
+    :vartype _offsets: array
+    :ivar _codes: The code of each item's language tag, i.e., its position in the tag table.
+    :vartype _codes: array
+    :ivar _tags: The table of distinct language tags used by the batch.
+    :vartype _tags: list[str]
+
+    **Example**::
+
+        >>> batch = LangStringBatch(["Hello", "Hello", "Bonjour"], ["en", "EN", "fr"])
+        >>> print(len(batch.dedupe()))  # Output: 2
+        >>> print(batch[2])  # Output: "Bonjour"@fr
+    """
+
+    __slots__ = ("_buffer", "_offsets", "_codes", "_tags")
+
+    def __init__(self, texts: Optional[list[str]] = None, langs: Optional[list[str]] = None) -> None:
+        """
+        Initialize a new LangStringBatch with the given texts and their corresponding language tags.
+
+        Texts and language tags are validated and transformed according to the `LangStringFlag` flags. Each distinct
+        language tag is validated only once.
+
+        :param texts: The texts of the batch. Defaults to None, creating an empty batch.
+        :type texts: Optional[list[str]]
+        :param langs: The language tags of the texts, in the same order. Defaults to None, creating an empty batch.
+        :type langs: Optional[list[str]]
+        :raises TypeError: If texts or langs are not lists of strings.
+        :raises ValueError: If texts and langs have different lengths or if a text or tag violates the enabled flags.
+        """
+        texts = [] if texts is None else texts
+        langs = [] if langs is None else langs
+        TypeValidator.validate_type_iterable(texts, list, str)
+        TypeValidator.validate_type_iterable(langs, list, str)
+        if len(texts) != len(langs):
+            raise ValueError(
+                f"Invalid batch columns. The number of texts ({len(texts)}) differs from the number of "
+                f"language tags ({len(langs)})."
+            )
+
+        validated_texts = [FlagValidator.validate_flags_text(LangStringFlag, text) for text in texts]
+
+        raw_codes: dict[str, int] = {}
+        tag_codes: dict[str, int] = {}
+        codes = []
+        for lang in langs:
+            code = raw_codes.get(lang)
+            if code is None:
+                tag = FlagValidator.validate_flags_lang(LangStringFlag, lang)
+                code = tag_codes.setdefault(tag, len(tag_codes))
+                raw_codes[lang] = code
+            codes.append(code)
+
+        self._set_columns(validated_texts, codes, list(tag_codes))
+
+    # ---------------------------------------------
+    # Getters
+    # ---------------------------------------------
+
+    def get_lang(self, index: int) -> str:
+        """
+        Return the language tag of the item at the given position.
+
+        :param index: The position of the item.
+        :type index: int
+        :return: The language tag of the item.
+        :rtype: str
+        :raises IndexError: If the index is out of range.
+        """
+        return self._tags[self._codes[self._normalize_index(index)]]
+
+    def get_langs(self) -> list[str]:
+        """
+        Return the language tags of all items, in order.
+
+        :return: A list with the language tag of each item.
+        :rtype: list[str]
+        """
+        tags = self._tags
+        return [tags[code] for code in self._codes]
+
+    def get_tags(self) -> list[str]:
+        """
+        Return the table of distinct language tags used by the batch, in order of first appearance.
+
+        :return: A list of distinct language tags.
+        :rtype: list[str]
+        """
+        return self._tags.copy()
+
+    def get_text(self, index: int) -> str:
+        """
+        Return the text of the item at the given position.
+
+        :param index: The position of the item.
+        :type index: int
+        :return: The text of the item.
+        :rtype: str
+        :raises IndexError: If the index is out of range.
+        """
+        index = self._normalize_index(index)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._buffer[start:end]
+
+    def get_texts(self) -> list[str]:
+        """
+        Return the texts of all items, in order.
+
+        :return: A list with the text of each item.
+        :rtype: list[str]
+        """
+        buffer = self._buffer
+        return [buffer[start:end] for start, end in zip(self._offsets, self._offsets[1:])]
+
+    # ---------------------------------------------
+    # Batch Operations
+    # ---------------------------------------------
+
+    def casefold_langs(self) -> "LangStringBatch":
+        """
+        Return a new batch whose language tags are casefolded.
+
+        Only the tag table is transformed, so the cost of this operation does not depend on the number of distinct
+        texts. Tags that become equal after casefolding share the same code in the new batch.
+
+        :return: A new LangStringBatch with casefolded language tags.
+        :rtype: LangStringBatch
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Hi"], ["EN", "en"])
+            >>> print(batch.casefold_langs().get_langs())  # Output: ['en', 'en']
+        """
+        tag_codes: dict[str, int] = {}
+        new_codes = [tag_codes.setdefault(tag.casefold(), len(tag_codes)) for tag in self._tags]
+        codes = array("I", (new_codes[code] for code in self._codes))
+        return self._from_columns(self._buffer, self._offsets, codes, list(tag_codes))
+
+    def dedupe(self) -> "LangStringBatch":
+        """
+        Return a new batch without duplicated items, keeping the first occurrence of each item.
+
+        Items are duplicated if they have the same text and the same casefolded language tag. When duplicates use
+        different casings of the same tag, the casefolded tag is used, as in `LangString.merge_langstrings`.
+
+        :return: A new LangStringBatch without duplicates.
+        :rtype: LangStringBatch
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Hello", "Hi"], ["en", "EN", "en"])
+            >>> print(batch.dedupe().get_langs())  # Output: ['en', 'en']
+        """
+        folded_tags = [tag.casefold() for tag in self._tags]
+        merged_langs: dict[tuple[str, str], str] = {}
+
+        for text, code in zip(self.get_texts(), self._codes):
+            key = (text, folded_tags[code])
+            if key not in merged_langs:
+                merged_langs[key] = self._tags[code]
+            elif merged_langs[key] != self._tags[code]:
+                merged_langs[key] = key[1]
+
+        return self._from_pairs([text for text, _ in merged_langs], list(merged_langs.values()))
+
+    def filter_by_lang(self, lang: str) -> "LangStringBatch":
+        """
+        Return a new batch with the items whose language tag matches the given one, case-insensitively.
+
+        The comparison is performed once per distinct tag and then applied to the items' codes.
+
+        :param lang: The language tag to keep.
+        :type lang: str
+        :return: A new LangStringBatch with the matching items, in their original order.
+        :rtype: LangStringBatch
+        :raises TypeError: If lang is not a string.
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["Hello", "Bonjour", "Hi"], ["en", "fr", "EN"])
+            >>> print(batch.filter_by_lang("en").get_texts())  # Output: ['Hello', 'Hi']
+        """
+        TypeValidator.validate_type_single(lang, str)
+        folded_lang = lang.casefold()
+        matching_codes = {code for code, tag in enumerate(self._tags) if tag.casefold() == folded_lang}
+        return self._take([index for index, code in enumerate(self._codes) if code in matching_codes])
+
+    def strip_texts(self, chars: Optional[str] = None) -> "LangStringBatch":
+        """
+        Return a new batch whose texts have the leading and trailing characters removed.
+
+        The stripped texts are validated and transformed according to the `LangStringFlag` flags, as the texts of a new
+        batch are.
+
+        :param chars: The set of characters to remove. If None (default), whitespace characters are removed.
+        :type chars: Optional[str]
+        :return: A new LangStringBatch with stripped texts.
+        :rtype: LangStringBatch
+        :raises TypeError: If chars is not a string or None.
+        :raises ValueError: If a stripped text is empty and `LangStringFlag.DEFINED_TEXT` is enabled.
+
+        **Example**::
+
+            >>> batch = LangStringBatch(["  Hello ", "Hi  "], ["en", "en"])
+            >>> print(batch.strip_texts().get_texts())  # Output: ['Hello', 'Hi']
+        """
+        TypeValidator.validate_type_single(chars, str, optional=True)
+        texts = [text.strip(chars) for text in self.get_texts()]
+        if FlagValidator.text_flags_enabled(LangStringFlag):
+            texts = [FlagValidator.validate_flags_text(LangStringFlag, text) for text in texts]
+        return self._from_texts(texts, self._codes, self._tags)
+
+    # ---------------------------------------------
+    # Overwritten Dunder Methods
+    # ---------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check equality of this batch with another batch.
+
+        Two batches are equal if they have the same texts and the same language tags, in the same order. Language tags
+        are compared exactly, as the order and casing of the items is part of the batch's content.
+
+        :param other: Another object to compare with.
+        :type other: object
+        :return: True if the other object is a LangStringBatch with the same items, otherwise False.
+        :rtype: bool
+        """
+        if not isinstance(other, LangStringBatch):
+            return NotImplemented
+        return (
+            self._buffer == other._buffer and self._offsets == other._offsets and self.get_langs() == other.get_langs()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[LangString, "LangStringBatch"]:
+        """
+        Return the item at the given position as a LangString, or a new batch for a slice.
+
+        :param key: The position of the item or a slice of positions.
+        :type key: Union[int, slice]
+        :return: A LangString for an integer key, or a LangStringBatch for a slice.
+        :rtype: Union[LangString, LangStringBatch]
+        :raises IndexError: If the index is out of range.
+        :raises TypeError: If the key is not an integer or a slice.
+        """
+        if isinstance(key, slice):
+            return self._take(range(len(self._codes))[key])
+        TypeValidator.validate_type_single(key, int)
+        return LangString._from_validated(self.get_text(key), self.get_lang(key))
+
+    def __iter__(self) -> Iterator[LangString]:
+        """
+        Iterate over the items of the batch as LangStrings.
+
+        :return: An iterator over the LangStrings.
+        :rtype: Iterator[LangString]
+        """
+        tags = self._tags
+        for text, code in zip(self.get_texts(), self._codes):
+            yield LangString._from_validated(text, tags[code])
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the batch.
+
+        :return: The number of items.
+        :rtype: int
+        """
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        """
+        Return the official string representation of the batch.
+
+        :return: The representation of the batch's texts and language tags.
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(texts={self.get_texts()!r}, langs={self.get_langs()!r})"
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def _from_columns(
+        cls, buffer: str, offsets: "array[int]", codes: "array[int]", tags: list[str]
+    ) -> "LangStringBatch":
+        """
+        Create a batch from already validated columns, without validation.
+
+        :param buffer: The concatenation of all texts.
+        :type buffer: str
+        :param offsets: The offsets of the texts in the buffer.
+        :type offsets: array[int]
+        :param codes: The code of each item's language tag.
+        :type codes: array[int]
+        :param tags: The tag table referred by the codes.
+        :type tags: list[str]
+        :return: The new batch.
+        :rtype: LangStringBatch
+        """
+        batch = cls.__new__(cls)
+        batch._buffer = buffer
+        batch._offsets = offsets
+        batch._codes = codes
+        batch._tags = tags
+        return batch
+
+    @classmethod
+    def _from_pairs(cls, texts: list[str], tags: list[str]) -> "LangStringBatch":
+        """
+        Create a batch from already validated texts and their language tags, without validation.
+
+        :param texts: The texts of the items.
+        :type texts: list[str]
+        :param tags: The language tag of each item.
+        :type tags: list[str]
+        :return: The new batch.
+        :rtype: LangStringBatch
+        """
+        tag_codes: dict[str, int] = {}
+        codes = [tag_codes.setdefault(tag, len(tag_codes)) for tag in tags]
+        batch = cls.__new__(cls)
+        batch._set_columns(texts, codes, list(tag_codes))
+        return batch
+
+    @classmethod
+    def _from_texts(cls, texts: list[str], codes: Iterable[int], tags: list[str]) -> "LangStringBatch":
+        """
+        Create a batch from already validated texts and the codes of an existing tag table, without validation.
+
+        Tags that are not used by any item are removed from the table.
+
+        :param texts: The texts of the items.
+        :type texts: list[str]
+        :param codes: The code of each item's language tag in the given table.
+        :type codes: Iterable[int]
+        :param tags: The tag table referred by the codes.
+        :type tags: list[str]
+        :return: The new batch.
+        :rtype: LangStringBatch
+        """
+        remap: dict[int, int] = {}
+        new_codes = [remap.setdefault(code, len(remap)) for code in codes]
+        batch = cls.__new__(cls)
+        batch._set_columns(texts, new_codes, [tags[code] for code in remap])
+        return batch
+
+    def _normalize_index(self, index: int) -> int:
+        """
+        Convert a possibly negative index into a non-negative one, checking its range.
+
+        :param index: The index to normalize.
+        :type index: int
+        :return: The non-negative index.
+        :rtype: int
+        :raises IndexError: If the index is out of range.
+        """
+        size = len(self._codes)
+        if not -size <= index < size:
+            raise IndexError(f"Batch index '{index}' out of range for a batch with {size} items.")
+        return index + size if index < 0 else index
+
+    def _set_columns(self, texts: list[str], codes: list[int], tags: list[str]) -> None:
+        """
+        Set the columns of the batch from the given texts, tag codes, and tag table.
+
+        :param texts: The texts of the items.
+        :type texts: list[str]
+        :param codes: The code of each item's language tag.
+        :type codes: list[int]
+        :param tags: The tag table.
+        :type tags: list[str]
+        """
+        self._buffer = "".join(texts)
+        self._offsets = array("Q", accumulate(map(len, texts), initial=0))
+        self._codes = array("I", codes)
+        self._tags = tags
+
+    def _take(self, indices: Iterable[int]) -> "LangStringBatch":
+        """
+        Create a batch with the items at the given positions, without validation.
+
+        :param indices: The positions of the items to take, in the desired order.
+        :type indices: Iterable[int]
+        :return: The new batch.
+        :rtype: LangStringBatch
+        """
+        indices = list(indices)
+        texts = [self.get_text(index) for index in indices]
+        return self._from_texts(texts, (self._codes[index] for index in indices), self._tags)
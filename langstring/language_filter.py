@@ -0,0 +1,296 @@
+"""
+Filtering of language tags by a priority list of language ranges across collections of `MultiLangString` objects.
+
+Serving labels for an `Accept-Language` header means matching the same ranges against the languages of many objects.
+`MultiLangString.get_langs_matching` prepares the ranges for each object. A `LanguageRangeFilter` prepares them once,
+and remembers the result of each distinct language tag, so an object whose languages were all seen before is filtered
+with one dictionary lookup per language.
+
+Key Features:
+    - **Compiled Ranges**: The ranges are casefolded and split into subtags once, when the filter is created.
+    - **Memoization**: Each distinct tag is parsed and matched against the ranges only once per filter.
+    - **Streaming**: The matching `SetLangString` or `LangString` objects of a collection are yielded one object at a
+      time, so results can be paginated or serialized without building them all.
+    - **Accept-Language**: Filters can be created directly from the value of an HTTP `Accept-Language` header.
+
+Classes:
+    - **LanguageRangeFilter**: A priority list of language ranges, compiled for repeated matching.
+
+**Example**::
+
+    >>> language_filter = LanguageRangeFilter.from_accept_language("pt-BR, pt;q=0.9, en;q=0.5")
+    >>> concepts = [MultiLangString({"en": {"Dog"}, "pt-BR": {"Cachorro"}}), MultiLangString({"pt-PT": {"Cão"}})]
+    >>> print(list(language_filter.iter_setlangstrings(concepts)))
+    # Output: [SetLangString(texts={'Cachorro'}, lang='pt-BR'), SetLangString(texts={'Dog'}, lang='en'),
+    #          SetLangString(texts={'Cão'}, lang='pt-PT')]
+"""
+
+from operator import itemgetter
+from typing import Iterable
+from typing import Iterator
+
+from .langstring import LangString
+from .language_tag import LanguageTag
+from .multilangstring import MultiLangString
+from .setlangstring import SetLangString
+from .utils.validators import TypeValidator
+
+
+class LanguageRangeFilter:
+    """
+    A priority list of language ranges, compiled for matching many language tags.
+
+    Tags are matched following RFC 4647 filtering (see `LanguageTag.matches`), and the matching tags are ordered by the
+    first range they match. The result of each distinct tag is kept by the filter; when `MAX_MEMO_SIZE` tags are kept,
+    the results are discarded and computed again when needed. A filter is meant to be shared by the processing of a
+    request or a batch, not modified: its ranges cannot be changed.
+
+    :cvar MAX_MEMO_SIZE: The maximum number of tags whose result is kept.
+    :vartype MAX_MEMO_SIZE: int
+
+    **Example**::
+
+        >>> language_filter = LanguageRangeFilter(["zh-Hant-*", "en"])
+        >>> print(language_filter.filter_langs(["en-GB", "zh-Hans", "zh-Hant-HK", "en"]))
+        # Output: ['zh-Hant-HK', 'en-GB', 'en']
+    """
+
+    MAX_MEMO_SIZE: int = 65536
+
+    def __init__(self, language_ranges: list[str], extended: bool = True) -> None:
+        """
+        Initialize a new LanguageRangeFilter.
+
+        :param language_ranges: The language ranges, from the most to the least preferred.
+        :type language_ranges: list[str]
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to True.
+        :type extended: bool
+        :raises TypeError: If language_ranges is not a list of strings, or if extended is not a bool.
+        """
+        TypeValidator.validate_type_iterable(language_ranges, list, str)
+        TypeValidator.validate_type_single(extended, bool)
+        self._language_ranges = list(language_ranges)
+        self._extended = extended
+        self._ranges = [language_range.casefold() for language_range in language_ranges]
+        self._ranges_subtags = [language_range.split("-") for language_range in self._ranges]
+        # For each tag, the position of the first range it matches, or -1 if it matches none
+        self._positions: dict[str, int] = {}
+
+    # ---------------------------------------------
+    # Getters
+    # ---------------------------------------------
+
+    @property
+    def extended(self) -> bool:
+        """
+        Get whether extended filtering is used instead of basic filtering.
+
+        :return: True for extended filtering, False for basic filtering.
+        :rtype: bool
+        """
+        return self._extended
+
+    @property
+    def language_ranges(self) -> list[str]:
+        """
+        Get the language ranges, from the most to the least preferred.
+
+        :return: A copy of the ranges, as given.
+        :rtype: list[str]
+        """
+        return list(self._language_ranges)
+
+    # ---------------------------------------------
+    # Matching Methods
+    # ---------------------------------------------
+
+    def filter_langs(self, langs: Iterable[str]) -> list[str]:
+        """
+        Select the language tags matching any range.
+
+        The tags are ordered by the first range they match, and keep their original order among the tags matching the
+        same range. As iterating over a `MultiLangString` yields its languages, a `MultiLangString` can be given
+        directly.
+
+        :param langs: The language tags.
+        :type langs: Iterable[str]
+        :return: The matching tags, as given.
+        :rtype: list[str]
+        :raises TypeError: If a tag is not a string.
+
+        **Example**::
+
+            >>> language_filter = LanguageRangeFilter(["fr", "en"])
+            >>> print(language_filter.filter_langs(MultiLangString({"en": {"Hi"}, "fr-CA": {"Salut"}})))
+            # Output: ['fr-CA', 'en']
+        """
+        positions = self._positions
+        matched = []
+        for lang in langs:
+            position = positions.get(lang)
+            if position is None:
+                position = self._compute_position(lang)
+            if position >= 0:
+                matched.append((position, lang))
+        if len(matched) > 1:
+            matched.sort(key=itemgetter(0))
+        return [lang for _, lang in matched]
+
+    def iter_langstrings(self, multilangstrings: Iterable[MultiLangString]) -> Iterator[LangString]:
+        """
+        Yield a LangString for each text of the matching languages of each MultiLangString, in order.
+
+        The languages of each MultiLangString are selected and ordered as done by `filter_langs`. If the flyweight cache
+        of LangString is enabled (see `LangString.enable_flyweight_cache`), the yielded LangStrings are shared, frozen
+        ones.
+
+        :param multilangstrings: The MultiLangStrings.
+        :type multilangstrings: Iterable[MultiLangString]
+        :return: An iterator over the LangStrings.
+        :rtype: Iterator[LangString]
+        :raises TypeError: If an element is not a MultiLangString.
+
+        **Example**::
+
+            >>> language_filter = LanguageRangeFilter(["en"])
+            >>> print(list(language_filter.iter_langstrings([MultiLangString({"en-US": {"Hi"}, "fr": {"Salut"}})])))
+            # Output: [LangString(text='Hi', lang='en-US')]
+        """
+        for multilangstring in multilangstrings:
+            TypeValidator.validate_type_single(multilangstring, MultiLangString)
+            mls_dict = multilangstring._mls_dict
+            use_flyweight = LangString._flyweight_cache is not None
+            for lang in self.filter_langs(mls_dict):
+                for text in mls_dict[lang]:
+                    yield LangString.flyweight(text, lang) if use_flyweight else LangString._from_validated(text, lang)
+
+    def iter_setlangstrings(self, multilangstrings: Iterable[MultiLangString]) -> Iterator[SetLangString]:
+        """
+        Yield a SetLangString for each matching language of each MultiLangString, in order.
+
+        The languages of each MultiLangString are selected and ordered as done by `filter_langs`. The yielded
+        SetLangStrings are equal to the ones returned by `MultiLangString.get_setlangstrings_matching`, and independent
+        from the MultiLangStrings.
+
+        :param multilangstrings: The MultiLangStrings.
+        :type multilangstrings: Iterable[MultiLangString]
+        :return: An iterator over the SetLangStrings.
+        :rtype: Iterator[SetLangString]
+        :raises TypeError: If an element is not a MultiLangString.
+
+        **Example**::
+
+            >>> language_filter = LanguageRangeFilter(["zh-Hant-*"])
+            >>> print(list(language_filter.iter_setlangstrings([MultiLangString({"zh-Hant-TW": {"貓"}})])))
+            # Output: [SetLangString(texts={'貓'}, lang='zh-Hant-TW')]
+        """
+        for multilangstring in multilangstrings:
+            TypeValidator.validate_type_single(multilangstring, MultiLangString)
+            mls_dict = multilangstring._mls_dict
+            for lang in self.filter_langs(mls_dict):
+                yield SetLangString._from_validated(set(mls_dict[lang]), lang)
+
+    def matches(self, lang: str) -> bool:
+        """
+        Check whether a language tag matches any range.
+
+        :param lang: The language tag.
+        :type lang: str
+        :return: True if the tag matches a range, otherwise False.
+        :rtype: bool
+        :raises TypeError: If lang is not a string.
+
+        **Example**::
+
+            >>> print(LanguageRangeFilter(["de-DE"]).matches("de-Latn-DE"))  # Output: True
+        """
+        position = self._positions.get(lang)
+        if position is None:
+            position = self._compute_position(lang)
+        return position >= 0
+
+    # ---------------------------------------------
+    # Static Methods
+    # ---------------------------------------------
+
+    @classmethod
+    def from_accept_language(cls, header: str, extended: bool = False) -> "LanguageRangeFilter":
+        """
+        Create a filter from the value of an HTTP `Accept-Language` header.
+
+        The ranges are ordered by decreasing quality value ("q"), keeping their order in the header for equal values.
+        Ranges with a quality value of 0, which are not acceptable, and entries with malformed quality values (not
+        numbers from 0 to 1) or with other parameters are ignored. As HTTP language ranges are basic ranges, basic
+        filtering is used by default.
+
+        :param header: The value of the header (e.g., "fr-CH, fr;q=0.9, en;q=0.8, *;q=0.5").
+        :type header: str
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to False.
+        :type extended: bool
+        :return: The new filter.
+        :rtype: LanguageRangeFilter
+        :raises TypeError: If header is not a string, or if extended is not a bool.
+
+        **Example**::
+
+            >>> language_filter = LanguageRangeFilter.from_accept_language("en;q=0.5, fr-CH, fr;q=0.9")
+            >>> print(language_filter.language_ranges)  # Output: ['fr-CH', 'fr', 'en']
+        """
+        TypeValidator.validate_type_single(header, str)
+        weighted_ranges: list[tuple[float, str]] = []
+        for entry in header.split(","):
+            language_range, _, parameters = entry.partition(";")
+            language_range = language_range.strip()
+            if not language_range:
+                continue
+            quality = 1.0
+            parameter_name, _, value = parameters.partition("=")
+            if parameter_name.strip().casefold() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    continue
+                # Also rejects nan, which fails all comparisons
+                if not 0 <= quality <= 1:
+                    continue
+            elif parameters.strip():
+                continue
+            if quality > 0:
+                weighted_ranges.append((quality, language_range))
+        weighted_ranges.sort(key=itemgetter(0), reverse=True)
+        return cls([language_range for _, language_range in weighted_ranges], extended=extended)
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    def _compute_position(self, lang: str) -> int:
+        """
+        Match a language tag against the ranges and keep the result.
+
+        :param lang: The language tag.
+        :type lang: str
+        :return: The position of the first range matched by the tag, or -1 if it matches none.
+        :rtype: int
+        :raises TypeError: If lang is not a string.
+        """
+        position = LanguageTag._first_match(
+            self._ranges, self._ranges_subtags, LanguageTag.parse(lang).tag, self._extended
+        )
+        if len(self._positions) >= self.MAX_MEMO_SIZE:
+            self._positions.clear()
+        self._positions[lang] = -1 if position is None else position
+        return self._positions[lang]
+
+    # ---------------------------------------------
+    # Overwritten Dunder Methods
+    # ---------------------------------------------
+
+    def __repr__(self) -> str:
+        """
+        Return the official string representation of the LanguageRangeFilter.
+
+        :return: The representation, with the ranges and the filtering scheme.
+        :rtype: str
+        """
+        return f"{self.__class__.__name__}(language_ranges={self._language_ranges!r}, extended={self._extended!r})"
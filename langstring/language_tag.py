@@ -0,0 +1,381 @@
+"""
+Parsed BCP 47 language tags, with the filtering and lookup matching schemes of RFC 4647.
+
+Language tags are otherwise compared by casefolded equality only. Selecting, e.g., all the Traditional Chinese texts
+(`zh-Hant-*`) or the texts in the base language of `pt-BR` requires the structure of the tags. `LanguageTag.parse`
+splits a tag into its subtags once, and keeps the result in a bounded cache, so parsing the same tag again is a single
+lookup.
+
+Key Features:
+    - **Structured Tags**: The language, extended language, script, region, variant, and extension subtags of a tag are
+      identified by their position and form, as defined by BCP 47 (RFC 5646).
+    - **Cached Parsing**: Each distinct tag is parsed once, as long as it stays in the least-recently-used cache.
+    - **RFC 4647 Matching**: Basic and extended filtering, which select all the tags matching a language range, and
+      lookup, which selects the single best tag for a priority list of ranges.
+    - **Lenient**: Malformed tags are parsed without raising, the subtags that cannot be identified being kept as
+      extensions. Use the `VALID_LANG` flags to reject invalid tags.
+
+Classes:
+    - **LanguageTag**: A parsed language tag, with the matching methods.
+
+**Example**::
+
+    >>> tag = LanguageTag.parse("zh-Hant-TW")
+    >>> print(tag.language, tag.script, tag.region)  # Output: zh hant tw
+    >>> print(tag.matches("zh-Hant-*"))  # Output: True
+    >>> print(LanguageTag.lookup(["pt-BR", "en"], ["en-US", "pt"]))  # Output: pt
+"""
+
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+
+from .utils.lru_cache import CacheInfo
+from .utils.lru_cache import LRUCache
+from .utils.validators import TypeValidator
+
+
+class LanguageTag(NamedTuple):
+    """
+    A language tag parsed into its BCP 47 subtags.
+
+    As language tags are case-insensitive in this library, the tag and all its subtags are casefolded. Subtags that are
+    absent are empty strings or empty tuples. Instances are created by `LanguageTag.parse`, which caches them.
+
+    :ivar tag: The whole casefolded tag.
+    :vartype tag: str
+    :ivar language: The primary language subtag (e.g., "zh").
+    :vartype language: str
+    :ivar extlangs: The extended language subtags (e.g., ("yue",) for "zh-yue").
+    :vartype extlangs: tuple[str, ...]
+    :ivar script: The script subtag (e.g., "hant").
+    :vartype script: str
+    :ivar region: The region subtag (e.g., "tw" or "419").
+    :vartype region: str
+    :ivar variants: The variant subtags (e.g., ("1996",) for "de-DE-1996").
+    :vartype variants: tuple[str, ...]
+    :ivar extensions: The remaining subtags, starting with the first extension or private use singleton, or with the
+                      first subtag that could not be identified.
+    :vartype extensions: tuple[str, ...]
+
+    **Example**::
+
+        >>> print(LanguageTag.parse("sr-Latn-RS"))
+        # Output: LanguageTag(tag='sr-latn-rs', language='sr', extlangs=(), script='latn', region='rs', variants=(),
+        #                     extensions=())
+    """
+
+    tag: str
+    language: str
+    extlangs: tuple[str, ...]
+    script: str
+    region: str
+    variants: tuple[str, ...]
+    extensions: tuple[str, ...]
+
+    # ---------------------------------------------
+    # Matching Methods
+    # ---------------------------------------------
+
+    def matches(self, language_range: str, extended: bool = True) -> bool:
+        """
+        Check whether the tag matches a language range, following RFC 4647 filtering.
+
+        With basic filtering (section 3.3.1), the range matches the tags equal to it or starting with it followed by
+        "-", and the range "*" matches every tag. Extended filtering (section 3.3.2) also accepts wildcard subtags
+        ("*") anywhere in the range and lets the tag have additional subtags between the ones of the range, so, e.g.,
+        "de-DE" matches "de-Latn-DE", and "zh-*-TW" matches "zh-Hant-TW". The comparison is case-insensitive.
+
+        :param language_range: The language range.
+        :type language_range: str
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to True.
+        :type extended: bool
+        :return: True if the tag matches the range, otherwise False.
+        :rtype: bool
+        :raises TypeError: If language_range is not a string.
+
+        **Example**::
+
+            >>> print(LanguageTag.parse("de-Latn-DE").matches("de-DE"))  # Output: True
+            >>> print(LanguageTag.parse("de-Latn-DE").matches("de-DE", extended=False))  # Output: False
+        """
+        TypeValidator.validate_type_single(language_range, str)
+        language_range = language_range.casefold()
+        if extended:
+            return LanguageTag._matches_extended(language_range.split("-"), self.tag.split("-"))
+        return LanguageTag._matches_basic(language_range, self.tag)
+
+    @property
+    def subtags(self) -> tuple[str, ...]:
+        """
+        Get all the subtags of the tag, in order.
+
+        :return: The casefolded subtags.
+        :rtype: tuple[str, ...]
+        """
+        return tuple(self.tag.split("-"))
+
+    # ---------------------------------------------
+    # Static Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """
+        Remove all parsed tags from the cache and reset its statistics.
+        """
+        _parse_cache.clear()
+
+    @staticmethod
+    def filter(language_ranges: list[str], tags: Iterable[str], extended: bool = True) -> list[str]:
+        """
+        Select the tags matching any range of a priority list, following RFC 4647 filtering.
+
+        The tags are ordered by the first range they match, and keep their original order among the tags matching the
+        same range. Each tag is returned as given, without being casefolded.
+
+        :param language_ranges: The language ranges, from the most to the least preferred.
+        :type language_ranges: list[str]
+        :param tags: The candidate language tags.
+        :type tags: Iterable[str]
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to True.
+        :type extended: bool
+        :return: The matching tags.
+        :rtype: list[str]
+        :raises TypeError: If language_ranges is not a list of strings.
+
+        **Example**::
+
+            >>> print(LanguageTag.filter(["fr", "en-*"], ["en", "fr-CA", "en-GB", "de"]))
+            # Output: ['fr-CA', 'en', 'en-GB']
+        """
+        TypeValidator.validate_type_iterable(language_ranges, list, str)
+        return LanguageTag._filter_parsed(language_ranges, ((tag, LanguageTag.parse(tag)) for tag in tags), extended)
+
+    @staticmethod
+    def get_parse_cache_info() -> CacheInfo:
+        """
+        Get the statistics of the cache of parsed tags.
+
+        :return: The hits, misses, maximum size, and current size of the cache.
+        :rtype: CacheInfo
+        """
+        return _parse_cache.info()
+
+    @staticmethod
+    def lookup(language_ranges: list[str], tags: Iterable[str], default: Optional[str] = None) -> Optional[str]:
+        """
+        Select the single tag best matching a priority list of ranges, following RFC 4647 lookup (section 3.4).
+
+        Each range, in order, is compared to the tags. If no tag is equal to it, its last subtag is removed (together
+        with a preceding single-character subtag), and the comparison is repeated until a tag is found or the range is
+        empty. Wildcard subtags ("*") are ignored. The comparison is case-insensitive.
+
+        :param language_ranges: The language ranges, from the most to the least preferred.
+        :type language_ranges: list[str]
+        :param tags: The candidate language tags.
+        :type tags: Iterable[str]
+        :param default: The value returned if no tag matches. Defaults to None.
+        :type default: Optional[str]
+        :return: The best matching tag, as given, or the default value.
+        :rtype: Optional[str]
+        :raises TypeError: If language_ranges is not a list of strings or default is not a string or None.
+
+        **Example**::
+
+            >>> print(LanguageTag.lookup(["zh-Hant-CN-x-private1", "en"], ["zh", "zh-Hant", "en"]))  # Output: zh-Hant
+        """
+        TypeValidator.validate_type_iterable(language_ranges, list, str)
+        TypeValidator.validate_type_single(default, str, optional=True)
+        available: dict[str, str] = {}
+        for tag in tags:
+            available.setdefault(tag.casefold(), tag)
+        for language_range in language_ranges:
+            subtags = [subtag for subtag in language_range.casefold().split("-") if subtag != "*"]
+            while subtags:
+                found = available.get("-".join(subtags))
+                if found is not None:
+                    return found
+                subtags.pop()
+                if subtags and len(subtags[-1]) == 1:
+                    subtags.pop()
+        return default
+
+    @staticmethod
+    def parse(tag: str) -> "LanguageTag":
+        """
+        Parse a language tag into its subtags, or return the cached result of a previous parsing.
+
+        :param tag: The language tag.
+        :type tag: str
+        :return: The parsed tag.
+        :rtype: LanguageTag
+        :raises TypeError: If tag is not a string.
+
+        **Example**::
+
+            >>> tag = LanguageTag.parse("en-GB-oxendict")
+            >>> print(tag.region, tag.variants)  # Output: gb ('oxendict',)
+        """
+        parsed = _parse_cache.get(tag)
+        if parsed is None:
+            TypeValidator.validate_type_single(tag, str)
+            parsed = LanguageTag._parse_uncached(tag)
+            _parse_cache.put(tag, parsed)
+        return parsed
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def _filter_parsed(
+        language_ranges: list[str], parsed_tags: Iterable[tuple[str, "LanguageTag"]], extended: bool
+    ) -> list[str]:
+        """
+        Select the tags matching any range of a priority list, as `filter` does, from already parsed tags.
+
+        :param language_ranges: The language ranges, from the most to the least preferred.
+        :type language_ranges: list[str]
+        :param parsed_tags: The candidate tags, as given, each with its parsed tag.
+        :type parsed_tags: Iterable[tuple[str, LanguageTag]]
+        :param extended: Whether to use extended filtering instead of basic filtering.
+        :type extended: bool
+        :return: The matching tags, as given.
+        :rtype: list[str]
+        """
+        ranges = [language_range.casefold() for language_range in language_ranges]
+        ranges_subtags = [language_range.split("-") for language_range in ranges]
+        matched: list[list[str]] = [[] for _ in ranges]
+        for tag, parsed in parsed_tags:
+            position = LanguageTag._first_match(ranges, ranges_subtags, parsed.tag, extended)
+            if position is not None:
+                matched[position].append(tag)
+        return [tag for tags_of_range in matched for tag in tags_of_range]
+
+    @staticmethod
+    def _first_match(ranges: list[str], ranges_subtags: list[list[str]], tag: str, extended: bool) -> Optional[int]:
+        """
+        Find the first range of a priority list matched by a tag, following RFC 4647 filtering.
+
+        :param ranges: The casefolded language ranges.
+        :type ranges: list[str]
+        :param ranges_subtags: The subtags of each range.
+        :type ranges_subtags: list[list[str]]
+        :param tag: The casefolded language tag.
+        :type tag: str
+        :param extended: Whether to use extended filtering instead of basic filtering.
+        :type extended: bool
+        :return: The position of the first matching range, or None if no range matches.
+        :rtype: Optional[int]
+        """
+        if extended:
+            tag_subtags = tag.split("-")
+            for position, range_subtags in enumerate(ranges_subtags):
+                if LanguageTag._matches_extended(range_subtags, tag_subtags):
+                    return position
+        else:
+            for position, language_range in enumerate(ranges):
+                if LanguageTag._matches_basic(language_range, tag):
+                    return position
+        return None
+
+    @staticmethod
+    def _matches_basic(language_range: str, tag: str) -> bool:
+        """
+        Apply the basic filtering algorithm of RFC 4647 (section 3.3.1) to a casefolded range and tag.
+
+        :param language_range: The casefolded language range.
+        :type language_range: str
+        :param tag: The casefolded language tag.
+        :type tag: str
+        :return: True if the tag matches the range, otherwise False.
+        :rtype: bool
+        """
+        return language_range == "*" or tag == language_range or tag.startswith(language_range + "-")
+
+    @staticmethod
+    def _matches_extended(range_subtags: list[str], tag_subtags: list[str]) -> bool:
+        """
+        Apply the extended filtering algorithm of RFC 4647 (section 3.3.2) to casefolded subtags.
+
+        :param range_subtags: The subtags of the language range.
+        :type range_subtags: list[str]
+        :param tag_subtags: The subtags of the language tag.
+        :type tag_subtags: list[str]
+        :return: True if the tag matches the range, otherwise False.
+        :rtype: bool
+        """
+        if range_subtags[0] != "*" and range_subtags[0] != tag_subtags[0]:
+            return False
+        tag_position = 1
+        for range_subtag in range_subtags[1:]:
+            if range_subtag == "*":
+                continue
+            while True:
+                if tag_position >= len(tag_subtags):
+                    return False
+                tag_subtag = tag_subtags[tag_position]
+                if tag_subtag == range_subtag:
+                    tag_position += 1
+                    break
+                if len(tag_subtag) == 1:
+                    return False
+                tag_position += 1
+        return True
+
+    @staticmethod
+    def _parse_uncached(tag: str) -> "LanguageTag":
+        """
+        Parse a language tag into its subtags.
+
+        :param tag: The language tag.
+        :type tag: str
+        :return: The parsed tag.
+        :rtype: LanguageTag
+        """
+        folded = tag.casefold()
+        subtags = folded.split("-")
+        count = len(subtags)
+        language = subtags[0]
+        position = 1
+        extlangs: list[str] = []
+        script = ""
+        region = ""
+        variants: list[str] = []
+
+        if len(language) > 1:
+            while (
+                position < count and len(extlangs) < 3 and len(subtags[position]) == 3 and subtags[position].isalpha()
+            ):
+                extlangs.append(subtags[position])
+                position += 1
+            if position < count and len(subtags[position]) == 4 and subtags[position].isalpha():
+                script = subtags[position]
+                position += 1
+            if position < count and (
+                (len(subtags[position]) == 2 and subtags[position].isalpha())
+                or (len(subtags[position]) == 3 and subtags[position].isdigit())
+            ):
+                region = subtags[position]
+                position += 1
+            while position < count and subtags[position].isalnum() and subtags[position].isascii():
+                subtag = subtags[position]
+                if not (5 <= len(subtag) <= 8 or (len(subtag) == 4 and subtag[0].isdigit())):
+                    break
+                variants.append(subtag)
+                position += 1
+
+        return LanguageTag(
+            tag=folded,
+            language=language,
+            extlangs=tuple(extlangs),
+            script=script,
+            region=region,
+            variants=tuple(variants),
+            extensions=tuple(subtags[position:]) if position < count else (),
+        )
+
+
+# The cache of parsed tags, keyed by the tags as given
+_parse_cache: LRUCache[LanguageTag] = LRUCache(65536)
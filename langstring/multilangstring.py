@@ -32,18 +32,34 @@ Modules:
     controller: Provides control flags that influence the behavior of the MultiLangString class.
     flags: Defines the MultiLangStringFlag class with various control flags for the MultiLangString class.
     langstring: Provides the LangString class used within the MultiLangString class.
+    language_tag: Provides the LanguageTag class, used to match languages against language ranges.
     setlangstring: Provides the SetLangString class used within the MultiLangString class.
+    setlangstring_view: Provides the SetLangStringView class, a read-only live view of a language's texts.
+    text_pool: Provides the TextPool class, used to share equal texts when enabled.
+    utils.grouping: Provides the row grouping used to build many MultiLangStrings at once.
+    utils.sorted_text_set: Provides the sorted storage used for texts when the SORTED_TEXTS flag is enabled.
     utils.validators: Provides validation methods used within the MultiLangString class.
 """
 
+from heapq import merge
+from typing import Any
+from typing import Callable
+from typing import Hashable
 from typing import Iterator
 from typing import Optional
+from typing import SupportsIndex
 from typing import Union
 
 from .controller import Controller
 from .flags import MultiLangStringFlag
+from .flags import SetLangStringFlag
 from .langstring import LangString
+from .language_tag import LanguageTag
 from .setlangstring import SetLangString
+from .setlangstring_view import SetLangStringView
+from .text_pool import TextPool
+from .utils.grouping import RowGrouper
+from .utils.sorted_text_set import SortedTextSet
 from .utils.validators import FlagValidator
 from .utils.validators import TypeValidator
 
@@ -69,6 +85,11 @@ class MultiLangString:
     :vartype pref_lang: str
     """
 
+    # False only for objects created by `from_trusted_dict` whose content was not validated yet
+    _validated: bool = True
+    # The parsed tags of the languages, created by the first matching against language ranges
+    _lang_index: Optional[dict[str, LanguageTag]] = None
+
     def __init__(self, mls_dict: Optional[dict[str, set[str]]] = None, pref_lang: Optional[str] = "en") -> None:
         """
         Initialize a MultiLangString object with an optional dictionary and preferred language.
@@ -85,6 +106,7 @@ class MultiLangString:
         :type pref_lang: Optional[str]
         :raises TypeError: If mls_dict is not a dictionary or pref_lang is not a string.
         """
+        self._shared_langs: set[str] = set()
         self.mls_dict: Optional[dict[str, set[str]]] = mls_dict if mls_dict is not None else {}
         self.pref_lang: Optional[str] = pref_lang if pref_lang is not None else "en"
 
@@ -97,9 +119,16 @@ class MultiLangString:
         """
         Get the dictionary representing the internal structure of the MultiLangString.
 
+        As the returned dictionary and sets may be modified by the caller, any set still shared with another
+        MultiLangString (see `_writable_texts`) is copied before the dictionary is returned.
+
         :return: The dictionary where keys are language codes and values are sets of text entries.
         :rtype: dict[str, set[str]]
         """
+        for lang in list(self._shared_langs):
+            if lang in self._mls_dict:
+                self._writable_texts(lang)
+        self._shared_langs.clear()
         return self._mls_dict
 
     @mls_dict.setter
@@ -108,7 +137,8 @@ class MultiLangString:
         Set the dictionary representing the internal structure of the MultiLangString.
 
         Ensures keys are strings and values are sets of strings. Validates and merges entries with case-insensitive
-        language keys, and validates the texts in the merged dictionary.
+        language keys, and validates the texts in the merged dictionary. If the `TextPool` is enabled, the stored texts
+        are the pooled strings equal to the validated texts.
 
         :param in_mls_dict: A dictionary where keys are language codes and values are sets of text entries.
         :type in_mls_dict: Optional[dict[str, set[str]]]
@@ -128,13 +158,14 @@ class MultiLangString:
         temp_dict: dict[str, set[str]] = {}
         for lang, texts in new_mls_dict.items():
             validated_key = FlagValidator.validate_flags_lang(MultiLangStringFlag, lang)
-            temp_dict[validated_key] = set()
+            temp_dict[validated_key] = self._new_texts_set()
             # Validating texts inside the dict's values
             for text in texts:
                 validated_value = FlagValidator.validate_flags_text(MultiLangStringFlag, text)
-                temp_dict[validated_key].add(validated_value)
+                temp_dict[validated_key].add(TextPool.intern(validated_value))
 
         self._mls_dict = temp_dict
+        self._shared_langs = set()
 
     @property
     def pref_lang(self) -> str:
@@ -231,10 +262,10 @@ class MultiLangString:
         registered_lang = self._get_registered_lang(validated_lang)
 
         if registered_lang is None:
-            self.mls_dict[validated_lang] = set()
-            self.mls_dict[validated_lang].add(validated_text)
-        else:
-            self.mls_dict[registered_lang].add(validated_text)
+            self._mls_dict[validated_lang] = self._new_texts_set()
+            self._mls_dict[validated_lang].add(validated_text)
+        elif validated_text not in self._mls_dict[registered_lang]:
+            self._writable_texts(registered_lang).add(validated_text)
 
     @TypeValidator.validate_type_decorator
     def add_text_in_pref_lang(self, text: str) -> None:
@@ -308,9 +339,9 @@ class MultiLangString:
             >>> mls1.add_multilangstring(mls2)
             >>> print(mls1)  # Output: {'Hello'}@en, {'Bonjour'}@fr
         """
-        for lang in multilangstring.mls_dict:
+        for lang in multilangstring._mls_dict:
             self.add_empty_lang(lang)
-            for text in multilangstring.mls_dict[lang]:
+            for text in multilangstring._mls_dict[lang]:
                 self.add_entry(text=text, lang=lang)
 
     @TypeValidator.validate_type_decorator
@@ -332,7 +363,7 @@ class MultiLangString:
         validated_lang = FlagValidator.validate_flags_lang(MultiLangStringFlag, lang)
         registered_lang = self._get_registered_lang(validated_lang)
         if registered_lang is None:
-            self.mls_dict[validated_lang] = set()
+            self._mls_dict[validated_lang] = self._new_texts_set()
 
     # ----- DISCARD METHODS -----
 
@@ -405,10 +436,10 @@ class MultiLangString:
         """
         registered_lang = self._get_registered_lang(lang)
 
-        if registered_lang in self.mls_dict and text in self.mls_dict[registered_lang]:
-            self.mls_dict[registered_lang].remove(text)
-            if len(self.mls_dict[registered_lang]) == 0 and clean_empty:
-                del self.mls_dict[registered_lang]
+        if registered_lang in self._mls_dict and text in self._mls_dict[registered_lang]:
+            self._writable_texts(registered_lang).remove(text)
+            if len(self._mls_dict[registered_lang]) == 0 and clean_empty:
+                del self._mls_dict[registered_lang]
 
     @TypeValidator.validate_type_decorator
     def discard_text_in_pref_lang(self, text: str, clean_empty: bool = False) -> None:
@@ -481,7 +512,8 @@ class MultiLangString:
             >>> mls.discard_setlangstring(set_lang_str, clean_empty=True)
             >>> print(mls)  # Output: {}@en
         """
-        for text in setlangstring.texts:
+        # Iterate over a snapshot, as the texts may be a live view of this MultiLangString
+        for text in list(setlangstring.texts):
             self.discard_entry(text=text, lang=setlangstring.lang, clean_empty=clean_empty)
 
     @TypeValidator.validate_type_decorator
@@ -507,8 +539,8 @@ class MultiLangString:
             >>> mls.discard_multilangstring(mls_to_discard, clean_empty=True)
             >>> print(mls)  # Output: {}
         """
-        for lang in multilangstring.mls_dict:
-            for text in list(multilangstring.mls_dict[lang]):
+        for lang in multilangstring._mls_dict:
+            for text in list(multilangstring._mls_dict[lang]):
                 self.discard_entry(text=text, lang=lang, clean_empty=clean_empty)
 
     @TypeValidator.validate_type_decorator
@@ -531,7 +563,7 @@ class MultiLangString:
         """
         registered_lang = self._get_registered_lang(lang)
         if registered_lang is not None:
-            del self.mls_dict[registered_lang]
+            del self._mls_dict[registered_lang]
 
     # ----- REMOVE METHODS -----
 
@@ -678,7 +710,8 @@ class MultiLangString:
             >>> mls.remove_setlangstring(set_lang_str, clean_empty=True)
             >>> print(mls)  # Output: {}@en
         """
-        for text in setlangstring.texts:
+        # Iterate over a snapshot, as the texts may be a live view of this MultiLangString
+        for text in list(setlangstring.texts):
             self.remove_entry(text, setlangstring.lang, clean_empty)
 
     @TypeValidator.validate_type_decorator
@@ -704,8 +737,8 @@ class MultiLangString:
             >>> mls.remove_multilangstring(mls_to_remove, clean_empty=True)
             >>> print(mls)  # Output: {}
         """
-        for lang in multilangstring.mls_dict:
-            for text in multilangstring.mls_dict[lang]:
+        for lang in multilangstring._mls_dict:
+            for text in multilangstring._mls_dict[lang]:
                 self.remove_entry(text=text, lang=lang, clean_empty=clean_empty)
 
     @TypeValidator.validate_type_decorator
@@ -728,7 +761,7 @@ class MultiLangString:
         """
         registered_lang = self._get_registered_lang(lang)
         if registered_lang is not None:
-            del self.mls_dict[registered_lang]
+            del self._mls_dict[registered_lang]
         else:
             raise ValueError(f"Lang '{lang}' not found in the MultiLangString.")
 
@@ -744,9 +777,9 @@ class MultiLangString:
             >>> mls.remove_empty_langs()
             >>> print(mls)  # Output: {'Hello'}@en
         """
-        empty_langs = [lang for lang, text in self.mls_dict.items() if not text]
+        empty_langs = [lang for lang, text in self._mls_dict.items() if not text]
         for lang in empty_langs:
-            del self.mls_dict[lang]
+            del self._mls_dict[lang]
 
     # ----- CONVERSION METHODS -----
 
@@ -794,13 +827,13 @@ class MultiLangString:
             print_lang = Controller.get_flag(MultiLangStringFlag.PRINT_WITH_LANG)
 
         strings = []
-        selected_langs = langs if (langs is not None) else list(self.mls_dict.keys())
+        selected_langs = langs if (langs is not None) else list(self._mls_dict.keys())
 
         for lang in selected_langs:
             registered_lang = self._get_registered_lang(lang)
 
             if registered_lang is not None:
-                for text in self.mls_dict[registered_lang]:
+                for text in self._mls_dict[registered_lang]:
                     new_text = f'"{text}"' if print_quotes else text
                     new_lang = f"{separator}{lang}" if print_lang else ""
                     strings.append(f"{new_text}{new_lang}")
@@ -811,7 +844,9 @@ class MultiLangString:
         """
         Convert the MultiLangString to a list of LangString objects.
 
-        This method converts the text entries of the MultiLangString into a list of LangString objects.
+        This method converts the text entries of the MultiLangString into a list of LangString objects. If the
+        flyweight cache of LangString is enabled (see `LangString.enable_flyweight_cache`), the LangStrings are shared,
+        frozen ones.
 
         :param langs: A list of languages to include in the output. If None, includes all languages.
         :type langs: Optional[list[str]]
@@ -834,7 +869,7 @@ class MultiLangString:
         langstrings = []
         self_reg_langs = []
 
-        selected_langs = self.mls_dict.keys() if (langs is None) else langs
+        selected_langs = self._mls_dict.keys() if (langs is None) else langs
 
         for selected_lang in selected_langs:
             reg_lang = self._get_registered_lang(selected_lang)
@@ -842,7 +877,7 @@ class MultiLangString:
                 self_reg_langs.append(reg_lang)
 
         for lang in self_reg_langs:
-            for text in self.mls_dict[lang]:
+            for text in self._mls_dict[lang]:
                 langstrings.append(self.get_langstring(text, lang))
 
         return langstrings
@@ -873,7 +908,7 @@ class MultiLangString:
         setlangstrings = []
         self_reg_langs = []
 
-        selected_langs = self.mls_dict.keys() if (langs is None) else langs
+        selected_langs = self._mls_dict.keys() if (langs is None) else langs
 
         for selected_lang in selected_langs:
             reg_lang = self._get_registered_lang(selected_lang)
@@ -885,6 +920,38 @@ class MultiLangString:
 
         return setlangstrings
 
+    def to_setlangstring_views(self, langs: Optional[list[str]] = None) -> list[SetLangStringView]:
+        """
+        Create read-only live views of the texts of the MultiLangString's languages, without copying them.
+
+        This method is the zero-copy counterpart of `to_setlangstrings`. Each view reflects any later change to the
+        texts of its language. See `get_setlangstring_view`.
+
+        :param langs: A list of languages to include in the output. If None, includes all languages.
+        :type langs: Optional[list[str]]
+        :return: A list of SetLangStringView objects, one for each selected language present in the MultiLangString.
+        :rtype: list[SetLangStringView]
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+            >>> for view in mls.to_setlangstring_views():
+            ...     print(view)
+            ...
+            # Output:   {'Hello'}@en
+            #           {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_iterable(langs, list, str, optional=True)
+
+        selected_langs = self._mls_dict.keys() if (langs is None) else langs
+
+        views = []
+        for selected_lang in selected_langs:
+            reg_lang = self._get_registered_lang(selected_lang)
+            if reg_lang is not None:
+                views.append(SetLangStringView(self, reg_lang))
+        return views
+
     # ----- COUNT METHODS -----
 
     @TypeValidator.validate_type_decorator
@@ -908,7 +975,7 @@ class MultiLangString:
             >>> print(count)  # Output: 1
         """
         registered_lang = self._get_registered_lang(lang)
-        return 0 if registered_lang is None else len(self.mls_dict[registered_lang])
+        return 0 if registered_lang is None else len(self._mls_dict[registered_lang])
 
     def count_entries_per_lang(self) -> dict[str, int]:
         """
@@ -925,7 +992,7 @@ class MultiLangString:
             >>> counts = mls.count_entries_per_lang()
             >>> print(counts)  # Output: {'en': 2, 'fr': 1}
         """
-        return {lang: len(texts) for lang, texts in self.mls_dict.items()}
+        return {lang: len(texts) for lang, texts in self._mls_dict.items()}
 
     def count_entries_total(self) -> int:
         """
@@ -942,7 +1009,7 @@ class MultiLangString:
             >>> total_count = mls.count_entries_total()
             >>> print(total_count)  # Output: 3
         """
-        return sum(len(texts) for texts in self.mls_dict.values())
+        return sum(len(texts) for texts in self._mls_dict.values())
 
     def count_langs_total(self) -> int:
         """
@@ -959,7 +1026,7 @@ class MultiLangString:
             >>> total_langs = mls.count_langs_total()
             >>> print(total_langs)  # Output: 2
         """
-        return len(self.mls_dict)
+        return len(self._mls_dict)
 
     # ----- CONTAIN METHODS -----
 
@@ -1032,7 +1099,7 @@ class MultiLangString:
             >>> print(result)  # Output: False
         """
         registered_lang = self._get_registered_lang(lang)
-        return False if (registered_lang is None) else (text in self.mls_dict[registered_lang])
+        return False if (registered_lang is None) else (text in self._mls_dict[registered_lang])
 
     @TypeValidator.validate_type_decorator
     def contains_lang(self, lang: str) -> bool:
@@ -1103,8 +1170,8 @@ class MultiLangString:
             >>> result = mls.contains_text_in_any_lang("Hola")
             >>> print(result)  # Output: False
         """
-        for lang in self.mls_dict:
-            if text in self.mls_dict[lang]:
+        for lang in self._mls_dict:
+            if text in self._mls_dict[lang]:
                 return True
         return False
 
@@ -1189,7 +1256,7 @@ class MultiLangString:
             >>> result = mls.contains_multilangstring(mls_to_check)
             >>> print(result)  # Output: False
         """
-        for lang, texts in multilangstring.mls_dict.items():
+        for lang, texts in multilangstring._mls_dict.items():
             for text in texts:
                 if not self.contains_entry(text, lang):
                     return False
@@ -1218,13 +1285,15 @@ class MultiLangString:
             >>> langs_casefolded = mls.get_langs(casefold=True)
             >>> print(langs_casefolded)  # Output: ['en', 'fr']
         """
-        return [lang.lower() for lang in self.mls_dict.keys()] if casefold else list(self.mls_dict.keys())
+        return [lang.lower() for lang in self._mls_dict.keys()] if casefold else list(self._mls_dict.keys())
 
     def get_texts(self) -> list[str]:
         """
         Return a sorted list of all texts in the MultiLangString.
 
         This method returns a list of all text entries present in the MultiLangString, sorted in alphabetical order.
+        When all languages store their texts in sorted order (see the SORTED_TEXTS flag), the already sorted
+        sequences are merged instead of sorting the whole result.
 
         :return: A sorted list of text entries.
         :rtype: list[str]
@@ -1235,7 +1304,10 @@ class MultiLangString:
             >>> texts = mls.get_texts()
             >>> print(texts)  # Output: ['Bonjour', 'Hello', 'World']
         """
-        result = [item for subset in self.mls_dict.values() for item in subset]
+        if self._mls_dict and all(isinstance(texts, SortedTextSet) for texts in self._mls_dict.values()):
+            return list(merge(*self._mls_dict.values()))
+
+        result = [item for subset in self._mls_dict.values() for item in subset]
         result.sort()
         return result
 
@@ -1245,7 +1317,9 @@ class MultiLangString:
         Retrieve a LangString from the MultiLangString.
 
         This method returns a LangString object if the specified text and language are present in the MultiLangString.
-        If the text and language are not found, it returns a LangString with only the language set.
+        If the text and language are not found, it returns a LangString with only the language set. If the flyweight
+        cache of LangString is enabled (see `LangString.enable_flyweight_cache`), the returned LangString is a shared,
+        frozen one.
 
         :param text: The text entry to retrieve.
         :type text: str
@@ -1263,7 +1337,10 @@ class MultiLangString:
             >>> lang_str = mls.get_langstring("Hola", "es")
             >>> print(lang_str)  # Output: ""@es
         """
-        return LangString(text=text, lang=lang) if self.contains_entry(text=text, lang=lang) else LangString(lang=lang)
+        found_text = text if self.contains_entry(text=text, lang=lang) else ""
+        if LangString._flyweight_cache is not None:
+            return LangString.flyweight(text=found_text, lang=lang)
+        return LangString(text=found_text, lang=lang)
 
     @TypeValidator.validate_type_decorator
     def get_setlangstring(self, lang: str) -> SetLangString:
@@ -1289,15 +1366,41 @@ class MultiLangString:
         """
         registered_lang = self._get_registered_lang(lang)
         if registered_lang is not None:
-            return SetLangString(texts=self.mls_dict[registered_lang], lang=lang)
+            return SetLangString(texts=self._mls_dict[registered_lang], lang=lang)
         return SetLangString(lang=lang)
 
+    @TypeValidator.validate_type_decorator
+    def get_setlangstring_view(self, lang: str) -> SetLangStringView:
+        """
+        Retrieve a read-only live view of the texts of a language, without copying them.
+
+        The view provides the read API of a SetLangString (membership tests, iteration, length, comparisons, and set
+        algebra) directly over the texts stored in the MultiLangString, and reflects any later change to them. If the
+        language is not found, the view is empty until the language is added. Use the view's `materialize` method to
+        obtain an independent SetLangString, equal to the one returned by `get_setlangstring`.
+
+        :param lang: The language to retrieve the view for.
+        :type lang: str
+        :return: A SetLangStringView of the texts of the specified language.
+        :rtype: SetLangStringView
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}})
+            >>> view = mls.get_setlangstring_view("EN")
+            >>> print("Hello" in view, len(view))  # Output: True 2
+            >>> mls.discard_entry("World", "en")
+            >>> print(view)  # Output: {'Hello'}@EN
+        """
+        return SetLangStringView(self, lang)
+
     def get_multilangstring(self, langs: list[str]) -> "MultiLangString":
         """
         Retrieve a MultiLangString containing only the specified languages.
 
         This method returns a new MultiLangString object containing only the specified languages and their texts
-        from the current MultiLangString.
+        from the current MultiLangString. The sets of texts are shared copy-on-write between both objects, so they are
+        only copied when one of the objects modifies the texts of a language.
 
         :param langs: A list of languages to include in the new MultiLangString.
         :type langs: list[str]
@@ -1311,14 +1414,75 @@ class MultiLangString:
             >>> print(new_mls)  # Output: {'Hello', 'World'}@en, {'Hola'}@es
         """
         TypeValidator.validate_type_iterable(langs, list, str)
+        return self._select_langs(langs, move=False)
 
-        new_mls = MultiLangString()
-        for lang in langs:
-            if self.contains_lang(lang):
-                new_sls = self.get_setlangstring(lang)
-                new_mls.add_setlangstring(new_sls)
+    def get_langs_matching(self, language_ranges: Union[str, list[str]], extended: bool = True) -> list[str]:
+        """
+        Return the languages of the MultiLangString matching a language range or a priority list of ranges.
 
-        return new_mls
+        The languages are matched following RFC 4647 filtering (see `LanguageTag.matches`), so, e.g., "zh-Hant-*"
+        matches "zh-Hant" and "zh-Hant-TW", and "pt" matches "pt" and "pt-BR". The languages are ordered by the first
+        range they match, and keep their order in the MultiLangString among the languages matching the same range. The
+        parsed tags of the languages are kept by the object, so they are not parsed again by the next matchings.
+
+        :param language_ranges: The language range, or the language ranges from the most to the least preferred.
+        :type language_ranges: Union[str, list[str]]
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to True.
+        :type extended: bool
+        :return: The matching languages, as registered in the MultiLangString.
+        :rtype: list[str]
+        :raises TypeError: If language_ranges is neither a string nor a list of strings, or if extended is not a bool.
+
+        **Example**::
+
+            >>> mls = MultiLangString({"zh-Hant-TW": {"台北"}, "zh-Hans": {"台北"}, "en": {"Taipei"}})
+            >>> print(mls.get_langs_matching("zh-Hant-*"))  # Output: ['zh-Hant-TW']
+            >>> print(mls.get_langs_matching(["en", "zh"]))  # Output: ['en', 'zh-Hant-TW', 'zh-Hans']
+        """
+        if isinstance(language_ranges, str):
+            language_ranges = [language_ranges]
+        TypeValidator.validate_type_iterable(language_ranges, list, str)
+        TypeValidator.validate_type_single(extended, bool)
+
+        index = self._lang_index
+        if index is None or len(index) > 2 * len(self._mls_dict):
+            # Created on first use, and recreated when most of its tags are no longer languages of the object
+            index = self._lang_index = {}
+        parsed_langs = []
+        for lang in self._mls_dict:
+            parsed = index.get(lang)
+            if parsed is None:
+                parsed = index[lang] = LanguageTag.parse(lang)
+            parsed_langs.append((lang, parsed))
+        return LanguageTag._filter_parsed(language_ranges, parsed_langs, extended)
+
+    def get_setlangstrings_matching(
+        self, language_ranges: Union[str, list[str]], extended: bool = True
+    ) -> list[SetLangString]:
+        """
+        Return a SetLangString for each language of the MultiLangString matching a language range or a priority list of
+        ranges.
+
+        The languages are selected and ordered as done by `get_langs_matching`.
+
+        :param language_ranges: The language range, or the language ranges from the most to the least preferred.
+        :type language_ranges: Union[str, list[str]]
+        :param extended: Whether to use extended filtering instead of basic filtering. Defaults to True.
+        :type extended: bool
+        :return: The SetLangStrings of the matching languages.
+        :rtype: list[SetLangString]
+        :raises TypeError: If language_ranges is neither a string nor a list of strings, or if extended is not a bool.
+
+        **Example**::
+
+            >>> mls = MultiLangString({"pt-BR": {"Olá"}, "pt-PT": {"Olá"}, "en": {"Hello"}})
+            >>> print(mls.get_setlangstrings_matching("pt"))  # Output: [SetLangString(texts={'Olá'}, lang='pt-BR'),
+            ...                                               #          SetLangString(texts={'Olá'}, lang='pt-PT')]
+        """
+        return [
+            SetLangString(texts=self._mls_dict[lang], lang=lang)
+            for lang in self.get_langs_matching(language_ranges, extended)
+        ]
 
     # ----- POP METHODS -----
 
@@ -1387,7 +1551,7 @@ class MultiLangString:
         Remove and return a MultiLangString containing the specified languages.
 
         This method removes all text entries associated with the specified languages from the MultiLangString,
-        and returns them as a new MultiLangString object.
+        and returns them as a new MultiLangString object. The sets of texts are moved to the new object, not copied.
 
         :param langs: A list of languages to remove.
         :type langs: list[str]
@@ -1403,13 +1567,163 @@ class MultiLangString:
         """
         TypeValidator.validate_type_iterable(langs, list, str)
 
-        new_mls = self.get_multilangstring(langs)
+        new_mls = self._select_langs(langs, move=True)
         for lang in langs:
             self.discard_lang(lang)
         return new_mls  # noqa: R504
 
+    # ----- TRANSFORMATION METHODS -----
+
+    def filter_texts(self, predicate: Callable[[str], Any]) -> "MultiLangString":
+        """
+        Return a new MultiLangString with the texts for which the predicate returns a true value.
+
+        All languages are kept, even if none of their texts is kept, as well as the preferred language. The kept texts
+        and the languages are already validated, so they are not validated again.
+
+        :param predicate: The function called with each text.
+        :type predicate: Callable[[str], Any]
+        :return: A new MultiLangString with the kept texts.
+        :rtype: MultiLangString
+        :raises TypeError: If predicate is not callable.
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}})
+            >>> print(mls.filter_texts(lambda text: "o" in text[1:]))  # Output: {'World'}@en, {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_callable(predicate)
+        new_mls_dict: dict[str, set[str]] = {}
+        for lang, texts in self._mls_dict.items():
+            new_texts = self._new_texts_set()
+            new_texts.update([text for text in texts if predicate(text)])
+            new_mls_dict[lang] = new_texts
+        return MultiLangString._from_state(new_mls_dict, self._pref_lang, self._validated)
+
+    def map_langs(self, func: Callable[[str], str]) -> "MultiLangString":
+        """
+        Return a new MultiLangString with each language tag transformed by the given function.
+
+        This is equivalent to adding the texts of each language, under its transformed tag, to a new MultiLangString:
+        each distinct new tag is validated only once, according to the `MultiLangStringFlag` flags, and the texts of
+        languages mapped to tags that match case-insensitively are merged. Merged languages use the casefolded tag if
+        they were mapped to different casings, as done by the constructor. The texts are not validated again, and the
+        sets of texts of languages that are not merged are shared copy-on-write with the new MultiLangString. The
+        preferred language is not transformed.
+
+        :param func: The function called with each language tag, returning the new language tag.
+        :type func: Callable[[str], str]
+        :return: A new MultiLangString with the transformed language tags.
+        :rtype: MultiLangString
+        :raises TypeError: If func is not callable or does not return strings.
+        :raises ValueError: If a new language tag violates the enabled flags.
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en-US": {"Color"}, "en-GB": {"Colour"}, "fr": {"Couleur"}})
+            >>> print(mls.map_langs(lambda lang: lang.split("-")[0]))  # Output: {'Color', 'Colour'}@en, {'Couleur'}@fr
+        """
+        TypeValidator.validate_type_callable(func)
+        validate_langs = FlagValidator.lang_flags_enabled(MultiLangStringFlag)
+        validated_langs: dict[str, str] = {}
+
+        # Group the registered languages by casefolded new tag, in order of first occurrence
+        groups: dict[str, list[tuple[str, str]]] = {}
+        for lang in self._mls_dict:
+            new_lang = func(lang)
+            TypeValidator.validate_type_single(new_lang, str)
+            if validate_langs:
+                validated_lang = validated_langs.get(new_lang)
+                if validated_lang is None:
+                    validated_lang = FlagValidator.validate_flags_lang(MultiLangStringFlag, new_lang)
+                    validated_langs[new_lang] = validated_lang
+                new_lang = validated_lang
+            groups.setdefault(new_lang.casefold(), []).append((new_lang, lang))
+
+        new_mls = MultiLangString._from_state({}, self._pref_lang, self._validated)
+        for lang_cf, entries in groups.items():
+            variants = {new_lang for new_lang, _ in entries}
+            new_lang = variants.pop() if len(variants) == 1 else lang_cf
+            if len(entries) == 1:
+                lang = entries[0][1]
+                new_mls._mls_dict[new_lang] = self._mls_dict[lang]
+                new_mls._shared_langs.add(new_lang)
+                self._shared_langs.add(lang)
+            else:
+                new_texts = self._new_texts_set()
+                for _, lang in entries:
+                    new_texts.update(self._mls_dict[lang])
+                new_mls._mls_dict[new_lang] = new_texts
+        return new_mls
+
+    def map_texts(self, func: Callable[[str], str]) -> "MultiLangString":
+        """
+        Return a new MultiLangString with each text transformed by the given function.
+
+        This is equivalent to adding each transformed text to a new MultiLangString, but each distinct transformed text
+        is validated only once, according to the `MultiLangStringFlag` flags, and the languages, which are not
+        transformed, are not validated again. If the `TextPool` is enabled, the stored texts are the pooled strings
+        equal to the validated texts. All languages and the preferred language are kept.
+
+        :param func: The function called with each text, returning the new text.
+        :type func: Callable[[str], str]
+        :return: A new MultiLangString with the transformed texts.
+        :rtype: MultiLangString
+        :raises TypeError: If func is not callable or does not return strings.
+        :raises ValueError: If a transformed text violates the enabled flags.
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello ", " Hello"}, "fr": {"Bonjour"}})
+            >>> print(mls.map_texts(str.strip))  # Output: {'Hello'}@en, {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_callable(func)
+        validate_texts = FlagValidator.text_flags_enabled(MultiLangStringFlag)
+        store_texts = validate_texts or TextPool.is_enabled()
+        # For each distinct transformed text, the validated and pooled text to be stored
+        stored_texts: dict[str, str] = {}
+
+        new_mls_dict: dict[str, set[str]] = {}
+        for lang, texts in self._mls_dict.items():
+            new_texts = self._new_texts_set()
+            for text in texts:
+                new_text = func(text)
+                TypeValidator.validate_type_single(new_text, str)
+                if store_texts:
+                    stored_text = stored_texts.get(new_text)
+                    if stored_text is None:
+                        stored_text = new_text
+                        if validate_texts:
+                            stored_text = FlagValidator.validate_flags_text(MultiLangStringFlag, stored_text)
+                        stored_text = stored_texts[new_text] = TextPool.intern(stored_text)
+                    new_text = stored_text
+                new_texts.add(new_text)
+            new_mls_dict[lang] = new_texts
+        return MultiLangString._from_state(new_mls_dict, self._pref_lang, self._validated)
+
     # ----- GENERAL METHODS -----
 
+    def copy(self) -> "MultiLangString":
+        """
+        Create a copy of the MultiLangString.
+
+        The copy is created directly from the already validated languages and texts, which are not validated again.
+        The sets of texts are shared copy-on-write between both objects, so a language's set is only copied when one
+        of the objects modifies its texts. Hence, modifying the copy never affects the original object, and vice versa.
+
+        :return: A new MultiLangString with the same languages, texts, and preferred language.
+        :rtype: MultiLangString
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+            >>> mls_copy = mls.copy()
+            >>> mls_copy.add_entry("Hi", "en")
+            >>> print(mls)  # Output: {'Hello'}@en, {'Bonjour'}@fr
+            >>> print(mls_copy)  # Output: {'Hello', 'Hi'}@en, {'Bonjour'}@fr
+        """
+        return self.__copy__()
+
     def has_pref_lang_entries(self) -> bool:
         """
         Check if there are any entries in the preferred language.
@@ -1429,7 +1743,53 @@ class MultiLangString:
             >>> print(has_entries)  # Output: False
         """
         registered_lang = self._get_registered_lang(self.pref_lang)
-        return len(self.mls_dict[registered_lang]) > 0 if (registered_lang is not None) else False
+        return len(self._mls_dict[registered_lang]) > 0 if (registered_lang is not None) else False
+
+    @property
+    def is_validated(self) -> bool:
+        """
+        Check whether the content of the MultiLangString was validated.
+
+        Only MultiLangStrings created by `from_trusted_dict` whose content was adopted without validation, and copies
+        of them, are not validated until `validate` is called.
+
+        :return: True if the languages and texts were validated, otherwise False.
+        :rtype: bool
+
+        **Example**::
+
+            >>> mls = MultiLangString.from_trusted_dict({"en": {"Hello"}})
+            >>> print(mls.is_validated)  # Output: False
+            >>> mls.validate()
+            >>> print(mls.is_validated)  # Output: True
+        """
+        return self._validated
+
+    def validate(self) -> None:
+        """
+        Run the full validation on a MultiLangString created by `from_trusted_dict`.
+
+        The languages and texts are validated exactly as by the constructor: their types are checked, languages whose
+        casing differs are merged, and the `MultiLangStringFlag` flags are applied. If the validation fails, the
+        MultiLangString is left unchanged. Calling this method on an already validated MultiLangString has no effect.
+
+        :raises TypeError: If the languages, the texts, or the preferred language are not strings, or if the texts of
+                           a language are not in a set.
+        :raises ValueError: If a language or a text violates the enabled flags.
+
+        **Example**::
+
+            >>> mls = MultiLangString.from_trusted_dict({"en": {"Hello"}, "EN": {"World"}})
+            >>> mls.validate()
+            >>> print(mls)  # Output: {'Hello', 'World'}@en
+        """
+        if self._validated:
+            return
+        validated_mls = MultiLangString(self._mls_dict, self._pref_lang)
+        self._mls_dict = validated_mls._mls_dict
+        self._pref_lang = validated_mls._pref_lang
+        self._shared_langs = set()
+        self._validated = True
 
     # --------------------------------------------------
     # Overwritten Dictionary's Dunder Methods
@@ -1456,6 +1816,37 @@ class MultiLangString:
         """
         return self.contains_lang(lang)
 
+    def __copy__(self) -> "MultiLangString":
+        """
+        Create a copy of the MultiLangString, sharing its sets of texts copy-on-write.
+
+        This method is used by `copy.copy` and by the `copy` method.
+
+        :return: A new MultiLangString with the same languages, texts, and preferred language.
+        :rtype: MultiLangString
+        """
+        new_mls = self.__class__._from_state(dict(self._mls_dict), self._pref_lang, self._validated)
+        new_mls._shared_langs.update(self._mls_dict)
+        self._shared_langs.update(self._mls_dict)
+        return new_mls
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "MultiLangString":
+        """
+        Create a deep copy of the MultiLangString, with its own sets of texts.
+
+        The sets of texts are copied directly, without validating the already validated languages and texts again.
+        This method is used by `copy.deepcopy`.
+
+        :param memo: The dictionary of objects already copied during the current copying pass.
+        :type memo: dict[int, Any]
+        :return: A new MultiLangString with the same languages, texts, and preferred language.
+        :rtype: MultiLangString
+        """
+        new_mls_dict = {lang: texts.copy() for lang, texts in self._mls_dict.items()}
+        new_mls = self.__class__._from_state(new_mls_dict, self._pref_lang, self._validated)
+        memo[id(self)] = new_mls
+        return new_mls
+
     @TypeValidator.validate_type_decorator
     def __delitem__(self, lang: str) -> None:
         """
@@ -1479,7 +1870,7 @@ class MultiLangString:
 
         # Del valid using registered lang or raise KeyError when invalid (not registered in any case)
         del_lang = reg_lang if (reg_lang is not None) else lang
-        del self.mls_dict[del_lang]
+        del self._mls_dict[del_lang]
 
     @TypeValidator.validate_type_decorator
     def __eq__(self, other: object) -> bool:
@@ -1507,8 +1898,8 @@ class MultiLangString:
             return NotImplemented
 
         # Convert langs to casefolded version for both instances for comparison
-        casefolded_self = {k.casefold(): v for k, v in self.mls_dict.items()}
-        casefolded_other = {k.casefold(): v for k, v in other.mls_dict.items()}
+        casefolded_self = {k.casefold(): v for k, v in self._mls_dict.items()}
+        casefolded_other = {k.casefold(): v for k, v in other._mls_dict.items()}
 
         # Check if the sets of casefolded langs are the same
         if set(casefolded_self.keys()) != set(casefolded_other.keys()):
@@ -1546,7 +1937,8 @@ class MultiLangString:
 
         # Get valid using registered lang or raise KeyError when invalid (not registered in any case)
         get_lang = reg_lang if (reg_lang is not None) else lang
-        return self.mls_dict[get_lang]
+        # The returned set may be modified by the caller, so it must not be shared
+        return self._writable_texts(get_lang)
 
     def __hash__(self) -> int:
         """
@@ -1568,8 +1960,8 @@ class MultiLangString:
         """
         # Create a casefolded version of mls_dict with sorted values
         hashable_data = tuple(
-            (lang.casefold(), tuple(sorted(self.mls_dict[lang])))
-            for lang in sorted(self.mls_dict.keys(), key=str.casefold)
+            (lang.casefold(), tuple(self._sorted_texts(self._mls_dict[lang])))
+            for lang in sorted(self._mls_dict.keys(), key=str.casefold)
         )
 
         # Hash the hashable_data
@@ -1593,7 +1985,7 @@ class MultiLangString:
             >>> # Output:   en
             >>> #           fr
         """
-        return iter(self.mls_dict)
+        return iter(self._mls_dict)
 
     def __len__(self) -> int:
         """
@@ -1610,7 +2002,7 @@ class MultiLangString:
             >>> mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
             >>> print(len(mls))  # Output: 2
         """
-        return len(self.mls_dict)
+        return len(self._mls_dict)
 
     def __repr__(self) -> str:
         """
@@ -1628,7 +2020,28 @@ class MultiLangString:
             >>> print(repr(mls))
             # Output: 'MultiLangString(mls_dict={'en': {'Hello'}, 'fr': {'Bonjour'}}, pref_lang='en')'
         """
-        return f"{self.__class__.__name__}(mls_dict={repr(self.mls_dict)}, pref_lang={repr(self.pref_lang)})"
+        return f"{self.__class__.__name__}(mls_dict={repr(self._mls_dict)}, pref_lang={repr(self.pref_lang)})"
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """
+        Support pickling by rebuilding the MultiLangString from its already validated languages and texts.
+
+        Unpickling does not validate the languages and texts again, which avoids the validation cost when, e.g.,
+        transferring MultiLangStrings between processes. The sets shared copy-on-write with other objects are pickled as
+        copies, so objects pickled together do not share them after unpickling.
+
+        :param protocol: The pickle protocol version.
+        :type protocol: SupportsIndex
+        :return: A tuple with the function used to rebuild the MultiLangString and its arguments.
+        :rtype: tuple[Any, ...]
+        """
+        shared_langs = self._shared_langs
+        mls_dict = (
+            {lang: texts.copy() if lang in shared_langs else texts for lang, texts in self._mls_dict.items()}
+            if shared_langs
+            else self._mls_dict
+        )
+        return self.__class__._from_state, (mls_dict, self._pref_lang, self._validated)
 
     def __reversed__(self) -> Iterator[str]:
         """
@@ -1645,7 +2058,7 @@ class MultiLangString:
             >>> reversed_langs = list(reversed(mls))
             >>> print(reversed_langs)  # Output: ['fr', 'en']
         """
-        return reversed(self.mls_dict)
+        return reversed(self._mls_dict)
 
     def __setitem__(self, lang: str, texts: set[str]) -> None:
         """
@@ -1674,7 +2087,7 @@ class MultiLangString:
         registered_lang = self._get_registered_lang(lang)
         add_lang = registered_lang if (registered_lang is not None) else lang
 
-        self.mls_dict[add_lang] = set()
+        self._mls_dict[add_lang] = self._new_texts_set()
         if texts:
             for text in texts:
                 self.add_entry(text, add_lang)
@@ -1694,7 +2107,7 @@ class MultiLangString:
             >>> mls = MultiLangString({"en": {"World", "Hello"}, "fr": {"Bonjour"}})
             >>> print(mls)  # Output: {'Hello', 'World'}@en, {'Bonjour'}@fr
         """
-        if not self.mls_dict:
+        if not self._mls_dict:
             return "{}"
 
         formatted_items = []
@@ -1702,9 +2115,9 @@ class MultiLangString:
         print_quotes = Controller.get_flag(MultiLangStringFlag.PRINT_WITH_QUOTES)
 
         # Sorted to produce a deterministic output
-        for lang, texts in sorted(self.mls_dict.items()):  # Sort languages
+        for lang, texts in sorted(self._mls_dict.items()):  # Sort languages
             if texts:
-                sorted_texts = sorted(texts)  # Sort texts within the language
+                sorted_texts = self._sorted_texts(texts)  # Sort texts within the language
                 if print_quotes:
                     formatted_texts = "{" + ", ".join(f"'{text}'" for text in sorted_texts) + "}"
                 else:
@@ -1735,6 +2148,13 @@ class MultiLangString:
         MultiLangString. The resulting MultiLangString contains all languages and texts from the provided
         instances. If the list is empty, an empty MultiLangString is returned.
 
+        The merge is performed in a single pass over all instances: texts are collected in case-insensitive language
+        buckets, each distinct language tag is validated only once, and the texts are added to the buckets in bulk.
+        Languages keep the casing of their first occurrence, and the preferred language of the first instance is used.
+        The provided instances are not modified. The sets of texts of the first instance that receive no new texts are
+        shared copy-on-write with the result, i.e., they are only copied when one of the objects modifies them. The
+        result is not validated (see `is_validated`) if any of the instances is not.
+
         :param multilangstrings: A list of MultiLangString instances to merge.
         :type multilangstrings: list[MultiLangString]
         :return: A new MultiLangString containing all languages and texts from the provided instances.
@@ -1749,15 +2169,204 @@ class MultiLangString:
         """
         TypeValidator.validate_type_iterable(multilangstrings, list, MultiLangString)
 
-        if len(multilangstrings):
-            unified_mls = multilangstrings[0]  # Initialize with the first element
-            for mls in multilangstrings[1:]:  # Loop through elements from the second to the last
-                unified_mls.add_multilangstring(mls)
-        else:
-            unified_mls = MultiLangString()
-
+        if not multilangstrings:
+            return MultiLangString()
+
+        validate_texts = FlagValidator.text_flags_enabled(MultiLangStringFlag)
+        validated_langs: dict[str, str] = {}
+        registered_langs: dict[str, str] = {}
+        new_mls_dict: dict[str, set[str]] = {}
+
+        # The entries of the first element are already registered and validated, so its sets are shared copy-on-write
+        first_mls = multilangstrings[0]
+        texts_type = type(MultiLangString._new_texts_set())
+        shared_langs: set[str] = set()
+        for lang, texts in first_mls._mls_dict.items():
+            registered_lang = registered_langs.setdefault(lang.casefold(), lang)
+            if registered_lang not in new_mls_dict and type(texts) is texts_type:
+                new_mls_dict[registered_lang] = texts
+                shared_langs.add(registered_lang)
+            else:
+                if registered_lang not in new_mls_dict:
+                    new_mls_dict[registered_lang] = MultiLangString._new_texts_set()
+                elif registered_lang in shared_langs:
+                    new_mls_dict[registered_lang] = new_mls_dict[registered_lang].copy()
+                    shared_langs.discard(registered_lang)
+                new_mls_dict[registered_lang].update(texts)
+
+        for mls in multilangstrings[1:]:
+            for lang, texts in mls._mls_dict.items():
+                validated_lang = validated_langs.get(lang)
+                if validated_lang is None:
+                    validated_lang = FlagValidator.validate_flags_lang(MultiLangStringFlag, lang)
+                    validated_langs[lang] = validated_lang
+
+                registered_lang = registered_langs.setdefault(validated_lang.casefold(), validated_lang)
+                if registered_lang not in new_mls_dict:
+                    new_mls_dict[registered_lang] = MultiLangString._new_texts_set()
+                elif registered_lang in shared_langs:
+                    if not validate_texts and texts <= new_mls_dict[registered_lang]:
+                        continue
+                    new_mls_dict[registered_lang] = new_mls_dict[registered_lang].copy()
+                    shared_langs.discard(registered_lang)
+
+                if validate_texts:
+                    new_mls_dict[registered_lang].update(
+                        FlagValidator.validate_flags_text(MultiLangStringFlag, text) for text in texts
+                    )
+                else:
+                    new_mls_dict[registered_lang].update(texts)
+
+        unified_mls = MultiLangString(pref_lang=first_mls.pref_lang)
+        unified_mls._mls_dict = new_mls_dict
+        unified_mls._shared_langs = shared_langs
+        if not all(mls._validated for mls in multilangstrings):
+            unified_mls._validated = False
+        for lang, texts in first_mls._mls_dict.items():
+            if new_mls_dict.get(registered_langs[lang.casefold()]) is texts:
+                first_mls._shared_langs.add(lang)
         return unified_mls
 
+    @classmethod
+    def from_columns(
+        cls, subjects: list[Hashable], texts: list[str], langs: list[str], use_numpy: Optional[bool] = None
+    ) -> dict[Hashable, "MultiLangString"]:
+        """
+        Build one MultiLangString per subject from parallel columns of subjects, texts, and language tags.
+
+        This is the bulk equivalent of creating a MultiLangString for each subject and adding its entries one by one,
+        e.g., when importing the literals of a triple store export. The rows are grouped by subject and by casefolded
+        language tag (using NumPy if available), and each group is validated once. Language tags are merged as in
+        `_merge_language_entries`: if a subject uses different casings of the same tag, the casefolded tag is used;
+        otherwise, the original casing is preserved. Texts and tags are validated according to the
+        `MultiLangStringFlag` flags, and texts are pooled if the `TextPool` is enabled.
+
+        :param subjects: The subject of each row. Subjects must be hashable.
+        :type subjects: list[Hashable]
+        :param texts: The text of each row.
+        :type texts: list[str]
+        :param langs: The language tag of each row.
+        :type langs: list[str]
+        :param use_numpy: Whether to use NumPy to group the rows. If None (default), NumPy is used if it is installed.
+        :type use_numpy: Optional[bool]
+        :return: A dictionary mapping each subject, in order of first appearance, to its MultiLangString.
+        :rtype: dict[Hashable, MultiLangString]
+        :raises TypeError: If the columns are not lists or texts and langs do not contain only strings.
+        :raises ValueError: If the columns have different lengths or if a text or tag violates the enabled flags.
+        :raises ImportError: If use_numpy is True and NumPy is not installed.
+
+        **Example**::
+
+            >>> subjects = ["s1", "s1", "s2", "s1"]
+            >>> texts = ["Hello", "World", "Bonjour", "Hi"]
+            >>> langs = ["en", "EN", "fr", "pt"]
+            >>> for subject, mls in MultiLangString.from_columns(subjects, texts, langs).items():
+            >>>     print(subject, mls)  # Output: s1 {'Hello', 'World'}@en, {'Hi'}@pt
+            >>>                          #         s2 {'Bonjour'}@fr
+        """
+        TypeValidator.validate_type_single(subjects, list)
+        TypeValidator.validate_type_iterable(texts, list, str)
+        TypeValidator.validate_type_iterable(langs, list, str)
+        TypeValidator.validate_type_single(use_numpy, bool, optional=True)
+        if not len(subjects) == len(texts) == len(langs):
+            raise ValueError(
+                f"Invalid columns. The number of subjects ({len(subjects)}), texts ({len(texts)}), and language tags "
+                f"({len(langs)}) must be equal."
+            )
+
+        # Factorize subjects, original language tags, and casefolded language tags
+        subject_codes, subject_values = RowGrouper.factorize(subjects)
+        raw_codes, raw_langs = RowGrouper.factorize(langs)
+        folded_codes, folded_langs = RowGrouper.factorize(str(lang).casefold() for lang in raw_langs)
+        lang_codes = [folded_codes[raw_code] for raw_code in raw_codes]
+
+        groups = RowGrouper.group_rows(subject_codes, lang_codes, use_numpy)
+
+        validated_langs: dict[str, str] = {}
+        validated_texts: dict[str, str] = {}
+        multilangstrings: dict[Hashable, MultiLangString] = {}
+        for subject_code, lang_groups in groups.items():
+            mls_dict: dict[str, set[str]] = {}
+            # The flags may map different tags to the same validated tag (e.g., STRIP_LANG), so the validated tags are
+            # merged again, keeping the first one registered, as done by add_entry.
+            registered_langs: dict[str, str] = {}
+            for folded_code, rows in lang_groups.items():
+                variants = {raw_codes[row] for row in rows}
+                lang = str(raw_langs[variants.pop()] if len(variants) == 1 else folded_langs[folded_code])
+
+                validated_lang = validated_langs.get(lang)
+                if validated_lang is None:
+                    validated_lang = FlagValidator.validate_flags_lang(MultiLangStringFlag, lang)
+                    validated_langs[lang] = validated_lang
+
+                lang_texts = []
+                for row in rows:
+                    validated_text = validated_texts.get(texts[row])
+                    if validated_text is None:
+                        validated_text = TextPool.intern(
+                            FlagValidator.validate_flags_text(MultiLangStringFlag, texts[row])
+                        )
+                        validated_texts[texts[row]] = validated_text
+                    lang_texts.append(validated_text)
+
+                registered_lang = registered_langs.setdefault(validated_lang.casefold(), validated_lang)
+                lang_texts_set = mls_dict.get(registered_lang)
+                if lang_texts_set is None:
+                    lang_texts_set = mls_dict[registered_lang] = cls._new_texts_set()
+                lang_texts_set.update(lang_texts)
+
+            multilangstring = cls()
+            multilangstring._mls_dict = mls_dict
+            multilangstrings[subject_values[subject_code]] = multilangstring
+
+        return multilangstrings
+
+    @classmethod
+    def from_trusted_dict(cls, mls_dict: dict[str, set[str]], pref_lang: str = "en") -> "MultiLangString":
+        """
+        Create a MultiLangString adopting a trusted dictionary as-is, deferring its validation.
+
+        The constructor checks the types of all languages and texts, merges languages whose casing differs, and
+        validates every language and text according to the flags. For dictionaries known to be valid, e.g., loaded
+        from a cache written by this library, this work can be skipped: the dictionary becomes the storage of the new
+        MultiLangString without being copied or inspected, and the object is marked as not validated (see
+        `is_validated`). The full validation is run when `validate` is called.
+
+        If any `MultiLangStringFlag` flag that transforms or rejects languages or texts, or the SORTED_TEXTS flag, is
+        enabled, the flags require the content to be validated, so the MultiLangString is validated immediately, as if
+        created by the constructor.
+
+        The caller must guarantee that the languages and texts are strings, that the texts of each language are in a
+        set, and that no two languages differ only in casing. The dictionary and its sets must not be used by the
+        caller afterward.
+
+        :param mls_dict: A dictionary where keys are language codes and values are sets of text entries.
+        :type mls_dict: dict[str, set[str]]
+        :param pref_lang: The preferred language. Defaults to "en".
+        :type pref_lang: str
+        :return: The new MultiLangString.
+        :rtype: MultiLangString
+        :raises TypeError: If mls_dict is not a dictionary or pref_lang is not a string.
+
+        **Example**::
+
+            >>> cached = {"en": {"Hello", "World"}, "fr": {"Bonjour"}}
+            >>> mls = MultiLangString.from_trusted_dict(cached, pref_lang="fr")
+            >>> print(mls)  # Output: {'Hello', 'World'}@en, {'Bonjour'}@fr
+            >>> print(mls.is_validated)  # Output: False
+        """
+        TypeValidator.validate_type_single(mls_dict, dict)
+        TypeValidator.validate_type_single(pref_lang, str)
+
+        new_mls = cls._from_state(mls_dict, pref_lang, validated=False)
+        if (
+            FlagValidator.lang_flags_enabled(MultiLangStringFlag)
+            or FlagValidator.text_flags_enabled(MultiLangStringFlag)
+            or Controller.get_flag(MultiLangStringFlag.SORTED_TEXTS)
+        ):
+            new_mls.validate()
+        return new_mls
+
     # --------------------------------------------------
     # Private Methods
     # --------------------------------------------------
@@ -1781,11 +2390,36 @@ class MultiLangString:
             >>> registered_lang = mls._get_registered_lang("EN")
             >>> print(registered_lang)  # Output: en
         """
-        lang_register = {s.casefold(): s for s in self.mls_dict.keys()}
+        lang_register = {s.casefold(): s for s in self._mls_dict.keys()}
         if lang.casefold() in lang_register:
             return lang_register[lang.casefold()]
         return None
 
+    @staticmethod
+    def _new_texts_set() -> set[str]:
+        """
+        Create an empty set to store the texts of a language.
+
+        A SortedTextSet is created when the SORTED_TEXTS flag is enabled, so that the texts of the language are kept in
+        sorted order. Otherwise, a plain set is created.
+
+        :return: An empty set for the texts of a language.
+        :rtype: set[str]
+        """
+        return SortedTextSet() if Controller.get_flag(MultiLangStringFlag.SORTED_TEXTS) else set()
+
+    @staticmethod
+    def _sorted_texts(texts: set[str]) -> list[str]:
+        """
+        Return the given texts in sorted order, avoiding a new sort when the texts are already stored sorted.
+
+        :param texts: The set of texts to be ordered.
+        :type texts: set[str]
+        :return: A list with the texts in sorted order.
+        :rtype: list[str]
+        """
+        return list(texts) if isinstance(texts, SortedTextSet) else sorted(texts)
+
     @staticmethod
     def _merge_language_entries(mls_dict: dict[str, set[str]]) -> dict[str, set[str]]:
         """
@@ -1832,3 +2466,101 @@ class MultiLangString:
                 merged_dict[langs[0]] = merged_texts  # Preserve original case for unique entries
 
         return merged_dict
+
+    @classmethod
+    def _from_state(cls, mls_dict: dict[str, set[str]], pref_lang: str, validated: bool = True) -> "MultiLangString":
+        """
+        Create a MultiLangString from the internal state of an existing one, without any check or validation.
+
+        This is the construction path used when copying and unpickling MultiLangStrings. The dictionary is used as the
+        new object's storage, so it must not be shared.
+
+        :param mls_dict: A new dictionary of languages and texts, owned by the created object.
+        :type mls_dict: dict[str, set[str]]
+        :param pref_lang: The preferred language.
+        :type pref_lang: str
+        :param validated: Whether the languages and texts were validated. Defaults to True.
+        :type validated: bool
+        :return: The new MultiLangString.
+        :rtype: MultiLangString
+        """
+        new_mls = cls.__new__(cls)
+        new_mls._mls_dict = mls_dict
+        new_mls._pref_lang = pref_lang
+        new_mls._shared_langs = set()
+        if not validated:
+            new_mls._validated = False
+        return new_mls
+
+    def _select_langs(self, langs: list[str], move: bool) -> "MultiLangString":
+        """
+        Create a MultiLangString with the texts of the specified languages, sharing or moving their sets of texts.
+
+        The result is the same as adding `get_setlangstring(lang)` to a new MultiLangString for each language present.
+        When no text flag is enabled, the texts need no transformation, so the sets are not copied: they are shared
+        copy-on-write with the new MultiLangString or, if `move` is True, handed over to it, as the caller removes the
+        languages from this MultiLangString. The new MultiLangString is validated (see `is_validated`) only if this
+        one is.
+
+        :param langs: The languages to select.
+        :type langs: list[str]
+        :param move: Whether the caller removes the selected languages from this MultiLangString afterward.
+        :type move: bool
+        :return: A new MultiLangString with the selected languages.
+        :rtype: MultiLangString
+        """
+        new_mls = MultiLangString()
+        if not self._validated:
+            new_mls._validated = False
+
+        if FlagValidator.text_flags_enabled(SetLangStringFlag) or FlagValidator.text_flags_enabled(MultiLangStringFlag):
+            for lang in langs:
+                if self.contains_lang(lang):
+                    new_mls.add_setlangstring(self.get_setlangstring(lang))
+            return new_mls
+
+        new_registered_langs: dict[str, str] = {}
+        for lang in langs:
+            registered_lang = self._get_registered_lang(lang)
+            if registered_lang is None:
+                continue
+
+            # The language tag is validated as when passing through get_setlangstring and add_setlangstring
+            new_lang = FlagValidator.validate_flags_lang(
+                MultiLangStringFlag, FlagValidator.validate_flags_lang(SetLangStringFlag, lang)
+            )
+            texts = self._mls_dict[registered_lang]
+            new_registered_lang = new_registered_langs.get(new_lang.casefold())
+
+            if new_registered_lang is None:
+                new_registered_langs[new_lang.casefold()] = new_lang
+                new_mls._mls_dict[new_lang] = texts
+                if not move or registered_lang in self._shared_langs:
+                    new_mls._shared_langs.add(new_lang)
+                if not move:
+                    self._shared_langs.add(registered_lang)
+            elif new_mls._mls_dict[new_registered_lang] is not texts:
+                new_mls._writable_texts(new_registered_lang).update(texts)
+
+        return new_mls
+
+    def _writable_texts(self, lang: str) -> set[str]:
+        """
+        Return the set of texts of a registered language, copying it first if it is shared with another object.
+
+        Sets of texts may be shared copy-on-write between MultiLangStrings (e.g., by `get_multilangstring` or
+        `merge_multilangstrings`). Each object marks its shared languages, and every method that modifies the texts of a
+        language obtains the set through this method, so a shared set is never modified in place.
+
+        :param lang: The registered language whose texts will be modified.
+        :type lang: str
+        :return: The set of texts of the language, owned only by this MultiLangString.
+        :rtype: set[str]
+        :raises KeyError: If the language is not registered.
+        """
+        texts = self._mls_dict[lang]
+        if lang in self._shared_langs:
+            texts = texts.copy()
+            self._mls_dict[lang] = texts
+            self._shared_langs.discard(lang)
+        return texts
@@ -0,0 +1,306 @@
+"""
+In-place reapplication of the current flags to existing `LangString`, `SetLangString`, and `MultiLangString` objects.
+
+Texts and language tags are validated and transformed when they are stored, according to the flags enabled at that
+time. Enabling a flag afterward, e.g., `LOWERCASE_LANG` or `STRIP_TEXT`, does not affect the objects already created.
+The `Renormalizer` brings such objects in line with the current flags without creating them again, which is much
+faster than rebuilding a whole collection through the constructors.
+
+Key Features:
+    - **In Place**: Objects are modified, not recreated, so references to them (and to their sets of texts) remain
+      valid.
+    - **Memoization**: Each distinct language tag and text is validated only once per call, however many objects
+      contain it.
+    - **Case Merging**: Languages of a `MultiLangString` that become case-insensitive duplicates are merged, following
+      the casing rules of the `MultiLangString` constructor.
+    - **Skipped Work**: Texts or language tags are not inspected at all when no flag that may transform or reject them
+      is enabled.
+
+Classes:
+    - **Renormalizer**: Reapplies the current flags to existing objects.
+
+**Example**::
+
+    >>> langstrings = [LangString("Hello", "EN"), LangString("Hi", "En")]
+    >>> Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    >>> Renormalizer.renormalize(langstrings)  # Output: 2
+    >>> print(langstrings)  # Output: [LangString(text='Hello', lang='en'), LangString(text='Hi', lang='en')]
+"""
+
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from .flags import GlobalFlag
+from .flags import LangStringFlag
+from .flags import MultiLangStringFlag
+from .flags import SetLangStringFlag
+from .langstring import LangString
+from .multilangstring import MultiLangString
+from .setlangstring import SetLangString
+from .setlangstring_view import SetLangStringView
+from .utils.non_instantiable import NonInstantiable
+from .utils.validators import FlagValidator
+
+_FlagType = type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+
+
+class _FlagMemo:
+    """
+    The memoized validations of language tags and texts for one type of flags, during one renormalization.
+
+    :ivar validate_langs: Whether any flag that may transform or reject a language tag is enabled.
+    :vartype validate_langs: bool
+    :ivar validate_texts: Whether any flag that may transform or reject a text is enabled.
+    :vartype validate_texts: bool
+    """
+
+    def __init__(self, flag_type: _FlagType) -> None:
+        """
+        Initialize the memo, reading the current flags.
+
+        :param flag_type: The type of flags used for the validations.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        """
+        self.flag_type = flag_type
+        self.validate_langs = FlagValidator.lang_flags_enabled(flag_type)
+        self.validate_texts = FlagValidator.text_flags_enabled(flag_type)
+        self._langs: dict[str, str] = {}
+        self._texts: dict[str, str] = {}
+
+    def lang(self, lang: str) -> str:
+        """
+        Validate a language tag, or return the result of its previous validation.
+
+        :param lang: The language tag.
+        :type lang: str
+        :return: The validated language tag.
+        :rtype: str
+        :raises ValueError: If the language tag violates the enabled flags.
+        """
+        validated_lang = self._langs.get(lang)
+        if validated_lang is None:
+            validated_lang = FlagValidator.validate_flags_lang(self.flag_type, lang)
+            self._langs[lang] = validated_lang
+        return validated_lang
+
+    def text(self, text: str) -> str:
+        """
+        Validate a text, or return the result of its previous validation.
+
+        :param text: The text.
+        :type text: str
+        :return: The validated text.
+        :rtype: str
+        :raises ValueError: If the text violates the enabled flags.
+        """
+        validated_text = self._texts.get(text)
+        if validated_text is None:
+            validated_text = FlagValidator.validate_flags_text(self.flag_type, text)
+            self._texts[text] = validated_text
+        return validated_text
+
+
+class Renormalizer(metaclass=NonInstantiable):
+    """
+    A utility class reapplying the current flags to existing LangStrings, SetLangStrings, and MultiLangStrings.
+
+    :cvar FLAG_TYPES: The types of flags that may be applied to all objects with the `flag_type` argument.
+    :vartype FLAG_TYPES: tuple[type, ...]
+
+    **Example**::
+
+        >>> mls = MultiLangString({"en": {"Hello"}, "EN ": {"Hi"}})
+        >>> Controller.set_flag(MultiLangStringFlag.STRIP_LANG, True)
+        >>> Renormalizer.renormalize([mls])  # Output: 1
+        >>> print(mls)  # Output: {'Hello', 'Hi'}@en
+    """
+
+    FLAG_TYPES: tuple[_FlagType, ...] = (GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag)
+
+    @classmethod
+    def renormalize(
+        cls,
+        objects: Iterable[Union[LangString, SetLangString, MultiLangString]],
+        flag_type: Optional[_FlagType] = None,
+    ) -> int:
+        """
+        Reapply the current flags to the texts and language tags of existing objects, modifying them in place.
+
+        Each object ends up with the texts and language tags it would have if it were created again from its current
+        content, while keeping its identity:
+            - A LangString gets its validated text and language tag.
+            - The texts of a SetLangString are validated, merging the texts that become equal, and its language tag is
+              validated. Its set of texts is updated in place.
+            - The texts, the language tags, and the preferred language of a MultiLangString are validated. Languages
+              that become case-insensitive duplicates are merged: the casefolded tag is used if their tags differ in
+              casing, as done by the constructor. Its dictionary is updated in place.
+
+        Objects are processed one at a time, and each object is only modified once all its new values are valid. If a
+        value is rejected by the flags, a ValueError is raised: the objects before it are already renormalized and the
+        others are unchanged. Note that renormalized LangStrings and SetLangStrings may get a different hash, so they
+        should not be renormalized while stored in sets or used as dictionary keys.
+
+        :param objects: The objects to be renormalized.
+        :type objects: Iterable[Union[LangString, SetLangString, MultiLangString]]
+        :param flag_type: The type of flags to apply to all objects. If None (default), each object is validated with
+                          the flags of its own class (LangStringFlag, SetLangStringFlag, or MultiLangStringFlag).
+        :type flag_type: Optional[type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]]
+        :return: The number of objects that were modified.
+        :rtype: int
+        :raises TypeError: If an object is not a LangString, SetLangString, or MultiLangString, if it is a
+                           SetLangStringView, or if flag_type is not a flag type.
+        :raises ValueError: If a text or language tag violates the enabled flags.
+        :raises AttributeError: If a frozen LangString (see `LangString.flyweight`) would be modified.
+
+        **Example**::
+
+            >>> setlangstring = SetLangString({"Hello", " Hello "}, "en")
+            >>> Controller.set_flag(GlobalFlag.STRIP_TEXT, True)
+            >>> Renormalizer.renormalize([setlangstring], flag_type=GlobalFlag)  # Output: 1
+            >>> print(setlangstring)  # Output: {'Hello'}@en
+        """
+        if flag_type is not None and flag_type not in cls.FLAG_TYPES:
+            raise TypeError(
+                f"Invalid flag_type with value '{flag_type}'. Expected one of "
+                f"{', '.join(repr(flag.__name__) for flag in cls.FLAG_TYPES)}."
+            )
+
+        memos: dict[_FlagType, _FlagMemo] = {}
+
+        def get_memo(default_flag_type: _FlagType) -> _FlagMemo:
+            current_flag_type = default_flag_type if flag_type is None else flag_type
+            memo = memos.get(current_flag_type)
+            if memo is None:
+                memo = memos[current_flag_type] = _FlagMemo(current_flag_type)
+            return memo
+
+        modified = 0
+        for obj in objects:
+            if isinstance(obj, LangString):
+                modified += cls._renormalize_langstring(obj, get_memo(LangStringFlag))
+            elif isinstance(obj, SetLangStringView):
+                raise TypeError(
+                    "Invalid argument of type 'SetLangStringView'. Views are read-only: renormalize the "
+                    "MultiLangString they belong to instead."
+                )
+            elif isinstance(obj, SetLangString):
+                modified += cls._renormalize_setlangstring(obj, get_memo(SetLangStringFlag))
+            elif isinstance(obj, MultiLangString):
+                modified += cls._renormalize_multilangstring(obj, get_memo(MultiLangStringFlag))
+            else:
+                raise TypeError(
+                    f"Invalid argument with value '{obj}'. Expected one of 'LangString', 'SetLangString', or "
+                    f"'MultiLangString', but got '{type(obj).__name__}'."
+                )
+        return modified
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def _renormalize_langstring(langstring: LangString, memo: _FlagMemo) -> bool:
+        """
+        Reapply the flags to a LangString.
+
+        :param langstring: The LangString to be renormalized.
+        :type langstring: LangString
+        :param memo: The memoized validations.
+        :type memo: _FlagMemo
+        :return: True if the LangString was modified, otherwise False.
+        :rtype: bool
+        :raises AttributeError: If the LangString must be modified but is frozen.
+        """
+        new_text = memo.text(langstring._text) if memo.validate_texts else langstring._text
+        new_lang = memo.lang(langstring._lang) if memo.validate_langs else langstring._lang
+        if new_text == langstring._text and new_lang == langstring._lang:
+            return False
+        langstring._check_not_frozen()
+        langstring._text = new_text
+        langstring._lang = new_lang
+        return True
+
+    @staticmethod
+    def _renormalize_setlangstring(setlangstring: SetLangString, memo: _FlagMemo) -> bool:
+        """
+        Reapply the flags to a SetLangString.
+
+        :param setlangstring: The SetLangString to be renormalized.
+        :type setlangstring: SetLangString
+        :param memo: The memoized validations.
+        :type memo: _FlagMemo
+        :return: True if the SetLangString was modified, otherwise False.
+        :rtype: bool
+        """
+        new_lang = memo.lang(setlangstring._lang) if memo.validate_langs else setlangstring._lang
+        new_texts: Optional[set[str]] = None
+        if memo.validate_texts:
+            validated_texts = {memo.text(text) for text in setlangstring._texts}
+            if validated_texts != setlangstring._texts:
+                new_texts = validated_texts
+
+        if new_texts is None and new_lang == setlangstring._lang:
+            return False
+        if new_texts is not None:
+            setlangstring._texts.clear()
+            setlangstring._texts.update(new_texts)
+        setlangstring._lang = new_lang
+        return True
+
+    @staticmethod
+    def _renormalize_multilangstring(multilangstring: MultiLangString, memo: _FlagMemo) -> bool:
+        """
+        Reapply the flags to a MultiLangString, merging the languages that become case-insensitive duplicates.
+
+        Languages whose tag and texts are unchanged keep their sets of texts, including their copy-on-write sharing
+        state.
+
+        :param multilangstring: The MultiLangString to be renormalized.
+        :type multilangstring: MultiLangString
+        :param memo: The memoized validations.
+        :type memo: _FlagMemo
+        :return: True if the MultiLangString was modified, otherwise False.
+        :rtype: bool
+        """
+        mls_dict = multilangstring._mls_dict
+        new_pref_lang = memo.lang(multilangstring._pref_lang) if memo.validate_langs else multilangstring._pref_lang
+        changed = new_pref_lang != multilangstring._pref_lang
+
+        # Group the languages by casefolded new tag: (new tag, current tag, new texts or None if unchanged)
+        groups: dict[str, list[tuple[str, str, Optional[set[str]]]]] = {}
+        for lang, texts in mls_dict.items():
+            new_lang = memo.lang(lang) if memo.validate_langs else lang
+            new_texts: Optional[set[str]] = None
+            if memo.validate_texts:
+                validated_texts = {memo.text(text) for text in texts}
+                if validated_texts != texts:
+                    new_texts = validated_texts
+            groups.setdefault(new_lang.casefold(), []).append((new_lang, lang, new_texts))
+            changed = changed or new_lang != lang or new_texts is not None
+
+        changed = changed or len(groups) != len(mls_dict)
+        if not changed:
+            return False
+
+        new_mls_dict: dict[str, set[str]] = {}
+        new_shared_langs: set[str] = set()
+        for lang_cf, entries in groups.items():
+            variants = {new_lang for new_lang, _, _ in entries}
+            new_lang = variants.pop() if len(variants) == 1 else lang_cf
+            if len(entries) == 1 and entries[0][2] is None:
+                lang = entries[0][1]
+                new_mls_dict[new_lang] = mls_dict[lang]
+                if lang in multilangstring._shared_langs:
+                    new_shared_langs.add(new_lang)
+                continue
+            merged_texts = MultiLangString._new_texts_set()
+            for _, lang, entry_texts in entries:
+                merged_texts.update(mls_dict[lang] if entry_texts is None else entry_texts)
+            new_mls_dict[new_lang] = merged_texts
+
+        mls_dict.clear()
+        mls_dict.update(new_mls_dict)
+        multilangstring._shared_langs = new_shared_langs
+        multilangstring._pref_lang = new_pref_lang
+        return True
@@ -38,16 +38,21 @@ Modules:
     controller: Provides control flags that influence the behavior of the SetLangString class.
     flags: Defines the SetLangStringFlag class with various control flags for the SetLangString class.
     langstring: Provides the LangString class used within the SetLangString class.
+    text_pool: Provides the TextPool class, used to share equal texts when enabled.
     utils.validators: Provides validation methods used within the SetLangString class.
 """
 
+from typing import Any
+from typing import Callable
 from typing import Iterator
 from typing import Optional
+from typing import SupportsIndex
 from typing import Union
 
 from .controller import Controller
 from .flags import SetLangStringFlag
 from .langstring import LangString
+from .text_pool import TextPool
 from .utils.validators import FlagValidator
 from .utils.validators import TypeValidator
 
@@ -116,7 +121,8 @@ class SetLangString:
         Set the set of text strings.
 
         If the provided texts are None, it defaults to an empty set.
-        This method also validates the type and the texts based on control flags.
+        This method also validates the type and the texts based on control flags. If the `TextPool` is enabled, the
+        stored texts are the pooled strings equal to the validated texts.
 
         :param new_texts: The new set of text strings or a list of text strings.
         :type new_texts: Optional[Union[set[str], list[str]]]
@@ -134,7 +140,7 @@ class SetLangString:
         self._texts = set()
 
         for text_value in new_texts:
-            self._texts.add(FlagValidator.validate_flags_text(SetLangStringFlag, text_value))
+            self._texts.add(TextPool.intern(FlagValidator.validate_flags_text(SetLangStringFlag, text_value)))
 
     @property
     def lang(self) -> str:
@@ -189,7 +195,7 @@ class SetLangString:
             >>> print(set_lang_str)  # Output: {'Hello', 'World'}@en
         """
         self._validate_match_types_and_langs(langstring, True)
-        self.texts.add(FlagValidator.validate_flags_text(SetLangStringFlag, langstring.text))
+        self._texts.add(FlagValidator.validate_flags_text(SetLangStringFlag, langstring.text))
 
     @TypeValidator.validate_type_decorator
     def add_text(self, text: str) -> None:
@@ -210,7 +216,7 @@ class SetLangString:
             >>> set_lang_str.add_text("World")
             >>> print(set_lang_str)  # Output: {'Hello', 'World'}@en
         """
-        self.texts.add(FlagValidator.validate_flags_text(SetLangStringFlag, text))
+        self._texts.add(FlagValidator.validate_flags_text(SetLangStringFlag, text))
 
     @TypeValidator.validate_type_decorator
     def discard_text(self, text: str) -> None:
@@ -232,7 +238,7 @@ class SetLangString:
             >>> set_lang_str.discard_text("Python")
             >>> print(set_lang_str)  # Output: {'Hello'}@en
         """
-        self.texts.discard(text)
+        self._texts.discard(text)
 
     @TypeValidator.validate_type_decorator
     def discard_langstring(self, langstring: LangString) -> None:
@@ -259,7 +265,7 @@ class SetLangString:
             >>> print(set_lang_str)  # Output: {'Hello'}@en
         """
         self._validate_match_types_and_langs(langstring, True)
-        self.texts.discard(langstring.text)
+        self._texts.discard(langstring.text)
 
     @TypeValidator.validate_type_decorator
     def remove_langstring(self, langstring: LangString) -> None:
@@ -281,7 +287,7 @@ class SetLangString:
             >>> set_lang_str.remove_text("Python")  # Raises KeyError
         """
         self._validate_match_types_and_langs(langstring, True)
-        self.texts.remove(langstring.text)
+        self._texts.remove(langstring.text)
 
     @TypeValidator.validate_type_decorator
     def remove_text(self, text: str) -> None:
@@ -306,7 +312,7 @@ class SetLangString:
             >>> lang_str = LangString("Python", "en")
             >>> set_lang_str.remove_langstring(lang_str)  # Raises KeyError
         """
-        self.texts.remove(text)
+        self._texts.remove(text)
 
     @TypeValidator.validate_type_decorator
     def to_langstrings(self) -> list[LangString]:
@@ -314,6 +320,8 @@ class SetLangString:
         Convert the set of texts to a list of LangString objects.
 
         This method creates a LangString object for each text in the set, associating it with the set's language tag.
+        If the flyweight cache of LangString is enabled (see `LangString.enable_flyweight_cache`), the LangStrings are
+        shared, frozen ones.
 
         :return: A list of LangString objects.
         :rtype: list[LangString]
@@ -329,9 +337,11 @@ class SetLangString:
             # "Hello"@en
             # "World"en
         """
+        if LangString._flyweight_cache is not None:
+            return [LangString.flyweight(text, self.lang) for text in self._texts]
         langstrings = []
-        for text in self.texts:
-            langstrings.append(LangString(text=text, lang=self.lang))
+        for text in self._texts:
+            langstrings.append(LangString._from_validated(text, self.lang))
         return langstrings
 
     @TypeValidator.validate_type_decorator
@@ -379,13 +389,91 @@ class SetLangString:
 
         strings = []
 
-        for text in self.texts:
+        for text in self._texts:
             new_text = f'"{text}"' if print_quotes else text
             new_lang = f"{separator}{self.lang}" if print_lang else ""
             strings.append(f"{new_text}{new_lang}")
 
         return sorted(strings)
 
+    def filter_texts(self, predicate: Callable[[str], Any]) -> "SetLangString":
+        """
+        Return a new SetLangString with the texts for which the predicate returns a true value.
+
+        The kept texts and the language tag are already validated, so they are not validated again.
+
+        :param predicate: The function called with each text.
+        :type predicate: Callable[[str], Any]
+        :return: A new SetLangString with the kept texts and the same language tag.
+        :rtype: SetLangString
+        :raises TypeError: If predicate is not callable.
+
+        **Example**::
+
+            >>> set_lang_str = SetLangString({"Hello", "Hi", "World"}, "en")
+            >>> print(set_lang_str.filter_texts(lambda text: text.startswith("H")))  # Output: {'Hello', 'Hi'}@en
+        """
+        TypeValidator.validate_type_callable(predicate)
+        return SetLangString._from_state({text for text in self._texts if predicate(text)}, self.lang)
+
+    def map_langs(self, func: Callable[[str], str]) -> "SetLangString":
+        """
+        Return a new SetLangString with the same texts and the language tag transformed by the given function.
+
+        The new language tag is validated according to the `SetLangStringFlag` flags. The texts are not validated again.
+
+        :param func: The function called with the language tag, returning the new language tag.
+        :type func: Callable[[str], str]
+        :return: A new SetLangString with the same texts and the new language tag.
+        :rtype: SetLangString
+        :raises TypeError: If func is not callable or does not return a string.
+        :raises ValueError: If the new language tag violates the enabled flags.
+
+        **Example**::
+
+            >>> set_lang_str = SetLangString({"Hello"}, "en-us")
+            >>> print(set_lang_str.map_langs(lambda lang: lang.split("-")[0]))  # Output: {'Hello'}@en
+        """
+        TypeValidator.validate_type_callable(func)
+        new_lang = func(self.lang)
+        TypeValidator.validate_type_single(new_lang, str)
+        return SetLangString._from_state(
+            self._texts.copy(), FlagValidator.validate_flags_lang(SetLangStringFlag, new_lang)
+        )
+
+    def map_texts(self, func: Callable[[str], str]) -> "SetLangString":
+        """
+        Return a new SetLangString with each text transformed by the given function.
+
+        This is equivalent to creating a new SetLangString with the transformed texts, but texts mapped to the same
+        value are validated only once, according to the `SetLangStringFlag` flags, and the language tag is not
+        validated again. If the `TextPool` is enabled, the stored texts are the pooled strings equal to the validated
+        texts.
+
+        :param func: The function called with each text, returning the new text.
+        :type func: Callable[[str], str]
+        :return: A new SetLangString with the transformed texts and the same language tag.
+        :rtype: SetLangString
+        :raises TypeError: If func is not callable or does not return strings.
+        :raises ValueError: If a transformed text violates the enabled flags.
+
+        **Example**::
+
+            >>> set_lang_str = SetLangString({" Hello", "Hello ", "World"}, "en")
+            >>> print(set_lang_str.map_texts(str.strip))  # Output: {'Hello', 'World'}@en
+        """
+        TypeValidator.validate_type_callable(func)
+        new_texts = set()
+        for text in self._texts:
+            new_text = func(text)
+            TypeValidator.validate_type_single(new_text, str)
+            new_texts.add(new_text)
+        if FlagValidator.text_flags_enabled(SetLangStringFlag):
+            new_texts = {FlagValidator.validate_flags_text(SetLangStringFlag, text) for text in new_texts}
+        if TextPool.is_enabled():
+            new_texts = {TextPool.intern(text) for text in new_texts}
+        return SetLangString._from_state(new_texts, self.lang)
+
     # -------------------------------------------
     # Overwritten Set's Built-in Regular Methods
     # -------------------------------------------
@@ -433,14 +521,14 @@ class SetLangString:
             >>> set_lang_str.clear()
             >>> print(set_lang_str)  # Output: {}@en
         """
-        self.texts.clear()
+        self._texts.clear()
 
     def copy(self) -> "SetLangString":
         """
         Create a shallow copy of the SetLangString.
 
         This method returns a new SetLangString object that is a shallow copy of the original, mimicking the behavior
-        of the standard set's copy method.
+        of the standard set's copy method. The already validated texts and language tag are not validated again.
 
         :return: A shallow copy of the SetLangString.
         :rtype: SetLangString
@@ -451,7 +539,7 @@ class SetLangString:
             >>> copied_set_lang_str = set_lang_str.copy()
             >>> print(copied_set_lang_str)  # Output: {'Hello', 'World'}@en
         """
-        return SetLangString(texts=self.texts.copy(), lang=self.lang)
+        return self.__copy__()
 
     def discard(self, element: Union[str, LangString]) -> None:
         """
@@ -500,7 +588,7 @@ class SetLangString:
             >>> print(element)  # Output: 'Hello' or 'World'
             >>> print(set_lang_str)  # Output: {'World'}@en or {'Hello'}@en
         """
-        return self.texts.pop()
+        return self._texts.pop()
 
     def remove(self, element: Union[str, LangString]) -> None:
         """
@@ -553,8 +641,8 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        difference_texts = self.texts.difference(*others_texts)
-        return SetLangString(texts=difference_texts, lang=self.lang)
+        difference_texts = self._texts.difference(*others_texts)
+        return SetLangString._from_validated(difference_texts, self.lang)
 
     def difference_update(self, *others: Union[set[str], "SetLangString"]) -> None:
         """
@@ -577,7 +665,7 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        self.texts.difference_update(*others_texts)
+        self._texts.difference_update(*others_texts)
 
     def isdisjoint(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -601,7 +689,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts.isdisjoint(other_texts)
+        return self._texts.isdisjoint(other_texts)
 
     def issubset(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -625,7 +713,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts.issubset(other_texts)
+        return self._texts.issubset(other_texts)
 
     def issuperset(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -649,7 +737,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts.issuperset(other_texts)
+        return self._texts.issuperset(other_texts)
 
     def intersection(self, *others: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -674,8 +762,8 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        intersection_texts = self.texts.intersection(*others_texts)
-        return SetLangString(texts=intersection_texts, lang=self.lang)
+        intersection_texts = self._texts.intersection(*others_texts)
+        return SetLangString._from_validated(intersection_texts, self.lang)
 
     def intersection_update(self, *others: Union[set[str], "SetLangString"]) -> None:
         """
@@ -698,7 +786,7 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        self.texts.intersection_update(*others_texts)
+        self._texts.intersection_update(*others_texts)
 
     def symmetric_difference(self, other: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -722,8 +810,10 @@ class SetLangString:
         """
         other_texts = self._extract_texts(other)
         self._validate_match_types_and_langs(other)
-        sym_diff_texts = self.texts.symmetric_difference(other_texts)
-        return SetLangString(texts=sym_diff_texts, lang=self.lang)
+        sym_diff_texts = self._texts.symmetric_difference(other_texts)
+        if not isinstance(other, SetLangString):
+            TypeValidator.validate_type_iterable(sym_diff_texts, set, str)
+        return SetLangString._from_validated(sym_diff_texts, self.lang)
 
     def symmetric_difference_update(self, other: Union[set[str], "SetLangString"]) -> None:
         """
@@ -745,7 +835,7 @@ class SetLangString:
         """
         other_texts = self._extract_texts(other)
         self._validate_match_types_and_langs(other)
-        self.texts.symmetric_difference_update(other_texts)
+        self._texts.symmetric_difference_update(other_texts)
 
     def union(self, *others: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -770,8 +860,10 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        union_texts = self.texts.union(*others_texts)
-        return SetLangString(texts=union_texts, lang=self.lang)
+        union_texts = self._texts.union(*others_texts)
+        if not all(isinstance(other, SetLangString) for other in others):
+            TypeValidator.validate_type_iterable(union_texts, set, str)
+        return SetLangString._from_validated(union_texts, self.lang)
 
     def update(self, *others: Union[set[str], "SetLangString"]) -> None:
         """
@@ -794,7 +886,7 @@ class SetLangString:
         others_texts = [self._extract_texts(other) for other in others]
         for other in others:
             self._validate_match_types_and_langs(other)
-        self.texts.update(*others_texts)
+        self._texts.update(*others_texts)
 
     # -------------------------------------------
     # Overwritten Set's Built-in Dunder Methods
@@ -851,11 +943,45 @@ class SetLangString:
 
         # If element is a string, check if it's in the texts
         if isinstance(element, str):
-            return element in self.texts
+            return element in self._texts
 
         # If element is a LangString, check if its text is in the texts
         # No need to check 'isinstance(element, LangString)' as type validation assures that
-        return element.text in self.texts
+        return element.text in self._texts
+
+    def __copy__(self) -> "SetLangString":
+        """
+        Create a shallow copy of the SetLangString.
+
+        The copy has its own set of texts, created directly from the already validated texts and language tag, which
+        are not validated again. This method is used by `copy.copy` and by the `copy` method.
+
+        :return: A new SetLangString with the same texts and language tag.
+        :rtype: SetLangString
+
+        **Example**::
+
+            >>> set_lang_str = SetLangString({"Hello", "World"}, "en")
+            >>> copied_set_lang_str = copy.copy(set_lang_str)
+            >>> print(copied_set_lang_str)  # Output: {'Hello', 'World'}@en
+        """
+        return self.__class__._from_state(self._texts.copy(), self.lang)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "SetLangString":
+        """
+        Create a deep copy of the SetLangString.
+
+        As the texts and the language tag are immutable strings, the deep copy is created exactly as the shallow copy,
+        without validating them again. This method is used by `copy.deepcopy`.
+
+        :param memo: The dictionary of objects already copied during the current copying pass.
+        :type memo: dict[int, Any]
+        :return: A new SetLangString with the same texts and language tag.
+        :rtype: SetLangString
+        """
+        new_setlangstring = self.__copy__()
+        memo[id(self)] = new_setlangstring
+        return new_setlangstring
 
     def __eq__(self, other: object) -> bool:
         """
@@ -880,7 +1006,7 @@ class SetLangString:
         if not isinstance(other, SetLangString):
             return NotImplemented
 
-        return self.texts == other.texts and self.lang.casefold() == other.lang.casefold()
+        return self._texts == other._texts and self.lang.casefold() == other.lang.casefold()
 
     def __ge__(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -904,7 +1030,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts >= other_texts
+        return self._texts >= other_texts
 
     def __gt__(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -928,7 +1054,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts > other_texts
+        return self._texts > other_texts
 
     def __hash__(self) -> int:
         """
@@ -947,7 +1073,7 @@ class SetLangString:
             >>> print(hash_value)  # Output: A unique integer representing the hash value
         """
         # Convert the set to a frozenset for hashing, as sets are mutable and, hence, unhashable.
-        return hash((frozenset(self.texts), self.lang.casefold()))
+        return hash((frozenset(self._texts), self.lang.casefold()))
 
     def __iand__(self, other: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -1037,7 +1163,7 @@ class SetLangString:
             # Output: 'Hello'
             #         'World'
         """
-        return iter(self.texts)
+        return iter(self._texts)
 
     def __ixor__(self, other: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -1084,7 +1210,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts <= other_texts
+        return self._texts <= other_texts
 
     def __len__(self) -> int:
         """
@@ -1102,7 +1228,7 @@ class SetLangString:
             >>> length = len(set_lang_str)
             >>> print(length)  # Output: 2
         """
-        return len(self.texts)
+        return len(self._texts)
 
     def __lt__(self, other: Union[set[str], "SetLangString"]) -> bool:
         """
@@ -1126,7 +1252,7 @@ class SetLangString:
         """
         self._validate_match_types_and_langs(other)
         other_texts = self._extract_texts(other)
-        return self.texts < other_texts
+        return self._texts < other_texts
 
     def __or__(self, other: Union[set[str], "SetLangString"]) -> "SetLangString":
         """
@@ -1150,6 +1276,20 @@ class SetLangString:
         """
         return self.union(other)
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """
+        Support pickling by rebuilding the SetLangString from its already validated texts and language tag.
+
+        Unpickling does not validate the texts and the language tag again, which avoids the validation cost when, e.g.,
+        transferring SetLangStrings between processes.
+
+        :param protocol: The pickle protocol version.
+        :type protocol: SupportsIndex
+        :return: A tuple with the function used to rebuild the SetLangString and its arguments.
+        :rtype: tuple[Any, ...]
+        """
+        return self.__class__._from_state, (self._texts, self.lang)
+
     def __repr__(self) -> str:
         """
         Return the official string representation of the SetLangString object.
@@ -1166,7 +1306,7 @@ class SetLangString:
             >>> repr_str = repr(set_lang_str)
             >>> print(repr_str)  # Output: SetLangString(texts={'Hello', 'World'}, lang='en')
         """
-        return f"{self.__class__.__name__}(texts={repr(self.texts)}, lang={repr(self.lang)})"
+        return f"{self.__class__.__name__}(texts={repr(self._texts)}, lang={repr(self.lang)})"
 
     def __str__(self) -> str:
         """
@@ -1185,11 +1325,11 @@ class SetLangString:
             >>> set_lang_str = SetLangString({"Hello", "World"}, "en")
             >>> print(str(set_lang_str))  # Output: {'Hello', 'World'}@en
         """
-        if not self.texts:
+        if not self._texts:
             texts_str = "{}"
         else:
             # The texts are sorted to ensure deterministic output.
-            sorted_texts = sorted(self.texts)
+            sorted_texts = sorted(self._texts)
             if Controller.get_flag(SetLangStringFlag.PRINT_WITH_QUOTES):
                 texts_str = "{" + ", ".join(f"'{text}'" for text in sorted_texts) + "}"
             else:
@@ -1302,6 +1442,56 @@ class SetLangString:
     # Private Methods
     # -------------------------------------------
 
+    @classmethod
+    def _from_state(cls, texts: set[str], lang: str) -> "SetLangString":
+        """
+        Create a SetLangString from the internal state of an existing SetLangString, without any check or validation.
+
+        This is the construction path used when copying and unpickling SetLangStrings. The set is used as the new
+        object's storage, so it must not be shared.
+
+        :param texts: A new set of already validated text strings, owned by the created object.
+        :type texts: set[str]
+        :param lang: The already validated language tag.
+        :type lang: str
+        :return: The new SetLangString.
+        :rtype: SetLangString
+        """
+        new_setlangstring = cls.__new__(cls)
+        new_setlangstring._texts = texts
+        new_setlangstring._lang = lang
+        return new_setlangstring
+
+    @classmethod
+    def _from_validated(cls, texts: set[str], lang: str) -> "SetLangString":
+        """
+        Create a SetLangString from a new set of strings and a language tag string, skipping redundant checks.
+
+        This is the construction path used by the methods that derive new SetLangStrings from existing ones. The set is
+        used as the new object's storage, so it must not be shared. The types of the arguments are not checked, and
+        the flag validations are only performed when a flag that may transform or reject the values is enabled, so the
+        result is always the same as the one of the public constructor. As in the constructor, the texts are pooled if
+        the `TextPool` is enabled.
+
+        :param texts: A new set of text strings, owned by the created object.
+        :type texts: set[str]
+        :param lang: The language tag for the set of texts.
+        :type lang: str
+        :return: The new SetLangString.
+        :rtype: SetLangString
+        :raises ValueError: If the enabled flags reject any text or the language tag.
+        """
+        new_setlangstring = cls.__new__(cls)
+        if FlagValidator.text_flags_enabled(SetLangStringFlag):
+            texts = {FlagValidator.validate_flags_text(SetLangStringFlag, text) for text in texts}
+        if FlagValidator.lang_flags_enabled(SetLangStringFlag):
+            lang = FlagValidator.validate_flags_lang(SetLangStringFlag, lang)
+        if TextPool.is_enabled():
+            texts = {TextPool.intern(text) for text in texts}
+        new_setlangstring._texts = texts
+        new_setlangstring._lang = lang
+        return new_setlangstring
+
     def _validate_match_types_and_langs(
         self, other: Union[str, set[str], "SetLangString", "LangString"], overwrite_strict: bool = False
     ) -> None:
@@ -1365,4 +1555,4 @@ class SetLangString:
             >>> texts = set_lang_str._extract_texts(set_lang_str)
             >>> print(texts)  # Output: {'Hello', 'World'}
         """
-        return other.texts if isinstance(other, SetLangString) else other
+        return other._texts if isinstance(other, SetLangString) else other
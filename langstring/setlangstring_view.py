@@ -0,0 +1,373 @@
+"""
+A read-only live view of one language of a `MultiLangString`.
+
+`MultiLangString.get_setlangstring` returns an independent `SetLangString`, which requires copying and re-validating all
+texts of the language. A `SetLangStringView`, obtained with `MultiLangString.get_setlangstring_view`, exposes the same
+read API (membership tests, iteration, length, comparisons, and set algebra) directly over the set of texts stored
+inside the `MultiLangString`, without copying it. The view is live: changes made to the `MultiLangString` are
+immediately visible through it. When an independent copy is needed, it can be obtained with `materialize`.
+
+Views are `SetLangString` instances, so they can be used wherever a `SetLangString` is read. Operations that would
+modify the view raise a TypeError, as the texts must be changed through the `MultiLangString`. Set algebra operations,
+such as `union` or `intersection`, return new and independent `SetLangString` objects.
+
+Key Features:
+    - **Zero-Copy Reads**: Texts are read directly from the `MultiLangString` storage.
+    - **Live Updates**: The view always reflects the current texts of its language in the `MultiLangString`.
+    - **Explicit Copies**: The `materialize` method returns an independent `SetLangString`.
+
+Classes:
+    - **SetLangStringView**: A read-only live view of a language of a `MultiLangString`.
+
+**Example**::
+
+    >>> mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    >>> view = mls.get_setlangstring_view("en")
+    >>> mls.add_entry("Hi", "en")
+    >>> print(view)  # Output: {'Hello', 'Hi'}@en
+    >>> print("Hi" in view)  # Output: True
+    >>> setlangstring = view.materialize()
+"""
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NoReturn
+from typing import Optional
+from typing import SupportsIndex
+from typing import Union
+
+from .flags import SetLangStringFlag
+from .langstring import LangString
+from .setlangstring import SetLangString
+from .utils.validators import FlagValidator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .multilangstring import MultiLangString
+
+
+class SetLangStringView(SetLangString):
+    """
+    A read-only live view of the texts of one language of a `MultiLangString`.
+
+    Views are created by `MultiLangString.get_setlangstring_view` and should not be instantiated directly.
+
+    :ivar texts: A snapshot of the texts of the language in the MultiLangString.
+    :vartype texts: frozenset[str]
+    :ivar lang: The language tag of the view.
+    :vartype lang: str
+    """
+
+    def __init__(self, multilangstring: "MultiLangString", lang: str) -> None:
+        """
+        Initialize a new view of a language of a MultiLangString.
+
+        The language tag of the view is validated according to the SetLangStringFlag flags, as in the SetLangString
+        returned by `MultiLangString.get_setlangstring`.
+
+        :param multilangstring: The MultiLangString containing the texts.
+        :type multilangstring: MultiLangString
+        :param lang: The language of the view. It is matched case-insensitively to the languages of the MultiLangString.
+        :type lang: str
+        """
+        self._multilangstring = multilangstring
+        self._lang = FlagValidator.validate_flags_lang(SetLangStringFlag, lang)
+        registered_lang = multilangstring._get_registered_lang(lang)
+        self._registered_lang = lang if registered_lang is None else registered_lang
+
+    # -------------------------------------------
+    # Getters and Setters
+    # -------------------------------------------
+
+    @property  # type: ignore[override]
+    def texts(self) -> frozenset[str]:
+        """
+        Get the current texts of the language in the MultiLangString.
+
+        If the language is not present in the MultiLangString, an empty set is returned. The texts are returned as a
+        frozenset, so they cannot be modified through the view; the read API of the view does not copy them.
+
+        :return: A snapshot of the texts.
+        :rtype: frozenset[str]
+        """
+        return frozenset(self._texts)
+
+    @texts.setter
+    def texts(self, new_texts: Optional[Union[set[str], list[str]]]) -> NoReturn:
+        """
+        Refuse to set the texts of the view.
+
+        :param new_texts: The new texts.
+        :type new_texts: Optional[Union[set[str], list[str]]]
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    @property
+    def _texts(self) -> set[str]:  # type: ignore[override]
+        """
+        Get the set of texts of the language stored in the MultiLangString, used by the read API of the view.
+
+        :return: The stored set of texts, or an empty set if the language is not present. It must not be modified.
+        :rtype: set[str]
+        """
+        mls_dict = self._multilangstring._mls_dict
+        texts = mls_dict.get(self._registered_lang)
+        if texts is None:
+            # The language may have been removed or registered again with another casing.
+            registered_lang = self._multilangstring._get_registered_lang(self._registered_lang)
+            if registered_lang is None:
+                return set()
+            self._registered_lang = registered_lang
+            texts = mls_dict[registered_lang]
+        return texts
+
+    @property
+    def lang(self) -> str:
+        """
+        Get the language tag of the view.
+
+        :return: The language tag.
+        :rtype: str
+        """
+        return self._lang
+
+    @lang.setter
+    def lang(self, new_lang: str) -> NoReturn:
+        """
+        Refuse to set the language tag of the view.
+
+        :param new_lang: The new language tag.
+        :type new_lang: str
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    # -------------------------------------------
+    # SetLangStringView's Regular Methods
+    # -------------------------------------------
+
+    def materialize(self) -> SetLangString:
+        """
+        Create an independent SetLangString with the current texts and the language tag of the view.
+
+        The result is the same SetLangString returned by `MultiLangString.get_setlangstring`.
+
+        :return: A new SetLangString.
+        :rtype: SetLangString
+
+        **Example**::
+
+            >>> mls = MultiLangString({"en": {"Hello"}})
+            >>> setlangstring = mls.get_setlangstring_view("en").materialize()
+            >>> setlangstring.add("Hi")
+            >>> print(mls)  # Output: {'Hello'}@en
+        """
+        return SetLangString._from_validated(set(self._texts), self.lang)
+
+    # -------------------------------------------
+    # Copying and Pickling
+    # -------------------------------------------
+
+    def __copy__(self) -> SetLangString:
+        """
+        Create an independent SetLangString, as `materialize`. This method is used by `copy.copy` and `copy`.
+
+        :return: A new SetLangString.
+        :rtype: SetLangString
+        """
+        return self.materialize()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> SetLangString:
+        """
+        Create an independent SetLangString, as `materialize`. This method is used by `copy.deepcopy`.
+
+        :param memo: The dictionary of objects already copied during the current copying pass.
+        :type memo: dict[int, Any]
+        :return: A new SetLangString.
+        :rtype: SetLangString
+        """
+        materialized = self.materialize()
+        memo[id(self)] = materialized
+        return materialized
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """
+        Support pickling by pickling the materialized SetLangString, as views cannot exist without a MultiLangString.
+
+        :param protocol: The pickle protocol version.
+        :type protocol: SupportsIndex
+        :return: A tuple with the function used to rebuild the SetLangString and its arguments.
+        :rtype: tuple[Any, ...]
+        """
+        return self.materialize().__reduce_ex__(protocol)
+
+    # -------------------------------------------
+    # Read-Only Overrides of the Mutating Methods
+    # -------------------------------------------
+
+    def add_langstring(self, langstring: LangString) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def add_text(self, text: str) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def discard_text(self, text: str) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def discard_langstring(self, langstring: LangString) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def remove_langstring(self, langstring: LangString) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def remove_text(self, text: str) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def add(self, new_element: Union[str, LangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def clear(self) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def discard(self, element: Union[str, LangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def pop(self) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def remove(self, element: Union[str, LangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def difference_update(self, *others: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def intersection_update(self, *others: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def symmetric_difference_update(self, other: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def update(self, *others: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def __iand__(self, other: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def __ior__(self, other: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def __isub__(self, other: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    def __ixor__(self, other: Union[set[str], SetLangString]) -> NoReturn:
+        """
+        Refuse to modify the view.
+
+        :raises TypeError: Always, as views are read-only.
+        """
+        self._raise_read_only()
+
+    # -------------------------------------------
+    # Private Methods
+    # -------------------------------------------
+
+    def _raise_read_only(self) -> NoReturn:
+        """
+        Raise the error used by all operations that would modify the view.
+
+        :raises TypeError: Always.
+        """
+        raise TypeError(
+            f"{self.__class__.__name__} is read-only. Modify the MultiLangString, or use 'materialize' to obtain an "
+            f"independent SetLangString."
+        )
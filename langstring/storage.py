@@ -0,0 +1,405 @@
+"""
+A persistent repository of `MultiLangString` objects backed by a local SQLite database.
+
+Large collections of labels (e.g., tens of millions of language-tagged texts) cannot be kept in memory as
+`MultiLangString` objects. The `MultiLangStringStore` persists them, keyed by a string identifier, in a database file
+handled by the standard library `sqlite3` module, so no additional dependency is required. Each text is stored as a row
+of a normalized table with the columns `(id, lang_casefold, lang_original, text)`, indexed by language and by text, so
+that identifiers can be looked up without reading the stored objects.
+
+Key Features:
+    - **Batched Writes**: Rows are written with `executemany` in batches of bounded size, inside a single transaction.
+    - **Streaming Reads**: Stored objects are rebuilt lazily, one at a time, while the rows are read from the database.
+    - **Indexed Lookups**: Identifiers can be found by text or by (case-insensitive) language tag.
+    - **Consistent Semantics**: Objects are rebuilt with the `MultiLangString` constructor, so language tags differing
+      only in casing are merged as usual and the current `MultiLangStringFlag` flags are applied.
+
+Classes:
+    - **MultiLangStringStore**: Persists MultiLangStrings, keyed by identifier, in a SQLite database.
+
+**Example**::
+
+    >>> with MultiLangStringStore("labels.db") as store:
+    >>>     store.put("Q90", MultiLangString({"en": {"Paris"}, "fr": {"Paris"}}))
+    >>>     print(store.find_ids_by_text("Paris", "FR"))  # Output: ['Q90']
+    >>>     print(store.get("Q90"))  # Output: {'Paris'}@en, {'Paris'}@fr
+"""
+
+import sqlite3
+from itertools import groupby
+from os import PathLike
+from types import TracebackType
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from .multilangstring import MultiLangString
+from .utils.validators import TypeValidator
+
+# Type of the rows of the entries table, as written to the database
+_EntryRow = tuple[str, str, str, Optional[str]]
+
+
+class MultiLangStringStore:
+    """
+    A persistent repository of MultiLangStrings, keyed by identifier, backed by a SQLite database.
+
+    Each MultiLangString is stored as one row per text (or one row with no text for languages without texts), together
+    with its preferred language. Storing an object under an existing identifier replaces the previous one.
+
+    The store owns its database connection. It should be closed when no longer needed, either explicitly with `close`
+    or by using it as a context manager.
+
+    :cvar DEFAULT_BATCH_SIZE: The default maximum number of rows written with a single `executemany` call.
+    :vartype DEFAULT_BATCH_SIZE: int
+
+    **Example**::
+
+        >>> store = MultiLangStringStore()  # In-memory database
+        >>> store.put_many([("a", MultiLangString({"en": {"Hi"}})), ("b", MultiLangString({"EN": {"Yes"}}))])
+        >>> print(store.find_ids_by_lang("en"))  # Output: ['a', 'b']
+        >>> store.close()
+    """
+
+    DEFAULT_BATCH_SIZE: int = 10000
+
+    def __init__(self, path: Union[str, "PathLike[str]"] = ":memory:", batch_size: Optional[int] = None) -> None:
+        """
+        Initialize a new store, creating the database tables and indexes if they do not exist.
+
+        :param path: The path of the database file. Defaults to ":memory:", creating a temporary in-memory database.
+        :type path: Union[str, PathLike[str]]
+        :param batch_size: The maximum number of rows written with a single `executemany` call. Defaults to
+                           DEFAULT_BATCH_SIZE.
+        :type batch_size: Optional[int]
+        :raises TypeError: If batch_size is not an integer.
+        :raises ValueError: If batch_size is not positive.
+        """
+        TypeValidator.validate_type_single(batch_size, int, optional=True)
+        batch_size = self.DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size. Expected a positive integer, got '{batch_size}'.")
+
+        self._batch_size = batch_size
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS multilangstrings (
+                    id TEXT PRIMARY KEY,
+                    pref_lang TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    seq INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL,
+                    lang_casefold TEXT NOT NULL,
+                    lang_original TEXT NOT NULL,
+                    text TEXT
+                );
+                CREATE INDEX IF NOT EXISTS entries_id ON entries (id);
+                CREATE INDEX IF NOT EXISTS entries_lang ON entries (lang_casefold, id);
+                CREATE INDEX IF NOT EXISTS entries_text ON entries (text, lang_casefold);
+                """)
+
+    # ---------------------------------------------
+    # Writing
+    # ---------------------------------------------
+
+    def delete(self, mls_id: str) -> bool:
+        """
+        Delete the MultiLangString stored under the given identifier.
+
+        :param mls_id: The identifier of the MultiLangString.
+        :type mls_id: str
+        :return: True if a MultiLangString was deleted, False if the identifier was not stored.
+        :rtype: bool
+        :raises TypeError: If mls_id is not a string.
+        """
+        TypeValidator.validate_type_single(mls_id, str)
+        with self._connection:
+            self._connection.execute("DELETE FROM entries WHERE id = ?", (mls_id,))
+            cursor = self._connection.execute("DELETE FROM multilangstrings WHERE id = ?", (mls_id,))
+        return cursor.rowcount > 0
+
+    def put(self, mls_id: str, multilangstring: MultiLangString) -> None:
+        """
+        Store a MultiLangString under the given identifier, replacing any MultiLangString previously stored under it.
+
+        :param mls_id: The identifier of the MultiLangString.
+        :type mls_id: str
+        :param multilangstring: The MultiLangString to be stored.
+        :type multilangstring: MultiLangString
+        :raises TypeError: If mls_id is not a string or multilangstring is not a MultiLangString.
+        """
+        self.put_many([(mls_id, multilangstring)])
+
+    def put_many(self, items: Iterable[tuple[str, MultiLangString]]) -> None:
+        """
+        Store several MultiLangStrings, each under its identifier, in a single transaction.
+
+        The items are consumed lazily and their rows are written in batches of about `batch_size` rows, so the
+        items can be produced by a generator of arbitrary length. If an error occurs, no item is stored.
+
+        :param items: The (identifier, MultiLangString) pairs to be stored.
+        :type items: Iterable[tuple[str, MultiLangString]]
+        :raises TypeError: If an identifier is not a string or an object is not a MultiLangString.
+
+        **Example**::
+
+            >>> store.put_many((str(i), MultiLangString({"en": {f"Label {i}"}})) for i in range(100000))
+        """
+        batch_size = self._batch_size
+        batch_ids: set[str] = set()
+        ids: list[tuple[str]] = []
+        headers: list[tuple[str, str]] = []
+        rows: list[_EntryRow] = []
+        with self._connection:
+            for mls_id, multilangstring in items:
+                TypeValidator.validate_type_single(mls_id, str)
+                TypeValidator.validate_type_single(multilangstring, MultiLangString)
+                if mls_id in batch_ids:
+                    # The last item stored under an identifier replaces the previous ones, so they cannot share a batch
+                    self._write_batch(ids, headers, rows)
+                    batch_ids, ids, headers, rows = set(), [], [], []
+                batch_ids.add(mls_id)
+                ids.append((mls_id,))
+                headers.append((mls_id, multilangstring.pref_lang))
+                for lang, texts in multilangstring._mls_dict.items():
+                    lang_casefold = lang.casefold()
+                    if texts:
+                        rows.extend((mls_id, lang_casefold, lang, text) for text in texts)
+                    else:
+                        rows.append((mls_id, lang_casefold, lang, None))
+                if len(rows) >= batch_size or len(ids) >= batch_size:
+                    self._write_batch(ids, headers, rows)
+                    batch_ids, ids, headers, rows = set(), [], [], []
+            self._write_batch(ids, headers, rows)
+
+    # ---------------------------------------------
+    # Reading
+    # ---------------------------------------------
+
+    def get(self, mls_id: str) -> Optional[MultiLangString]:
+        """
+        Rebuild the MultiLangString stored under the given identifier.
+
+        :param mls_id: The identifier of the MultiLangString.
+        :type mls_id: str
+        :return: A new MultiLangString, or None if the identifier is not stored.
+        :rtype: Optional[MultiLangString]
+        :raises TypeError: If mls_id is not a string.
+        """
+        TypeValidator.validate_type_single(mls_id, str)
+        for _, multilangstring in self.iter_multilangstrings([mls_id]):
+            return multilangstring
+        return None
+
+    def iter_ids(self) -> Iterator[str]:
+        """
+        Iterate over the identifiers of the stored MultiLangStrings, in ascending order.
+
+        :return: An iterator over the identifiers.
+        :rtype: Iterator[str]
+        """
+        cursor = self._connection.execute("SELECT id FROM multilangstrings ORDER BY id")
+        return (mls_id for (mls_id,) in cursor)
+
+    def iter_multilangstrings(self, ids: Optional[Iterable[str]] = None) -> Iterator[tuple[str, MultiLangString]]:
+        """
+        Lazily rebuild stored MultiLangStrings, one at a time, together with their identifiers.
+
+        Each MultiLangString is created with the MultiLangString constructor from its stored rows, so language tags
+        differing only in casing are merged and the current MultiLangStringFlag flags are applied, as for any other
+        MultiLangString. Texts of the same language are added in the order in which they were stored.
+
+        :param ids: The identifiers of the MultiLangStrings to be rebuilt. Identifiers that are not stored are
+                    skipped. If None (default), all stored MultiLangStrings are rebuilt, in ascending identifier order.
+        :type ids: Optional[Iterable[str]]
+        :return: An iterator over (identifier, MultiLangString) pairs.
+        :rtype: Iterator[tuple[str, MultiLangString]]
+        :raises TypeError: If an identifier is not a string.
+
+        **Example**::
+
+            >>> for mls_id, mls in store.iter_multilangstrings():
+            >>>     print(mls_id, mls.get_langs())
+        """
+        if ids is None:
+            cursor = self._connection.execute(
+                "SELECT m.id, m.pref_lang, e.lang_original, e.text FROM multilangstrings AS m "
+                "LEFT JOIN entries AS e ON e.id = m.id ORDER BY m.id, e.seq"
+            )
+            yield from self._rebuild(cursor)
+            return
+
+        for mls_id in ids:
+            TypeValidator.validate_type_single(mls_id, str)
+            cursor = self._connection.execute(
+                "SELECT m.id, m.pref_lang, e.lang_original, e.text FROM multilangstrings AS m "
+                "LEFT JOIN entries AS e ON e.id = m.id WHERE m.id = ? ORDER BY e.seq",
+                (mls_id,),
+            )
+            yield from self._rebuild(cursor)
+
+    # ---------------------------------------------
+    # Lookups
+    # ---------------------------------------------
+
+    def find_ids_by_lang(self, lang: str) -> list[str]:
+        """
+        Find the identifiers of the MultiLangStrings containing the given language.
+
+        Language tags are compared case-insensitively. A language is found even if it has no texts.
+
+        :param lang: The language tag to be looked up.
+        :type lang: str
+        :return: The identifiers, in ascending order.
+        :rtype: list[str]
+        :raises TypeError: If lang is not a string.
+        """
+        TypeValidator.validate_type_single(lang, str)
+        cursor = self._connection.execute(
+            "SELECT DISTINCT id FROM entries WHERE lang_casefold = ? ORDER BY id", (lang.casefold(),)
+        )
+        return [mls_id for (mls_id,) in cursor]
+
+    def find_ids_by_text(self, text: str, lang: Optional[str] = None) -> list[str]:
+        """
+        Find the identifiers of the MultiLangStrings containing the given text.
+
+        :param text: The text to be looked up. Texts are compared exactly.
+        :type text: str
+        :param lang: If given, only texts in this language, compared case-insensitively, are considered.
+        :type lang: Optional[str]
+        :return: The identifiers, in ascending order.
+        :rtype: list[str]
+        :raises TypeError: If text is not a string or lang is neither a string nor None.
+
+        **Example**::
+
+            >>> print(store.find_ids_by_text("Paris"))  # Output: ['Q90', 'Q167646']
+        """
+        TypeValidator.validate_type_single(text, str)
+        TypeValidator.validate_type_single(lang, str, optional=True)
+        if lang is None:
+            cursor = self._connection.execute("SELECT DISTINCT id FROM entries WHERE text = ? ORDER BY id", (text,))
+        else:
+            cursor = self._connection.execute(
+                "SELECT DISTINCT id FROM entries WHERE text = ? AND lang_casefold = ? ORDER BY id",
+                (text, lang.casefold()),
+            )
+        return [mls_id for (mls_id,) in cursor]
+
+    # ---------------------------------------------
+    # Resource Management
+    # ---------------------------------------------
+
+    def close(self) -> None:
+        """
+        Close the database connection. The store cannot be used after it is closed.
+        """
+        self._connection.close()
+
+    def __enter__(self) -> "MultiLangStringStore":
+        """
+        Enter the runtime context of the store.
+
+        :return: The store itself.
+        :rtype: MultiLangStringStore
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Exit the runtime context of the store, closing the database connection.
+
+        :param exc_type: The type of the exception raised in the context, if any.
+        :type exc_type: Optional[type[BaseException]]
+        :param exc_value: The exception raised in the context, if any.
+        :type exc_value: Optional[BaseException]
+        :param traceback: The traceback of the exception raised in the context, if any.
+        :type traceback: Optional[TracebackType]
+        """
+        self.close()
+
+    # ---------------------------------------------
+    # Dunder Methods
+    # ---------------------------------------------
+
+    def __contains__(self, mls_id: object) -> bool:
+        """
+        Check whether a MultiLangString is stored under the given identifier.
+
+        :param mls_id: The identifier to be checked.
+        :type mls_id: object
+        :return: True if the identifier is stored, otherwise False.
+        :rtype: bool
+        """
+        if not isinstance(mls_id, str):
+            return False
+        cursor = self._connection.execute("SELECT 1 FROM multilangstrings WHERE id = ?", (mls_id,))
+        return cursor.fetchone() is not None
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored MultiLangStrings.
+
+        :return: The number of stored MultiLangStrings.
+        :rtype: int
+        """
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM multilangstrings").fetchone()
+        return int(count)
+
+    # ---------------------------------------------
+    # Private Methods
+    # ---------------------------------------------
+
+    @staticmethod
+    def _rebuild(
+        rows: Iterable[tuple[str, str, Optional[str], Optional[str]]],
+    ) -> Iterator[tuple[str, MultiLangString]]:
+        """
+        Rebuild MultiLangStrings from (id, pref_lang, lang_original, text) rows sorted by identifier.
+
+        :param rows: The rows to be read. The language is None for MultiLangStrings without languages, and the text is
+                     None for languages without texts.
+        :type rows: Iterable[tuple[str, str, Optional[str], Optional[str]]]
+        :return: An iterator over (identifier, MultiLangString) pairs.
+        :rtype: Iterator[tuple[str, MultiLangString]]
+        """
+        for mls_id, group in groupby(rows, key=lambda row: row[0]):
+            pref_lang = ""
+            mls_dict: dict[str, set[str]] = {}
+            for _, pref_lang, lang, text in group:
+                if lang is None:
+                    continue
+                texts = mls_dict.setdefault(lang, set())
+                if text is not None:
+                    texts.add(text)
+            yield mls_id, MultiLangString(mls_dict, pref_lang)
+
+    def _write_batch(self, ids: list[tuple[str]], headers: list[tuple[str, str]], rows: list[_EntryRow]) -> None:
+        """
+        Write a batch of MultiLangStrings, replacing the rows previously stored under their identifiers.
+
+        :param ids: The identifiers of the batch.
+        :type ids: list[tuple[str]]
+        :param headers: The (identifier, preferred language) pairs of the batch.
+        :type headers: list[tuple[str, str]]
+        :param rows: The (id, lang_casefold, lang_original, text) rows of the batch.
+        :type rows: list[_EntryRow]
+        """
+        if not ids:
+            return
+        connection = self._connection
+        connection.executemany("DELETE FROM entries WHERE id = ?", ids)
+        connection.executemany("INSERT OR REPLACE INTO multilangstrings (id, pref_lang) VALUES (?, ?)", headers)
+        connection.executemany(
+            "INSERT INTO entries (id, lang_casefold, lang_original, text) VALUES (?, ?, ?, ?)",
+            rows,
+        )
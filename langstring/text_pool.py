@@ -0,0 +1,139 @@
+"""
+An opt-in pool sharing a single string object among all equal texts stored by the `langstring` classes.
+
+Multilingual labels repeat the same texts across languages and objects (e.g., brand names, numbers, or identical
+strings in `en`, `en-GB`, and `en-US`). Each `LangString` and each text of a `SetLangString` or `MultiLangString`
+normally holds its own string object. When the pool is enabled, the constructors and bulk loaders replace each text by
+the equal string already stored in the pool, so repeated texts are stored only once. As Python compares strings by
+identity before comparing their characters, lookups and set operations between pooled texts are also faster.
+
+Key Features:
+    - **Opt-In**: No text is pooled until `TextPool.enable` is called.
+    - **Bounded Size**: The pool keeps at most `maxsize` texts, evicting the least recently used ones. Evicted texts
+      remain valid: they are only no longer shared with texts created afterward.
+    - **Statistics**: Hits and misses are counted, so the share of repeated texts can be measured.
+
+Classes:
+    - **TextPool**: Enables, disables, and inspects the pool, and pools texts.
+
+**Example**::
+
+    >>> TextPool.enable(maxsize=1_000_000)
+    >>> mls = MultiLangString({"en": {"Paris"}, "en-GB": {"Paris"}, "fr": {"Paris"}})
+    >>> print(TextPool.get_info())  # Output: CacheInfo(hits=2, misses=1, maxsize=1000000, currsize=1)
+"""
+
+from typing import Optional
+
+from .utils.lru_cache import CacheInfo
+from .utils.lru_cache import LRUCache
+from .utils.non_instantiable import NonInstantiable
+from .utils.validators import TypeValidator
+
+
+class TextPool(metaclass=NonInstantiable):
+    """
+    A utility class pooling equal texts into a single string object.
+
+    The pool is used by the constructors of `LangString`, `SetLangString`, and `MultiLangString`, by
+    `MultiLangString.from_columns`, and by the `map_texts` methods of `SetLangString` and `MultiLangString`. Texts are
+    pooled after being validated, so the pool only holds the texts that are actually stored. Python strings cannot be
+    weakly referenced, so the pool keeps strong references to its texts and its size is bounded by least-recently-used
+    eviction. The pool belongs to the current process: worker processes do not share it.
+
+    :cvar DEFAULT_MAXSIZE: The default maximum number of pooled texts.
+    :vartype DEFAULT_MAXSIZE: int
+
+    **Example**::
+
+        >>> TextPool.enable()
+        >>> first = LangString("".join(["O", "K"]), "en")
+        >>> second = LangString("".join(["O", "K"]), "fr")
+        >>> print(first.text is second.text)  # Output: True
+        >>> TextPool.disable()
+    """
+
+    DEFAULT_MAXSIZE: int = 1_000_000
+
+    _pool: Optional[LRUCache[str]] = None
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Remove all texts from the pool and reset its statistics. Nothing is done if the pool is disabled.
+        """
+        if cls._pool is not None:
+            cls._pool.clear()
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Disable the pool, discarding its texts. The texts already stored by the objects are not affected.
+        """
+        cls._pool = None
+
+    @classmethod
+    def enable(cls, maxsize: Optional[int] = None) -> None:
+        """
+        Enable a new, empty pool.
+
+        :param maxsize: The maximum number of pooled texts. Defaults to DEFAULT_MAXSIZE.
+        :type maxsize: Optional[int]
+        :raises TypeError: If maxsize is not an integer.
+        :raises ValueError: If maxsize is not positive.
+
+        **Example**::
+
+            >>> TextPool.enable(maxsize=100000)
+            >>> print(TextPool.is_enabled())  # Output: True
+        """
+        TypeValidator.validate_type_single(maxsize, int, optional=True)
+        cls._pool = LRUCache(cls.DEFAULT_MAXSIZE if maxsize is None else maxsize)
+
+    @classmethod
+    def get_info(cls) -> Optional[CacheInfo]:
+        """
+        Get the statistics of the pool.
+
+        :return: The hits, misses, maximum size, and current size of the pool, or None if the pool is disabled. The
+                 `hit_rate` property of the result gives the fraction of pooled texts that were already in the pool.
+        :rtype: Optional[CacheInfo]
+        """
+        return None if cls._pool is None else cls._pool.info()
+
+    @classmethod
+    def intern(cls, text: str) -> str:
+        """
+        Return the pooled string equal to the given text, adding the text to the pool if it is not there yet.
+
+        If the pool is disabled, the text is returned unchanged.
+
+        :param text: The text to be pooled.
+        :type text: str
+        :return: A string equal to the text, shared with all equal texts pooled since the pool was enabled.
+        :rtype: str
+
+        **Example**::
+
+            >>> TextPool.enable()
+            >>> pooled = TextPool.intern("".join(["O", "K"]))
+            >>> print(TextPool.intern("".join(["O", "K"])) is pooled)  # Output: True
+        """
+        pool = cls._pool
+        if pool is None:
+            return text
+        pooled = pool.get(text)
+        if pooled is None:
+            pool.put(text, text)
+            return text
+        return pooled
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Check whether the pool is enabled.
+
+        :return: True if the pool is enabled, otherwise False.
+        :rtype: bool
+        """
+        return cls._pool is not None
@@ -8,9 +8,18 @@ and should not be directly accessed by end users of the langstring package.
 Modules:
 --------
 
+    - **grouping**: Contains the RowGrouper class, used to group rows of column-oriented data, optionally with NumPy.
+
+    - **lru_cache**: Contains the LRUCache class, a bounded and thread-safe cache with hit and miss statistics.
+
     - **non_instantiable**: Contains the NonInstantiable class which is used to prevent instantiation of certain
       classes.
 
+    - **parallel**: Contains the ParallelRunner class, used to process batch conversions in ordered chunks with an
+      executor.
+
+    - **sorted_text_set**: Contains the SortedTextSet class, a set of texts that keeps its elements in sorted order.
+
     - **validators**: Provides validation functions for language strings and other components within the
       langstring package.
 
@@ -0,0 +1,281 @@
+"""
+The `grouping` module provides the `RowGrouper` and `LangGrouper` classes, used to group data by keys in a single pass.
+
+Bulk operations, such as building one `MultiLangString` per subject from the columns of a triple store export, need to
+group millions of rows by a pair of keys (e.g., the subject and the casefolded language). The `RowGrouper` first
+factorizes the key columns into integer codes and then groups the rows by those codes. When NumPy is installed, the
+grouping is performed with a stable vectorized sort; otherwise, a pure-Python single pass is used. Both strategies
+produce exactly the same groups, in the same order.
+
+Key Features:
+    - **Factorization**: Hashable values are mapped to integer codes in order of first appearance.
+    - **Optional NumPy Acceleration**: NumPy is an optional dependency used only when available (or when requested).
+    - **Deterministic Order**: Groups are returned in order of first appearance, and rows keep their original order.
+    - **Language Grouping**: Texts are bucketed by casefolded language tag into plain sets, keeping track of the casing
+      variants of each tag, so that each resulting object can be built only once.
+
+Classes:
+    - **RowGrouper**: Factorizes key columns and groups rows by pairs of integer codes.
+    - **LangGroup**: The texts and language tag variants grouped under one casefolded language tag.
+    - **LangGrouper**: Groups texts by casefolded language tag.
+
+**Example**::
+
+    >>> subject_codes, subjects = RowGrouper.factorize(["s1", "s2", "s1"])
+    >>> lang_codes, langs = RowGrouper.factorize(["en", "en", "fr"])
+    >>> print(RowGrouper.group_rows(subject_codes, lang_codes))  # Output: {0: {0: [0], 1: [2]}, 1: {0: [1]}}
+    >>> groups = LangGrouper.group_texts([("en", ["Hello"]), ("EN", ["Hi"])])
+    >>> print(groups["en"].merged_lang, groups["en"].texts)  # Output: en {'Hello', 'Hi'}
+"""
+
+from importlib.util import find_spec
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+
+from .non_instantiable import NonInstantiable
+
+
+class RowGrouper(metaclass=NonInstantiable):
+    """
+    A utility class for grouping rows of column-oriented data by pairs of integer codes.
+
+    **Example**::
+
+        >>> groups = RowGrouper.group_rows([0, 0, 1], [0, 0, 0])
+        >>> print(groups)  # Output: {0: {0: [0, 1]}, 1: {0: [2]}}
+    """
+
+    @staticmethod
+    def factorize(values: Iterable[Hashable]) -> tuple[list[int], list[Hashable]]:
+        """
+        Map each value to an integer code, assigned in order of first appearance.
+
+        :param values: The values to be factorized.
+        :type values: Iterable[Hashable]
+        :return: The code of each value and the list of distinct values, indexed by their codes.
+        :rtype: tuple[list[int], list[Hashable]]
+
+        **Example**::
+
+            >>> print(RowGrouper.factorize(["b", "a", "b"]))  # Output: ([0, 1, 0], ['b', 'a'])
+        """
+        uniques: dict[Hashable, int] = {}
+        codes = [uniques.setdefault(value, len(uniques)) for value in values]
+        return codes, list(uniques)
+
+    @classmethod
+    def group_rows(
+        cls, first_codes: list[int], second_codes: list[int], use_numpy: Optional[bool] = None
+    ) -> dict[int, dict[int, list[int]]]:
+        """
+        Group the positions of the rows by their first code and, within it, by their second code.
+
+        The codes are expected to be assigned in order of first appearance (e.g., by `factorize`). First-level groups
+        follow the order of their codes, second-level groups follow the order of their first row, and the rows of each
+        group are in ascending order.
+
+        :param first_codes: The first code of each row.
+        :type first_codes: list[int]
+        :param second_codes: The second code of each row.
+        :type second_codes: list[int]
+        :param use_numpy: Whether to use NumPy for the grouping. If None (default), NumPy is used if it is installed.
+        :type use_numpy: Optional[bool]
+        :return: A dictionary mapping each first code to a dictionary mapping each second code to its rows.
+        :rtype: dict[int, dict[int, list[int]]]
+        :raises ImportError: If use_numpy is True and NumPy is not installed.
+
+        **Example**::
+
+            >>> groups = RowGrouper.group_rows([0, 1, 1, 0], [1, 0, 1, 1])
+            >>> print(groups)  # Output: {0: {1: [0, 3]}, 1: {0: [1], 1: [2]}}
+        """
+        if use_numpy is None:
+            use_numpy = cls.numpy_available()
+
+        if use_numpy:
+            return cls._group_rows_numpy(first_codes, second_codes)
+
+        groups: dict[int, dict[int, list[int]]] = {}
+        for row, (first_code, second_code) in enumerate(zip(first_codes, second_codes)):
+            groups.setdefault(first_code, {}).setdefault(second_code, []).append(row)
+        return groups
+
+    @staticmethod
+    def numpy_available() -> bool:
+        """
+        Check whether the optional NumPy dependency is installed.
+
+        :return: True if NumPy can be imported, otherwise False.
+        :rtype: bool
+        """
+        return find_spec("numpy") is not None
+
+    # --------------------------------------------------
+    # Private Methods
+    # --------------------------------------------------
+
+    @staticmethod
+    def _group_rows_numpy(first_codes: list[int], second_codes: list[int]) -> dict[int, dict[int, list[int]]]:
+        """
+        Group rows using a stable NumPy sort, producing the same result as the pure-Python grouping.
+
+        :param first_codes: The first code of each row.
+        :type first_codes: list[int]
+        :param second_codes: The second code of each row.
+        :type second_codes: list[int]
+        :return: A dictionary mapping each first code to a dictionary mapping each second code to its rows.
+        :rtype: dict[int, dict[int, list[int]]]
+        :raises ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy as np  # type: ignore[import-not-found, unused-ignore]
+        except ImportError as e:
+            raise ImportError(
+                f"{e}. NumPy-accelerated grouping requires the 'numpy' library. Install it with 'pip install numpy'."
+            ) from e
+
+        if not first_codes:
+            return {}
+
+        first = np.asarray(first_codes, dtype=np.int64)
+        second = np.asarray(second_codes, dtype=np.int64)
+
+        # Stable sort by (first, second): rows of each group remain in ascending order
+        order = np.lexsort((second, first))
+        first_sorted = first[order]
+        second_sorted = second[order]
+        boundaries = np.flatnonzero((np.diff(first_sorted) != 0) | (np.diff(second_sorted) != 0)) + 1
+        starts = np.concatenate(([0], boundaries)).tolist()
+        ends = np.concatenate((boundaries, [len(order)])).tolist()
+
+        # Second-level groups are ordered by their first row, which is the first element of each sorted group
+        unordered: dict[int, list[tuple[int, int, list[int]]]] = {}
+        order_list: list[int] = order.tolist()
+        first_list: list[int] = first_sorted.tolist()
+        second_list: list[int] = second_sorted.tolist()
+        for start, end in zip(starts, ends):
+            unordered.setdefault(first_list[start], []).append(
+                (order_list[start], second_list[start], order_list[start:end])
+            )
+
+        groups: dict[int, dict[int, list[int]]] = {}
+        for first_code, second_groups in unordered.items():
+            second_groups.sort(key=lambda group: group[0])
+            groups[first_code] = {second_code: rows for _, second_code, rows in second_groups}
+        return groups
+
+
+class LangGroup:
+    """
+    The texts and language tag variants grouped under one casefolded language tag.
+
+    :ivar folded_lang: The casefolded language tag shared by all entries of the group.
+    :vartype folded_lang: str
+    :ivar langs: The distinct language tags of the group, in order of first appearance.
+    :vartype langs: list[str]
+    :ivar texts: The texts of the group.
+    :vartype texts: set[str]
+    """
+
+    __slots__ = ("folded_lang", "langs", "texts", "_first_text", "_first_text_varies")
+
+    def __init__(self, folded_lang: str, lang: str, texts: Iterable[str]) -> None:
+        """
+        Initialize a new group with its first entry.
+
+        :param folded_lang: The casefolded language tag of the group.
+        :type folded_lang: str
+        :param lang: The language tag of the first entry.
+        :type lang: str
+        :param texts: The texts of the first entry.
+        :type texts: Iterable[str]
+        """
+        self.folded_lang = folded_lang
+        self.langs = [lang]
+        self.texts = set(texts)
+        self._first_text: Optional[str] = next(iter(texts), None) if isinstance(texts, (list, tuple)) else None
+        self._first_text_varies = False
+
+    @property
+    def merged_lang(self) -> str:
+        """
+        Get the language tag of the group: the original tag if it has a single casing, or the casefolded tag otherwise.
+
+        This is the rule used by `SetLangString.merge_setlangstrings` and `MultiLangString._merge_language_entries`.
+
+        :return: The language tag of the group.
+        :rtype: str
+        """
+        return self.langs[0] if len(self.langs) == 1 else self.folded_lang
+
+    @property
+    def first_text_lang(self) -> str:
+        """
+        Get the language tag that `LangString.merge_langstrings` assigns to the first text of the group.
+
+        It is the tag of the first entry, or the casefolded tag if the first text also appears with another casing.
+
+        :return: The language tag of the first text of the group.
+        :rtype: str
+        """
+        return self.folded_lang if self._first_text_varies else self.langs[0]
+
+    def add(self, lang: str, texts: Iterable[str]) -> None:
+        """
+        Add an entry to the group.
+
+        :param lang: The language tag of the entry. Its casefolded version must be the group's one.
+        :type lang: str
+        :param texts: The texts of the entry.
+        :type texts: Iterable[str]
+        """
+        if lang != self.langs[0]:
+            if lang not in self.langs:
+                self.langs.append(lang)
+            if not self._first_text_varies and self._first_text is not None and self._first_text in texts:
+                self._first_text_varies = True
+        self.texts.update(texts)
+
+
+class LangGrouper(metaclass=NonInstantiable):
+    """
+    A utility class for grouping texts by casefolded language tag in a single pass.
+
+    **Example**::
+
+        >>> groups = LangGrouper.group_texts([("en", ["Hello"]), ("fr", ["Bonjour"]), ("EN", ["Hi"])])
+        >>> print(list(groups))  # Output: ['en', 'fr']
+    """
+
+    @staticmethod
+    def group_texts(entries: Iterable[tuple[str, Iterable[str]]]) -> dict[str, LangGroup]:
+        """
+        Group the texts of (language tag, texts) entries by casefolded language tag.
+
+        Entries with no texts still create their group. Each distinct language tag is casefolded only once.
+
+        :param entries: The (language tag, texts) entries to be grouped.
+        :type entries: Iterable[tuple[str, Iterable[str]]]
+        :return: A dictionary mapping each casefolded language tag to its group, in order of first appearance.
+        :rtype: dict[str, LangGroup]
+
+        **Example**::
+
+            >>> groups = LangGrouper.group_texts([("en", ["Hello"]), ("EN", ["Hi"]), ("fr", [])])
+            >>> print(groups["en"].langs, groups["fr"].texts)  # Output: ['en', 'EN'] set()
+        """
+        folded_langs: dict[str, str] = {}
+        groups: dict[str, LangGroup] = {}
+        for lang, texts in entries:
+            folded_lang = folded_langs.get(lang)
+            if folded_lang is None:
+                folded_lang = lang.casefold()
+                folded_langs[lang] = folded_lang
+
+            group = groups.get(folded_lang)
+            if group is None:
+                groups[folded_lang] = LangGroup(folded_lang, lang, texts)
+            else:
+                group.add(lang, texts)
+        return groups
@@ -0,0 +1,160 @@
+"""
+A bounded, thread-safe mapping evicting its least recently used entries.
+
+`functools.lru_cache` memoizes whole functions and cannot be enabled, resized, or inspected at runtime by the users of
+a library. `LRUCache` is used instead by the opt-in caches of the `langstring` package, such as the parse cache of the
+`Converter`, which are created only when enabled and must report their hit rates.
+
+Key Features:
+    - **Bounded Size**: When the cache is full, the least recently used entry is evicted.
+    - **Statistics**: Hits and misses are counted, so the effectiveness of the cache can be measured.
+    - **Thread Safety**: All operations are protected by a lock, so a cache can be shared by threads.
+
+Classes:
+    - **CacheInfo**: The statistics of a cache.
+    - **LRUCache**: A bounded mapping evicting its least recently used entries.
+
+**Example**::
+
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.put("a", 1)
+    >>> print(cache.get("a"), cache.get("b"))  # Output: 1 None
+    >>> print(cache.info())  # Output: CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from typing import TypeVar
+
+from .validators import TypeValidator
+
+# Generic type variable used for the values of the cache
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a cache.
+
+    :ivar hits: The number of lookups that found their key.
+    :vartype hits: int
+    :ivar misses: The number of lookups that did not find their key.
+    :vartype misses: int
+    :ivar maxsize: The maximum number of entries of the cache.
+    :vartype maxsize: int
+    :ivar currsize: The current number of entries of the cache.
+    :vartype currsize: int
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the fraction of lookups that found their key.
+
+        :return: The hit rate, between 0.0 and 1.0. It is 0.0 if no lookup was performed.
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[V]):
+    """
+    A bounded, thread-safe mapping that evicts its least recently used entries.
+
+    **Example**::
+
+        >>> cache = LRUCache(maxsize=1)
+        >>> cache.put("a", 1)
+        >>> cache.put("b", 2)
+        >>> print(cache.get("a"), cache.get("b"))  # Output: None 2
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize a new empty cache.
+
+        :param maxsize: The maximum number of entries of the cache.
+        :type maxsize: int
+        :raises TypeError: If maxsize is not an integer.
+        :raises ValueError: If maxsize is not positive.
+        """
+        TypeValidator.validate_type_single(maxsize, int)
+        if maxsize < 1:
+            raise ValueError(f"Invalid maxsize. Expected a positive integer, got '{maxsize}'.")
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Get the value of a key, marking it as the most recently used entry, and count the lookup.
+
+        :param key: The key to be looked up.
+        :type key: Hashable
+        :return: The value of the key, or None if the key is not in the cache.
+        :rtype: Optional[V]
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            return value
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache.
+
+        :return: The current statistics.
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Store the value of a key as the most recently used entry, evicting the least recently used one if needed.
+
+        :param key: The key to be stored.
+        :type key: Hashable
+        :param value: The value of the key. It must not be None.
+        :type value: V
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """
+        Return the current number of entries of the cache.
+
+        :return: The number of entries.
+        :rtype: int
+        """
+        return len(self._entries)
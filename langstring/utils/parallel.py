@@ -0,0 +1,157 @@
+"""
+Chunked processing of the `Converter` batch conversions with an executor.
+
+The `Converter` batch methods accept an opt-in `workers` argument. When it is given, the input list is split into
+ordered chunks that are processed by a `concurrent.futures` executor (a `ProcessPoolExecutor` by default), and the
+partial results are returned in the order of the chunks, so that the calling method can combine them
+deterministically. The current state of the `Controller` flags is sent with every chunk and applied in the worker
+before the chunk is processed, ensuring that workers validate and transform data exactly as the calling process does.
+
+Key Features:
+    - **Deterministic Results**: Chunks preserve the order of the input and results are returned in chunk order.
+    - **Flag Propagation**: The `Controller` flags of the calling process are applied in every worker.
+    - **Executor Reuse**: Either a number of worker processes or an existing `Executor` can be provided.
+
+Classes:
+    - **ParallelRunner**: Splits a list into chunks and maps a function over them using an executor.
+
+**Example**::
+
+    >>> chunk_results = ParallelRunner.map_chunks(sorted, ["b", "a", "d", "c"], workers=2)
+    >>> print(chunk_results)  # Output: [['a', 'b'], ['c', 'd']]
+"""
+
+import os
+from concurrent.futures import Executor
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+from typing import Union
+
+from ..controller import Controller
+from .non_instantiable import NonInstantiable
+from .validators import TypeValidator
+
+# Generic type variable used for the results of the processed chunks
+T = TypeVar("T")
+
+
+class ParallelRunner(metaclass=NonInstantiable):
+    """
+    A utility class for processing lists in ordered chunks using an executor.
+
+    :cvar CHUNKS_PER_WORKER: The number of chunks created for each worker, allowing a better load balance.
+    :vartype CHUNKS_PER_WORKER: int
+
+    **Example**::
+
+        >>> chunk_results = ParallelRunner.map_chunks(len, ["a", "b", "c"], workers=2)
+        >>> print(sum(chunk_results))  # Output: 3
+    """
+
+    CHUNKS_PER_WORKER: int = 4
+
+    @staticmethod
+    def validate_workers(workers: Union[int, Executor, None]) -> None:
+        """
+        Validate the `workers` argument received by a batch conversion method.
+
+        :param workers: None, a positive number of worker processes, or an executor instance.
+        :type workers: Union[int, Executor, None]
+        :raises TypeError: If workers is not None, an integer, or an Executor.
+        :raises ValueError: If workers is an integer lower than one.
+        """
+        if workers is None or isinstance(workers, Executor):
+            return
+        TypeValidator.validate_type_single(workers, int)
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers '{workers}'. The number of workers must be at least 1.")
+
+    @staticmethod
+    def split_chunks(items: list[Any], num_chunks: int) -> list[list[Any]]:
+        """
+        Split a list into at most `num_chunks` contiguous chunks of similar sizes, preserving the order of the items.
+
+        :param items: The list to be split.
+        :type items: list[Any]
+        :param num_chunks: The maximum number of chunks to create.
+        :type num_chunks: int
+        :return: The list of chunks. Concatenating them results in the original list.
+        :rtype: list[list[Any]]
+
+        **Example**::
+
+            >>> print(ParallelRunner.split_chunks([1, 2, 3, 4, 5], 2))  # Output: [[1, 2, 3], [4, 5]]
+        """
+        num_chunks = max(1, min(num_chunks, len(items)))
+        chunk_size, remainder = divmod(len(items), num_chunks)
+        chunks = []
+        start = 0
+        for index in range(num_chunks):
+            end = start + chunk_size + (1 if index < remainder else 0)
+            chunks.append(items[start:end])
+            start = end
+        return chunks
+
+    @classmethod
+    def map_chunks(cls, func: Callable[[list[Any]], T], items: list[Any], workers: Union[int, Executor]) -> list[T]:
+        """
+        Apply a function to ordered chunks of a list using an executor and return the results in chunk order.
+
+        If `workers` is an integer, a `ProcessPoolExecutor` with that number of processes is created and shut down
+        after the processing. If it is an `Executor`, it is used as is and is not shut down. When a single worker is
+        requested or the list has less than two items, the function is applied directly to the whole list.
+
+        The function and the items must be picklable when a process-based executor is used.
+
+        :param func: The function to apply to each chunk.
+        :type func: Callable[[list[Any]], T]
+        :param items: The list to be processed.
+        :type items: list[Any]
+        :param workers: The number of worker processes, or the executor to use.
+        :type workers: Union[int, Executor]
+        :return: The results of the function for each chunk, in the order of the chunks.
+        :rtype: list[T]
+        """
+        cls.validate_workers(workers)
+
+        if (not isinstance(workers, Executor) and workers == 1) or len(items) < 2:
+            return [func(items)]
+
+        num_workers = (os.cpu_count() or 1) if isinstance(workers, Executor) else workers
+        chunks = cls.split_chunks(items, num_workers * cls.CHUNKS_PER_WORKER)
+        pids = [os.getpid()] * len(chunks)
+        flags = [Controller.get_flags()] * len(chunks)
+        funcs = [func] * len(chunks)
+
+        if isinstance(workers, Executor):
+            return list(workers.map(cls.run_chunk, pids, flags, funcs, chunks))
+
+        # Deferred, as loading the process pool machinery (multiprocessing) is only needed when it is used
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.run_chunk, pids, flags, funcs, chunks))
+
+    @staticmethod
+    def run_chunk(pid: int, flags: dict[Any, bool], func: Callable[[list[Any]], T], chunk: list[Any]) -> T:
+        """
+        Apply the flags of the calling process and process a chunk.
+
+        The flags are only applied in another process. Thread-based executors share the `Controller` of the calling
+        process, whose flags must not be changed concurrently with the other threads.
+
+        :param pid: The identifier of the calling process.
+        :type pid: int
+        :param flags: The state of the Controller flags in the calling process.
+        :type flags: dict[Any, bool]
+        :param func: The function to apply to the chunk.
+        :type func: Callable[[list[Any]], T]
+        :param chunk: The chunk to be processed.
+        :type chunk: list[Any]
+        :return: The result of the function for the chunk.
+        :rtype: T
+        """
+        if os.getpid() != pid:
+            Controller._apply_flags(flags)
+        return func(chunk)
@@ -0,0 +1,284 @@
+"""
+The `sorted_text_set` module provides the `SortedTextSet` class, a set of texts that keeps its elements ordered.
+
+`SortedTextSet` is used by `MultiLangString` as the storage of each language's texts when the
+`MultiLangStringFlag.SORTED_TEXTS` flag is enabled. It is a regular `set` subclass, so membership tests, equality and
+set algebra behave exactly as for plain sets, but it additionally maintains a sorted list of its elements. New elements
+are placed with a binary search, so iteration and rendering are deterministic and never require a full sort.
+
+Key Features:
+    - **Drop-in Replacement**: `SortedTextSet` is a `set`, so it passes all type validations performed on sets and can
+      be compared with and combined with plain sets.
+    - **Sorted Iteration**: Iterating, printing, or representing a `SortedTextSet` yields its elements in sorted order.
+    - **Binary-search Insertion**: Single insertions and removals locate their position in O(log n) comparisons.
+
+Classes:
+    - **SortedTextSet**: A set of strings that keeps its elements in sorted order.
+
+**Example**::
+
+    >>> texts = SortedTextSet({"World", "Hello"})
+    >>> texts.add("Hi")
+    >>> print(list(texts))  # Output: ['Hello', 'Hi', 'World']
+"""
+
+from bisect import bisect_left
+from bisect import insort
+from itertools import chain
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+
+class SortedTextSet(set[str]):
+    """
+    A set of strings that keeps its elements in sorted order.
+
+    The class behaves as a regular set, but it maintains an auxiliary sorted list that is kept up to date by all
+    mutating methods. Iteration follows the sorted order, so functions such as `sorted`, `list`, or `str.join` receive
+    the elements already ordered. Binary set operators (e.g., `|`, `&`) return plain sets, as for any `set` subclass.
+
+    :ivar _order: The elements of the set in sorted order.
+    :vartype _order: list[str]
+
+    **Example**::
+
+        >>> texts = SortedTextSet(["b", "a"])
+        >>> texts.add("c")
+        >>> texts.discard("a")
+        >>> print(texts)  # Output: {'b', 'c'}
+    """
+
+    __slots__ = ("_order",)
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        """
+        Initialize a SortedTextSet with the given texts.
+
+        :param texts: The initial elements of the set. Defaults to an empty iterable.
+        :type texts: Iterable[str]
+        """
+        super().__init__(texts)
+        self._order: list[str] = sorted(super().__iter__())
+
+    # --------------------------------------------------
+    # Overwritten Set's Methods
+    # --------------------------------------------------
+
+    def add(self, text: str) -> None:
+        """
+        Add a text to the set, keeping the sorted order.
+
+        :param text: The text to add.
+        :type text: str
+        """
+        if not super().__contains__(text):
+            super().add(text)
+            insort(self._order, text)
+
+    def clear(self) -> None:
+        """Remove all elements from the set."""
+        super().clear()
+        self._order.clear()
+
+    def copy(self) -> "SortedTextSet":
+        """
+        Return a shallow copy of the set, preserving its type and order.
+
+        :return: A new SortedTextSet with the same elements.
+        :rtype: SortedTextSet
+        """
+        new_set = SortedTextSet()
+        set.update(new_set, self)
+        new_set._order = self._order.copy()
+        return new_set
+
+    def difference_update(self, *others: Iterable[Any]) -> None:
+        """
+        Remove all elements of the given iterables from the set.
+
+        :param others: The iterables whose elements are removed.
+        :type others: Iterable[Any]
+        """
+        super().difference_update(*others)
+        self._filter_order()
+
+    def discard(self, text: object) -> None:
+        """
+        Remove a text from the set if it is present.
+
+        :param text: The text to remove.
+        :type text: object
+        """
+        if isinstance(text, str) and super().__contains__(text):
+            super().discard(text)
+            del self._order[bisect_left(self._order, text)]
+
+    def intersection_update(self, *others: Iterable[Any]) -> None:
+        """
+        Keep only the elements found in the set and in all given iterables.
+
+        :param others: The iterables to intersect with.
+        :type others: Iterable[Any]
+        """
+        super().intersection_update(*others)
+        self._filter_order()
+
+    def pop(self) -> str:
+        """
+        Remove and return the greatest element of the set.
+
+        :return: The removed element.
+        :rtype: str
+        :raises KeyError: If the set is empty.
+        """
+        if not self._order:
+            raise KeyError("pop from an empty set")
+        text = self._order.pop()
+        super().discard(text)
+        return text
+
+    def remove(self, text: str) -> None:
+        """
+        Remove a text from the set.
+
+        :param text: The text to remove.
+        :type text: str
+        :raises KeyError: If the text is not present in the set.
+        """
+        if not super().__contains__(text):
+            raise KeyError(text)
+        self.discard(text)
+
+    def symmetric_difference_update(self, other: Iterable[str]) -> None:
+        """
+        Update the set, keeping only elements found in either the set or the iterable, but not in both.
+
+        :param other: The iterable to compare with.
+        :type other: Iterable[str]
+        """
+        super().symmetric_difference_update(other)
+        self._order = sorted(super().__iter__())
+
+    def update(self, *others: Iterable[str]) -> None:
+        """
+        Add all elements of the given iterables to the set.
+
+        The new elements are appended to the sorted list, which is then re-sorted. As the existing elements are
+        already ordered, the sort runs in near-linear time.
+
+        :param others: The iterables whose elements are added.
+        :type others: Iterable[str]
+        """
+        new_texts = {text for text in chain(*others) if not set.__contains__(self, text)}
+        if new_texts:
+            super().update(new_texts)
+            self._order.extend(new_texts)
+            self._order.sort()
+
+    # --------------------------------------------------
+    # Overwritten Set's Dunder Methods
+    # --------------------------------------------------
+
+    def __iand__(self, other: Any) -> "SortedTextSet":  # type: ignore[misc]
+        """
+        Update the set with the intersection of itself and another set (in-place &= operator).
+
+        :param other: The set to intersect with.
+        :type other: Any
+        :return: This set, updated.
+        :rtype: SortedTextSet
+        """
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.intersection_update(other)
+        return self
+
+    def __ior__(self, other: Any) -> "SortedTextSet":  # type: ignore[override, misc]
+        """
+        Update the set with the union of itself and another set (in-place |= operator).
+
+        :param other: The set to unite with.
+        :type other: Any
+        :return: This set, updated.
+        :rtype: SortedTextSet
+        """
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.update(other)
+        return self
+
+    def __isub__(self, other: Any) -> "SortedTextSet":  # type: ignore[misc]
+        """
+        Update the set with the difference of itself and another set (in-place -= operator).
+
+        :param other: The set whose elements are removed.
+        :type other: Any
+        :return: This set, updated.
+        :rtype: SortedTextSet
+        """
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.difference_update(other)
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the elements of the set in sorted order.
+
+        :return: An iterator over the sorted elements.
+        :rtype: Iterator[str]
+        """
+        return iter(self._order)
+
+    def __ixor__(self, other: Any) -> "SortedTextSet":  # type: ignore[override, misc]
+        """
+        Update the set with the symmetric difference of itself and another set (in-place ^= operator).
+
+        :param other: The set to compare with.
+        :type other: Any
+        :return: This set, updated.
+        :rtype: SortedTextSet
+        """
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.symmetric_difference_update(other)
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Support pickling and copying by rebuilding the set from its sorted elements.
+
+        :return: A tuple with the class and the arguments used to rebuild the set.
+        :rtype: tuple[Any, ...]
+        """
+        return self.__class__, (self._order.copy(),)
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of the set in the same format as a plain set, with elements in sorted order.
+
+        :return: The representation of the set.
+        :rtype: str
+        """
+        if not self._order:
+            return "set()"
+        return "{" + ", ".join(repr(text) for text in self._order) + "}"
+
+    def __reversed__(self) -> Iterator[str]:
+        """
+        Iterate over the elements of the set in reverse sorted order.
+
+        :return: A reverse iterator over the sorted elements.
+        :rtype: Iterator[str]
+        """
+        return reversed(self._order)
+
+    # --------------------------------------------------
+    # Private Methods
+    # --------------------------------------------------
+
+    def _filter_order(self) -> None:
+        """Drop from the sorted list the elements that are no longer in the set, keeping the order."""
+        if len(self._order) != super().__len__():
+            self._order = [text for text in self._order if set.__contains__(self, text)]
@@ -1,6 +1,5 @@
 """
-The `validators` module provides two classes, `TypeValidator` and `FlagValidator`, for validating argument types and \
-flag-based constraints, respectively.
+Validation of argument types and of flag-based constraints on texts and language tags.
 
 This module defines two classes:
     - `TypeValidator`: Handles type validation for arguments based on type hints. It includes methods for validating
@@ -32,14 +31,13 @@ Enums Utilized:
 The validators in this module are designed to be non-instantiable, emphasizing their role as static utility classes.
 """
 
-import inspect
-import warnings
 from functools import wraps
 from typing import Any
 from typing import Callable
 from typing import get_args
 from typing import get_origin
 from typing import get_type_hints
+from typing import Iterable
 from typing import Optional
 from typing import TypeVar
 from typing import Union
@@ -63,13 +61,18 @@ class FlagValidator(metaclass=NonInstantiable):
     according to the specified flag type. The validation rules and transformations are controlled by flags
     managed by the `Controller` class.
 
-    The `FlagValidator` class is non-instantiable, emphasizing its role as a static utility class.
-
     Methods:
         - `validate_flags_text(flag_type: type[Enum], text: Optional[str]) -> str`: Validate and transform the `text`
           argument based on the specified flag type.
         - `validate_flags_lang(flag_type: type[Enum], lang: Optional[str]) -> Optional[str]`: Validate and transform the
           `lang` argument based on the specified flag type.
+        - `check_text(flag_type: type[Enum], text: Any) -> Optional[str]` and `check_lang(flag_type: type[Enum],
+          lang: Any) -> Optional[str]`: Apply the same validation and transformation, returning None instead of
+          raising on rejected values.
+        - `is_valid_text(flag_type: type[Enum], text: Any) -> bool` and `is_valid_lang(flag_type: type[Enum],
+          lang: Any) -> bool`: Check whether a value would be accepted, without raising.
+        - `mask_valid_texts`, `mask_valid_langs`, `invalid_text_indices`, and `invalid_lang_indices`: Check batches of
+          values, returning a mask of accepted values or the indices of the rejected ones.
 
     **Example**::
 
@@ -200,31 +203,6 @@ class FlagValidator(metaclass=NonInstantiable):
                 f"'{flag_type.__name__}.VALID_LANG' is enabled. Expected valid language code."
             )
 
-        def handle_import_error(e: ImportError) -> None:
-            """
-            Handle ImportError for the 'langcodes' library.
-
-            Depending on the ENFORCE_EXTRA_DEPEND flag, this function either raises an ImportError with an appropriate
-            message or issues a warning about the missing 'langcodes' library.
-
-            :param e: The original ImportError exception.
-            :type e: ImportError
-            :raises ImportError: If the ENFORCE_EXTRA_DEPEND flag is set.
-            :raises UserWarning: If the ENFORCE_EXTRA_DEPEND flag is not set.
-            """
-            if Controller.get_flag(GlobalFlag.ENFORCE_EXTRA_DEPEND):
-                error_message = (
-                    str(e) + ". VALID_LANG functionality requires the 'langcodes' library. "
-                    "Install it with 'pip install langstring[langcodes]'."
-                )
-                raise ImportError(error_message) from e
-
-            warnings.warn(
-                "Language validation skipped. VALID_LANG functionality requires the 'langcodes' library. "
-                "Install it with 'pip install langstring[langcodes]' to enable this feature.",
-                UserWarning,
-            )
-
         TypeValidator.validate_type_single(flag_type, type)
         TypeValidator.validate_type_single(lang, str, optional=True)
 
@@ -251,17 +229,363 @@ class FlagValidator(metaclass=NonInstantiable):
             )
 
         # Perform language validation if VALID_LANG flag is enabled
-        if Controller.get_flag(flag_type.VALID_LANG):
-            try:
-                from langcodes import tag_is_valid  # type: ignore[import-not-found]
-
-                if not tag_is_valid(transformed_lang):
-                    handle_validation_error(original_lang or "", flag_type)
-            except ImportError as e:
-                handle_import_error(e)
+        if Controller.get_flag(flag_type.VALID_LANG) and not FlagValidator._tag_is_valid(transformed_lang):
+            handle_validation_error(original_lang or "", flag_type)
 
         return transformed_lang
 
+    @staticmethod
+    def lang_flags_enabled(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]],
+    ) -> bool:
+        """
+        Check whether any flag that may transform or reject a language tag is enabled for the given flag type.
+
+        When no such flag is enabled, `validate_flags_lang` returns any string unchanged, so the validation of tags
+        that are already known to be strings can be skipped.
+
+        :param flag_type: The type of flags to be checked.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :return: True if STRIP_LANG, LOWERCASE_LANG, DEFINED_LANG, or VALID_LANG is enabled, otherwise False.
+        :rtype: bool
+        """
+        return (
+            Controller.get_flag(flag_type.STRIP_LANG)
+            or Controller.get_flag(flag_type.LOWERCASE_LANG)
+            or Controller.get_flag(flag_type.DEFINED_LANG)
+            or Controller.get_flag(flag_type.VALID_LANG)
+        )
+
+    @staticmethod
+    def text_flags_enabled(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]],
+    ) -> bool:
+        """
+        Check whether any flag that may transform or reject a text is enabled for the given flag type.
+
+        When no such flag is enabled, `validate_flags_text` returns any string unchanged, so the validation of texts
+        that are already known to be strings can be skipped.
+
+        :param flag_type: The type of flags to be checked.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :return: True if STRIP_TEXT or DEFINED_TEXT is enabled, otherwise False.
+        :rtype: bool
+        """
+        return Controller.get_flag(flag_type.STRIP_TEXT) or Controller.get_flag(flag_type.DEFINED_TEXT)
+
+    @staticmethod
+    def check_lang(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], lang: Any
+    ) -> Optional[str]:
+        """
+        Validate and transform the 'lang' argument like `validate_flags_lang`, without raising on rejected values.
+
+        The same flags are applied in the same way, but no error message is built and no exception is raised for
+        rejected values, which makes this method suited to filtering large amounts of data.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param lang: The language to be validated and transformed.
+        :type lang: Any
+        :return: The transformed language string, or None if 'lang' is rejected by the flags or is neither a string
+                 nor None.
+        :rtype: Optional[str]
+        :raises TypeError: If 'flag_type' is not a type.
+        :raises ImportError: If 'VALID_LANG' is enabled but the 'langcodes' library is not installed and
+                             `ENFORCE_EXTRA_DEPEND` is enabled.
+
+        **Example**::
+
+            >>> Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+            >>> print(FlagValidator.check_lang(LangStringFlag, "EN"))  # Output: en
+            >>> Controller.set_flag(LangStringFlag.DEFINED_LANG, True)
+            >>> print(FlagValidator.check_lang(LangStringFlag, "  "))  # Output: None
+        """
+        return FlagValidator._lang_checker(flag_type)(lang)
+
+    @staticmethod
+    def check_text(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], text: Any
+    ) -> Optional[str]:
+        """
+        Validate and transform the 'text' argument like `validate_flags_text`, without raising on rejected values.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param text: The text to be validated and transformed.
+        :type text: Any
+        :return: The transformed text, or None if 'text' is rejected by the flags or is neither a string nor None.
+        :rtype: Optional[str]
+        :raises TypeError: If 'flag_type' is not a type.
+
+        **Example**::
+
+            >>> Controller.set_flag(GlobalFlag.STRIP_TEXT, True)
+            >>> print(FlagValidator.check_text(GlobalFlag, "  Hello  "))  # Output: Hello
+            >>> Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+            >>> print(FlagValidator.check_text(GlobalFlag, "   "))  # Output: None
+        """
+        return FlagValidator._text_checker(flag_type)(text)
+
+    @staticmethod
+    def invalid_lang_indices(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], langs: Iterable[Any]
+    ) -> list[int]:
+        """
+        Get the positions of the languages rejected by `check_lang`.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param langs: The languages to be checked.
+        :type langs: Iterable[Any]
+        :return: The indices of the rejected languages, in increasing order.
+        :rtype: list[int]
+        :raises TypeError: If 'flag_type' is not a type.
+        :raises ImportError: If 'VALID_LANG' is enabled but the 'langcodes' library is not installed and
+                             `ENFORCE_EXTRA_DEPEND` is enabled.
+
+        **Example**::
+
+            >>> Controller.set_flag(LangStringFlag.DEFINED_LANG, True)
+            >>> print(FlagValidator.invalid_lang_indices(LangStringFlag, ["en", "", "fr", None]))  # Output: [1, 3]
+        """
+        return [index for index, valid in enumerate(FlagValidator.mask_valid_langs(flag_type, langs)) if not valid]
+
+    @staticmethod
+    def invalid_text_indices(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], texts: Iterable[Any]
+    ) -> list[int]:
+        """
+        Get the positions of the texts rejected by `check_text`.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param texts: The texts to be checked.
+        :type texts: Iterable[Any]
+        :return: The indices of the rejected texts, in increasing order.
+        :rtype: list[int]
+        :raises TypeError: If 'flag_type' is not a type.
+
+        **Example**::
+
+            >>> Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+            >>> print(FlagValidator.invalid_text_indices(GlobalFlag, ["Hello", " ", 1]))  # Output: [1, 2]
+        """
+        return [index for index, valid in enumerate(FlagValidator.mask_valid_texts(flag_type, texts)) if not valid]
+
+    @staticmethod
+    def is_valid_lang(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], lang: Any
+    ) -> bool:
+        """
+        Check whether `validate_flags_lang` would accept the 'lang' argument, without raising on rejected values.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param lang: The language to be checked.
+        :type lang: Any
+        :return: True if the language is accepted, otherwise False.
+        :rtype: bool
+        :raises TypeError: If 'flag_type' is not a type.
+        :raises ImportError: If 'VALID_LANG' is enabled but the 'langcodes' library is not installed and
+                             `ENFORCE_EXTRA_DEPEND` is enabled.
+
+        **Example**::
+
+            >>> Controller.set_flag(LangStringFlag.VALID_LANG, True)
+            >>> print(FlagValidator.is_valid_lang(LangStringFlag, "en"))  # Output: True
+            >>> print(FlagValidator.is_valid_lang(LangStringFlag, "xx-invalid-tag"))  # Output: False
+        """
+        return FlagValidator._lang_checker(flag_type)(lang) is not None
+
+    @staticmethod
+    def is_valid_text(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], text: Any
+    ) -> bool:
+        """
+        Check whether `validate_flags_text` would accept the 'text' argument, without raising on rejected values.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param text: The text to be checked.
+        :type text: Any
+        :return: True if the text is accepted, otherwise False.
+        :rtype: bool
+        :raises TypeError: If 'flag_type' is not a type.
+
+        **Example**::
+
+            >>> Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+            >>> print(FlagValidator.is_valid_text(GlobalFlag, "Hello"))  # Output: True
+            >>> print(FlagValidator.is_valid_text(GlobalFlag, ""))  # Output: False
+        """
+        return FlagValidator._text_checker(flag_type)(text) is not None
+
+    @staticmethod
+    def mask_valid_langs(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], langs: Iterable[Any]
+    ) -> list[bool]:
+        """
+        Check a batch of languages with `is_valid_lang`.
+
+        The flags are read once for the whole batch, and each distinct language is checked only once, so repeated tags
+        are cheap even when `VALID_LANG` is enabled.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param langs: The languages to be checked.
+        :type langs: Iterable[Any]
+        :return: For each language, in order, True if it is accepted, otherwise False.
+        :rtype: list[bool]
+        :raises TypeError: If 'flag_type' is not a type.
+        :raises ImportError: If 'VALID_LANG' is enabled but the 'langcodes' library is not installed and
+                             `ENFORCE_EXTRA_DEPEND` is enabled.
+
+        **Example**::
+
+            >>> Controller.set_flag(LangStringFlag.DEFINED_LANG, True)
+            >>> print(FlagValidator.mask_valid_langs(LangStringFlag, ["en", "", "en"]))  # Output: [True, False, True]
+        """
+        check = FlagValidator._lang_checker(flag_type)
+        decisions: dict[Optional[str], bool] = {}
+        mask: list[bool] = []
+        for lang in langs:
+            if lang is not None and not isinstance(lang, str):
+                mask.append(False)
+                continue
+            valid = decisions.get(lang)
+            if valid is None:
+                valid = decisions[lang] = check(lang) is not None
+            mask.append(valid)
+        return mask
+
+    @staticmethod
+    def mask_valid_texts(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]], texts: Iterable[Any]
+    ) -> list[bool]:
+        """
+        Check a batch of texts with `is_valid_text`. The flags are read once for the whole batch.
+
+        :param flag_type: The type of flags to be used for validation, which should be one of the flag enums.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :param texts: The texts to be checked.
+        :type texts: Iterable[Any]
+        :return: For each text, in order, True if it is accepted, otherwise False.
+        :rtype: list[bool]
+        :raises TypeError: If 'flag_type' is not a type.
+
+        **Example**::
+
+            >>> Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+            >>> print(FlagValidator.mask_valid_texts(GlobalFlag, ["Hello", "", None]))  # Output: [True, False, False]
+        """
+        check = FlagValidator._text_checker(flag_type)
+        return [check(text) is not None for text in texts]
+
+    @staticmethod
+    def _lang_checker(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]],
+    ) -> Callable[[Any], Optional[str]]:
+        """
+        Create a function applying the current language flags of the given flag type, as `check_lang` does.
+
+        The flags are read when the function is created, so it must not outlive a change of the flags.
+
+        :param flag_type: The type of flags to be applied.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :return: A function returning the transformed language, or None if the language is rejected.
+        :rtype: Callable[[Any], Optional[str]]
+        :raises TypeError: If 'flag_type' is not a type.
+        """
+        TypeValidator.validate_type_single(flag_type, type)
+        strip = Controller.get_flag(flag_type.STRIP_LANG)
+        lowercase = Controller.get_flag(flag_type.LOWERCASE_LANG)
+        defined = Controller.get_flag(flag_type.DEFINED_LANG)
+        valid = Controller.get_flag(flag_type.VALID_LANG)
+
+        def check(lang: Any) -> Optional[str]:
+            if lang is None:
+                transformed_lang = ""
+            elif not isinstance(lang, str):
+                return None
+            else:
+                transformed_lang = lang.strip() if strip else lang
+                transformed_lang = transformed_lang.casefold() if lowercase else transformed_lang
+            if defined and not transformed_lang.strip():
+                return None
+            if valid and not FlagValidator._tag_is_valid(transformed_lang):
+                return None
+            return transformed_lang
+
+        return check
+
+    @staticmethod
+    def _tag_is_valid(tag: str) -> bool:
+        """
+        Check a language tag with the 'langcodes' library, as required by the `VALID_LANG` flags.
+
+        If the library is not installed, an ImportError is raised when `ENFORCE_EXTRA_DEPEND` is enabled. Otherwise, a
+        warning is issued and the tag is considered valid.
+
+        :param tag: The language tag to be checked.
+        :type tag: str
+        :return: True if the tag is valid or cannot be checked, otherwise False.
+        :rtype: bool
+        :raises ImportError: If the 'langcodes' library is not installed and `ENFORCE_EXTRA_DEPEND` is enabled.
+        :raises UserWarning: If the 'langcodes' library is not installed and `ENFORCE_EXTRA_DEPEND` is disabled.
+        """
+        try:
+            from langcodes import tag_is_valid  # type: ignore[import-not-found]
+        except ImportError as e:
+            if Controller.get_flag(GlobalFlag.ENFORCE_EXTRA_DEPEND):
+                error_message = (
+                    str(e) + ". VALID_LANG functionality requires the 'langcodes' library. "
+                    "Install it with 'pip install langstring[langcodes]'."
+                )
+                raise ImportError(error_message) from e
+
+            import warnings  # Deferred, as it is only needed when 'langcodes' is missing
+
+            warnings.warn(
+                "Language validation skipped. VALID_LANG functionality requires the 'langcodes' library. "
+                "Install it with 'pip install langstring[langcodes]' to enable this feature.",
+                UserWarning,
+            )
+            return True
+        return bool(tag_is_valid(tag))
+
+    @staticmethod
+    def _text_checker(
+        flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]],
+    ) -> Callable[[Any], Optional[str]]:
+        """
+        Create a function applying the current text flags of the given flag type, as `check_text` does.
+
+        The flags are read when the function is created, so it must not outlive a change of the flags.
+
+        :param flag_type: The type of flags to be applied.
+        :type flag_type: type[Union[GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag]]
+        :return: A function returning the transformed text, or None if the text is rejected.
+        :rtype: Callable[[Any], Optional[str]]
+        :raises TypeError: If 'flag_type' is not a type.
+        """
+        TypeValidator.validate_type_single(flag_type, type)
+        strip = Controller.get_flag(flag_type.STRIP_TEXT)
+        defined = Controller.get_flag(flag_type.DEFINED_TEXT)
+
+        def check(text: Any) -> Optional[str]:
+            if text is None:
+                transformed_text = ""
+            elif not isinstance(text, str):
+                return None
+            else:
+                transformed_text = text.strip() if strip else text
+            if defined and not transformed_text.strip():
+                return None
+            return transformed_text
+
+        return check
+
 
 class TypeValidator(metaclass=NonInstantiable):
     """
@@ -271,14 +595,13 @@ class TypeValidator(metaclass=NonInstantiable):
     validation decorators to functions or methods.
     The validation ensures that the arguments match the specified type hints.
 
-    The `TypeValidator` class is non-instantiable, emphasizing its role as a static utility class.
-
     Methods:
         - `_check_arg(arg: Any, hint: type[Any]) -> bool`: Check if the argument matches the type hint.
         - `validate_type_decorator(func: Callable[..., T]) -> Callable[..., T]`: Decorator to validate the types of
           arguments passed to a function or method based on their type hints.
         - `validate_type_single(arg: Any, arg_exp_type: type, optional: bool = False) -> None`: Validate that a single
           argument matches the expected type.
+        - `validate_type_callable(arg: Any) -> None`: Validate that an argument is callable.
         - `validate_type_iterable(arg: Any, arg_exp_type: type, arg_content_exp_type: type, optional: bool = False) ->
           None`: Validate that an argument is an iterable of the expected type and that its contents match the expected
           content type.
@@ -474,23 +797,30 @@ class TypeValidator(metaclass=NonInstantiable):
             >>> union_example([42])  # Raises TypeError
         """
 
+        # Parameter names and type hints of the function, with and without 'self', resolved on the first call
+        signature_cache: dict[bool, tuple[list[str], dict[str, Any]]] = {}
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract type hints from the function, excluding the return type
-            type_hints = {k: v for k, v in get_type_hints(func).items() if k != "return"}
-            # Get the parameter names from the function signature
-            param_names = list(inspect.signature(func).parameters)
+            if not signature_cache:
+                import inspect  # Deferred, so that importing the package does not load 'inspect'
+
+                # Extract type hints from the function, excluding the return type
+                all_type_hints = {k: v for k, v in get_type_hints(func).items() if k != "return"}
+                # Get the parameter names from the function signature
+                all_param_names = list(inspect.signature(func).parameters)
+                signature_cache[False] = (all_param_names, all_type_hints)
+                # Remove 'self' from parameters and type hints for the validation of instance methods
+                signature_cache[True] = (
+                    [name for name in all_param_names if name != "self"],
+                    {k: v for k, v in all_type_hints.items() if k != "self"},
+                )
 
             # Check if the function is an instance method
-            is_instance_method = "self" in param_names and len(args) > 0 and isinstance(args[0], args[0].__class__)
-            if is_instance_method:
-                # Remove 'self' from parameters and type hints for validation
-                param_names.remove("self")
-                type_hints.pop("self", None)
-                # Skip 'self' when checking arguments
-                args_to_check = args[1:]
-            else:
-                args_to_check = args
+            is_instance_method = "self" in signature_cache[False][0] and len(args) > 0
+            param_names, type_hints = signature_cache[is_instance_method]
+            # Skip 'self' when checking arguments
+            args_to_check = args[1:] if is_instance_method else args
 
             # Validate positional arguments against their type hints
             for arg, (name, hint) in zip(args_to_check, zip(param_names, type_hints.values())):
@@ -545,6 +875,26 @@ class TypeValidator(metaclass=NonInstantiable):
                 f"Expected '{arg_exp_type.__name__}', but got '{type(arg).__name__}'."
             )
 
+    @staticmethod
+    def validate_type_callable(arg: Any) -> None:
+        """
+        Validate that an argument is callable, e.g., a function passed to be applied to texts or language tags.
+
+        :param arg: The argument to be checked.
+        :type arg: Any
+        :raises TypeError: If the argument is not callable.
+
+        **Example**::
+
+            >>> TypeValidator.validate_type_callable(str.strip)
+            >>> TypeValidator.validate_type_callable("strip")
+            # Raises TypeError: Invalid argument with value 'strip'. Expected a callable, but got 'str'.
+        """
+        if not callable(arg):
+            raise TypeError(
+                f"Invalid argument with value '{arg}'. Expected a callable, but got '{type(arg).__name__}'."
+            )
+
     @staticmethod
     def validate_type_iterable(
         arg: Any, arg_exp_type: type, arg_content_exp_type: type, optional: bool = False
@@ -0,0 +1,258 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator
+
+import pytest
+from langstring import AsyncPipeline
+from langstring import Controller
+from langstring import Converter
+from langstring import GlobalFlag
+from langstring import LangString
+from langstring import MultiLangString
+
+STRINGS = [f"text{i % 7}@{lang}" for i, lang in enumerate(["en", "EN", "fr", "pt-BR", "pt-br", "de"] * 6)]
+
+
+async def async_source(items: list) -> AsyncIterator:
+    """Yield the given items asynchronously, giving control to the event loop before each item.
+
+    :param items: The items to yield.
+    :return: An asynchronous iterator over the items.
+    """
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def collect(iterator: AsyncIterator) -> list:
+    """Collect all items of an asynchronous iterator in a list.
+
+    :param iterator: The asynchronous iterator.
+    :return: The list of items.
+    """
+    return [item async for item in iterator]
+
+
+@pytest.mark.parametrize("items, chunk_size", [(list(range(7)), 3), (list(range(6)), 3), ([], 2), (["a"], 10)])
+@pytest.mark.parametrize("make_source", [list, async_source])
+def test_chunked_splits_in_order(items: list, chunk_size: int, make_source) -> None:
+    """Test that chunked reads synchronous and asynchronous sources in ordered chunks of bounded size.
+
+    :param items: The items of the source.
+    :param chunk_size: The maximum chunk size.
+    :param make_source: Function creating the source from the items.
+    :return: None. Asserts that the chunks are bounded and preserve the order of the items.
+    """
+    chunks = asyncio.run(collect(AsyncPipeline.chunked(make_source(items), chunk_size)))
+    assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+    assert [item for chunk in chunks for item in chunk] == items
+
+
+@pytest.mark.parametrize("chunk_size, error", [(0, ValueError), (-1, ValueError), ("2", TypeError)])
+def test_chunked_invalid_chunk_size(chunk_size, error) -> None:
+    """Test that invalid chunk sizes raise the appropriate errors.
+
+    :param chunk_size: The invalid chunk size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        asyncio.run(collect(AsyncPipeline.chunked([1, 2], chunk_size)))
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=3)])
+@pytest.mark.parametrize("make_source", [list, async_source])
+@pytest.mark.parametrize("chunk_size, max_pending", [(1, 1), (4, 2), (5, 3), (100, 2)])
+def test_strings_to_langstrings_matches_converter(executor, make_source, chunk_size: int, max_pending: int) -> None:
+    """Test that the asynchronous conversion of strings produces the same LangStrings, in order, as the Converter.
+
+    :param executor: The executor used to convert the chunks, or None.
+    :param make_source: Function creating the source from the strings.
+    :param chunk_size: The maximum chunk size.
+    :param max_pending: The maximum number of pending chunks.
+    :return: None. Asserts that the results are equal and in the same order.
+    """
+    expected = Converter.from_strings_to_langstrings("parse", STRINGS)
+    stream = AsyncPipeline.strings_to_langstrings(
+        make_source(STRINGS), chunk_size=chunk_size, executor=executor, max_pending=max_pending
+    )
+    result = asyncio.run(collect(stream))
+    assert [repr(ls) for ls in result] == [repr(ls) for ls in expected]
+
+
+def test_strings_to_langstrings_manual_method() -> None:
+    """Test the asynchronous conversion of strings using the 'manual' method.
+
+    :return: None. Asserts that all LangStrings have the given language.
+    """
+    result = asyncio.run(collect(AsyncPipeline.strings_to_langstrings(["Hello", "Hi"], "manual", lang="en")))
+    assert [(ls.text, ls.lang) for ls in result] == [("Hello", "en"), ("Hi", "en")]
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=2)])
+def test_strings_to_langstrings_applies_flags(executor) -> None:
+    """Test that the Controller flags are applied when converting chunks, with or without an executor.
+
+    :param executor: The executor used to convert the chunks, or None.
+    :return: None. Asserts that texts and languages are transformed according to the flags.
+    """
+    Controller.set_flag(GlobalFlag.STRIP_TEXT, True)
+    Controller.set_flag(GlobalFlag.LOWERCASE_LANG, True)
+    stream = AsyncPipeline.strings_to_langstrings([" Hello @EN", "World @En"], chunk_size=1, executor=executor)
+    result = asyncio.run(collect(stream))
+    assert [(ls.text, ls.lang) for ls in result] == [("Hello", "en"), ("World", "en")]
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=2)])
+def test_strings_to_langstrings_propagates_errors(executor) -> None:
+    """Test that validation errors raised while converting a chunk are propagated to the consumer.
+
+    :param executor: The executor used to convert the chunks, or None.
+    :return: None. Asserts that the results of previous chunks are produced before the ValueError is raised.
+    """
+    Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+    received = []
+
+    async def consume() -> None:
+        async for langstring in AsyncPipeline.strings_to_langstrings(
+            ["Hello@en", "Hi@en", "@en"], chunk_size=2, executor=executor
+        ):
+            received.append(langstring.text)
+
+    with pytest.raises(ValueError, match="DEFINED_TEXT"):
+        asyncio.run(consume())
+    assert received == ["Hello", "Hi"]
+
+
+def test_strings_to_langstrings_backpressure() -> None:
+    """Test that the source is only read as results are requested by the consumer.
+
+    :return: None. Asserts that no more than one chunk is read ahead of the consumer.
+    """
+    read_count = 0
+
+    def source():
+        nonlocal read_count
+        for string in STRINGS:
+            read_count += 1
+            yield string
+
+    async def consume_first() -> None:
+        stream = AsyncPipeline.strings_to_langstrings(source(), chunk_size=4)
+        await stream.__anext__()
+        await stream.aclose()
+
+    asyncio.run(consume_first())
+    assert read_count == 4
+
+
+def test_strings_to_langstrings_yields_control() -> None:
+    """Test that other tasks run between the conversion of chunks.
+
+    :return: None. Asserts that a concurrent task progresses while the conversion is running.
+    """
+    events = []
+
+    async def ticker() -> None:
+        for _ in range(3):
+            events.append("tick")
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        task = asyncio.create_task(ticker())
+        async for _ in AsyncPipeline.strings_to_langstrings(STRINGS, chunk_size=6):
+            events.append("item")
+        await task
+
+    asyncio.run(main())
+    last_item_index = len(events) - 1 - events[::-1].index("item")
+    assert events.index("tick") < last_item_index, "The ticker task should run before the conversion finishes"
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=3)])
+@pytest.mark.parametrize("chunk_size", [1, 5, 100])
+def test_strings_to_multilangstring_matches_converter(executor, chunk_size: int) -> None:
+    """Test that the asynchronous conversion to a MultiLangString matches the Converter, including language casing.
+
+    :param executor: The executor used to convert the chunks, or None.
+    :param chunk_size: The maximum chunk size.
+    :return: None. Asserts the equality of the MultiLangStrings and of their languages.
+    """
+    expected = Converter.from_strings_to_multilangstring("parse", STRINGS)
+    result = asyncio.run(
+        AsyncPipeline.strings_to_multilangstring(async_source(STRINGS), chunk_size=chunk_size, executor=executor)
+    )
+    assert result == expected
+    assert result.get_langs() == expected.get_langs()
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=3)])
+def test_langstrings_to_multilangstring_pipeline(executor) -> None:
+    """Test chaining the conversion of strings to LangStrings and their collection into a MultiLangString.
+
+    :param executor: The executor used to process the chunks, or None.
+    :return: None. Asserts that the result equals adding the LangStrings one by one.
+    """
+    expected = MultiLangString()
+    for langstring in Converter.from_strings_to_langstrings("parse", STRINGS):
+        expected.add_langstring(langstring)
+
+    async def main() -> MultiLangString:
+        langstrings = AsyncPipeline.strings_to_langstrings(STRINGS, chunk_size=4, executor=executor)
+        return await AsyncPipeline.langstrings_to_multilangstring(langstrings, chunk_size=3, executor=executor)
+
+    result = asyncio.run(main())
+    assert result == expected
+    assert result.get_langs() == expected.get_langs()
+
+
+def test_langstrings_to_multilangstring_empty_source() -> None:
+    """Test collecting an empty stream of LangStrings.
+
+    :return: None. Asserts that an empty MultiLangString is returned.
+    """
+    assert asyncio.run(AsyncPipeline.langstrings_to_multilangstring([])) == MultiLangString()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+def test_group_langstrings_groups_consecutive_keys(chunk_size: int) -> None:
+    """Test that consecutive pairs with the same key are grouped, preserving the order of the groups.
+
+    :param chunk_size: The maximum chunk size.
+    :return: None. Asserts the keys and contents of the produced MultiLangStrings.
+    """
+    pairs = [
+        ("s1", LangString("Hello", "en")),
+        ("s1", LangString("Hi", "EN")),
+        ("s1", LangString("Oi", "pt")),
+        ("s2", LangString("Hallo", "de")),
+        ("s1", LangString("Hey", "en")),
+    ]
+    result = asyncio.run(collect(AsyncPipeline.group_langstrings(async_source(pairs), chunk_size=chunk_size)))
+    assert [key for key, _ in result] == ["s1", "s2", "s1"]
+    assert result[0][1] == MultiLangString({"en": {"Hello", "Hi"}, "pt": {"Oi"}})
+    assert result[0][1].get_langs() == ["en", "pt"]
+    assert result[1][1] == MultiLangString({"de": {"Hallo"}})
+    assert result[2][1] == MultiLangString({"en": {"Hey"}})
+
+
+def test_group_langstrings_empty_source() -> None:
+    """Test grouping an empty stream.
+
+    :return: None. Asserts that no groups are produced.
+    """
+    assert asyncio.run(collect(AsyncPipeline.group_langstrings([]))) == []
+
+
+@pytest.mark.parametrize("max_pending, executor, error", [(0, None, ValueError), (1, "executor", TypeError)])
+def test_invalid_pipeline_arguments(max_pending: int, executor, error) -> None:
+    """Test that invalid pipeline arguments raise the appropriate errors.
+
+    :param max_pending: The maximum number of pending chunks.
+    :param executor: The executor argument.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    stream = AsyncPipeline.strings_to_langstrings(STRINGS, executor=executor, max_pending=max_pending)
+    with pytest.raises(error):
+        asyncio.run(collect(stream))
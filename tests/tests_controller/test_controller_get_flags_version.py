@@ -0,0 +1,38 @@
+import pytest
+from langstring import Controller
+from langstring import GlobalFlag
+from langstring import LangStringFlag
+from langstring import MultiLangStringFlag
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda: Controller.set_flag(GlobalFlag.STRIP_TEXT, True),
+        lambda: Controller.set_flag(LangStringFlag.STRIP_TEXT, False),
+        lambda: Controller.reset_flag(GlobalFlag.VALID_LANG),
+        lambda: Controller.reset_flag(MultiLangStringFlag.SORTED_TEXTS),
+        lambda: Controller.reset_flags(),
+        lambda: Controller.reset_flags(LangStringFlag),
+    ],
+)
+def test_get_flags_version_incremented_by_changes(change) -> None:
+    """Test that setting or resetting flags increments the version of the flags' state.
+
+    :param change: A function setting or resetting flags.
+    :return: None. Asserts that the version increased.
+    """
+    version = Controller.get_flags_version()
+    change()
+    assert Controller.get_flags_version() > version
+
+
+def test_get_flags_version_unchanged_by_reads() -> None:
+    """Test that reading or printing flags does not change the version of the flags' state.
+
+    :return: None. Asserts that the version is unchanged.
+    """
+    version = Controller.get_flags_version()
+    Controller.get_flag(GlobalFlag.STRIP_TEXT)
+    Controller.get_flags()
+    assert Controller.get_flags_version() == version
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+from langstring import Controller
+from langstring import Converter
+from langstring import LangString
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+
+LANGS = ["en", "EN", "En", "fr", "pt-BR", "pt-br", " en", "de"]
+TEXTS = ["Hello", "Hi", " Hello ", "Bonjour", "Olá"]
+
+
+def make_pairs(seed: int) -> list[tuple[str, str]]:
+    """Create a random list of (text, lang) pairs.
+
+    :param seed: The seed of the random generator.
+    :return: The list of pairs.
+    """
+    rng = random.Random(seed)
+    return [(rng.choice(TEXTS), rng.choice(LANGS)) for _ in range(rng.randint(0, 12))]
+
+
+def reference_setlangstrings(langstrings: list[LangString]) -> list[SetLangString]:
+    """Convert LangStrings to SetLangStrings by merging one-element SetLangStrings, as in previous versions.
+
+    :param langstrings: The LangStrings to convert.
+    :return: The list of SetLangStrings.
+    """
+    merged = LangString.merge_langstrings(langstrings)
+    return SetLangString.merge_setlangstrings([Converter.from_langstrings_to_setlangstring([ls]) for ls in merged])
+
+
+def reference_multilangstring(langstrings: list[LangString]) -> MultiLangString:
+    """Convert LangStrings to a MultiLangString by adding the merged LangStrings one by one, as in previous versions.
+
+    :param langstrings: The LangStrings to convert.
+    :return: The MultiLangString.
+    """
+    multilangstring = MultiLangString()
+    for langstring in LangString.merge_langstrings(langstrings):
+        multilangstring.add_langstring(langstring)
+    return multilangstring
+
+
+FLAG_COMBINATIONS = [
+    {},
+    {SetLangStringFlag.STRIP_LANG: True, MultiLangStringFlag.STRIP_LANG: True},
+    {SetLangStringFlag.LOWERCASE_LANG: True, MultiLangStringFlag.LOWERCASE_LANG: True},
+    {SetLangStringFlag.STRIP_TEXT: True, MultiLangStringFlag.STRIP_TEXT: True},
+]
+
+
+@pytest.mark.parametrize("flags", FLAG_COMBINATIONS)
+@pytest.mark.parametrize("seed", range(30))
+def test_from_langstrings_grouping_matches_reference(flags: dict, seed: int) -> None:
+    """Test that the single-pass grouping produces the same results as merging the LangStrings one by one.
+
+    :param flags: The flags to enable.
+    :param seed: The seed of the random input.
+    :return: None. Asserts the texts and language tags, including casing, of the SetLangStrings and MultiLangString.
+    """
+    for flag, value in flags.items():
+        Controller.set_flag(flag, value)
+    pairs = make_pairs(seed)
+
+    result = Converter.from_langstrings_to_setlangstrings([LangString(text, lang) for text, lang in pairs])
+    expected = reference_setlangstrings([LangString(text, lang) for text, lang in pairs])
+    assert [(sls.texts, sls.lang) for sls in result] == [(sls.texts, sls.lang) for sls in expected]
+
+    result_mls = Converter.from_langstrings_to_multilangstring([LangString(text, lang) for text, lang in pairs])
+    expected_mls = reference_multilangstring([LangString(text, lang) for text, lang in pairs])
+    assert list(result_mls.mls_dict.items()) == list(expected_mls.mls_dict.items())
+
+
+@pytest.mark.parametrize("flags", FLAG_COMBINATIONS)
+@pytest.mark.parametrize("seed", range(30))
+def test_from_setlangstrings_to_multilangstring_grouping_matches_reference(flags: dict, seed: int) -> None:
+    """Test that the single-pass grouping of SetLangStrings produces the same result as adding them one by one.
+
+    :param flags: The flags to enable.
+    :param seed: The seed of the random input.
+    :return: None. Asserts the texts and language tags, including casing, of the MultiLangString.
+    """
+    for flag, value in flags.items():
+        Controller.set_flag(flag, value)
+    rng = random.Random(seed)
+    entries = [(set(rng.sample(TEXTS, rng.randint(0, 3))), rng.choice(LANGS)) for _ in range(rng.randint(0, 6))]
+
+    result = Converter.from_setlangstrings_to_multilangstring([SetLangString(t, lang) for t, lang in entries])
+    expected = MultiLangString()
+    for setlangstring in SetLangString.merge_setlangstrings([SetLangString(t, lang) for t, lang in entries]):
+        expected.add_setlangstring(setlangstring)
+    assert list(result.mls_dict.items()) == list(expected.mls_dict.items())
+
+
+def test_from_langstrings_grouping_does_not_modify_input() -> None:
+    """Test that the conversions do not change the language tags of the given LangStrings and SetLangStrings.
+
+    :return: None. Asserts the language tags of the arguments after the conversions.
+    """
+    langstrings = [LangString("Hello", "en"), LangString("Hello", "EN")]
+    Converter.from_langstrings_to_setlangstrings(langstrings)
+    Converter.from_langstrings_to_multilangstring(langstrings)
+    assert [ls.lang for ls in langstrings] == ["en", "EN"]
+
+    setlangstrings = [SetLangString({"Hello"}, "en"), SetLangString({"Hi"}, "EN")]
+    Converter.from_setlangstrings_to_multilangstring(setlangstrings)
+    assert [sls.lang for sls in setlangstrings] == ["en", "EN"]
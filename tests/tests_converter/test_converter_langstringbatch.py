@@ -0,0 +1,108 @@
+import pytest
+from langstring import Converter
+from langstring import LangString
+from langstring import LangStringBatch
+from langstring import MultiLangString
+from langstring import SetLangString
+
+TEXTS = ["Hello", "Bonjour", "Hi", "Hello", "Olá", "Hello", "Oi"]
+LANGS = ["en", "fr", "EN", "En", "pt-BR", "en", "pt-br"]
+
+
+def make_langstrings() -> list[LangString]:
+    """Create the LangStrings corresponding to the test texts and languages.
+
+    :return: A new list of LangStrings.
+    """
+    return [LangString(text, lang) for text, lang in zip(TEXTS, LANGS)]
+
+
+def test_from_langstrings_to_langstringbatch_roundtrip() -> None:
+    """Test converting LangStrings to a batch and back.
+
+    :return: None. Asserts that the LangStrings are preserved, in order and with their casing.
+    """
+    batch = Converter.from_langstrings_to_langstringbatch(make_langstrings())
+    assert batch == LangStringBatch(TEXTS, LANGS)
+    result = Converter.from_langstringbatch_to_langstrings(batch)
+    assert [(ls.text, ls.lang) for ls in result] == list(zip(TEXTS, LANGS))
+
+
+def test_from_langstringbatch_to_setlangstrings_matches_langstrings() -> None:
+    """Test that converting a batch to SetLangStrings matches the conversion of the equivalent LangStrings.
+
+    :return: None. Asserts the texts and languages of the SetLangStrings.
+    """
+    expected = Converter.from_langstrings_to_setlangstrings(make_langstrings())
+    result = Converter.from_langstringbatch_to_setlangstrings(LangStringBatch(TEXTS, LANGS))
+    assert [(sls.texts, sls.lang) for sls in result] == [(sls.texts, sls.lang) for sls in expected]
+
+
+def test_from_langstringbatch_to_multilangstring_matches_langstrings() -> None:
+    """Test that converting a batch to a MultiLangString matches the conversion of the equivalent LangStrings.
+
+    :return: None. Asserts the equality and the languages of the MultiLangStrings.
+    """
+    expected = Converter.from_langstrings_to_multilangstring(make_langstrings())
+    result = Converter.from_langstringbatch_to_multilangstring(LangStringBatch(TEXTS, LANGS))
+    assert result == expected
+    assert result.get_langs() == expected.get_langs()
+
+
+def test_from_setlangstrings_to_langstringbatch() -> None:
+    """Test converting SetLangStrings to a batch.
+
+    :return: None. Asserts the (text, lang) pairs of the batch.
+    """
+    setlangstrings = [SetLangString({"Hello", "Hi"}, "en"), SetLangString(set(), "de"), SetLangString({"Oi"}, "pt")]
+    batch = Converter.from_setlangstrings_to_langstringbatch(setlangstrings)
+    assert sorted(zip(batch.get_texts(), batch.get_langs())) == [("Hello", "en"), ("Hi", "en"), ("Oi", "pt")]
+    assert batch.get_langs()[-1] == "pt"
+
+
+def test_from_multilangstring_to_langstringbatch() -> None:
+    """Test converting a MultiLangString to a batch and back.
+
+    :return: None. Asserts the (text, lang) pairs of the batch and the MultiLangString obtained from it.
+    """
+    mls = MultiLangString({"en": {"Hello", "Hi"}, "fr": {"Bonjour"}, "de": set()})
+    batch = Converter.from_multilangstring_to_langstringbatch(mls)
+    assert sorted(zip(batch.get_texts(), batch.get_langs())) == [("Bonjour", "fr"), ("Hello", "en"), ("Hi", "en")]
+    assert Converter.from_langstringbatch_to_multilangstring(batch) == MultiLangString(
+        {"en": {"Hello", "Hi"}, "fr": {"Bonjour"}}
+    )
+
+
+def test_from_multilangstring_to_langstringbatch_keeps_shared_texts() -> None:
+    """Test that converting a copied MultiLangString to a batch does not copy the texts it shares with the original.
+
+    :return: None. Asserts that the sets of texts are still shared after the conversion.
+    """
+    mls = MultiLangString({"en": {"Hello", "Hi"}, "fr": {"Bonjour"}})
+    copied = mls.copy()
+    batch = Converter.from_multilangstring_to_langstringbatch(copied)
+    assert len(batch) == 3
+    assert copied._mls_dict["en"] is mls._mls_dict["en"]
+    assert copied._shared_langs
+
+
+@pytest.mark.parametrize(
+    "method, arg",
+    [
+        (Converter.from_langstrings_to_langstringbatch, ["Hello"]),
+        (Converter.from_setlangstrings_to_langstringbatch, [LangString("Hello", "en")]),
+        (Converter.from_multilangstring_to_langstringbatch, {"en": {"Hello"}}),
+        (Converter.from_langstringbatch_to_langstrings, [LangString("Hello", "en")]),
+        (Converter.from_langstringbatch_to_setlangstrings, None),
+        (Converter.from_langstringbatch_to_multilangstring, "Hello@en"),
+    ],
+)
+def test_langstringbatch_conversions_invalid_types(method, arg) -> None:
+    """Test that the batch conversion methods reject arguments of invalid types.
+
+    :param method: The conversion method.
+    :param arg: The invalid argument.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        method(arg)
@@ -0,0 +1,131 @@
+import pytest
+from langstring import Controller
+from langstring import Converter
+from langstring import GlobalFlag
+from langstring import LangString
+from langstring import LangStringFlag
+
+
+@pytest.fixture(autouse=True)
+def disable_parse_cache():
+    """Disable the parse cache after each test.
+
+    :return: None.
+    """
+    yield
+    Converter.disable_parse_cache()
+
+
+def test_parse_cache_disabled_by_default() -> None:
+    """Test that the parse cache is disabled unless explicitly enabled.
+
+    :return: None. Asserts that no statistics are available and that parsing works.
+    """
+    assert Converter.get_parse_cache_info() is None
+    assert Converter.from_string_to_langstring_parse("Hello@en") == LangString("Hello", "en")
+    assert Converter.get_parse_cache_info() is None
+
+
+@pytest.mark.parametrize(
+    "input_string, separator",
+    [("Hello@en", "@"), ("Hello", "@"), ("a@b@c", "@"), ("Hello|en", "|"), ("Hello@en", ""), ("", "@")],
+)
+def test_parse_cache_results_match_uncached(input_string: str, separator: str) -> None:
+    """Test that cached results are equal to the uncached ones, on misses and on hits.
+
+    :param input_string: The string to parse.
+    :param separator: The separator.
+    :return: None. Asserts the text and language of the first and second results.
+    """
+    expected = Converter.from_string_to_langstring_parse(input_string, separator)
+    Converter.enable_parse_cache()
+    for _ in range(2):
+        result = Converter.from_string_to_langstring_parse(input_string, separator)
+        assert isinstance(result, LangString)
+        assert (result.text, result.lang) == (expected.text, expected.lang)
+    assert Converter.get_parse_cache_info()[:2] == (1, 1)
+
+
+def test_parse_cache_returns_independent_langstrings() -> None:
+    """Test that cache hits return new LangStrings, unaffected by modifications of previous results.
+
+    :return: None. Asserts the identity and content of the results.
+    """
+    Converter.enable_parse_cache()
+    first = Converter.from_string_to_langstring_parse("Yes@en")
+    first.text = "No"
+    second = Converter.from_string_to_langstring_parse("Yes@en")
+    assert second is not first
+    assert second == LangString("Yes", "en")
+
+
+def test_parse_cache_statistics_and_hit_rate() -> None:
+    """Test the statistics reported by the parse cache, including through the list conversions.
+
+    :return: None. Asserts hits, misses, sizes, and hit rate.
+    """
+    Converter.enable_parse_cache(maxsize=10)
+    Converter.from_strings_to_langstrings("parse", ["Yes@en", "Yes@en", "Oui@fr", "Yes@en"])
+    info = Converter.get_parse_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 2, 10, 2)
+    assert info.hit_rate == 0.5
+    Converter.clear_parse_cache()
+    assert Converter.get_parse_cache_info()[:] == (0, 0, 10, 0)
+    assert Converter.get_parse_cache_info().hit_rate == 0.0
+
+
+def test_parse_cache_is_bounded() -> None:
+    """Test that the least recently used entries are evicted when the cache is full.
+
+    :return: None. Asserts the size of the cache and which strings are hits.
+    """
+    Converter.enable_parse_cache(maxsize=2)
+    for string in ["a@en", "b@en", "a@en", "c@en"]:
+        Converter.from_string_to_langstring_parse(string)
+    assert Converter.get_parse_cache_info().currsize == 2
+    Converter.from_string_to_langstring_parse("a@en")
+    assert Converter.get_parse_cache_info().hits == 2, "'a@en' was recently used and should not be evicted"
+    Converter.from_string_to_langstring_parse("b@en")
+    assert Converter.get_parse_cache_info().hits == 2, "'b@en' should have been evicted"
+
+
+@pytest.mark.parametrize("flag", [GlobalFlag.LOWERCASE_LANG, LangStringFlag.LOWERCASE_LANG])
+def test_parse_cache_invalidated_by_flag_changes(flag) -> None:
+    """Test that results cached under previous flag states are not returned after a flag changes.
+
+    :param flag: The flag changing the parsed language.
+    :return: None. Asserts the language of the results before and after setting and resetting the flag.
+    """
+    Converter.enable_parse_cache()
+    assert Converter.from_string_to_langstring_parse("Hello@EN").lang == "EN"
+    Controller.set_flag(flag, True)
+    assert Converter.from_string_to_langstring_parse("Hello@EN").lang == "en"
+    Controller.reset_flags()
+    assert Converter.from_string_to_langstring_parse("Hello@EN").lang == "EN"
+    assert Converter.get_parse_cache_info().hits == 0
+
+
+def test_parse_cache_does_not_cache_errors() -> None:
+    """Test that strings rejected by the enabled flags raise errors on every call.
+
+    :return: None. Asserts that a ValueError is raised twice and that nothing is cached.
+    """
+    Converter.enable_parse_cache()
+    Controller.set_flag(LangStringFlag.DEFINED_LANG, True)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="DEFINED_LANG"):
+            Converter.from_string_to_langstring_parse("Hello")
+    assert Converter.get_parse_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), (-5, ValueError), ("10", TypeError), (1.5, TypeError)])
+def test_enable_parse_cache_invalid_maxsize(maxsize, error) -> None:
+    """Test that invalid cache sizes are rejected.
+
+    :param maxsize: The invalid size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised and the cache stays disabled.
+    """
+    with pytest.raises(error):
+        Converter.enable_parse_cache(maxsize)
+    assert Converter.get_parse_cache_info() is None
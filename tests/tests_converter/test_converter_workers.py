@@ -0,0 +1,184 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langstring import Controller
+from langstring import Converter
+from langstring import GlobalFlag
+from langstring import LangString
+from langstring import MultiLangString
+from langstring import SetLangString
+from langstring.utils.parallel import ParallelRunner
+
+STRINGS = [f"text{i % 7}@{lang}" for i, lang in enumerate(["en", "EN", "fr", "pt-BR", "pt-br", "de"] * 6)]
+
+
+def make_langstrings() -> list[LangString]:
+    """Create a list of LangStrings with repeated texts and language case variations.
+
+    :return: A new list of LangStrings.
+    """
+    return [Converter.from_string_to_langstring_parse(string) for string in STRINGS]
+
+
+def make_setlangstrings() -> list[SetLangString]:
+    """Create a list of SetLangStrings with language case variations.
+
+    :return: A new list of SetLangStrings.
+    """
+    return [
+        SetLangString({"a", "b"}, "en"),
+        SetLangString({"c"}, "fr"),
+        SetLangString({"b", "d"}, "EN"),
+        SetLangString({"e"}, "pt"),
+        SetLangString({"f"}, "fr"),
+    ]
+
+
+def make_multilangstrings() -> list[MultiLangString]:
+    """Create a list of MultiLangStrings with language case variations.
+
+    :return: A new list of MultiLangStrings.
+    """
+    return [
+        MultiLangString({"en": {"a"}, "fr": {"b"}}),
+        MultiLangString({"EN": {"c"}, "de": {"d"}}),
+        MultiLangString({"fr": {"e", "b"}}),
+        MultiLangString({"pt": {"f"}, "En": {"a"}}),
+    ]
+
+
+def normalize(item) -> str:
+    """Return a representation of a conversion output item that does not depend on set iteration order.
+
+    :param item: A string, LangString, or SetLangString.
+    :return: The normalized representation of the item.
+    """
+    if isinstance(item, SetLangString):
+        return f"{sorted(item.texts)}@{item.lang}"
+    return repr(item)
+
+
+@pytest.mark.parametrize("workers", [1, 2, ThreadPoolExecutor(max_workers=3)])
+@pytest.mark.parametrize(
+    "conversion, make_input, ordered",
+    [
+        (lambda arg, w: Converter.from_strings_to_langstrings("parse", arg, workers=w), lambda: list(STRINGS), True),
+        (
+            lambda arg, w: Converter.from_strings_to_multilangstring("parse", arg, workers=w),
+            lambda: list(STRINGS),
+            True,
+        ),
+        (lambda arg, w: Converter.from_langstrings_to_strings(arg, workers=w), make_langstrings, True),
+        (lambda arg, w: Converter.from_langstrings_to_setlangstrings(arg, workers=w), make_langstrings, True),
+        (lambda arg, w: Converter.from_langstrings_to_multilangstring(arg, workers=w), make_langstrings, True),
+        (lambda arg, w: Converter.from_setlangstrings_to_strings(arg, workers=w), make_setlangstrings, True),
+        (lambda arg, w: Converter.from_setlangstrings_to_langstrings(arg, workers=w), make_setlangstrings, False),
+        (lambda arg, w: Converter.from_setlangstrings_to_multilangstring(arg, workers=w), make_setlangstrings, True),
+        (lambda arg, w: Converter.from_multilangstrings_to_strings(arg, workers=w), make_multilangstrings, True),
+        (lambda arg, w: Converter.from_multilangstrings_to_langstrings(arg, workers=w), make_multilangstrings, False),
+        (lambda arg, w: Converter.from_multilangstrings_to_setlangstrings(arg, workers=w), make_multilangstrings, True),
+    ],
+)
+def test_workers_match_sequential_results(conversion, make_input, ordered: bool, workers) -> None:
+    """Test that conversions using workers produce the same results as sequential conversions.
+
+    :param conversion: A function applying the conversion with the given workers argument.
+    :param make_input: A function creating a fresh input for the conversion.
+    :param ordered: False if the output order depends on the iteration order of sets, which is not guaranteed.
+    :param workers: The workers argument (number of processes or executor).
+    :return: None. Asserts that the results are equal, including order (when defined) and language casing.
+    """
+    expected = conversion(make_input(), None)
+    result = conversion(make_input(), workers)
+
+    if isinstance(expected, list):
+        result_reprs = [normalize(item) for item in result]
+        expected_reprs = [normalize(item) for item in expected]
+        if not ordered:
+            result_reprs.sort()
+            expected_reprs.sort()
+        assert result_reprs == expected_reprs
+    else:
+        assert result == expected
+        assert result.get_langs() == expected.get_langs()
+
+
+def test_workers_propagate_controller_flags() -> None:
+    """Test that the Controller flags of the calling process are applied in spawned worker processes.
+
+    :return: None. Asserts that texts and languages are transformed according to the flags set in the parent.
+    """
+    Controller.set_flag(GlobalFlag.STRIP_TEXT, True)
+    Controller.set_flag(GlobalFlag.LOWERCASE_LANG, True)
+    strings = [" Hello @EN", "World @En", " Bonjour@FR"]
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        result = Converter.from_strings_to_langstrings("parse", strings, workers=executor)
+
+    assert [(ls.text, ls.lang) for ls in result] == [("Hello", "en"), ("World", "en"), ("Bonjour", "fr")]
+
+
+def test_workers_propagate_validation_errors() -> None:
+    """Test that validation errors raised in workers are propagated to the caller.
+
+    :return: None. Asserts that a ValueError is raised for an empty text when DEFINED_TEXT is enabled.
+    """
+    Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError, match="DEFINED_TEXT"):
+        Converter.from_strings_to_langstrings("parse", ["Hello@en", "@en", "Hi@en"], workers=2)
+
+
+@pytest.mark.parametrize("workers, error", [(0, ValueError), (-2, ValueError), ("2", TypeError), (1.5, TypeError)])
+def test_workers_invalid_values(workers, error) -> None:
+    """Test that invalid workers arguments raise the appropriate errors.
+
+    :param workers: The invalid workers argument.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        Converter.from_strings_to_langstrings("parse", ["Hello@en", "Hi@en"], workers=workers)
+
+
+@pytest.mark.parametrize(
+    "items, num_chunks, expected",
+    [
+        ([1, 2, 3, 4, 5], 2, [[1, 2, 3], [4, 5]]),
+        ([1, 2, 3], 5, [[1], [2], [3]]),
+        ([], 3, [[]]),
+        ([1, 2, 3, 4], 1, [[1, 2, 3, 4]]),
+    ],
+)
+def test_parallel_runner_split_chunks(items: list, num_chunks: int, expected: list) -> None:
+    """Test that chunks are contiguous, balanced, and preserve the order of the items.
+
+    :param items: The list to split.
+    :param num_chunks: The maximum number of chunks.
+    :param expected: The expected chunks.
+    :return: None. Asserts that the chunks match the expected ones.
+    """
+    assert ParallelRunner.split_chunks(items, num_chunks) == expected
+
+
+def test_parallel_runner_run_chunk_applies_flags_in_other_processes_only() -> None:
+    """Test that the flags sent with a chunk are applied in worker processes but not in the calling process.
+
+    A thread of the calling process shares its Controller, so applying stale flags there would undo the changes made
+    concurrently by other threads.
+
+    :return: None. Asserts the flags and their version after processing chunks with the current and another process id.
+    """
+    stale_flags = Controller.get_flags()
+    Controller.set_flag(GlobalFlag.LOWERCASE_LANG, True)
+    version = Controller.get_flags_version()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(ParallelRunner.run_chunk, os.getpid(), stale_flags, len, [1, 2]).result() == 2
+    assert Controller.get_flag(GlobalFlag.LOWERCASE_LANG) is True
+    assert Controller.get_flags_version() == version
+
+    assert ParallelRunner.run_chunk(os.getpid() + 1, stale_flags, len, [1]) == 1
+    assert Controller.get_flag(GlobalFlag.LOWERCASE_LANG) is False
+    assert Controller.get_flags_version() == version + 1
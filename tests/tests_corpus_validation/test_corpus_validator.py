@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+import pytest
+from langstring import Controller
+from langstring import CorpusValidator
+from langstring import LangString
+from langstring import MultiLangString
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+from langstring.corpus_validation import TagStatistics
+from langstring.utils.validators import FlagValidator
+
+
+def test_validate_strings() -> None:
+    """Test the report of a collection of strings parsed with the separator.
+
+    :return: None. Asserts every field of the report.
+    """
+    report = CorpusValidator.validate(["Hello@en", "@fr", "Bonjour@xx-invalid-tag", "Hallo", "Hi@en"])
+    assert report.records == 5
+    assert report.literals == 5
+    assert report.violations == {"DEFINED_TEXT": 1, "DEFINED_LANG": 1, "VALID_LANG": 2}
+    assert report.offending_indices == {"DEFINED_TEXT": [1], "DEFINED_LANG": [3], "VALID_LANG": [2, 3]}
+    assert report.tag_statistics == {
+        "en": TagStatistics(literals=2, undefined_texts=0, valid_tag=True),
+        "fr": TagStatistics(literals=1, undefined_texts=1, valid_tag=True),
+        "xx-invalid-tag": TagStatistics(literals=1, undefined_texts=0, valid_tag=False),
+        "": TagStatistics(literals=1, undefined_texts=0, valid_tag=False),
+    }
+    assert report.untracked_literals == 0
+    assert report.is_valid is False
+
+
+def test_validate_objects() -> None:
+    """Test that LangString, SetLangString, and MultiLangString records count one literal per text.
+
+    :return: None. Asserts the counts and offending record indices.
+    """
+    records = [
+        LangString("Hello", "en"),
+        SetLangString({"a", "  ", ""}, "en"),
+        MultiLangString({"en": {"Hello"}, " ": {"Hallo", "Hi"}, "fr": set()}),
+    ]
+    report = CorpusValidator.validate(records)
+    assert report.records == 3
+    assert report.literals == 7
+    assert report.violations == {"DEFINED_TEXT": 2, "DEFINED_LANG": 2, "VALID_LANG": 2}
+    assert report.offending_indices == {"DEFINED_TEXT": [1], "DEFINED_LANG": [2], "VALID_LANG": [2]}
+    assert report.tag_statistics["en"] == TagStatistics(literals=5, undefined_texts=2, valid_tag=True)
+    assert "fr" not in report.tag_statistics, "Languages without texts contain no literal"
+
+
+def test_validate_ignores_flags() -> None:
+    """Test that the rules are checked regardless of the flags currently enabled.
+
+    :return: None. Asserts that an undefined text stored while the flags allowed it is reported.
+    """
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    report = CorpusValidator.validate([SetLangString({" "}, "en")])
+    assert report.violations["DEFINED_TEXT"] == 1
+
+
+def test_validate_valid_corpus() -> None:
+    """Test the report of a collection without violations, given as a generator.
+
+    :return: None. Asserts that the report is valid.
+    """
+    report = CorpusValidator.validate(f"Text {i}@en" for i in range(100))
+    assert report.is_valid is True
+    assert report.records == 100
+    assert report.offending_indices == {"DEFINED_TEXT": [], "DEFINED_LANG": [], "VALID_LANG": []}
+
+
+@pytest.mark.parametrize("separator, record, tag", [("|", "a@b|en", "en"), ("", "Hello@en", ""), ("@", "a@b@en", "en")])
+def test_validate_separator(separator, record, tag) -> None:
+    """Test that strings are split at the last occurrence of the separator.
+
+    :param separator: The separator.
+    :param record: The string record.
+    :param tag: The expected language tag.
+    :return: None. Asserts the tag of the statistics.
+    """
+    assert list(CorpusValidator.validate([record], separator=separator).tag_statistics) == [tag]
+
+
+def test_validate_caps_indices_and_tags() -> None:
+    """Test that offending indices and tag statistics are capped while counts stay exact.
+
+    :return: None. Asserts the capped indices, tracked tags, and untracked literals.
+    """
+    records = [f"@tag-{i % 5}" for i in range(1000)]
+    report = CorpusValidator.validate(records, max_indices=3, max_tags=2)
+    assert report.violations["DEFINED_TEXT"] == 1000
+    assert report.offending_indices["DEFINED_TEXT"] == [0, 1, 2]
+    assert list(report.tag_statistics) == ["tag-0", "tag-1"]
+    assert report.tag_statistics["tag-0"].literals == 200
+    assert report.untracked_literals == 600
+
+
+def test_validate_checks_each_tag_once() -> None:
+    """Test that the language rules are checked once per distinct tag.
+
+    :return: None. Asserts the number of tag validations.
+    """
+    records = ["a@en", "b@fr", "c@en"] * 100
+    with patch.object(FlagValidator, "_tag_is_valid", wraps=FlagValidator._tag_is_valid) as tag_is_valid:
+        CorpusValidator.validate(records)
+    assert tag_is_valid.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "records, kwargs, error",
+    [
+        ([1], {}, TypeError),
+        (["a@en", None], {}, TypeError),
+        ([], {"separator": None}, TypeError),
+        ([], {"max_indices": -1}, ValueError),
+        ([], {"max_tags": 0}, ValueError),
+        ([], {"max_tags": "1"}, TypeError),
+    ],
+)
+def test_validate_invalid_arguments(records, kwargs, error) -> None:
+    """Test that invalid records and arguments are rejected.
+
+    :param records: The records.
+    :param kwargs: The keyword arguments of the validation.
+    :param error: The expected exception type.
+    :return: None. Asserts the raised exception.
+    """
+    with pytest.raises(error):
+        CorpusValidator.validate(records, **kwargs)
@@ -0,0 +1,157 @@
+import random
+
+import pytest
+from langstring import Controller
+from langstring import ExternalMerger
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import SetLangString
+
+TEXTS = ["Hello", "Hi", "Bonjour", "Olá", "hello", ""]
+LANGS = ["en", "EN", "En", "fr", "FR", "pt-BR", "pt-br", ""]
+
+
+def random_langstrings(seed: int, size: int) -> list[LangString]:
+    """Create a random list of LangStrings with many duplicates and casing variants.
+
+    :param seed: The random seed.
+    :param size: The number of LangStrings.
+    :return: A new list of LangStrings.
+    """
+    rng = random.Random(seed)
+    return [LangString(rng.choice(TEXTS), rng.choice(LANGS)) for _ in range(size)]
+
+
+def random_setlangstrings(seed: int, size: int) -> list[SetLangString]:
+    """Create a random list of SetLangStrings with casing variants of the language tags.
+
+    :param seed: The random seed.
+    :param size: The number of SetLangStrings.
+    :return: A new list of SetLangStrings.
+    """
+    rng = random.Random(seed)
+    return [SetLangString(set(rng.sample(TEXTS, rng.randint(0, 3))), rng.choice(LANGS)) for _ in range(size)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("memory_limit, partitions", [(None, None), (1, 1), (3, 4), (10, 7), (1000, 2)])
+def test_external_merge_langstrings_matches_merge_langstrings(seed: int, memory_limit, partitions) -> None:
+    """Test that the merged LangStrings equal those of LangString.merge_langstrings, in memory or spilled.
+
+    :param seed: The random seed of the input.
+    :param memory_limit: The memory limit of the merger.
+    :param partitions: The number of partitions of the merger.
+    :return: None. Asserts texts, language casing, and order of the results.
+    """
+    langstrings = random_langstrings(seed, 200)
+    expected = LangString.merge_langstrings([LangString(ls.text, ls.lang) for ls in langstrings])
+    merger = ExternalMerger(memory_limit=memory_limit, partitions=partitions)
+    result = list(merger.merge_langstrings(iter(langstrings)))
+    assert [(ls.text, ls.lang) for ls in result] == [(ls.text, ls.lang) for ls in expected]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("memory_limit, partitions", [(None, None), (1, 1), (5, 3), (30, 8)])
+def test_external_merge_setlangstrings_matches_merge_setlangstrings(seed: int, memory_limit, partitions) -> None:
+    """Test that the merged SetLangStrings equal those of SetLangString.merge_setlangstrings, in memory or spilled.
+
+    :param seed: The random seed of the input.
+    :param memory_limit: The memory limit of the merger.
+    :param partitions: The number of partitions of the merger.
+    :return: None. Asserts texts, language casing, and order of the results.
+    """
+    setlangstrings = random_setlangstrings(seed, 60)
+    expected = SetLangString.merge_setlangstrings([SetLangString(set(s.texts), s.lang) for s in setlangstrings])
+    merger = ExternalMerger(memory_limit=memory_limit, partitions=partitions)
+    result = list(merger.merge_setlangstrings(setlangstrings))
+    assert [(s.texts, s.lang) for s in result] == [(s.texts, s.lang) for s in expected]
+
+
+def test_external_merge_does_not_modify_inputs() -> None:
+    """Test that the input objects are not modified and the results are new objects.
+
+    :return: None. Asserts the languages of the inputs and the identity of the results.
+    """
+    langstrings = [LangString("Hi", "en"), LangString("Hi", "EN")]
+    result = list(ExternalMerger(memory_limit=1).merge_langstrings(langstrings))
+    assert result == [LangString("Hi", "en")]
+    assert result[0] is not langstrings[0]
+    assert [ls.lang for ls in langstrings] == ["en", "EN"]
+
+
+def test_external_merge_empty_input() -> None:
+    """Test merging empty inputs.
+
+    :return: None. Asserts that no result is produced.
+    """
+    merger = ExternalMerger(memory_limit=1)
+    assert list(merger.merge_langstrings([])) == []
+    assert list(merger.merge_setlangstrings(iter([]))) == []
+
+
+def test_external_merge_spill_files_are_removed(tmp_path) -> None:
+    """Test that the spill files are removed when the results are exhausted or the generator is closed.
+
+    :param tmp_path: The pytest temporary directory.
+    :return: None. Asserts that the temporary directory is empty.
+    """
+    merger = ExternalMerger(memory_limit=2, partitions=3, temp_dir=tmp_path)
+    langstrings = random_langstrings(0, 50)
+
+    results = merger.merge_langstrings(langstrings)
+    next(results)
+    assert list(tmp_path.iterdir()), "Spill files should exist while the results are being read"
+    results.close()
+    assert list(tmp_path.iterdir()) == []
+
+    list(merger.merge_langstrings(langstrings))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_external_merge_applies_flags() -> None:
+    """Test that the language tags of the results are validated with the enabled LangStringFlag flags.
+
+    :return: None. Asserts that the merged language tag is lowercased.
+    """
+    langstrings = [LangString("Hi", "x-Custom"), LangString("Hi", "X-CUSTOM")]
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    assert [ls.lang for ls in ExternalMerger(memory_limit=1).merge_langstrings(langstrings)] == ["x-custom"]
+
+
+@pytest.mark.parametrize(
+    "method, items",
+    [
+        ("merge_langstrings", [LangString("a", "en"), "a@en"]),
+        ("merge_setlangstrings", [SetLangString({"a"}, "en"), LangString("a", "en")]),
+    ],
+)
+def test_external_merge_invalid_items(method: str, items: list) -> None:
+    """Test that items of invalid types raise TypeError.
+
+    :param method: The merge method.
+    :param items: The items, one of which has an invalid type.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        list(getattr(ExternalMerger(), method)(items))
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"memory_limit": 0}, ValueError),
+        ({"partitions": 0}, ValueError),
+        ({"memory_limit": "1"}, TypeError),
+        ({"partitions": 1.0}, TypeError),
+        ({"temp_dir": 1}, TypeError),
+    ],
+)
+def test_external_merger_invalid_arguments(kwargs: dict, error) -> None:
+    """Test that invalid configurations are rejected.
+
+    :param kwargs: The invalid arguments.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        ExternalMerger(**kwargs)
@@ -0,0 +1,110 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import langstring
+
+# Modules that must not be loaded by importing the package or the core classes
+DEFERRED_MODULES = ["asyncio", "concurrent.futures", "inspect", "multiprocessing", "sqlite3", "tempfile"]
+
+# Maximum number of modules reported by 'python -X importtime' as loaded by 'import langstring'
+IMPORTED_MODULES_BUDGET = 40
+
+# Maximum cumulative time, in microseconds, reported by 'python -X importtime' for 'import langstring'. As timings
+# depend on the machine load, this budget is only checked when the LANGSTRING_IMPORT_BENCHMARK variable is set.
+IMPORT_TIME_BUDGET_US = 50_000
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run Python code in a new interpreter.
+
+    :param code: The code to run.
+    :param options: The interpreter options.
+    :return: The completed process, with captured text output.
+    """
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def import_langstring_with_importtime() -> list[tuple[str, int]]:
+    """Import the package in a new interpreter and read the modules it loads from the 'python -X importtime' report.
+
+    :return: The name and cumulative time, in microseconds, of each module loaded by 'import langstring', in report
+             order, the package itself being the last one.
+    """
+    entries = []
+    for line in run_python("import langstring", "-X", "importtime").stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and len(fields) == 3 and fields[1].strip().isdigit():
+            entries.append((fields[2].rstrip(), int(fields[1])))
+    end = next(index for index, (name, _) in enumerate(entries) if name == " langstring") + 1
+    # The modules loaded by the package are reported, nested, just before it and after the previous top-level import
+    start = end - 1
+    while start > 0 and entries[start - 1][0].startswith("  "):
+        start -= 1
+    return [(name.strip(), cumulative) for name, cumulative in entries[start:end]]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import langstring",
+        "from langstring import LangString",
+        "from langstring import MultiLangString, SetLangString, Controller, GlobalFlag",
+    ],
+)
+def test_import_does_not_load_deferred_modules(statement: str) -> None:
+    """Test that importing the package or its core classes does not load heavy modules.
+
+    :param statement: The import statement.
+    :return: None. Asserts that none of the deferred modules was loaded.
+    """
+    code = f"import sys\n{statement}\nprint(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    assert run_python(code).stdout.strip() == ""
+
+
+def test_import_modules_budget() -> None:
+    """Test that importing the package loads no submodule and at most IMPORTED_MODULES_BUDGET modules.
+
+    Unlike timings, the modules reported by 'python -X importtime' do not depend on the machine load.
+
+    :return: None. Asserts the loaded package modules and the number of loaded modules.
+    """
+    modules = [name for name, _ in import_langstring_with_importtime()]
+    assert [name for name in modules if name.startswith("langstring")] == ["langstring"]
+    assert len(modules) <= IMPORTED_MODULES_BUDGET, f"'import langstring' loaded {len(modules)} modules: {modules}"
+
+
+@pytest.mark.skipif("LANGSTRING_IMPORT_BENCHMARK" not in os.environ, reason="opt-in import time benchmark")
+def test_import_time_budget() -> None:
+    """Test that the cumulative import time of the package stays within its budget.
+
+    The best of three measurements is used to reduce the influence of the machine load.
+
+    :return: None. Asserts that the cumulative time of 'langstring' is below IMPORT_TIME_BUDGET_US.
+    """
+    timings = [import_langstring_with_importtime()[-1][1] for _ in range(3)]
+    assert min(timings) < IMPORT_TIME_BUDGET_US, f"'import langstring' took {min(timings)} us"
+
+
+def test_lazy_names_are_loaded_on_access() -> None:
+    """Test that every public name can be accessed, and is listed by dir().
+
+    :return: None. Asserts the names and modules of the exported objects.
+    """
+    for name in langstring.__all__:
+        value = getattr(langstring, name)
+        assert value.__name__ == name
+        assert value.__module__.startswith("langstring.")
+        assert name in dir(langstring)
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    """Test that accessing an unknown attribute of the package raises AttributeError.
+
+    :return: None. Asserts that an AttributeError is raised.
+    """
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        langstring.Unknown
@@ -0,0 +1,133 @@
+import json
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import Converter
+from langstring import Instrumentation
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import MultiLangString
+from langstring import SetLangString
+from langstring.utils.validators import FlagValidator
+
+
+@pytest.fixture(autouse=True)
+def reset_instrumentation():
+    """Disable instrumentation and discard its metrics after each test.
+
+    :return: None.
+    """
+    yield
+    Instrumentation.disable()
+    Instrumentation.reset()
+
+
+def test_instrumentation_disabled_by_default() -> None:
+    """Test that nothing is recorded and no method is wrapped unless instrumentation is enabled.
+
+    :return: None. Asserts the state, the snapshot, and the identity of the methods.
+    """
+    upper = LangString.upper
+    LangString("Hello", "en").upper()
+    snapshot = Instrumentation.snapshot()
+    assert Instrumentation.is_enabled() is False
+    assert snapshot["enabled"] is False
+    assert snapshot["methods"] == {}
+    assert snapshot["validators"] == {}
+    assert LangString.upper is upper
+
+
+def test_instrumentation_records_calls_and_histograms() -> None:
+    """Test that calls, cumulative times, and histograms are recorded for the public methods.
+
+    :return: None. Asserts the recorded metrics of several methods.
+    """
+    Instrumentation.enable()
+    langstring = LangString("Hello", "en")
+    for _ in range(3):
+        langstring.upper()
+    SetLangString({"a"}, "en").add_text("b")
+    MultiLangString({"en": {"Hello"}}).get_langs()
+    Converter.from_string_to_langstring_parse("Hi@en")
+
+    methods = Instrumentation.snapshot()["methods"]
+    assert methods["LangString.upper"]["calls"] == 3
+    assert methods["LangString.upper"]["errors"] == 0
+    assert methods["LangString.upper"]["total_time"] > 0
+    assert sum(methods["LangString.upper"]["histogram"]) == 3
+    assert len(methods["LangString.upper"]["histogram"]) == len(Instrumentation.HISTOGRAM_BOUNDS_NS) + 1
+    assert methods["LangString.__init__"]["calls"] >= 2
+    assert methods["SetLangString.add_text"]["calls"] == 1
+    assert methods["MultiLangString.get_langs"]["calls"] == 1
+    assert methods["Converter.from_string_to_langstring_parse"]["calls"] == 1
+
+
+def test_instrumentation_counts_errors_and_validation_failures() -> None:
+    """Test that exceptions raised by methods and values rejected by validators are counted.
+
+    :return: None. Asserts the error and failure counters.
+    """
+    Instrumentation.enable()
+    Controller.set_flag(LangStringFlag.DEFINED_TEXT, True)
+    LangString("Hello", "en")
+    with pytest.raises(ValueError):
+        LangString("", "en")
+
+    snapshot = Instrumentation.snapshot()
+    assert snapshot["methods"]["LangString.__init__"] == {
+        **snapshot["methods"]["LangString.__init__"],
+        "calls": 2,
+        "errors": 1,
+    }
+    assert snapshot["validators"]["FlagValidator.validate_flags_text"] == {"calls": 2, "failures": 1}
+    assert snapshot["validators"]["FlagValidator.validate_flags_lang"] == {"calls": 1, "failures": 0}
+
+
+def test_instrumentation_disable_restores_methods_and_keeps_metrics() -> None:
+    """Test that disabling restores the original methods and keeps the recorded metrics until reset.
+
+    :return: None. Asserts the identity of the methods and the metrics before and after reset.
+    """
+    originals = (LangString.__dict__["upper"], Converter.__dict__["from_strings_to_langstrings"])
+    validator = FlagValidator.__dict__["validate_flags_lang"]
+    Instrumentation.enable()
+    Instrumentation.enable()
+    assert LangString.__dict__["upper"] is not originals[0]
+    LangString("Hello", "en").upper()
+    Instrumentation.disable()
+
+    assert (LangString.__dict__["upper"], Converter.__dict__["from_strings_to_langstrings"]) == originals
+    assert FlagValidator.__dict__["validate_flags_lang"] is validator
+    LangString("Hello", "en").upper()
+    assert Instrumentation.snapshot()["methods"]["LangString.upper"]["calls"] == 1
+    Instrumentation.reset()
+    assert Instrumentation.snapshot()["methods"] == {}
+
+
+def test_instrumentation_preserves_behavior() -> None:
+    """Test that instrumented methods return the same results, including static and class methods and pickling.
+
+    :return: None. Asserts conversion results and a pickle round trip.
+    """
+    expected = Converter.from_strings_to_multilangstring("parse", ["Hello@en", "Hi@EN", "Oi@pt"])
+    merged = LangString.merge_langstrings([LangString("a", "en"), LangString("a", "EN")])
+    Instrumentation.enable()
+    assert Converter.from_strings_to_multilangstring("parse", ["Hello@en", "Hi@EN", "Oi@pt"]) == expected
+    assert LangString.merge_langstrings([LangString("a", "en"), LangString("a", "EN")]) == merged
+    mls = MultiLangString({"en": {"Hello"}})
+    assert pickle.loads(pickle.dumps(mls)) == mls
+
+
+def test_instrumentation_snapshot_is_serializable() -> None:
+    """Test that the snapshot only contains plain values and is independent from later calls.
+
+    :return: None. Asserts JSON serialization and that the snapshot does not change.
+    """
+    Instrumentation.enable()
+    LangString("Hello", "en").upper()
+    snapshot = Instrumentation.snapshot()
+    serialized = json.dumps(snapshot)
+    LangString("Hello", "en").upper()
+    assert json.dumps(snapshot) == serialized
+    assert json.loads(serialized)["histogram_bounds_ns"][0] == 1000
@@ -0,0 +1,69 @@
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringFlag
+
+FLAG_COMBINATIONS = [
+    {},
+    {LangStringFlag.STRIP_TEXT: True},
+    {LangStringFlag.LOWERCASE_LANG: True},
+    {LangStringFlag.STRIP_TEXT: True, LangStringFlag.STRIP_LANG: True, LangStringFlag.LOWERCASE_LANG: True},
+]
+
+METHODS = [
+    ("center", (11, "*")),
+    ("ljust", (11,)),
+    ("rjust", (11,)),
+    ("zfill", (11,)),
+    ("upper", ()),
+    ("casefold", ()),
+    ("swapcase", ()),
+    ("replace", ("l", "L")),
+    ("strip", ("H",)),
+    ("removeprefix", (" ",)),
+    ("expandtabs", (2,)),
+    ("__add__", (" x ",)),
+    ("__mul__", (2,)),
+    ("__getitem__", (slice(1, 4),)),
+]
+
+
+@pytest.mark.parametrize("flags", FLAG_COMBINATIONS)
+@pytest.mark.parametrize("method, args", METHODS)
+def test_from_validated_matches_constructor(flags: dict, method: str, args: tuple) -> None:
+    """Test that the LangStrings returned by the str methods are equal to the ones built by the public constructor.
+
+    :param flags: The flags to enable.
+    :param method: The name of the method to call.
+    :param args: The arguments of the method.
+    :return: None. Asserts that the text and language of the result match the constructor applied to the str result.
+    """
+    for flag, value in flags.items():
+        Controller.set_flag(flag, value)
+    langstring = LangString(" He\tllo ", " EN ")
+    result = getattr(langstring, method)(*args)
+    expected = LangString(getattr(langstring.text, method)(*args), langstring.lang)
+    assert isinstance(result, LangString)
+    assert (result.text, result.lang) == (expected.text, expected.lang)
+
+
+@pytest.mark.parametrize("method", ["partition", "rpartition", "split"])
+def test_from_validated_defined_text_raises(method: str) -> None:
+    """Test that methods producing empty texts still raise ValueError when DEFINED_TEXT is enabled.
+
+    :param method: The name of the method to call.
+    :return: None. Asserts that a ValueError is raised, as by the public constructor.
+    """
+    Controller.set_flag(LangStringFlag.DEFINED_TEXT, True)
+    langstring = LangString("a,", "en")
+    with pytest.raises(ValueError, match="DEFINED_TEXT"):
+        getattr(langstring, method)(",")
+
+
+def test_from_validated_does_not_validate_types_without_flags() -> None:
+    """Test that the trusted construction path stores the given values as they are when no flag is enabled.
+
+    :return: None. Asserts the text and language of the created LangString.
+    """
+    langstring = LangString._from_validated(" Hello ", " EN ")
+    assert (langstring.text, langstring.lang) == (" Hello ", " EN ")
@@ -0,0 +1,48 @@
+import copy
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringFlag
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy, lambda ls: pickle.loads(pickle.dumps(ls))])
+def test_langstring_copy_and_pickle(copier) -> None:
+    """Test that copying and unpickling create equal and independent LangStrings.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the type, text, and language of the copy and its independence from the original.
+    """
+    langstring = LangString("Hello", "en")
+    copied = copier(langstring)
+    assert type(copied) is LangString
+    assert copied is not langstring
+    assert (copied.text, copied.lang) == ("Hello", "en")
+    copied.lang = "fr"
+    assert langstring.lang == "en"
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy, lambda ls: pickle.loads(pickle.dumps(ls))])
+def test_langstring_copy_and_pickle_skip_validation(copier) -> None:
+    """Test that copying and unpickling keep the validated state as it is, without validating it again.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the text and language of the copy after enabling transforming flags.
+    """
+    langstring = LangString(" Hello ", "EN")
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    copied = copier(langstring)
+    assert (copied.text, copied.lang) == (" Hello ", "EN")
+
+
+def test_langstring_deepcopy_memo() -> None:
+    """Test that deep copies of containers keep references to the same LangString shared.
+
+    :return: None. Asserts the identity of the copied elements.
+    """
+    langstring = LangString("Hello", "en")
+    copied = copy.deepcopy([langstring, langstring])
+    assert copied[0] is copied[1]
+    assert copied[0] is not langstring
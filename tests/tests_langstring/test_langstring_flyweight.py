@@ -0,0 +1,129 @@
+import copy
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import MultiLangString
+from langstring import Renormalizer
+from langstring import SetLangString
+
+
+@pytest.fixture(autouse=True)
+def disable_flyweight_cache():
+    """Disable the flyweight cache after each test.
+
+    :return: None.
+    """
+    yield
+    LangString.disable_flyweight_cache()
+
+
+def test_flyweight_without_cache_returns_new_frozen_langstrings() -> None:
+    """Test that flyweight returns new frozen LangStrings while the cache is disabled.
+
+    :return: None. Asserts equality, identity, and frozen state of the results.
+    """
+    assert LangString.get_flyweight_cache_info() is None
+    first = LangString.flyweight("Hello", "en")
+    second = LangString.flyweight("Hello", "en")
+    assert first == second == LangString("Hello", "en")
+    assert first is not second
+    assert first.is_frozen and second.is_frozen
+    assert not LangString("Hello", "en").is_frozen
+
+
+def test_flyweight_with_cache_shares_instances() -> None:
+    """Test that the flyweight cache returns the same instance for the same text and language tag.
+
+    :return: None. Asserts identity of the results and the cache statistics.
+    """
+    LangString.enable_flyweight_cache(maxsize=10)
+    first = LangString.flyweight("Hello", "en")
+    assert LangString.flyweight("Hello", "en") is first
+    assert LangString.flyweight("Hello", "EN") is not first, "Language tags keep their casing"
+    info = LangString.get_flyweight_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 2, 10, 2)
+    LangString.clear_flyweight_cache()
+    assert LangString.flyweight("Hello", "en") is not first
+
+
+def test_flyweight_cache_respects_flag_changes() -> None:
+    """Test that a change of flags does not return LangStrings validated with the previous flags.
+
+    :return: None. Asserts the language tag of the results before and after enabling a flag.
+    """
+    LangString.enable_flyweight_cache()
+    assert LangString.flyweight("Hello", "EN").lang == "EN"
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    assert LangString.flyweight("Hello", "EN").lang == "en"
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda langstring: setattr(langstring, "text", "Hi"),
+        lambda langstring: setattr(langstring, "lang", "fr"),
+        lambda langstring: langstring.__imul__(2),
+        lambda langstring: Renormalizer.renormalize([langstring]),
+    ],
+)
+def test_frozen_langstring_cannot_be_modified(modify) -> None:
+    """Test that frozen LangStrings cannot be modified.
+
+    :param modify: A function modifying the LangString.
+    :return: None. Asserts that an AttributeError is raised and that the LangString is unchanged.
+    """
+    frozen = LangString.flyweight("Hello", "EN")
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    with pytest.raises(AttributeError):
+        modify(frozen)
+    assert (frozen.text, frozen.lang) == ("Hello", "EN")
+
+
+@pytest.mark.parametrize(
+    "copier", [copy.copy, copy.deepcopy, lambda langstring: pickle.loads(pickle.dumps(langstring))]
+)
+def test_copies_of_frozen_langstring_are_modifiable(copier) -> None:
+    """Test that copies of frozen LangStrings can be modified.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the frozen state and modification of the copy.
+    """
+    copied = copier(LangString.flyweight("Hello", "en"))
+    assert not copied.is_frozen
+    copied.text = "Hi"
+    assert copied == LangString("Hi", "en")
+
+
+def test_exports_use_flyweight_cache() -> None:
+    """Test that the LangString exports of SetLangString and MultiLangString use the flyweight cache when enabled.
+
+    :return: None. Asserts identity and frozen state of exported LangStrings with and without the cache.
+    """
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    setlangstring = SetLangString({"Hello"}, "en")
+    assert not mls.to_langstrings()[0].is_frozen
+    assert not setlangstring.to_langstrings()[0].is_frozen
+    assert not mls.get_langstring("Hello", "en").is_frozen
+
+    LangString.enable_flyweight_cache()
+    exported = mls.get_langstring("Hello", "en")
+    assert exported.is_frozen
+    assert setlangstring.to_langstrings()[0] is exported
+    assert exported in mls.to_langstrings()
+    assert mls.to_langstrings() == [LangString("Hello", "en"), LangString("Bonjour", "fr")]
+    assert mls.get_langstring("Hola", "es") == LangString("", "es")
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), ("10", TypeError)])
+def test_enable_flyweight_cache_invalid_maxsize(maxsize, error) -> None:
+    """Test that invalid cache sizes are rejected.
+
+    :param maxsize: The invalid maximum size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        LangString.enable_flyweight_cache(maxsize=maxsize)
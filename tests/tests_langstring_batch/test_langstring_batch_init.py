@@ -0,0 +1,154 @@
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringBatch
+from langstring import LangStringFlag
+
+
+@pytest.mark.parametrize(
+    "texts, langs",
+    [
+        ([], []),
+        (["Hello"], ["en"]),
+        (["Hello", "Bonjour", "Hi", ""], ["en", "fr", "EN", ""]),
+        (["😊", "Привет", "á"], ["emoji", "ru", "x-combining"]),
+        (["same", "same"], ["en", "en"]),
+    ],
+)
+def test_langstring_batch_init_roundtrip(texts: list[str], langs: list[str]) -> None:
+    """Test that a batch returns its texts and language tags in the order they were given.
+
+    :param texts: The texts of the batch.
+    :param langs: The language tags of the texts.
+    :return: None. Asserts the length, texts, languages, and the items produced by indexing and iteration.
+    """
+    batch = LangStringBatch(texts, langs)
+    assert len(batch) == len(texts)
+    assert batch.get_texts() == texts
+    assert batch.get_langs() == langs
+    assert [(ls.text, ls.lang) for ls in batch] == list(zip(texts, langs))
+    for index, (text, lang) in enumerate(zip(texts, langs)):
+        assert batch[index] == LangString(text, lang)
+        assert batch.get_text(index) == text
+        assert batch.get_lang(index) == lang
+
+
+def test_langstring_batch_init_tag_table() -> None:
+    """Test that the tag table contains each distinct tag once, in order of first appearance.
+
+    :return: None. Asserts the content of the tag table.
+    """
+    batch = LangStringBatch(["a", "b", "c", "d"], ["en", "fr", "en", "EN"])
+    assert batch.get_tags() == ["en", "fr", "EN"]
+
+
+def test_langstring_batch_init_default_is_empty() -> None:
+    """Test that a batch created without arguments is empty.
+
+    :return: None. Asserts the length and content of the batch.
+    """
+    batch = LangStringBatch()
+    assert len(batch) == 0
+    assert batch.get_texts() == []
+    assert batch.get_tags() == []
+
+
+@pytest.mark.parametrize(
+    "texts, langs, error",
+    [
+        (["a", "b"], ["en"], ValueError),
+        (["a"], [], ValueError),
+        ("a", ["en"], TypeError),
+        ([1], ["en"], TypeError),
+        (["a"], [None], TypeError),
+        (("a",), ("en",), TypeError),
+    ],
+)
+def test_langstring_batch_init_invalid_arguments(texts, langs, error) -> None:
+    """Test that invalid columns raise the appropriate errors.
+
+    :param texts: The texts argument.
+    :param langs: The langs argument.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        LangStringBatch(texts, langs)
+
+
+def test_langstring_batch_init_applies_langstring_flags() -> None:
+    """Test that texts and tags are transformed according to the LangStringFlag flags.
+
+    :return: None. Asserts that stripped and lowercased values are stored.
+    """
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(LangStringFlag.STRIP_LANG, True)
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    batch = LangStringBatch([" Hello ", "Hi"], [" EN", "en "])
+    assert batch.get_texts() == ["Hello", "Hi"]
+    assert batch.get_langs() == ["en", "en"]
+    assert batch.get_tags() == ["en"], "Tags equal after validation should share the same code"
+
+
+@pytest.mark.parametrize(
+    "flag, texts, langs, match",
+    [
+        (LangStringFlag.DEFINED_TEXT, ["Hello", "  "], ["en", "en"], "DEFINED_TEXT"),
+        (LangStringFlag.DEFINED_LANG, ["Hello"], [""], "DEFINED_LANG"),
+        (LangStringFlag.VALID_LANG, ["Hello"], ["not a tag"], "VALID_LANG"),
+    ],
+)
+def test_langstring_batch_init_flag_violations(flag: LangStringFlag, texts: list, langs: list, match: str) -> None:
+    """Test that values violating the enabled flags raise ValueError, as for LangStrings.
+
+    :param flag: The flag to enable.
+    :param texts: The texts of the batch.
+    :param langs: The language tags of the texts.
+    :param match: A pattern expected in the error message.
+    :return: None. Asserts that a ValueError is raised.
+    """
+    Controller.set_flag(flag, True)
+    with pytest.raises(ValueError, match=match):
+        LangStringBatch(texts, langs)
+
+
+@pytest.mark.parametrize("index", [2, -3, 10])
+def test_langstring_batch_getitem_out_of_range(index: int) -> None:
+    """Test that out-of-range indices raise IndexError.
+
+    :param index: The invalid index.
+    :return: None. Asserts that an IndexError is raised by indexing and by the getters.
+    """
+    batch = LangStringBatch(["a", "b"], ["en", "fr"])
+    with pytest.raises(IndexError):
+        batch[index]
+    with pytest.raises(IndexError):
+        batch.get_text(index)
+
+
+def test_langstring_batch_getitem_negative_and_slice() -> None:
+    """Test indexing with negative indices and slices.
+
+    :return: None. Asserts the returned LangString and batch.
+    """
+    batch = LangStringBatch(["a", "b", "c"], ["en", "fr", "de"])
+    assert batch[-1] == LangString("c", "de")
+    sliced = batch[::2]
+    assert isinstance(sliced, LangStringBatch)
+    assert sliced == LangStringBatch(["a", "c"], ["en", "de"])
+    assert sliced.get_tags() == ["en", "de"], "Unused tags should be removed from the table"
+
+
+def test_langstring_batch_eq_repr_and_hash() -> None:
+    """Test equality, representation, and unhashability of batches.
+
+    :return: None. Asserts comparison results, the representation, and that hashing raises TypeError.
+    """
+    batch = LangStringBatch(["a", "b"], ["en", "EN"])
+    assert batch == LangStringBatch(["a", "b"], ["en", "EN"])
+    assert batch != LangStringBatch(["a", "b"], ["en", "en"])
+    assert batch != LangStringBatch(["ab"], ["en"])
+    assert batch != ["a", "b"]
+    assert repr(batch) == "LangStringBatch(texts=['a', 'b'], langs=['en', 'EN'])"
+    with pytest.raises(TypeError):
+        hash(batch)
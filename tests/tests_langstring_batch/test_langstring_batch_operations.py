@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringBatch
+from langstring import LangStringFlag
+from langstring.utils.validators import FlagValidator
+
+TEXTS = ["Hello", "Bonjour", "Hi", "Hello", "Olá", "Hello"]
+LANGS = ["en", "fr", "EN", "En", "pt-BR", "en"]
+
+
+@pytest.mark.parametrize(
+    "lang, expected_texts, expected_langs",
+    [
+        ("en", ["Hello", "Hi", "Hello", "Hello"], ["en", "EN", "En", "en"]),
+        ("EN", ["Hello", "Hi", "Hello", "Hello"], ["en", "EN", "En", "en"]),
+        ("pt-br", ["Olá"], ["pt-BR"]),
+        ("pt", [], []),
+        ("", [], []),
+    ],
+)
+def test_langstring_batch_filter_by_lang(lang: str, expected_texts: list[str], expected_langs: list[str]) -> None:
+    """Test that filtering keeps the items whose language matches case-insensitively, in order.
+
+    :param lang: The language to keep.
+    :param expected_texts: The expected texts.
+    :param expected_langs: The expected languages.
+    :return: None. Asserts the texts and languages of the filtered batch.
+    """
+    filtered = LangStringBatch(TEXTS, LANGS).filter_by_lang(lang)
+    assert filtered.get_texts() == expected_texts
+    assert filtered.get_langs() == expected_langs
+
+
+def test_langstring_batch_filter_by_lang_invalid_type() -> None:
+    """Test that filtering by a non-string language raises TypeError.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        LangStringBatch(TEXTS, LANGS).filter_by_lang(None)
+
+
+def test_langstring_batch_casefold_langs() -> None:
+    """Test that casefolding languages transforms every tag and merges equal tags in the table.
+
+    :return: None. Asserts the languages, texts, and tag table of the new batch and that the original is unchanged.
+    """
+    batch = LangStringBatch(TEXTS, LANGS)
+    folded = batch.casefold_langs()
+    assert folded.get_langs() == [lang.casefold() for lang in LANGS]
+    assert folded.get_texts() == TEXTS
+    assert folded.get_tags() == ["en", "fr", "pt-br"]
+    assert batch.get_langs() == LANGS, "The original batch should not be modified"
+
+
+@pytest.mark.parametrize(
+    "texts, chars, expected",
+    [
+        ([" Hello ", "\tHi\n", "Bonjour"], None, ["Hello", "Hi", "Bonjour"]),
+        (["--a--", "-b"], "-", ["a", "b"]),
+        (["   "], None, [""]),
+    ],
+)
+def test_langstring_batch_strip_texts(texts: list[str], chars, expected: list[str]) -> None:
+    """Test that stripping texts matches str.strip for every item.
+
+    :param texts: The texts of the batch.
+    :param chars: The characters to strip.
+    :param expected: The expected texts.
+    :return: None. Asserts the texts and languages of the stripped batch.
+    """
+    langs = ["en"] * len(texts)
+    stripped = LangStringBatch(texts, langs).strip_texts(chars)
+    assert stripped.get_texts() == expected
+    assert stripped.get_langs() == langs
+
+
+def test_langstring_batch_strip_texts_defined_text() -> None:
+    """Test that stripping texts to empty strings raises ValueError when DEFINED_TEXT is enabled.
+
+    :return: None. Asserts that a ValueError is raised.
+    """
+    batch = LangStringBatch(["--", "a"], ["en", "en"])
+    Controller.set_flag(LangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError, match="DEFINED_TEXT"):
+        batch.strip_texts("-")
+
+
+def test_langstring_batch_strip_texts_strip_text_flag() -> None:
+    """Test that the stripped texts are transformed by the STRIP_TEXT flag, as the texts of a LangString are.
+
+    :return: None. Asserts the stripped texts and their consistency with LangString.
+    """
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    stripped = LangStringBatch(["xHi x"], ["en"]).strip_texts("x")
+    assert stripped.get_texts() == ["Hi"]
+    assert stripped.get_texts() == [LangString("Hi ", "en").text]
+
+
+def test_langstring_batch_items_skip_validation() -> None:
+    """Test that indexing and iterating a batch does not validate the already validated items again.
+
+    :return: None. Asserts the items and that the flag validators are not called.
+    """
+    batch = LangStringBatch(["Hello", "Hi"], ["en", "fr"])
+    expected = [LangString("Hello", "en"), LangString("Hi", "fr")]
+    with patch.object(FlagValidator, "validate_flags_text") as validate_text:
+        item = batch[1]
+        items = list(batch)
+    validate_text.assert_not_called()
+    assert item == expected[1]
+    assert items == expected
+
+
+@pytest.mark.parametrize(
+    "texts, langs",
+    [
+        (TEXTS, LANGS),
+        (["a", "a", "a"], ["en", "en", "en"]),
+        (["a", "b", "a", "b"], ["en", "EN", "EN", "EN"]),
+        ([], []),
+        (["x", "x"], ["fr", "de"]),
+    ],
+)
+def test_langstring_batch_dedupe_matches_merge_langstrings(texts: list[str], langs: list[str]) -> None:
+    """Test that removing duplicates produces the same items as LangString.merge_langstrings.
+
+    :param texts: The texts of the batch.
+    :param langs: The language tags of the texts.
+    :return: None. Asserts the texts and languages, including casing, of the deduplicated batch.
+    """
+    expected = LangString.merge_langstrings([LangString(text, lang) for text, lang in zip(texts, langs)])
+    deduped = LangStringBatch(texts, langs).dedupe()
+    assert [(ls.text, ls.lang) for ls in deduped] == [(ls.text, ls.lang) for ls in expected]
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import LanguageRangeFilter
+from langstring import LanguageTag
+from langstring import MultiLangString
+from langstring import SetLangString
+
+
+@pytest.fixture(autouse=True)
+def disable_flyweight_cache():
+    """Disable the flyweight cache of LangString after each test.
+
+    :return: None.
+    """
+    yield
+    LangString.disable_flyweight_cache()
+
+
+CONCEPTS = [
+    MultiLangString({"en": {"Dog"}, "pt-BR": {"Cachorro"}, "de": {"Hund"}}),
+    MultiLangString({"pt-PT": {"Cão"}, "fr": {"Chien"}}),
+    MultiLangString({"de": {"Hund"}}),
+]
+
+
+@pytest.mark.parametrize(
+    "language_ranges, extended, langs, expected",
+    [
+        (["zh-Hant-*", "en"], True, ["en-GB", "zh-Hans", "zh-Hant-HK", "en"], ["zh-Hant-HK", "en-GB", "en"]),
+        (["de-DE"], True, ["de-Latn-DE", "de"], ["de-Latn-DE"]),
+        (["de-DE"], False, ["de-Latn-DE", "de-DE-1996"], ["de-DE-1996"]),
+        (["*"], False, ["b", "a"], ["b", "a"]),
+        ([], True, ["en"], []),
+    ],
+)
+def test_filter_langs(language_ranges, extended, langs, expected) -> None:
+    """Test that the filter selects and orders tags like LanguageTag.filter.
+
+    :param language_ranges: The ranges of the filter.
+    :param extended: Whether extended filtering is used.
+    :param langs: The filtered tags.
+    :param expected: The expected tags, in order.
+    :return: None. Asserts the result and its consistency with LanguageTag.filter and matches.
+    """
+    language_filter = LanguageRangeFilter(language_ranges, extended=extended)
+    assert language_filter.filter_langs(langs) == expected
+    assert language_filter.filter_langs(langs) == expected, "Memoized results should be identical"
+    assert LanguageTag.filter(language_ranges, langs, extended=extended) == expected
+    assert [lang for lang in langs if language_filter.matches(lang)] == [lang for lang in langs if lang in expected]
+
+
+def test_iter_setlangstrings() -> None:
+    """Test that the matching SetLangStrings of a collection are streamed object by object.
+
+    :return: None. Asserts the streamed SetLangStrings and their consistency with get_setlangstrings_matching.
+    """
+    language_filter = LanguageRangeFilter(["pt", "en"])
+    result = language_filter.iter_setlangstrings(iter(CONCEPTS))
+    assert next(result) == SetLangString({"Cachorro"}, "pt-BR")
+    assert list(result) == [SetLangString({"Dog"}, "en"), SetLangString({"Cão"}, "pt-PT")]
+    expected = [sls for mls in CONCEPTS for sls in mls.get_setlangstrings_matching(["pt", "en"])]
+    assert list(language_filter.iter_setlangstrings(CONCEPTS)) == expected
+
+
+def test_iter_setlangstrings_are_independent() -> None:
+    """Test that the streamed SetLangStrings do not share their texts with the MultiLangStrings.
+
+    :return: None. Asserts that modifying a SetLangString leaves the MultiLangString unchanged.
+    """
+    mls = MultiLangString({"en": {"Dog"}})
+    setlangstring = next(LanguageRangeFilter(["en"]).iter_setlangstrings([mls]))
+    setlangstring.add_text("Puppy")
+    assert mls["en"] == {"Dog"}
+
+
+def test_iter_langstrings() -> None:
+    """Test that a LangString is streamed for each text of the matching languages.
+
+    :return: None. Asserts the streamed LangStrings, with and without the flyweight cache.
+    """
+    language_filter = LanguageRangeFilter(["de", "fr"])
+    expected = [LangString("Hund", "de"), LangString("Chien", "fr"), LangString("Hund", "de")]
+    assert list(language_filter.iter_langstrings(CONCEPTS)) == expected
+    LangString.enable_flyweight_cache()
+    result = list(language_filter.iter_langstrings(CONCEPTS))
+    assert result == expected
+    assert result[0] is result[2]
+
+
+def test_iter_applies_flags() -> None:
+    """Test that the flags of the yielded classes are applied.
+
+    :return: None. Asserts the language of the streamed LangString.
+    """
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    assert list(LanguageRangeFilter(["pt"]).iter_langstrings([CONCEPTS[0]])) == [LangString("Cachorro", "pt-br")]
+
+
+def test_each_tag_is_matched_once() -> None:
+    """Test that each distinct tag is matched against the ranges only once per filter.
+
+    :return: None. Asserts the number of matchings.
+    """
+    language_filter = LanguageRangeFilter(["pt", "en"])
+    with patch.object(LanguageTag, "_first_match", wraps=LanguageTag._first_match) as first_match:
+        list(language_filter.iter_setlangstrings(CONCEPTS * 100))
+    assert first_match.call_count == 5
+
+
+def test_memo_is_bounded(monkeypatch) -> None:
+    """Test that the memoized results are discarded when the maximum size is reached.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: None. Asserts the number of memoized tags and that the results stay correct.
+    """
+    monkeypatch.setattr(LanguageRangeFilter, "MAX_MEMO_SIZE", 2)
+    language_filter = LanguageRangeFilter(["en"])
+    assert language_filter.filter_langs(["en", "fr", "en-GB", "de"]) == ["en", "en-GB"]
+    assert len(language_filter._positions) <= 2
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("fr-CH, fr;q=0.9, en;q=0.8, *;q=0.5", ["fr-CH", "fr", "en", "*"]),
+        ("en;q=0.5, fr-CH, fr;q=0.9", ["fr-CH", "fr", "en"]),
+        ("en;q=0.5, de;q=0.5", ["en", "de"]),
+        ("en, de;q=0, fr;Q=0.1", ["en", "fr"]),
+        ("en;q=abc, , fr;level=1, de", ["de"]),
+        ("en;q=2, fr;q=-0.5, de;q=inf, es;q=nan, it;q=-inf, pt;q=1.0", ["pt"]),
+        ("", []),
+    ],
+)
+def test_from_accept_language(header, expected) -> None:
+    """Test the parsing of Accept-Language header values.
+
+    :param header: The header value.
+    :param expected: The expected ranges, in order.
+    :return: None. Asserts the ranges and the filtering scheme of the filter.
+    """
+    language_filter = LanguageRangeFilter.from_accept_language(header)
+    assert language_filter.language_ranges == expected
+    assert language_filter.extended is False
+
+
+def test_invalid_arguments() -> None:
+    """Test that arguments of invalid types are rejected.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        LanguageRangeFilter("en")
+    with pytest.raises(TypeError):
+        LanguageRangeFilter(["en"], extended=None)
+    with pytest.raises(TypeError):
+        LanguageRangeFilter.from_accept_language(None)
+    with pytest.raises(TypeError):
+        LanguageRangeFilter(["en"]).filter_langs([1])
+    with pytest.raises(TypeError):
+        list(LanguageRangeFilter(["en"]).iter_setlangstrings([{"en": {"Dog"}}]))
+
+
+def test_repr() -> None:
+    """Test the representation of a filter.
+
+    :return: None. Asserts the representation.
+    """
+    assert repr(LanguageRangeFilter(["en"])) == "LanguageRangeFilter(language_ranges=['en'], extended=True)"
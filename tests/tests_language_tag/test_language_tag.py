@@ -0,0 +1,136 @@
+import pytest
+from langstring import LanguageTag
+
+
+@pytest.mark.parametrize(
+    "tag, language, extlangs, script, region, variants, extensions",
+    [
+        ("en", "en", (), "", "", (), ()),
+        ("EN-gb", "en", (), "", "gb", (), ()),
+        ("zh-Hant-TW", "zh", (), "hant", "tw", (), ()),
+        ("zh-yue-HK", "zh", ("yue",), "", "hk", (), ()),
+        ("es-419", "es", (), "", "419", (), ()),
+        ("de-DE-1996", "de", (), "", "de", ("1996",), ()),
+        ("sl-rozaj-biske", "sl", (), "", "", ("rozaj", "biske"), ()),
+        ("en-US-u-ca-gregory", "en", (), "", "us", (), ("u", "ca", "gregory")),
+        ("x-private", "x", (), "", "", (), ("private",)),
+        ("", "", (), "", "", (), ()),
+        ("not a tag", "not a tag", (), "", "", (), ()),
+    ],
+)
+def test_parse(tag, language, extlangs, script, region, variants, extensions) -> None:
+    """Test that tags are split into their casefolded BCP 47 subtags.
+
+    :param tag: The parsed tag.
+    :param language: The expected language subtag.
+    :param extlangs: The expected extended language subtags.
+    :param script: The expected script subtag.
+    :param region: The expected region subtag.
+    :param variants: The expected variant subtags.
+    :param extensions: The expected remaining subtags.
+    :return: None. Asserts every field of the parsed tag.
+    """
+    parsed = LanguageTag.parse(tag)
+    assert parsed == LanguageTag(tag.casefold(), language, extlangs, script, region, variants, extensions)
+    assert parsed.subtags == tuple(tag.casefold().split("-"))
+
+
+def test_parse_is_cached() -> None:
+    """Test that parsing the same tag again returns the cached object.
+
+    :return: None. Asserts the identity of the results and the cache statistics.
+    """
+    LanguageTag.clear_parse_cache()
+    first = LanguageTag.parse("pt-BR")
+    assert LanguageTag.parse("pt-BR") is first
+    info = LanguageTag.get_parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_parse_invalid_type() -> None:
+    """Test that a tag that is not a string is rejected.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        LanguageTag.parse(1)
+
+
+@pytest.mark.parametrize(
+    "tag, language_range, extended, expected",
+    [
+        ("de-DE", "de", False, True),
+        ("de-DE", "DE-de", False, True),
+        ("de-DE-1996", "de-DE", False, True),
+        ("de-Latn-DE", "de-DE", False, False),
+        ("de-Latn-DE", "de-DE", True, True),
+        ("de", "de-DE", True, False),
+        ("deu", "de", False, False),
+        ("fr", "*", False, True),
+        ("fr", "*", True, True),
+        ("zh-Hant", "zh-Hant-*", True, True),
+        ("zh-Hant-TW", "zh-Hant-*", True, True),
+        ("zh-Hans-TW", "zh-Hant-*", True, False),
+        ("zh-Hant-TW", "zh-*-TW", True, True),
+        ("de-x-DE", "de-DE", True, False),
+        ("de-Latn-DE-1996", "*-DE", True, True),
+    ],
+)
+def test_matches(tag, language_range, extended, expected) -> None:
+    """Test basic and extended filtering of RFC 4647.
+
+    :param tag: The language tag.
+    :param language_range: The language range.
+    :param extended: Whether extended filtering is used.
+    :param expected: Whether the tag is expected to match.
+    :return: None. Asserts the result of the matching.
+    """
+    assert LanguageTag.parse(tag).matches(language_range, extended=extended) is expected
+
+
+def test_filter_orders_by_range_priority() -> None:
+    """Test that filtered tags are ordered by the first range they match.
+
+    :return: None. Asserts the selected tags and their order.
+    """
+    tags = ["en", "fr-CA", "en-GB", "de", "fr"]
+    assert LanguageTag.filter(["fr", "en-*"], tags) == ["fr-CA", "fr", "en", "en-GB"]
+    assert LanguageTag.filter(["en-*"], tags, extended=False) == []
+    assert LanguageTag.filter([], tags) == []
+
+
+@pytest.mark.parametrize(
+    "language_ranges, tags, default, expected",
+    [
+        (["zh-Hant-CN-x-private1-private2", "en"], ["zh", "zh-Hant", "en"], None, "zh-Hant"),
+        (["pt-BR", "en"], ["en-US", "pt"], None, "pt"),
+        (["fr-CA"], ["FR"], None, "FR"),
+        (["de-*-DE"], ["de-DE", "de"], None, "de-DE"),
+        (["fr"], ["en"], "en", "en"),
+        (["*"], ["en"], None, None),
+        ([], ["en"], None, None),
+    ],
+)
+def test_lookup(language_ranges, tags, default, expected) -> None:
+    """Test the lookup scheme of RFC 4647.
+
+    :param language_ranges: The priority list of ranges.
+    :param tags: The candidate tags.
+    :param default: The default value.
+    :param expected: The expected result.
+    :return: None. Asserts the selected tag.
+    """
+    assert LanguageTag.lookup(language_ranges, tags, default) == expected
+
+
+def test_matching_invalid_arguments() -> None:
+    """Test that ranges of invalid types are rejected.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        LanguageTag.parse("en").matches(None)
+    with pytest.raises(TypeError):
+        LanguageTag.filter("en", ["en"])
+    with pytest.raises(TypeError):
+        LanguageTag.lookup(["en"], ["en"], default=1)
@@ -0,0 +1,132 @@
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import SetLangStringFlag
+
+MUTATIONS = [
+    lambda mls: mls.add_entry("New", "en"),
+    lambda mls: mls.add_entry("New", "EN"),
+    lambda mls: mls.add_text_in_pref_lang("New"),
+    lambda mls: mls.discard_entry("Hello", "en"),
+    lambda mls: mls.remove_entry("Hello", "en"),
+    lambda mls: mls.discard_lang("en"),
+    lambda mls: mls["en"].add("New"),
+    lambda mls: mls.mls_dict["en"].clear(),
+    lambda mls: mls.add_multilangstring(MultiLangString({"en": {"New"}})),
+    lambda mls: mls.discard_multilangstring(MultiLangString({"en": {"Hello"}})),
+]
+
+
+def snapshot(mls: MultiLangString) -> dict[str, set[str]]:
+    """Return an independent copy of the content of a MultiLangString.
+
+    :param mls: The MultiLangString.
+    :return: A dictionary with copies of its sets of texts.
+    """
+    return {lang: set(texts) for lang, texts in mls._mls_dict.items()}
+
+
+@pytest.mark.parametrize("mutation", MUTATIONS)
+def test_get_multilangstring_copy_on_write(mutation) -> None:
+    """Test that sub-selections share sets with the original until one of them modifies a language.
+
+    :param mutation: A function modifying a MultiLangString.
+    :return: None. Asserts the sharing of the sets and that modifying either object does not affect the other.
+    """
+    mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}})
+    sub = mls.get_multilangstring(["en"])
+    assert sub._mls_dict["en"] is mls._mls_dict["en"]
+
+    expected = snapshot(mls)
+    mutation(sub)
+    assert snapshot(mls) == expected
+
+    sub = mls.get_multilangstring(["en", "fr"])
+    expected_sub = snapshot(sub)
+    mutation(mls)
+    assert snapshot(sub) == expected_sub
+
+
+@pytest.mark.parametrize("mutation", MUTATIONS)
+def test_merge_multilangstrings_copy_on_write(mutation) -> None:
+    """Test that the merged MultiLangString shares the unchanged sets of the first element copy-on-write.
+
+    :param mutation: A function modifying a MultiLangString.
+    :return: None. Asserts the sharing of the sets and that modifying either object does not affect the other.
+    """
+    first = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    merged = MultiLangString.merge_multilangstrings([first, MultiLangString({"fr": {"Salut"}, "de": {"Hallo"}})])
+    assert merged._mls_dict["en"] is first._mls_dict["en"]
+    assert merged._mls_dict["fr"] is not first._mls_dict["fr"]
+
+    expected = snapshot(first)
+    mutation(merged)
+    assert snapshot(first) == expected
+
+    merged = MultiLangString.merge_multilangstrings([first, MultiLangString()])
+    expected_merged = snapshot(merged)
+    mutation(first)
+    assert snapshot(merged) == expected_merged
+
+
+def test_pop_multilangstring_moves_sets() -> None:
+    """Test that popping languages moves their sets to the new MultiLangString without copying or sharing them.
+
+    :return: None. Asserts the identity of the moved set and the content of both objects after modifications.
+    """
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    en_texts = mls._mls_dict["en"]
+    popped = mls.pop_multilangstring(["EN", "en"])
+    assert popped._mls_dict["EN"] is en_texts
+    assert not popped._shared_langs
+    assert mls._mls_dict == {"fr": {"Bonjour"}}
+
+    popped.add_entry("Hi", "en")
+    mls.add_entry("Hey", "en")
+    assert popped._mls_dict == {"EN": {"Hello", "Hi"}}
+    assert mls._mls_dict == {"fr": {"Bonjour"}, "en": {"Hey"}}
+
+
+def test_pop_multilangstring_of_shared_languages_keeps_sharing() -> None:
+    """Test that sets moved by a pop remain protected when they are shared with a third MultiLangString.
+
+    :return: None. Asserts that modifying the popped MultiLangString does not affect the original one.
+    """
+    original = MultiLangString({"en": {"Hello"}})
+    sub = original.get_multilangstring(["en"])
+    popped = sub.pop_multilangstring(["en"])
+    popped.add_entry("Hi", "en")
+    assert original._mls_dict == {"en": {"Hello"}}
+    assert popped._mls_dict == {"en": {"Hello", "Hi"}}
+
+
+def test_get_multilangstring_copy_on_write_with_views() -> None:
+    """Test that views keep reading the current texts of their MultiLangString after a copy-on-write.
+
+    :return: None. Asserts the texts read through the views of both objects.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    sub = mls.get_multilangstring(["en"])
+    view = sub.get_setlangstring_view("en")
+    sub.add_entry("Hi", "en")
+    assert view.texts == {"Hello", "Hi"}
+    assert mls.get_setlangstring_view("en").texts == {"Hello"}
+
+
+@pytest.mark.parametrize(
+    "flag", [MultiLangStringFlag.STRIP_TEXT, SetLangStringFlag.STRIP_TEXT, SetLangStringFlag.LOWERCASE_LANG]
+)
+def test_get_multilangstring_with_flags(flag) -> None:
+    """Test that sub-selections apply the flags as when adding the SetLangStrings of the languages.
+
+    :param flag: The flag to enable.
+    :return: None. Asserts the content of the sub-selection and that no set is shared when texts are transformed.
+    """
+    mls = MultiLangString({"EN": {" Hello ", "World"}, "fr": {"Bonjour"}})
+    Controller.set_flag(flag, True)
+    expected = MultiLangString()
+    expected.add_setlangstring(mls.get_setlangstring("EN"))
+    result = mls.get_multilangstring(["EN"])
+    assert result._mls_dict == expected._mls_dict
+    assert list(result._mls_dict) == list(expected._mls_dict)
@@ -0,0 +1,101 @@
+import copy
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+
+COPIERS = [
+    copy.copy,
+    copy.deepcopy,
+    lambda mls: mls.copy(),
+    lambda mls: pickle.loads(pickle.dumps(mls)),
+]
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_multilangstring_copy_and_pickle(copier) -> None:
+    """Test that copying and unpickling create equal and independent MultiLangStrings.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the content of the copy and that modifying either object does not affect the other.
+    """
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}}, pref_lang="fr")
+    copied = copier(mls)
+    assert type(copied) is MultiLangString
+    assert copied is not mls
+    assert copied.pref_lang == "fr"
+    assert copied.mls_dict == {"en": {"Hello"}, "fr": {"Bonjour"}}
+
+    copied.add_entry("Hi", "en")
+    copied.discard_entry("Bonjour", "fr")
+    assert mls.mls_dict == {"en": {"Hello"}, "fr": {"Bonjour"}}
+
+    mls.add_entry("Hey", "en")
+    assert copied.mls_dict == {"en": {"Hello", "Hi"}, "fr": set()}
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_multilangstring_copy_and_pickle_skip_validation(copier) -> None:
+    """Test that copying and unpickling keep the validated state as it is, without validating it again.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the content of the copy after enabling transforming flags.
+    """
+    mls = MultiLangString({"EN": {" Hello "}})
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    assert copier(mls).mls_dict == {"EN": {" Hello "}}
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_multilangstring_copy_and_pickle_sorted_texts(copier) -> None:
+    """Test that copies keep the sorted storage of texts.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the types and order of the copied sets of texts.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString({"en": {"b", "a", "c"}})
+    copied = copier(mls)
+    copied.add_entry("0", "en")
+    assert list(copied.mls_dict["en"]) == ["0", "a", "b", "c"]
+    assert type(copied.mls_dict["en"]) is type(mls.mls_dict["en"])
+    assert list(mls.mls_dict["en"]) == ["a", "b", "c"]
+
+
+def test_multilangstring_copy_shares_sets() -> None:
+    """Test that shallow copies share the sets of texts until one of the objects modifies a language.
+
+    :return: None. Asserts the identity of the sets before and after a modification.
+    """
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    copied = mls.copy()
+    assert copied._mls_dict["en"] is mls._mls_dict["en"]
+    copied.add_entry("Hi", "en")
+    assert copied._mls_dict["en"] is not mls._mls_dict["en"]
+    assert copied._mls_dict["fr"] is mls._mls_dict["fr"]
+
+
+def test_multilangstring_pickle_copies_sharing_sets() -> None:
+    """Test that copies sharing their sets of texts stay independent after being pickled together.
+
+    :return: None. Asserts that modifying one unpickled object leaves the other unchanged.
+    """
+    mls = MultiLangString({"en": {"Hi"}})
+    first, second = pickle.loads(pickle.dumps([mls, mls.copy()]))
+    first.add_entry("Yo", "en")
+    assert first._mls_dict == {"en": {"Hi", "Yo"}}
+    assert second._mls_dict == {"en": {"Hi"}}
+    assert mls._mls_dict == {"en": {"Hi"}}
+
+
+def test_multilangstring_delitem_invalid_type() -> None:
+    """Test that deleting a language with a key that is not a string raises a TypeError.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    mls = MultiLangString({"en": {"Hi"}})
+    with pytest.raises(TypeError, match="Invalid argument"):
+        del mls[1]
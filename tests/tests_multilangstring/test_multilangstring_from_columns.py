@@ -0,0 +1,150 @@
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring.utils.grouping import RowGrouper
+from langstring.utils.sorted_text_set import SortedTextSet
+
+NUMPY_OPTIONS = [False, pytest.param(True, marks=pytest.mark.skipif(not RowGrouper.numpy_available(), reason="numpy"))]
+
+COLUMNS = [
+    ([], [], []),
+    (["s1"], ["Hello"], ["en"]),
+    (["s1", "s1", "s2", "s1"], ["Hello", "World", "Bonjour", "Hi"], ["en", "EN", "fr", "pt"]),
+    (["s1", "s2", "s1", "s2", "s1"], ["a", "b", "a", "c", "d"], ["en", "fr", "en", "FR", "de"]),
+    ([1, 2, 1, 1], ["x", "y", "z", "w"], ["pt-BR", "pt-br", "pt-BR", "PT-BR"]),
+    ([("s", 1), ("s", 2)], ["", " "], ["", ""]),
+    (["s"] * 4, ["a", "b", "c", "d"], ["de", "en", "de", "fr"]),
+]
+
+
+def build_reference(subjects: list, texts: list[str], langs: list[str]) -> dict:
+    """Build the expected MultiLangStrings by creating a dictionary for each subject, in row order.
+
+    :param subjects: The subject of each row.
+    :param texts: The text of each row.
+    :param langs: The language tag of each row.
+    :return: A dictionary mapping each subject to its MultiLangString.
+    """
+    raw_dicts: dict = {}
+    for subject, text, lang in zip(subjects, texts, langs):
+        raw_dicts.setdefault(subject, {}).setdefault(lang, set()).add(text)
+    return {subject: MultiLangString(raw_dict) for subject, raw_dict in raw_dicts.items()}
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_OPTIONS)
+@pytest.mark.parametrize("subjects, texts, langs", COLUMNS)
+def test_from_columns_matches_constructor(subjects: list, texts: list[str], langs: list[str], use_numpy) -> None:
+    """Test that the bulk builder produces the same MultiLangStrings as the constructor, including language casing.
+
+    :param subjects: The subject of each row.
+    :param texts: The text of each row.
+    :param langs: The language tag of each row.
+    :param use_numpy: Whether to use NumPy to group the rows.
+    :return: None. Asserts the subjects order, equality, and language keys (with order) of each MultiLangString.
+    """
+    expected = build_reference(subjects, texts, langs)
+    result = MultiLangString.from_columns(subjects, texts, langs, use_numpy=use_numpy)
+    assert list(result) == list(expected)
+    for subject, mls in result.items():
+        assert mls == expected[subject]
+        assert list(mls.mls_dict) == list(expected[subject].mls_dict)
+        assert mls.pref_lang == "en"
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_OPTIONS)
+def test_from_columns_applies_flags(use_numpy) -> None:
+    """Test that texts and tags are transformed according to the MultiLangStringFlag flags.
+
+    :param use_numpy: Whether to use NumPy to group the rows.
+    :return: None. Asserts the content of the MultiLangStrings and the storage type.
+    """
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    subjects, texts, langs = ["s1", "s1", "s2"], [" b ", "a", "c "], ["EN", "EN", "Fr"]
+    result = MultiLangString.from_columns(subjects, texts, langs, use_numpy=use_numpy)
+    assert result == build_reference(subjects, texts, langs)
+    assert list(result["s1"]["en"]) == ["a", "b"]
+    assert isinstance(result["s1"]["en"], SortedTextSet)
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_OPTIONS)
+@pytest.mark.parametrize(
+    "flags, langs, expected",
+    [
+        ([MultiLangStringFlag.STRIP_LANG], ["en", " en", "EN "], {"en": {"a", "b", "c"}}),
+        ([MultiLangStringFlag.STRIP_LANG], ["EN", "fr", " en"], {"EN": {"a", "c"}, "fr": {"b"}}),
+        (
+            [MultiLangStringFlag.STRIP_LANG, MultiLangStringFlag.LOWERCASE_LANG],
+            [" EN", "en", "En "],
+            {"en": {"a", "b", "c"}},
+        ),
+    ],
+)
+def test_from_columns_merges_tags_equal_after_flags(flags: list, langs: list[str], expected: dict, use_numpy) -> None:
+    """Test that tags that only become equal once validated are merged, as done by add_entry.
+
+    :param flags: The flags to enable.
+    :param langs: The language tag of each row.
+    :param expected: The expected dictionary of the MultiLangString.
+    :param use_numpy: Whether to use NumPy to group the rows.
+    :return: None. Asserts the content of the MultiLangString and that it equals the one built with add_entry.
+    """
+    for flag in flags:
+        Controller.set_flag(flag, True)
+    texts = ["a", "b", "c"]
+    result = MultiLangString.from_columns(["s"] * 3, texts, langs, use_numpy=use_numpy)
+    reference = MultiLangString()
+    for text, lang in zip(texts, langs):
+        reference.add_entry(text, lang)
+    assert result["s"].mls_dict == expected
+    assert result["s"].mls_dict == reference.mls_dict
+
+
+@pytest.mark.parametrize(
+    "flag, texts, langs, match",
+    [
+        (MultiLangStringFlag.DEFINED_TEXT, ["Hello", " "], ["en", "en"], "DEFINED_TEXT"),
+        (MultiLangStringFlag.DEFINED_LANG, ["Hello"], [""], "DEFINED_LANG"),
+        (MultiLangStringFlag.VALID_LANG, ["Hello"], ["not a tag"], "VALID_LANG"),
+    ],
+)
+def test_from_columns_flag_violations(flag: MultiLangStringFlag, texts: list, langs: list, match: str) -> None:
+    """Test that values violating the enabled flags raise ValueError.
+
+    :param flag: The flag to enable.
+    :param texts: The text of each row.
+    :param langs: The language tag of each row.
+    :param match: A pattern expected in the error message.
+    :return: None. Asserts that a ValueError is raised.
+    """
+    Controller.set_flag(flag, True)
+    with pytest.raises(ValueError, match=match):
+        MultiLangString.from_columns(["s"] * len(texts), texts, langs)
+
+
+@pytest.mark.parametrize(
+    "subjects, texts, langs, use_numpy, error",
+    [
+        (["s1", "s2"], ["a"], ["en"], None, ValueError),
+        (["s1"], ["a"], ["en", "fr"], None, ValueError),
+        (("s1",), ["a"], ["en"], None, TypeError),
+        (["s1"], [1], ["en"], None, TypeError),
+        (["s1"], ["a"], [None], None, TypeError),
+        (["s1"], ["a"], ["en"], "yes", TypeError),
+        ([["unhashable"]], ["a"], ["en"], None, TypeError),
+    ],
+)
+def test_from_columns_invalid_arguments(subjects, texts, langs, use_numpy, error) -> None:
+    """Test that invalid columns raise the appropriate errors.
+
+    :param subjects: The subjects argument.
+    :param texts: The texts argument.
+    :param langs: The langs argument.
+    :param use_numpy: The use_numpy argument.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        MultiLangString.from_columns(subjects, texts, langs, use_numpy=use_numpy)
@@ -0,0 +1,153 @@
+import copy
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring.utils.sorted_text_set import SortedTextSet
+
+
+def test_from_trusted_dict_adopts_dict_as_is() -> None:
+    """Test that a trusted dictionary becomes the storage of the MultiLangString without validation.
+
+    :return: None. Asserts that the dictionary is adopted, the content, and that the object is not validated.
+    """
+    trusted = {"en": {"Hello", "World"}, "fr": {"Bonjour"}}
+    mls = MultiLangString.from_trusted_dict(trusted, pref_lang="fr")
+    assert mls._mls_dict is trusted, "The dictionary should be adopted without being copied"
+    assert mls.is_validated is False
+    assert mls.pref_lang == "fr"
+    assert mls == MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}}, pref_lang="fr")
+
+
+def test_from_trusted_dict_validate() -> None:
+    """Test that validate runs the validation of the constructor and marks the object as validated.
+
+    :return: None. Asserts the merged languages and the validation state before and after validate.
+    """
+    mls = MultiLangString.from_trusted_dict({"en": {"Hello"}, "EN": {"World"}})
+    assert mls.get_langs() == ["en", "EN"], "Case variants should not be merged before validation"
+    mls.validate()
+    assert mls.is_validated is True
+    assert mls.mls_dict == {"en": {"Hello", "World"}}
+    mls.validate()
+    assert mls.mls_dict == {"en": {"Hello", "World"}}
+
+
+@pytest.mark.parametrize(
+    "trusted, pref_lang, error",
+    [
+        ({"en": {1}}, "en", TypeError),
+        ({1: {"Hello"}}, "en", TypeError),
+        ({"en": ["Hello"]}, "en", TypeError),
+        ({"en": {"Hello"}}, 1, TypeError),
+    ],
+)
+def test_from_trusted_dict_validate_failure_leaves_object_unchanged(trusted, pref_lang, error) -> None:
+    """Test that a failing validation raises the constructor's errors and leaves the MultiLangString unchanged.
+
+    :param trusted: The invalid dictionary.
+    :param pref_lang: The preferred language.
+    :param error: The expected exception type.
+    :return: None. Asserts the raised exception and that the object is still not validated.
+    """
+    mls = MultiLangString._from_state(trusted, pref_lang, validated=False)
+    with pytest.raises(error):
+        mls.validate()
+    assert mls.is_validated is False
+    assert mls._mls_dict is trusted
+
+
+def test_from_trusted_dict_invalid_arguments() -> None:
+    """Test that arguments of invalid types are rejected.
+
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        MultiLangString.from_trusted_dict([("en", {"Hello"})])
+    with pytest.raises(TypeError):
+        MultiLangString.from_trusted_dict({"en": {"Hello"}}, pref_lang=None)
+
+
+@pytest.mark.parametrize(
+    "flag, trusted, expected",
+    [
+        (MultiLangStringFlag.LOWERCASE_LANG, {"EN": {"Hello"}}, {"en": {"Hello"}}),
+        (MultiLangStringFlag.STRIP_TEXT, {"en": {" Hello "}}, {"en": {"Hello"}}),
+    ],
+)
+def test_from_trusted_dict_validates_when_flags_require_it(flag, trusted, expected) -> None:
+    """Test that enabled flags transforming languages or texts cause an immediate validation.
+
+    :param flag: The enabled flag.
+    :param trusted: The trusted dictionary.
+    :param expected: The expected content.
+    :return: None. Asserts the validated content and validation state.
+    """
+    Controller.set_flag(flag, True)
+    mls = MultiLangString.from_trusted_dict(trusted)
+    assert mls.is_validated is True
+    assert mls.mls_dict == expected
+
+
+def test_from_trusted_dict_validates_with_sorted_texts() -> None:
+    """Test that the SORTED_TEXTS flag causes an immediate validation, storing the texts sorted.
+
+    :return: None. Asserts the type of the stored sets.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString.from_trusted_dict({"en": {"b", "a"}})
+    assert mls.is_validated is True
+    assert isinstance(mls._mls_dict["en"], SortedTextSet)
+
+
+def test_from_trusted_dict_rejects_on_validation() -> None:
+    """Test that a rejecting flag raises a ValueError when creating the MultiLangString.
+
+    :return: None. Asserts that a ValueError is raised.
+    """
+    Controller.set_flag(MultiLangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError):
+        MultiLangString.from_trusted_dict({"en": {""}})
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, lambda mls: mls.copy(), lambda mls: pickle.loads(pickle.dumps(mls))],
+)
+def test_from_trusted_dict_copies_keep_validation_state(copier) -> None:
+    """Test that copies and unpickled objects keep the validation state of the original.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the validation state of copies of unvalidated and validated objects.
+    """
+    mls = MultiLangString.from_trusted_dict({"en": {"Hello"}})
+    assert copier(mls).is_validated is False
+    mls.validate()
+    assert copier(mls).is_validated is True
+    assert copier(MultiLangString()).is_validated is True
+
+
+def test_from_trusted_dict_merge_keeps_validation_state() -> None:
+    """Test that merging an unvalidated MultiLangString gives an unvalidated result.
+
+    :return: None. Asserts the validation state of merges with and without unvalidated instances.
+    """
+    trusted = MultiLangString.from_trusted_dict({"en": {"  "}})
+    assert MultiLangString.merge_multilangstrings([trusted]).is_validated is False
+    assert MultiLangString.merge_multilangstrings([MultiLangString(), trusted]).is_validated is False
+    assert MultiLangString.merge_multilangstrings([MultiLangString({"en": {"Hi"}})]).is_validated is True
+
+
+@pytest.mark.parametrize("method", ["get_multilangstring", "pop_multilangstring"])
+def test_from_trusted_dict_selection_keeps_validation_state(method) -> None:
+    """Test that selecting languages of an unvalidated MultiLangString gives an unvalidated result.
+
+    :param method: The name of the selecting method.
+    :return: None. Asserts the validation state of the selections.
+    """
+    trusted = MultiLangString.from_trusted_dict({"en": {"  "}, "fr": {"Salut"}})
+    assert getattr(trusted, method)(["en"]).is_validated is False
+    validated = MultiLangString({"en": {"Hi"}, "fr": {"Salut"}})
+    assert getattr(validated, method)(["en"]).is_validated is True
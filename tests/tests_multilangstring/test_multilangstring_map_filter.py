@@ -0,0 +1,161 @@
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring.utils.sorted_text_set import SortedTextSet
+
+
+def reference_map_langs(mls: MultiLangString, func) -> MultiLangString:
+    """Map the language tags of a MultiLangString by adding each text to a new MultiLangString.
+
+    :param mls: The MultiLangString to transform.
+    :param func: The transformation function.
+    :return: The transformed MultiLangString.
+    """
+    result = MultiLangString(pref_lang=mls.pref_lang)
+    for lang in mls.get_langs():
+        result.add_empty_lang(func(lang))
+        for text in mls[lang]:
+            result.add_entry(text, func(lang))
+    return result
+
+
+def test_multilangstring_map_texts() -> None:
+    """Test transforming the texts of a MultiLangString.
+
+    :return: None. Asserts the transformed texts, kept languages, preferred language, and the unchanged original.
+    """
+    mls = MultiLangString({"en": {"Hello ", " Hello", "World"}, "fr": {"Bonjour"}, "de": set()}, pref_lang="fr")
+    result = mls.map_texts(str.strip)
+    assert result.mls_dict == {"en": {"Hello", "World"}, "fr": {"Bonjour"}, "de": set()}
+    assert result.pref_lang == "fr"
+    assert mls.mls_dict["en"] == {"Hello ", " Hello", "World"}
+
+
+def test_multilangstring_map_texts_validates_each_text_once(monkeypatch) -> None:
+    """Test that each distinct transformed text is validated once and that the flags are applied.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: None. Asserts the transformed texts and the number of validations.
+    """
+    from langstring.utils.validators import FlagValidator
+
+    calls = []
+    original = FlagValidator.validate_flags_text
+
+    def counting(flag_type, text):
+        calls.append(text)
+        return original(flag_type, text)
+
+    monkeypatch.setattr(FlagValidator, "validate_flags_text", counting)
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    mls = MultiLangString({"en": {"a", "b"}, "pt": {"a", "c"}, "es": {"b"}})
+    calls.clear()
+    result = mls.map_texts(lambda text: f" {text.upper()}")
+    assert result.mls_dict == {"en": {"A", "B"}, "pt": {"A", "C"}, "es": {"B"}}
+    assert sorted(calls) == [" A", " B", " C"]
+
+
+def test_multilangstring_map_texts_rejected_by_flag() -> None:
+    """Test that a transformed text violating the flags raises a ValueError.
+
+    :return: None. Asserts that a ValueError is raised.
+    """
+    Controller.set_flag(MultiLangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError):
+        MultiLangString({"en": {"a"}}).map_texts(lambda text: "")
+
+
+def test_multilangstring_map_texts_sorted_texts() -> None:
+    """Test that the texts are stored sorted when the SORTED_TEXTS flag is enabled.
+
+    :return: None. Asserts the type and order of the stored texts.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    result = MultiLangString({"en": {"b", "a"}}).map_texts(str.upper)
+    assert isinstance(result._mls_dict["en"], SortedTextSet)
+    assert list(result._mls_dict["en"]) == ["A", "B"]
+
+
+def test_multilangstring_filter_texts() -> None:
+    """Test keeping the texts of a MultiLangString that satisfy a predicate.
+
+    :return: None. Asserts the kept texts, that all languages are kept, and the unchanged original.
+    """
+    mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}}, pref_lang="fr")
+    result = mls.filter_texts(lambda text: text.startswith("W"))
+    assert result.mls_dict == {"en": {"World"}, "fr": set()}
+    assert result.pref_lang == "fr"
+    assert mls.mls_dict == {"en": {"Hello", "World"}, "fr": {"Bonjour"}}
+
+
+@pytest.mark.parametrize(
+    "mls_dict, func",
+    [
+        ({"en-US": {"Color"}, "en-GB": {"Colour"}, "fr": {"Couleur"}}, lambda lang: lang.split("-")[0]),
+        ({"en-US": {"a"}, "EN": {"b"}, "fr": {"c"}}, lambda lang: lang.split("-")[0]),
+        ({"en": {"a"}, "fr": {"b"}}, str.upper),
+        ({"en": {"a"}, "fr": {"b"}, "de": set()}, lambda lang: "xx"),
+        ({}, str.upper),
+    ],
+)
+def test_multilangstring_map_langs_matches_reference(mls_dict, func) -> None:
+    """Test that map_langs produces the same result as adding the texts to a new MultiLangString.
+
+    :param mls_dict: The content of the MultiLangString.
+    :param func: The transformation function.
+    :return: None. Asserts the content and the language casing of the result.
+    """
+    mls = MultiLangString(mls_dict, pref_lang="pt")
+    result = mls.map_langs(func)
+    expected = reference_map_langs(mls, func)
+    assert result.mls_dict == expected.mls_dict
+    assert result.get_langs() == expected.get_langs()
+    assert result.pref_lang == "pt"
+
+
+def test_multilangstring_map_langs_copy_on_write() -> None:
+    """Test that sets of texts shared with the result are copied before being modified.
+
+    :return: None. Asserts that modifying either object does not affect the other.
+    """
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    result = mls.map_langs(str.upper)
+    result.add_entry("Hi", "EN")
+    mls.add_entry("Salut", "fr")
+    assert mls.mls_dict == {"en": {"Hello"}, "fr": {"Bonjour", "Salut"}}
+    assert result.mls_dict == {"EN": {"Hello", "Hi"}, "FR": {"Bonjour"}}
+
+
+def test_multilangstring_map_langs_applies_flags() -> None:
+    """Test that the new language tags are validated according to the MultiLangStringFlag flags.
+
+    :return: None. Asserts the lowercased tags and the ValueError for an empty tag.
+    """
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    mls = MultiLangString({"en": {"a"}, "fr": {"b"}})
+    assert mls.map_langs(str.upper).get_langs() == ["en", "fr"]
+    Controller.set_flag(MultiLangStringFlag.DEFINED_LANG, True)
+    with pytest.raises(ValueError):
+        mls.map_langs(lambda lang: "")
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda mls: mls.map_texts("strip"),
+        lambda mls: mls.map_texts(len),
+        lambda mls: mls.map_texts(lambda text: [text]),
+        lambda mls: mls.filter_texts(None),
+        lambda mls: mls.map_langs(None),
+        lambda mls: mls.map_langs(lambda lang: None),
+    ],
+)
+def test_multilangstring_map_filter_invalid_type(call) -> None:
+    """Test that functions that are not callable or do not return strings raise a TypeError.
+
+    :param call: A function calling the method with an invalid argument.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        call(MultiLangString({"en": {"Hello"}}))
@@ -0,0 +1,65 @@
+import pytest
+from langstring import MultiLangString
+from langstring import SetLangString
+
+
+@pytest.mark.parametrize(
+    "language_ranges, extended, expected",
+    [
+        ("zh-Hant-*", True, ["zh-Hant-TW", "zh-hant"]),
+        ("zh", True, ["zh-Hant-TW", "zh-Hans", "zh-hant"]),
+        ("zh-TW", True, ["zh-Hant-TW"]),
+        ("zh-TW", False, []),
+        (["en", "zh-Hans"], True, ["en", "zh-Hans"]),
+        (["*"], False, ["zh-Hant-TW", "zh-Hans", "en", "zh-hant"]),
+        ([], True, []),
+    ],
+)
+def test_get_langs_matching(language_ranges, extended, expected) -> None:
+    """Test the selection of languages by language ranges.
+
+    :param language_ranges: The range or priority list of ranges.
+    :param extended: Whether extended filtering is used.
+    :param expected: The expected languages, in order.
+    :return: None. Asserts the selected languages.
+    """
+    mls = MultiLangString({"zh-Hant-TW": {"a"}, "zh-Hans": {"b"}, "en": {"c"}, "zh-hant": {"d"}})
+    assert mls.get_langs_matching(language_ranges, extended=extended) == expected
+
+
+def test_get_setlangstrings_matching() -> None:
+    """Test that a SetLangString is returned for each matching language, independent from the MultiLangString.
+
+    :return: None. Asserts the returned SetLangStrings and that modifying them leaves the MultiLangString unchanged.
+    """
+    mls = MultiLangString({"pt-BR": {"Olá"}, "pt-PT": {"Olá", "Bom dia"}, "en": {"Hello"}})
+    result = mls.get_setlangstrings_matching("PT")
+    assert result == [SetLangString({"Olá"}, "pt-BR"), SetLangString({"Olá", "Bom dia"}, "pt-PT")]
+    result[0].add_text("Oi")
+    assert mls["pt-BR"] == {"Olá"}
+
+
+def test_get_langs_matching_follows_changes() -> None:
+    """Test that languages added or removed after a matching are taken into account by the next ones.
+
+    :return: None. Asserts the matched languages after each change.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    assert mls.get_langs_matching("en") == ["en"]
+    mls.add_entry("Hi", "en-GB")
+    assert mls.get_langs_matching("en") == ["en", "en-GB"]
+    mls.remove_lang("en")
+    assert mls.get_langs_matching("en") == ["en-GB"]
+    assert mls.copy().get_langs_matching("en") == ["en-GB"]
+
+
+@pytest.mark.parametrize("language_ranges, extended", [(None, True), ([1], True), ("en", None)])
+def test_get_langs_matching_invalid_arguments(language_ranges, extended) -> None:
+    """Test that arguments of invalid types are rejected.
+
+    :param language_ranges: The ranges.
+    :param extended: The extended argument.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        MultiLangString({"en": {"Hello"}}).get_langs_matching(language_ranges, extended=extended)
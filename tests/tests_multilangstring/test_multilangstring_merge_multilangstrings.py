@@ -1,5 +1,8 @@
 import pytest
+from langstring import Controller
+from langstring import Converter
 from langstring import MultiLangString
+from langstring import MultiLangStringFlag
 from tests.conftest import TYPEERROR_MSG_SINGULAR
 
 
@@ -138,3 +141,59 @@ def test_merge_multilangstrings_unusual_but_valid(inputs, expected):
     assert all(
         result.mls_dict.get(lang, set()) == expected.get(lang, set()) for lang in expected
     ), "Merged MultiLangString does not match expected content in unusual but valid scenarios."
+
+
+def test_merge_multilangstrings_does_not_modify_inputs():
+    """Test that merging returns a new MultiLangString without modifying or sharing the inputs.
+
+    :return: None. Asserts the content of the inputs after the merge and that no text set is shared.
+    """
+    mls1 = MultiLangString({"en": {"Hello"}, "fr": set()}, pref_lang="fr")
+    mls2 = MultiLangString({"EN": {"Hi"}, "de": {"Hallo"}})
+    result = MultiLangString.merge_multilangstrings([mls1, mls2])
+    assert result is not mls1
+    assert result.mls_dict == {"en": {"Hello", "Hi"}, "fr": set(), "de": {"Hallo"}}
+    assert result.pref_lang == "fr"
+    assert mls1.mls_dict == {"en": {"Hello"}, "fr": set()}
+    assert mls2.mls_dict == {"EN": {"Hi"}, "de": {"Hallo"}}
+    result.add_entry("Hey", "de")
+    assert mls2.mls_dict["de"] == {"Hallo"}
+
+
+def test_merge_multilangstrings_keeps_first_casing_in_order():
+    """Test that languages keep the casing and the order of their first occurrence.
+
+    :return: None. Asserts the keys of the merged MultiLangString, in order.
+    """
+    inputs = [MultiLangString({"pt-BR": {"Oi"}}), MultiLangString({"en": {"Hi"}, "PT-br": {"Olá"}}), MultiLangString()]
+    result = MultiLangString.merge_multilangstrings(inputs)
+    assert list(result.mls_dict.items()) == [("pt-BR", {"Oi", "Olá"}), ("en", {"Hi"})]
+
+
+def test_merge_multilangstrings_applies_flags_to_other_elements():
+    """Test that the texts and languages of the merged elements are validated with the MultiLangStringFlag flags.
+
+    :return: None. Asserts the content of the merged MultiLangString and that invalid texts raise ValueError.
+    """
+    mls1 = MultiLangString({"en": {"Hello"}})
+    mls2 = MultiLangString({" EN ": {" Hi "}})
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(MultiLangStringFlag.STRIP_LANG, True)
+    assert MultiLangString.merge_multilangstrings([mls1, mls2]).mls_dict == {"en": {"Hello", "Hi"}}
+
+    Controller.set_flag(MultiLangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError, match="DEFINED_TEXT"):
+        MultiLangString.merge_multilangstrings([mls1, MultiLangString({"en": {"   "}})])
+
+
+def test_converter_from_multilangstrings_does_not_modify_inputs():
+    """Test that the conversions of lists of MultiLangStrings do not modify the first element.
+
+    :return: None. Asserts the content of the first element after the conversions.
+    """
+    mls1 = MultiLangString({"en": {"Hello"}})
+    mls2 = MultiLangString({"fr": {"Bonjour"}})
+    Converter.from_multilangstrings_to_strings([mls1, mls2])
+    Converter.from_multilangstrings_to_langstrings([mls1, mls2])
+    Converter.from_multilangstrings_to_setlangstrings([mls1, mls2])
+    assert mls1.mls_dict == {"en": {"Hello"}}
@@ -0,0 +1,109 @@
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring.utils.sorted_text_set import SortedTextSet
+
+SORTED_CASES = [
+    {"en": {"World", "Hello"}, "fr": {"Monde", "Bonjour"}},
+    {"en": {"b", "a"}, "EN": {"c"}, "pt": set()},
+    {"emoji": {"😊", "😂", "👍"}, "symbols": {"@", "#"}},
+    {"en": {"", " "}, "fr": {" ", ""}},
+    {},
+]
+
+
+@pytest.mark.parametrize("mls_dict", SORTED_CASES)
+def test_sorted_texts_flag_creates_sorted_storage(mls_dict: dict) -> None:
+    """Test that enabling SORTED_TEXTS stores each language's texts in a SortedTextSet.
+
+    :param mls_dict: The dictionary used to initialize the MultiLangString.
+    :return: None. Asserts the storage type and sorted iteration of every language.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString(mls_dict)
+    for texts in mls.mls_dict.values():
+        assert isinstance(texts, SortedTextSet), "Texts should be stored in a SortedTextSet"
+        assert list(texts) == sorted(texts), "Texts should be iterated in sorted order"
+
+
+def test_sorted_texts_flag_disabled_uses_plain_sets() -> None:
+    """Test that plain sets are used when SORTED_TEXTS is disabled (default).
+
+    :return: None. Asserts the storage type of a newly added language.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    mls.add_entry("Bonjour", "fr")
+    assert all(type(texts) is set for texts in mls.mls_dict.values())
+
+
+@pytest.mark.parametrize("mls_dict", SORTED_CASES)
+def test_sorted_texts_outputs_match_unsorted_storage(mls_dict: dict) -> None:
+    """Test that the sorted storage mode produces the same outputs as the default storage.
+
+    :param mls_dict: The dictionary used to initialize the MultiLangString.
+    :return: None. Asserts equality of get_texts, to_strings, __str__, __hash__, and __eq__ for both modes.
+    """
+    plain = MultiLangString(mls_dict)
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    ordered = MultiLangString(mls_dict)
+
+    assert ordered.get_texts() == plain.get_texts()
+    assert ordered.to_strings() == plain.to_strings()
+    assert str(ordered) == str(plain)
+    assert hash(ordered) == hash(plain)
+    assert ordered == plain
+
+
+def test_sorted_texts_add_methods_keep_order() -> None:
+    """Test that texts added through the add methods keep the sorted order.
+
+    :return: None. Asserts the iteration order and string representation after several additions.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString()
+    for text in ["pear", "apple", "fig"]:
+        mls.add_entry(text, "en")
+    mls.add_empty_lang("fr")
+    mls["de"] = {"Zug", "Auto"}
+    mls.add_text_in_pref_lang("banana")
+
+    assert list(mls["en"]) == ["apple", "banana", "fig", "pear"]
+    assert list(mls["de"]) == ["Auto", "Zug"]
+    assert isinstance(mls["fr"], SortedTextSet)
+    assert str(mls) == "{'Auto', 'Zug'}@de, {'apple', 'banana', 'fig', 'pear'}@en, {}@fr"
+
+
+def test_sorted_texts_discard_and_remove_keep_order() -> None:
+    """Test that discarding and removing texts keeps the remaining texts ordered.
+
+    :return: None. Asserts the iteration order and get_texts output after removals.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString({"en": {"c", "a", "b", "d"}, "fr": {"z"}})
+    mls.discard_entry("b", "en")
+    mls.remove_entry("d", "EN")
+    assert list(mls["en"]) == ["a", "c"]
+    assert mls.get_texts() == ["a", "c", "z"]
+
+
+def test_sorted_texts_repr_is_deterministic() -> None:
+    """Test that the representation lists the texts of each language in sorted order.
+
+    :return: None. Asserts the exact representation string.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString({"en": {"World", "Hello"}}, pref_lang="en")
+    assert repr(mls) == "MultiLangString(mls_dict={'en': {'Hello', 'World'}}, pref_lang='en')"
+
+
+def test_sorted_texts_mixed_storage_get_texts() -> None:
+    """Test get_texts when only some languages use the sorted storage.
+
+    :return: None. Asserts that the result is sorted regardless of the storage mix.
+    """
+    mls = MultiLangString({"en": {"b", "d"}})
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls.add_entry("c", "fr")
+    mls.add_entry("a", "fr")
+    assert mls.get_texts() == ["a", "b", "c", "d"]
@@ -0,0 +1,177 @@
+import pytest
+from langstring import Controller
+from langstring import GlobalFlag
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import Renormalizer
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+from langstring.utils.validators import FlagValidator
+
+
+def test_renormalize_langstrings_in_place() -> None:
+    """Test that LangStrings get the text and language tag they would get if created again.
+
+    :return: None. Asserts the identity and content of the renormalized LangStrings and the number of modified ones.
+    """
+    langstrings = [LangString(" Hello ", "EN"), LangString("Hi", "en")]
+    first = langstrings[0]
+    Controller.set_flag(LangStringFlag.LOWERCASE_LANG, True)
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    assert Renormalizer.renormalize(langstrings) == 1
+    assert langstrings[0] is first
+    assert langstrings == [LangString("Hello", "en"), LangString("Hi", "en")]
+    assert Renormalizer.renormalize(langstrings) == 0
+
+
+def test_renormalize_setlangstring_merges_texts_in_place() -> None:
+    """Test that texts of a SetLangString that become equal are merged, keeping the same set object.
+
+    :return: None. Asserts the texts, the language tag, and the identity of the set of texts.
+    """
+    setlangstring = SetLangString({"Hello", " Hello ", "World"}, "EN")
+    texts = setlangstring.texts
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(SetLangStringFlag.LOWERCASE_LANG, True)
+    assert Renormalizer.renormalize([setlangstring]) == 1
+    assert setlangstring.texts is texts
+    assert setlangstring == SetLangString({"Hello", "World"}, "en")
+
+
+@pytest.mark.parametrize(
+    "mls_dict, flags, expected, expected_langs",
+    [
+        ({"en": {"Hello"}, "EN ": {"Hi"}}, [MultiLangStringFlag.STRIP_LANG], {"en": {"Hello", "Hi"}}, ["en"]),
+        ({"en ": {"Hello"}, "en": {"Hi"}}, [MultiLangStringFlag.STRIP_LANG], {"en": {"Hello", "Hi"}}, ["en"]),
+        (
+            {"EN": {"a"}, "fr": {" b", "b"}},
+            [MultiLangStringFlag.LOWERCASE_LANG, MultiLangStringFlag.STRIP_TEXT],
+            {"en": {"a"}, "fr": {"b"}},
+            ["en", "fr"],
+        ),
+        ({"pt": {"a"}, "en": {"b"}}, [MultiLangStringFlag.STRIP_TEXT], {"pt": {"a"}, "en": {"b"}}, ["pt", "en"]),
+    ],
+)
+def test_renormalize_multilangstring(mls_dict, flags, expected, expected_langs) -> None:
+    """Test that languages of a MultiLangString are validated and merged when they become case duplicates.
+
+    :param mls_dict: The content of the MultiLangString, created before enabling the flags.
+    :param flags: The flags enabled afterward.
+    :param expected: The expected content.
+    :param expected_langs: The expected languages, in order.
+    :return: None. Asserts the content, language order, and identity of the dictionary.
+    """
+    mls = MultiLangString(mls_dict)
+    internal_dict = mls._mls_dict
+    for flag in flags:
+        Controller.set_flag(flag, True)
+    Renormalizer.renormalize([mls])
+    assert mls.mls_dict == expected
+    assert mls.get_langs() == expected_langs
+    assert mls._mls_dict is internal_dict
+
+
+def test_renormalize_multilangstring_pref_lang_and_copy_on_write() -> None:
+    """Test that the preferred language is validated and that sets shared with copies are not modified.
+
+    :return: None. Asserts the preferred language and the content of the renormalized object and of its copy.
+    """
+    mls = MultiLangString({"EN": {" a"}, "fr": {"b"}}, pref_lang="FR")
+    copied = mls.copy()
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    assert Renormalizer.renormalize([mls]) == 1
+    assert mls.pref_lang == "fr"
+    mls.add_entry("c", "fr")
+    assert mls.mls_dict == {"en": {"a"}, "fr": {"b", "c"}}
+    assert copied.mls_dict == {"EN": {" a"}, "fr": {"b"}}
+
+
+def test_renormalize_setlangstring_view_rejected() -> None:
+    """Test that a view is rejected, leaving the texts it shares with its MultiLangString and a copy unchanged.
+
+    :return: None. Asserts that a TypeError is raised and the content of the MultiLangString and of its copy.
+    """
+    mls = MultiLangString({"en": {" a"}})
+    copied = mls.copy()
+    view = mls.get_setlangstring_view("en")
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    with pytest.raises(TypeError, match="read-only"):
+        Renormalizer.renormalize([view], SetLangStringFlag)
+    assert mls.mls_dict == {"en": {" a"}}
+    assert copied.mls_dict == {"en": {" a"}}
+    assert view.lang == "en"
+
+
+def test_renormalize_with_flag_type_and_memoization(monkeypatch) -> None:
+    """Test applying a given flag type to all objects, validating each distinct value once.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: None. Asserts the renormalized objects and the number of validations.
+    """
+    objects = [
+        LangString("a ", "en"),
+        SetLangString({"a ", "b"}, "en"),
+        MultiLangString({"en": {"a ", "b"}, "fr": {"a "}}),
+    ]
+    Controller.set_flag(GlobalFlag.STRIP_TEXT, True)
+    calls = []
+    original = FlagValidator.validate_flags_text
+
+    def counting(flag_type, text):
+        calls.append((flag_type, text))
+        return original(flag_type, text)
+
+    monkeypatch.setattr(FlagValidator, "validate_flags_text", counting)
+    assert Renormalizer.renormalize(iter(objects), flag_type=GlobalFlag) == 3
+    assert sorted(text for _, text in calls) == ["a ", "b"]
+    assert {flag_type for flag_type, _ in calls} == {GlobalFlag}
+    assert objects[0] == LangString("a", "en")
+    assert objects[1] == SetLangString({"a", "b"}, "en")
+    assert objects[2].mls_dict == {"en": {"a", "b"}, "fr": {"a"}}
+
+
+def test_renormalize_without_flags_is_noop() -> None:
+    """Test that no object is modified when no flag is enabled.
+
+    :return: None. Asserts the number of modified objects and the unchanged content.
+    """
+    mls = MultiLangString({"en": {" a "}})
+    assert Renormalizer.renormalize([LangString(" a ", "EN"), SetLangString({" a"}, "EN "), mls]) == 0
+    assert mls.mls_dict == {"en": {" a "}}
+
+
+def test_renormalize_rejected_value_leaves_object_unchanged() -> None:
+    """Test that an object with a rejected value is not modified and that earlier objects are renormalized.
+
+    :return: None. Asserts the ValueError and the content of both objects.
+    """
+    first = MultiLangString({"EN": {"a"}})
+    second = MultiLangString({"EN": {"a", " "}})
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    Controller.set_flag(MultiLangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError):
+        Renormalizer.renormalize([first, second])
+    assert first.mls_dict == {"en": {"a"}}
+    assert second.mls_dict == {"EN": {"a", " "}}
+
+
+@pytest.mark.parametrize(
+    "objects, flag_type",
+    [
+        (["Hello@en"], None),
+        ([LangString("Hello", "en")], str),
+        ([LangString("Hello", "en")], "GlobalFlag"),
+    ],
+)
+def test_renormalize_invalid_arguments(objects, flag_type) -> None:
+    """Test that invalid objects and flag types raise a TypeError.
+
+    :param objects: The objects to be renormalized.
+    :param flag_type: The flag type.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        Renormalizer.renormalize(objects, flag_type=flag_type)
@@ -0,0 +1,71 @@
+import pytest
+from langstring import Controller
+from langstring import LangStringFlag
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+
+FLAG_COMBINATIONS = [
+    {},
+    {SetLangStringFlag.STRIP_TEXT: True},
+    {SetLangStringFlag.LOWERCASE_LANG: True},
+    {SetLangStringFlag.STRIP_TEXT: True, SetLangStringFlag.STRIP_LANG: True, SetLangStringFlag.LOWERCASE_LANG: True},
+]
+
+METHODS = [
+    ("copy", ()),
+    ("difference", ({"b"},)),
+    ("intersection", ({"a", "b", "z"},)),
+    ("symmetric_difference", ({"b", "d"},)),
+    ("union", ({"d"}, {"e"})),
+]
+
+
+@pytest.mark.parametrize("flags", FLAG_COMBINATIONS)
+@pytest.mark.parametrize("method, args", METHODS)
+def test_from_validated_matches_constructor(flags: dict, method: str, args: tuple) -> None:
+    """Test that the SetLangStrings returned by the set methods are equal to the ones built by the public constructor.
+
+    :param flags: The flags to enable.
+    :param method: The name of the method to call.
+    :param args: The arguments of the method.
+    :return: None. Asserts that the texts and language of the result match the constructor applied to the set result.
+    """
+    for flag, value in flags.items():
+        Controller.set_flag(flag, value)
+    setlangstring = SetLangString({"a", "b", "c"}, " EN ")
+    result = getattr(setlangstring, method)(*args)
+    expected = SetLangString(getattr(setlangstring.texts, method)(*args), setlangstring.lang)
+    assert isinstance(result, SetLangString)
+    assert (result.texts, result.lang) == (expected.texts, expected.lang)
+    assert result.texts is not setlangstring.texts, "The result must not share the storage of the original"
+
+
+def test_from_validated_strip_text_merges_texts() -> None:
+    """Test that texts equal after stripping are merged in derived SetLangStrings, as by the public constructor.
+
+    :return: None. Asserts the texts of the union.
+    """
+    setlangstring = SetLangString({"a"}, "en")
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    assert setlangstring.union({" a ", "b "}).texts == {"a", "b"}
+
+
+@pytest.mark.parametrize("method", ["union", "symmetric_difference"])
+def test_from_validated_keeps_type_errors(method: str) -> None:
+    """Test that operations with plain sets containing non-string elements still raise TypeError.
+
+    :param method: The name of the method to call.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        getattr(SetLangString({"a"}, "en"), method)({1})
+
+
+def test_from_validated_to_langstrings_defined_text() -> None:
+    """Test that converting to LangStrings applies the LangStringFlag flags to each text.
+
+    :return: None. Asserts the texts of the LangStrings.
+    """
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    langstrings = SetLangString({" a "}, "en").to_langstrings()
+    assert [langstring.text for langstring in langstrings] == ["a"]
@@ -0,0 +1,59 @@
+import copy
+import pickle
+
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+
+COPIERS = [
+    copy.copy,
+    copy.deepcopy,
+    lambda sls: sls.copy(),
+    lambda sls: pickle.loads(pickle.dumps(sls)),
+]
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_setlangstring_copy_and_pickle(copier) -> None:
+    """Test that copying and unpickling create equal SetLangStrings with their own sets of texts.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the type, texts, and language of the copy and its independence from the original.
+    """
+    setlangstring = SetLangString({"Hello", "World"}, "en")
+    copied = copier(setlangstring)
+    assert type(copied) is SetLangString
+    assert (copied.texts, copied.lang) == ({"Hello", "World"}, "en")
+    copied.add("Hi")
+    assert setlangstring.texts == {"Hello", "World"}
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_setlangstring_copy_and_pickle_skip_validation(copier) -> None:
+    """Test that copying and unpickling keep the validated state as it is, without validating it again.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the texts and language of the copy after enabling transforming flags.
+    """
+    setlangstring = SetLangString({" Hello "}, "EN")
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(SetLangStringFlag.LOWERCASE_LANG, True)
+    copied = copier(setlangstring)
+    assert (copied.texts, copied.lang) == ({" Hello "}, "EN")
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_setlangstring_view_copy_and_pickle(copier) -> None:
+    """Test that copying and unpickling a view create independent SetLangStrings equal to the materialized view.
+
+    :param copier: The function creating the copy.
+    :return: None. Asserts the type and content of the copy and that the MultiLangString is unchanged.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    copied = copier(mls.get_setlangstring_view("en"))
+    assert type(copied) is SetLangString
+    assert (copied.texts, copied.lang) == ({"Hello"}, "en")
+    copied.add("Hi")
+    assert mls.mls_dict == {"en": {"Hello"}}
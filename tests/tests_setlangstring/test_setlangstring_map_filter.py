@@ -0,0 +1,87 @@
+import pytest
+from langstring import Controller
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+
+
+@pytest.mark.parametrize(
+    "texts, func, expected",
+    [
+        ({" Hello", "Hello ", "World"}, str.strip, {"Hello", "World"}),
+        ({"Hello", "World"}, str.upper, {"HELLO", "WORLD"}),
+        ({"Hello", "World"}, lambda text: "same", {"same"}),
+        (set(), str.upper, set()),
+    ],
+)
+def test_setlangstring_map_texts(texts, func, expected) -> None:
+    """Test transforming the texts of a SetLangString.
+
+    :param texts: The texts of the SetLangString.
+    :param func: The transformation function.
+    :param expected: The expected texts.
+    :return: None. Asserts the texts and language of the result, and that the original is unchanged.
+    """
+    setlangstring = SetLangString(texts, "en")
+    result = setlangstring.map_texts(func)
+    assert result == SetLangString(expected, "en")
+    assert setlangstring.texts == texts
+
+
+def test_setlangstring_map_texts_applies_flags() -> None:
+    """Test that transformed texts are validated according to the SetLangStringFlag flags.
+
+    :return: None. Asserts the stripped texts and the ValueError for an empty text.
+    """
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    assert SetLangString({"a", "b"}, "en").map_texts(lambda text: f" {text} ").texts == {"a", "b"}
+    Controller.set_flag(SetLangStringFlag.DEFINED_TEXT, True)
+    with pytest.raises(ValueError):
+        SetLangString({"a"}, "en").map_texts(lambda text: "")
+
+
+def test_setlangstring_filter_texts() -> None:
+    """Test keeping the texts of a SetLangString that satisfy a predicate.
+
+    :return: None. Asserts the kept texts, the language, and that the original is unchanged.
+    """
+    setlangstring = SetLangString({"Hello", "Hi", "World"}, "en")
+    result = setlangstring.filter_texts(lambda text: text.startswith("H"))
+    assert result == SetLangString({"Hello", "Hi"}, "en")
+    assert setlangstring.filter_texts(lambda text: None).texts == set()
+    assert len(setlangstring) == 3
+
+
+def test_setlangstring_map_langs() -> None:
+    """Test transforming the language tag of a SetLangString, with and without flags.
+
+    :return: None. Asserts the new language tag and that the texts are copied.
+    """
+    setlangstring = SetLangString({"Hello"}, "en-us")
+    result = setlangstring.map_langs(lambda lang: lang.split("-")[0])
+    assert result == SetLangString({"Hello"}, "en")
+    result.add_text("Hi")
+    assert setlangstring.texts == {"Hello"}, "The texts should not be shared"
+
+    Controller.set_flag(SetLangStringFlag.LOWERCASE_LANG, True)
+    assert setlangstring.map_langs(str.upper).lang == "en-us"
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda sls: sls.map_texts("strip"),
+        lambda sls: sls.map_texts(len),
+        lambda sls: sls.map_texts(lambda text: [text]),
+        lambda sls: sls.filter_texts(None),
+        lambda sls: sls.map_langs(None),
+        lambda sls: sls.map_langs(lambda lang: 1),
+    ],
+)
+def test_setlangstring_map_filter_invalid_type(call) -> None:
+    """Test that functions that are not callable or do not return strings raise a TypeError.
+
+    :param call: A function calling the method with an invalid argument.
+    :return: None. Asserts that a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        call(SetLangString({"Hello"}, "en"))
@@ -0,0 +1,154 @@
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import SetLangString
+from langstring import SetLangStringFlag
+from langstring import SetLangStringView
+
+
+def test_setlangstring_view_reads_without_copying() -> None:
+    """Test that a view reads the texts stored in the MultiLangString without copying them.
+
+    :return: None. Asserts the identity of the texts and the results of the read API.
+    """
+    mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}})
+    view = mls.get_setlangstring_view("EN")
+    assert isinstance(view, SetLangString)
+    assert view._texts is mls.mls_dict["en"]
+    assert view.texts == {"Hello", "World"}
+    assert view.lang == "EN"
+    assert len(view) == 2
+    assert "Hello" in view
+    assert LangString("World", "en") in view
+    assert sorted(view) == ["Hello", "World"]
+    assert view == SetLangString({"Hello", "World"}, "en")
+    assert view.issuperset({"Hello"})
+    assert str(view) == "{'Hello', 'World'}@EN"
+
+
+def test_setlangstring_view_is_live() -> None:
+    """Test that a view reflects the changes made to the MultiLangString, including removal and re-addition.
+
+    :return: None. Asserts the texts of the view after each change.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    view = mls.get_setlangstring_view("en")
+    missing_view = mls.get_setlangstring_view("de")
+    assert len(missing_view) == 0
+
+    mls.add_entry("Hi", "EN")
+    assert view.texts == {"Hello", "Hi"}
+    mls.remove_lang("en")
+    assert view.texts == set()
+    mls.add_entry("Hey", "En")
+    assert view.texts == {"Hey"}
+    mls.add_entry("Hallo", "de")
+    assert missing_view.texts == {"Hallo"}
+
+
+def test_setlangstring_view_texts_cannot_be_modified() -> None:
+    """Test that the texts returned by a view are immutable, so they cannot be used to modify the MultiLangString.
+
+    :return: None. Asserts that modifying the texts raises AttributeError and the content of the MultiLangString.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    texts = mls.get_setlangstring_view("en").texts
+    assert isinstance(texts, frozenset)
+    with pytest.raises(AttributeError):
+        texts.add("x")
+    with pytest.raises(AttributeError):
+        texts.clear()
+    assert mls.mls_dict == {"en": {"Hello"}}
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda view: view.add("x"),
+        lambda view: view.add_text("x"),
+        lambda view: view.add_langstring(LangString("x", "en")),
+        lambda view: view.discard("Hello"),
+        lambda view: view.discard_text("Hello"),
+        lambda view: view.remove("Hello"),
+        lambda view: view.remove_text("Hello"),
+        lambda view: view.pop(),
+        lambda view: view.clear(),
+        lambda view: view.update({"x"}),
+        lambda view: view.difference_update({"Hello"}),
+        lambda view: view.intersection_update({"Hello"}),
+        lambda view: view.symmetric_difference_update({"Hello"}),
+        lambda view: view.__ior__({"x"}),
+        lambda view: setattr(view, "texts", {"x"}),
+        lambda view: setattr(view, "lang", "fr"),
+    ],
+)
+def test_setlangstring_view_is_read_only(operation) -> None:
+    """Test that operations modifying a view raise TypeError and leave the MultiLangString unchanged.
+
+    :param operation: A function applying a modifying operation to the view.
+    :return: None. Asserts that a TypeError is raised and the content of the MultiLangString.
+    """
+    mls = MultiLangString({"en": {"Hello"}})
+    with pytest.raises(TypeError, match="read-only"):
+        operation(mls.get_setlangstring_view("en"))
+    assert mls.mls_dict == {"en": {"Hello"}}
+
+
+def test_setlangstring_view_set_algebra_returns_independent_setlangstrings() -> None:
+    """Test that set algebra on a view returns new SetLangStrings that do not share the MultiLangString's texts.
+
+    :return: None. Asserts the types and texts of the results and the content of the MultiLangString.
+    """
+    mls = MultiLangString({"en": {"Hello", "World"}})
+    view = mls.get_setlangstring_view("en")
+    for result in (view.union({"Hi"}), view | {"Hi"}, view.copy(), view.difference({"World"}), view & {"Hello"}):
+        assert type(result) is SetLangString
+        result.add("New")
+    assert mls.mls_dict == {"en": {"Hello", "World"}}
+
+
+def test_setlangstring_view_materialize_matches_get_setlangstring() -> None:
+    """Test that materializing a view returns an independent SetLangString equal to the one of get_setlangstring.
+
+    :return: None. Asserts the texts and language of the materialized SetLangString and its independence.
+    """
+    mls = MultiLangString({"en": {" Hello ", "World"}})
+    Controller.set_flag(SetLangStringFlag.STRIP_TEXT, True)
+    Controller.set_flag(SetLangStringFlag.LOWERCASE_LANG, True)
+    materialized = mls.get_setlangstring_view("EN").materialize()
+    expected = mls.get_setlangstring("EN")
+    assert type(materialized) is SetLangString
+    assert (materialized.texts, materialized.lang) == (expected.texts, expected.lang)
+    materialized.add("Hi")
+    assert mls.mls_dict == {"en": {" Hello ", "World"}}
+
+
+def test_setlangstring_view_use_in_multilangstring_methods() -> None:
+    """Test that a view of a MultiLangString can be used to discard and add its own texts.
+
+    :return: None. Asserts the content of the MultiLangStrings.
+    """
+    mls = MultiLangString({"en": {"Hello", "World"}, "fr": {"Bonjour"}})
+    other = MultiLangString()
+    other.add_setlangstring(mls.get_setlangstring_view("en"))
+    assert other.mls_dict == {"en": {"Hello", "World"}}
+    mls.discard_setlangstring(mls.get_setlangstring_view("en"))
+    assert mls.mls_dict == {"en": set(), "fr": {"Bonjour"}}
+
+
+@pytest.mark.parametrize("langs, expected", [(None, ["en", "fr"]), (["FR", "de"], ["fr"]), ([], [])])
+def test_multilangstring_to_setlangstring_views(langs, expected: list[str]) -> None:
+    """Test creating views of the selected languages of a MultiLangString.
+
+    :param langs: The languages to select.
+    :param expected: The expected languages of the views.
+    :return: None. Asserts the types, languages, and texts of the views.
+    """
+    Controller.set_flag(MultiLangStringFlag.SORTED_TEXTS, True)
+    mls = MultiLangString({"en": {"Hello"}, "fr": {"Bonjour"}})
+    views = mls.to_setlangstring_views(langs)
+    assert all(isinstance(view, SetLangStringView) for view in views)
+    assert [view.lang for view in views] == expected
+    assert [view.texts for view in views] == [mls.mls_dict[lang] for lang in expected]
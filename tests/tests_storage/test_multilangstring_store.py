@@ -0,0 +1,202 @@
+import sqlite3
+
+import pytest
+from langstring import Controller
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import MultiLangStringStore
+
+
+def make_store(**kwargs) -> MultiLangStringStore:
+    """Create an in-memory store with three stored MultiLangStrings.
+
+    :return: A new MultiLangStringStore.
+    """
+    store = MultiLangStringStore(**kwargs)
+    store.put_many(
+        [
+            ("Q90", MultiLangString({"en": {"Paris"}, "fr": {"Paris"}, "pt-BR": {"Paris", "Cidade Luz"}})),
+            ("Q64", MultiLangString({"en": {"Berlin"}, "DE": {"Berlin"}}, pref_lang="de")),
+            ("Q1", MultiLangString({"en": {"universe"}, "la": set()})),
+        ]
+    )
+    return store
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 1000])
+def test_store_roundtrip(batch_size) -> None:
+    """Test that stored MultiLangStrings are rebuilt with the same texts, languages, and preferred language.
+
+    :param batch_size: The batch size of the store.
+    :return: None. Asserts equality, language casing, and preferred language of the rebuilt MultiLangStrings.
+    """
+    store = make_store(batch_size=batch_size)
+    assert len(store) == 3
+    assert list(store.iter_ids()) == ["Q1", "Q64", "Q90"]
+    rebuilt = dict(store.iter_multilangstrings())
+    assert list(rebuilt) == ["Q1", "Q64", "Q90"]
+    assert rebuilt["Q90"] == MultiLangString({"en": {"Paris"}, "fr": {"Paris"}, "pt-BR": {"Paris", "Cidade Luz"}})
+    assert rebuilt["Q90"].get_langs() == ["en", "fr", "pt-BR"]
+    assert rebuilt["Q64"].pref_lang == "de"
+    assert rebuilt["Q1"].get_langs() == ["en", "la"], "Languages without texts should be preserved"
+    assert store.get("Q64") == rebuilt["Q64"]
+    assert store.get("missing") is None
+
+
+def test_store_empty_multilangstring() -> None:
+    """Test storing a MultiLangString without languages.
+
+    :return: None. Asserts that the MultiLangString is stored and rebuilt empty.
+    """
+    store = MultiLangStringStore()
+    store.put("empty", MultiLangString())
+    assert "empty" in store
+    assert store.get("empty") == MultiLangString()
+
+
+def test_store_put_replaces() -> None:
+    """Test that storing under an existing identifier replaces the stored MultiLangString, also within a batch.
+
+    :return: None. Asserts the stored content and the lookups after replacement.
+    """
+    store = make_store()
+    store.put("Q90", MultiLangString({"it": {"Parigi"}}))
+    assert store.get("Q90") == MultiLangString({"it": {"Parigi"}})
+    assert store.find_ids_by_text("Paris") == []
+
+    store.put_many([("x", MultiLangString({"en": {"a"}})), ("x", MultiLangString({"en": {"b"}}))])
+    assert store.get("x") == MultiLangString({"en": {"b"}})
+    assert len(store) == 4
+
+
+def test_store_case_merging_on_read_back() -> None:
+    """Test that language casing variants of a stored object are merged as by the MultiLangString constructor.
+
+    :return: None. Asserts that the rebuilt MultiLangString matches the one built from the same entries.
+    """
+    store = MultiLangStringStore()
+    store.put("a", MultiLangString({"en": {"Hello"}}))
+    # Rows added by another writer with a different casing of the same language
+    store._connection.execute(
+        "INSERT INTO entries (id, lang_casefold, lang_original, text) VALUES ('a', 'en', 'EN', 'Hi')"
+    )
+    assert store.get("a") == MultiLangString({"en": {"Hello"}, "EN": {"Hi"}})
+    assert store.get("a").get_langs() == ["en"]
+
+
+def test_store_read_back_applies_flags() -> None:
+    """Test that the current MultiLangStringFlag flags are applied when rebuilding.
+
+    :return: None. Asserts that the language tag is lowercased on read-back.
+    """
+    store = MultiLangStringStore()
+    store.put("a", MultiLangString({"EN": {"Hello"}}))
+    Controller.set_flag(MultiLangStringFlag.LOWERCASE_LANG, True)
+    assert store.get("a").get_langs() == ["en"]
+
+
+@pytest.mark.parametrize(
+    "text, lang, expected",
+    [
+        ("Paris", None, ["Q90"]),
+        ("Paris", "FR", ["Q90"]),
+        ("Paris", "de", []),
+        ("Berlin", None, ["Q64"]),
+        ("paris", None, []),
+    ],
+)
+def test_store_find_ids_by_text(text, lang, expected) -> None:
+    """Test looking up identifiers by text, optionally restricted to a language.
+
+    :param text: The text to look up.
+    :param lang: The language to restrict the lookup to.
+    :param expected: The expected identifiers.
+    :return: None. Asserts the found identifiers.
+    """
+    assert make_store().find_ids_by_text(text, lang) == expected
+
+
+@pytest.mark.parametrize("lang, expected", [("en", ["Q1", "Q64", "Q90"]), ("de", ["Q64"]), ("LA", ["Q1"]), ("x", [])])
+def test_store_find_ids_by_lang(lang, expected) -> None:
+    """Test looking up identifiers by case-insensitive language tag.
+
+    :param lang: The language to look up.
+    :param expected: The expected identifiers.
+    :return: None. Asserts the found identifiers.
+    """
+    assert make_store().find_ids_by_lang(lang) == expected
+
+
+def test_store_iter_multilangstrings_selected_ids_and_delete() -> None:
+    """Test rebuilding selected identifiers and deleting MultiLangStrings.
+
+    :return: None. Asserts the rebuilt identifiers, the result of deletion, and the remaining identifiers.
+    """
+    store = make_store()
+    assert [mls_id for mls_id, _ in store.iter_multilangstrings(["Q90", "missing", "Q1"])] == ["Q90", "Q1"]
+    assert store.delete("Q90") is True
+    assert store.delete("Q90") is False
+    assert "Q90" not in store
+    assert store.find_ids_by_text("Paris") == []
+    assert list(store.iter_ids()) == ["Q1", "Q64"]
+
+
+def test_store_put_many_is_atomic() -> None:
+    """Test that an invalid item in put_many stores no item.
+
+    :return: None. Asserts that a TypeError is raised and the store is unchanged.
+    """
+    store = MultiLangStringStore(batch_size=1)
+    with pytest.raises(TypeError):
+        store.put_many([("a", MultiLangString({"en": {"a"}})), ("b", "not a MultiLangString")])
+    assert len(store) == 0
+
+
+def test_store_persists_to_file(tmp_path) -> None:
+    """Test that stored MultiLangStrings are available after reopening the database file.
+
+    :param tmp_path: The pytest temporary directory.
+    :return: None. Asserts the content of the reopened store and that a closed store cannot be used.
+    """
+    path = tmp_path / "labels.db"
+    with make_store(path=path) as store:
+        pass
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(store)
+    with MultiLangStringStore(path) as reopened:
+        assert list(reopened.iter_ids()) == ["Q1", "Q64", "Q90"]
+        assert reopened.get("Q90").get_langs() == ["en", "fr", "pt-BR"]
+
+
+@pytest.mark.parametrize(
+    "call, error",
+    [
+        (lambda store: store.put(1, MultiLangString()), TypeError),
+        (lambda store: store.put("a", {"en": {"a"}}), TypeError),
+        (lambda store: store.get(None), TypeError),
+        (lambda store: store.find_ids_by_text("a", 1), TypeError),
+        (lambda store: store.find_ids_by_lang(None), TypeError),
+        (lambda store: store.delete(1), TypeError),
+    ],
+)
+def test_store_invalid_arguments(call, error) -> None:
+    """Test that invalid arguments raise the appropriate errors.
+
+    :param call: A function calling a store method with invalid arguments.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        call(MultiLangStringStore())
+
+
+@pytest.mark.parametrize("batch_size, error", [(0, ValueError), (-1, ValueError), ("10", TypeError)])
+def test_store_invalid_batch_size(batch_size, error) -> None:
+    """Test that invalid batch sizes are rejected.
+
+    :param batch_size: The invalid batch size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        MultiLangStringStore(batch_size=batch_size)
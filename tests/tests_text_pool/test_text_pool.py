@@ -0,0 +1,136 @@
+import pytest
+from langstring import Controller
+from langstring import LangString
+from langstring import LangStringFlag
+from langstring import MultiLangString
+from langstring import MultiLangStringFlag
+from langstring import SetLangString
+from langstring import TextPool
+
+
+@pytest.fixture(autouse=True)
+def disable_text_pool():
+    """Disable the text pool after each test.
+
+    :return: None.
+    """
+    yield
+    TextPool.disable()
+
+
+def new_string(text: str) -> str:
+    """Create a new string object equal to the given text.
+
+    :param text: The text.
+    :return: A string equal to text that is not the same object as text.
+    """
+    return "".join(list(text))
+
+
+def test_text_pool_disabled_by_default() -> None:
+    """Test that texts are not pooled while the pool is disabled.
+
+    :return: None. Asserts the pool state, its statistics, and that texts are returned unchanged.
+    """
+    assert TextPool.is_enabled() is False
+    assert TextPool.get_info() is None
+    text = new_string("Paris")
+    assert TextPool.intern(text) is text
+    assert LangString(new_string("Paris"), "en").text is not LangString(new_string("Paris"), "fr").text
+
+
+def test_text_pool_intern_and_statistics() -> None:
+    """Test that equal texts are pooled into a single object and that hits and misses are counted.
+
+    :return: None. Asserts the identity of pooled texts and the pool statistics.
+    """
+    TextPool.enable(maxsize=10)
+    first = TextPool.intern(new_string("Paris"))
+    assert TextPool.intern(new_string("Paris")) is first
+    TextPool.intern("Berlin")
+    info = TextPool.get_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 2, 10, 2)
+    TextPool.clear()
+    assert TextPool.get_info().currsize == 0
+    assert TextPool.intern(new_string("Paris")) is not first
+
+
+def test_text_pool_lru_eviction() -> None:
+    """Test that the least recently used text is evicted when the pool is full.
+
+    :return: None. Asserts which texts remain pooled.
+    """
+    TextPool.enable(maxsize=2)
+    a = TextPool.intern(new_string("alpha"))
+    b = TextPool.intern(new_string("beta"))
+    TextPool.intern(new_string("alpha"))
+    TextPool.intern(new_string("gamma"))
+    assert TextPool.intern(new_string("alpha")) is a
+    assert TextPool.intern(new_string("beta")) is not b
+
+
+def test_text_pool_used_by_constructors() -> None:
+    """Test that the constructors of all classes and from_columns store pooled texts.
+
+    :return: None. Asserts that equal texts stored by different objects are the same object.
+    """
+    TextPool.enable()
+    pooled = TextPool.intern(new_string("OK"))
+    assert LangString(new_string("OK"), "en").text is pooled
+    assert next(iter(SetLangString({new_string("OK")}, "en").texts)) is pooled
+    mls = MultiLangString({"en": {new_string("OK")}, "en-GB": {new_string("OK")}})
+    assert all(next(iter(texts)) is pooled for texts in mls.mls_dict.values())
+    columns = MultiLangString.from_columns(["s"], [new_string("OK")], ["fr"])
+    assert next(iter(columns["s"]["fr"])) is pooled
+
+
+def test_text_pool_pools_validated_texts() -> None:
+    """Test that texts are pooled after being transformed by the flags.
+
+    :return: None. Asserts that the stripped text is pooled.
+    """
+    Controller.set_flag(LangStringFlag.STRIP_TEXT, True)
+    TextPool.enable()
+    assert LangString(" OK ", "en").text is LangString(new_string("OK"), "fr").text
+    assert TextPool.get_info().currsize == 1
+
+
+def test_text_pool_used_by_derived_objects() -> None:
+    """Test that the LangStrings and SetLangStrings derived from existing objects store pooled texts.
+
+    :return: None. Asserts that the texts of the derived objects are the pooled ones.
+    """
+    TextPool.enable()
+    pooled = TextPool.intern(new_string("OK"))
+    assert LangString("ok", "en").upper().text is pooled
+    union = SetLangString({"Hi"}, "en").union({new_string("OK")})
+    assert next(text for text in union.texts if text == "OK") is pooled
+
+
+def test_text_pool_used_by_map_texts() -> None:
+    """Test that the texts transformed by map_texts are pooled, with and without flags.
+
+    :return: None. Asserts that the transformed texts are the pooled ones.
+    """
+    TextPool.enable()
+    pooled = TextPool.intern(new_string("OK"))
+    setlangstring = SetLangString({"ok"}, "en").map_texts(lambda text: new_string(text.upper()))
+    assert next(iter(setlangstring.texts)) is pooled
+    mls = MultiLangString({"en": {"ok"}, "fr": {"OK "}}).map_texts(lambda text: new_string(text.upper().strip()))
+    assert all(next(iter(texts)) is pooled for texts in mls.mls_dict.values())
+
+    Controller.set_flag(MultiLangStringFlag.STRIP_TEXT, True)
+    mls = MultiLangString({"en": {"ok"}}).map_texts(lambda text: f" {text.upper()} ")
+    assert next(iter(mls.mls_dict["en"])) is pooled
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), (-1, ValueError), ("10", TypeError), (1.5, TypeError)])
+def test_text_pool_invalid_maxsize(maxsize, error) -> None:
+    """Test that invalid pool sizes are rejected.
+
+    :param maxsize: The invalid maximum size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        TextPool.enable(maxsize=maxsize)
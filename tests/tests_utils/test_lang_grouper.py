@@ -0,0 +1,26 @@
+import pytest
+from langstring.utils.grouping import LangGrouper
+
+
+@pytest.mark.parametrize(
+    "entries, expected",
+    [
+        ([], {}),
+        ([("en", ["a"])], {"en": (["en"], {"a"}, "en", "en")}),
+        ([("EN", ["a"]), ("en", ["b"])], {"en": (["EN", "en"], {"a", "b"}, "en", "EN")}),
+        ([("EN", ["a"]), ("en", ["a"])], {"en": (["EN", "en"], {"a"}, "en", "en")}),
+        ([("EN", ["a"]), ("EN", ["a"])], {"en": (["EN"], {"a"}, "EN", "EN")}),
+        ([("fr", []), ("de", {"x", "y"})], {"fr": (["fr"], set(), "fr", "fr"), "de": (["de"], {"x", "y"}, "de", "de")}),
+    ],
+)
+def test_lang_grouper_group_texts(entries: list, expected: dict) -> None:
+    """Test grouping texts by casefolded language tag.
+
+    :param entries: The (language tag, texts) entries.
+    :param expected: The expected (langs, texts, merged_lang, first_text_lang) of each group.
+    :return: None. Asserts the groups, in order.
+    """
+    groups = LangGrouper.group_texts(entries)
+    assert list(groups) == list(expected)
+    for key, group in groups.items():
+        assert (group.langs, group.texts, group.merged_lang, group.first_text_lang) == expected[key]
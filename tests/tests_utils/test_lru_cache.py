@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+from langstring.utils.lru_cache import CacheInfo
+from langstring.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_get_put_and_eviction() -> None:
+    """Test lookups, insertions, and eviction of the least recently used entry.
+
+    :return: None. Asserts the values found and the statistics of the cache.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+    assert cache.info().hit_rate == 0.75
+
+
+def test_lru_cache_put_existing_key_refreshes_entry() -> None:
+    """Test that storing an existing key replaces its value and marks it as recently used.
+
+    :return: None. Asserts which entry is evicted.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_lru_cache_clear() -> None:
+    """Test that clearing removes entries and resets statistics.
+
+    :return: None. Asserts the statistics after clearing.
+    """
+    cache = LRUCache(maxsize=5)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 5, 0)
+    assert cache.info().hit_rate == 0.0
+
+
+def test_lru_cache_thread_safety() -> None:
+    """Test that concurrent lookups and insertions keep the cache bounded and the statistics consistent.
+
+    :return: None. Asserts the size and the number of counted lookups.
+    """
+    cache = LRUCache(maxsize=50)
+
+    def work(offset: int) -> None:
+        for i in range(2000):
+            key = (i + offset) % 80
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert info.currsize == 50
+    assert info.hits + info.misses == 8000
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), (-1, ValueError), (None, TypeError), ("1", TypeError)])
+def test_lru_cache_invalid_maxsize(maxsize, error) -> None:
+    """Test that invalid sizes are rejected.
+
+    :param maxsize: The invalid size.
+    :param error: The expected exception type.
+    :return: None. Asserts that the expected exception is raised.
+    """
+    with pytest.raises(error):
+        LRUCache(maxsize)
@@ -0,0 +1,63 @@
+import sys
+
+import pytest
+from langstring.utils.grouping import RowGrouper
+
+NUMPY_OPTIONS = [False, pytest.param(True, marks=pytest.mark.skipif(not RowGrouper.numpy_available(), reason="numpy"))]
+
+
+@pytest.mark.parametrize(
+    "values, expected_codes, expected_uniques",
+    [
+        ([], [], []),
+        (["b", "a", "b"], [0, 1, 0], ["b", "a"]),
+        ([3, 3, 3], [0, 0, 0], [3]),
+        ([("s", 1), "s", ("s", 1)], [0, 1, 0], [("s", 1), "s"]),
+    ],
+)
+def test_row_grouper_factorize(values: list, expected_codes: list[int], expected_uniques: list) -> None:
+    """Test that values are mapped to codes in order of first appearance.
+
+    :param values: The values to factorize.
+    :param expected_codes: The expected codes.
+    :param expected_uniques: The expected distinct values.
+    :return: None. Asserts the codes and distinct values.
+    """
+    assert RowGrouper.factorize(values) == (expected_codes, expected_uniques)
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_OPTIONS)
+@pytest.mark.parametrize(
+    "first_codes, second_codes, expected",
+    [
+        ([], [], {}),
+        ([0, 0, 1], [0, 0, 0], {0: {0: [0, 1]}, 1: {0: [2]}}),
+        ([0, 1, 1, 0], [1, 0, 1, 1], {0: {1: [0, 3]}, 1: {0: [1], 1: [2]}}),
+        ([0, 1, 1, 0, 1], [0, 2, 1, 2, 0], {0: {0: [0], 2: [3]}, 1: {2: [1], 1: [2], 0: [4]}}),
+    ],
+)
+def test_row_grouper_group_rows(first_codes: list[int], second_codes: list[int], expected: dict, use_numpy) -> None:
+    """Test that rows are grouped in order of first appearance, with and without NumPy.
+
+    :param first_codes: The first code of each row.
+    :param second_codes: The second code of each row.
+    :param expected: The expected groups.
+    :param use_numpy: Whether to use NumPy.
+    :return: None. Asserts the groups, including the order of the dictionaries' keys.
+    """
+    groups = RowGrouper.group_rows(first_codes, second_codes, use_numpy=use_numpy)
+    assert groups == expected
+    assert [list(second) for second in groups.values()] == [list(second) for second in expected.values()]
+
+
+def test_row_grouper_numpy_required_but_missing(monkeypatch) -> None:
+    """Test that requesting NumPy when it cannot be imported raises ImportError, while auto-detection falls back.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: None. Asserts the ImportError and the fallback result.
+    """
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.setattr(RowGrouper, "numpy_available", staticmethod(lambda: False))
+    with pytest.raises(ImportError, match="numpy"):
+        RowGrouper.group_rows([0], [0], use_numpy=True)
+    assert RowGrouper.group_rows([0, 0], [1, 1]) == {0: {1: [0, 1]}}
@@ -0,0 +1,157 @@
+import copy
+import pickle
+
+import pytest
+from langstring.utils.sorted_text_set import SortedTextSet
+
+
+@pytest.mark.parametrize(
+    "texts, expected",
+    [
+        ([], []),
+        (["b", "a", "c"], ["a", "b", "c"]),
+        ({"World", "Hello"}, ["Hello", "World"]),
+        (["a", "a", "A"], ["A", "a"]),
+        (["😊", "Привет", "hello", ""], ["", "hello", "Привет", "😊"]),
+    ],
+)
+def test_sorted_text_set_init_iterates_sorted(texts, expected: list[str]) -> None:
+    """Test that a SortedTextSet iterates over its initial elements in sorted order.
+
+    :param texts: The initial elements of the set.
+    :param expected: The expected iteration order.
+    :return: None. Asserts that iteration follows the sorted order and that the set content is preserved.
+    """
+    sts = SortedTextSet(texts)
+    assert list(sts) == expected, f"Expected {expected}, got {list(sts)}"
+    assert sts == set(texts), "SortedTextSet should be equal to a plain set with the same elements"
+    assert isinstance(sts, set), "SortedTextSet should be a set"
+
+
+@pytest.mark.parametrize(
+    "initial, operations, expected",
+    [
+        (["b"], [("add", "a"), ("add", "c")], ["a", "b", "c"]),
+        (["a", "b"], [("add", "a")], ["a", "b"]),
+        (["a", "b", "c"], [("discard", "b")], ["a", "c"]),
+        (["a", "b"], [("discard", "z")], ["a", "b"]),
+        (["a", "b", "c"], [("remove", "a"), ("add", "d")], ["b", "c", "d"]),
+        (["c", "a"], [("update", ["b", "d", "a"])], ["a", "b", "c", "d"]),
+        (["a", "b", "c"], [("difference_update", {"a", "z"})], ["b", "c"]),
+        (["a", "b", "c"], [("intersection_update", ["b", "c", "z"])], ["b", "c"]),
+        (["a", "b"], [("symmetric_difference_update", {"b", "c"})], ["a", "c"]),
+        (["a", "b"], [("clear", None)], []),
+    ],
+)
+def test_sorted_text_set_mutations_keep_order(initial: list[str], operations: list, expected: list[str]) -> None:
+    """Test that mutating methods keep the elements of a SortedTextSet in sorted order.
+
+    :param initial: The initial elements of the set.
+    :param operations: A list of (method name, argument) pairs applied in sequence.
+    :param expected: The expected iteration order after all operations.
+    :return: None. Asserts that the order and the content match the expected elements.
+    """
+    sts = SortedTextSet(initial)
+    for method, argument in operations:
+        if argument is None:
+            getattr(sts, method)()
+        else:
+            getattr(sts, method)(argument)
+    assert list(sts) == expected, f"Expected {expected}, got {list(sts)}"
+    assert sts == set(expected), "The set content should match the expected elements"
+
+
+def test_sorted_text_set_in_place_operators() -> None:
+    """Test the in-place set operators of SortedTextSet.
+
+    :return: None. Asserts that the in-place operators keep the type and the sorted order.
+    """
+    sts = SortedTextSet(["b"])
+    sts |= {"d", "a"}
+    assert list(sts) == ["a", "b", "d"]
+    sts &= {"a", "b", "c"}
+    assert list(sts) == ["a", "b"]
+    sts -= {"a"}
+    assert list(sts) == ["b"]
+    sts ^= {"b", "c"}
+    assert list(sts) == ["c"]
+    assert isinstance(sts, SortedTextSet), "In-place operators should keep the SortedTextSet type"
+
+
+def test_sorted_text_set_in_place_operator_invalid_operand() -> None:
+    """Test that in-place operators reject non-set operands as plain sets do.
+
+    :return: None. Asserts that a TypeError is raised for a list operand.
+    """
+    sts = SortedTextSet(["a"])
+    with pytest.raises(TypeError):
+        sts |= ["b"]
+
+
+def test_sorted_text_set_remove_missing_raises_key_error() -> None:
+    """Test that removing a missing element raises KeyError.
+
+    :return: None. Asserts that a KeyError is raised and the set is unchanged.
+    """
+    sts = SortedTextSet(["a"])
+    with pytest.raises(KeyError):
+        sts.remove("b")
+    assert list(sts) == ["a"]
+
+
+def test_sorted_text_set_pop() -> None:
+    """Test that pop removes and returns the greatest element, and raises KeyError when empty.
+
+    :return: None. Asserts the popped values and the final empty state.
+    """
+    sts = SortedTextSet(["a", "c", "b"])
+    assert sts.pop() == "c"
+    assert list(sts) == ["a", "b"]
+    sts.pop()
+    sts.pop()
+    with pytest.raises(KeyError):
+        sts.pop()
+
+
+@pytest.mark.parametrize(
+    "texts, expected",
+    [([], "set()"), (["b", "a"], "{'a', 'b'}"), (["Hello"], "{'Hello'}")],
+)
+def test_sorted_text_set_repr_and_reversed(texts: list[str], expected: str) -> None:
+    """Test the representation and reverse iteration of SortedTextSet.
+
+    :param texts: The initial elements of the set.
+    :param expected: The expected representation.
+    :return: None. Asserts the representation and reverse iteration order.
+    """
+    sts = SortedTextSet(texts)
+    assert repr(sts) == expected
+    assert list(reversed(sts)) == sorted(texts, reverse=True)
+
+
+def test_sorted_text_set_binary_operators_return_plain_sets() -> None:
+    """Test that binary set operators return plain sets with the correct elements.
+
+    :return: None. Asserts the result types and values.
+    """
+    sts = SortedTextSet(["a", "b"])
+    result = sts | {"c"}
+    assert result == {"a", "b", "c"}
+    assert type(result) is set
+
+
+@pytest.mark.parametrize(
+    "copier", [copy.copy, copy.deepcopy, SortedTextSet.copy, lambda s: pickle.loads(pickle.dumps(s))]
+)
+def test_sorted_text_set_copies_are_independent(copier) -> None:
+    """Test that copies of a SortedTextSet keep the type and order and do not share state.
+
+    :param copier: The function used to copy the set.
+    :return: None. Asserts the copy type, order, and independence from the original.
+    """
+    sts = SortedTextSet(["b", "a"])
+    copied = copier(sts)
+    assert isinstance(copied, SortedTextSet)
+    assert list(copied) == ["a", "b"]
+    copied.add("c")
+    assert list(sts) == ["a", "b"], "Modifying the copy should not affect the original"
@@ -0,0 +1,142 @@
+import itertools
+import warnings
+from unittest.mock import patch
+
+import pytest
+from langstring import Controller
+from langstring import GlobalFlag
+from langstring import LangStringFlag
+from langstring import MultiLangStringFlag
+from langstring import SetLangStringFlag
+from langstring.utils.validators import FlagValidator
+
+TEXTS = [None, "", "   ", "Hello", "  Hello  ", "\tHello\n", "😊"]
+LANGS = [None, "", "   ", "en", "EN", "  en-GB  ", "xx-invalid-tag", "İ", "123"]
+
+
+def _expected(validator, flag_type, value):
+    """Run a raising validator, converting a rejected value into None.
+
+    :param validator: The raising validator.
+    :param flag_type: The type of flags.
+    :param value: The validated value.
+    :return: The transformed value, or None if it is rejected.
+    """
+    try:
+        return validator(flag_type, value)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize("flag_type", [GlobalFlag, LangStringFlag, SetLangStringFlag, MultiLangStringFlag])
+@pytest.mark.parametrize("strip, defined", list(itertools.product([False, True], repeat=2)))
+def test_check_text_matches_validate_flags_text(flag_type, strip, defined) -> None:
+    """Test that check_text, is_valid_text, and mask_valid_texts agree with validate_flags_text.
+
+    :param flag_type: The type of flags.
+    :param strip: Whether STRIP_TEXT is enabled.
+    :param defined: Whether DEFINED_TEXT is enabled.
+    :return: None. Asserts the results for each text and for the whole batch.
+    """
+    Controller.set_flag(flag_type.STRIP_TEXT, strip)
+    Controller.set_flag(flag_type.DEFINED_TEXT, defined)
+    expected = [_expected(FlagValidator.validate_flags_text, flag_type, text) for text in TEXTS]
+    assert [FlagValidator.check_text(flag_type, text) for text in TEXTS] == expected
+    assert [FlagValidator.is_valid_text(flag_type, text) for text in TEXTS] == [value is not None for value in expected]
+    assert FlagValidator.mask_valid_texts(flag_type, TEXTS) == [value is not None for value in expected]
+    assert FlagValidator.invalid_text_indices(flag_type, TEXTS) == [i for i, v in enumerate(expected) if v is None]
+
+
+@pytest.mark.parametrize("flag_type", [GlobalFlag, LangStringFlag, MultiLangStringFlag])
+@pytest.mark.parametrize("strip, lowercase, defined, valid", list(itertools.product([False, True], repeat=4)))
+def test_check_lang_matches_validate_flags_lang(flag_type, strip, lowercase, defined, valid) -> None:
+    """Test that check_lang, is_valid_lang, and mask_valid_langs agree with validate_flags_lang.
+
+    :param flag_type: The type of flags.
+    :param strip: Whether STRIP_LANG is enabled.
+    :param lowercase: Whether LOWERCASE_LANG is enabled.
+    :param defined: Whether DEFINED_LANG is enabled.
+    :param valid: Whether VALID_LANG is enabled.
+    :return: None. Asserts the results for each language and for the whole batch.
+    """
+    Controller.set_flag(flag_type.STRIP_LANG, strip)
+    Controller.set_flag(flag_type.LOWERCASE_LANG, lowercase)
+    Controller.set_flag(flag_type.DEFINED_LANG, defined)
+    Controller.set_flag(flag_type.VALID_LANG, valid)
+    expected = [_expected(FlagValidator.validate_flags_lang, flag_type, lang) for lang in LANGS]
+    assert [FlagValidator.check_lang(flag_type, lang) for lang in LANGS] == expected
+    assert [FlagValidator.is_valid_lang(flag_type, lang) for lang in LANGS] == [value is not None for value in expected]
+    assert FlagValidator.mask_valid_langs(flag_type, LANGS) == [value is not None for value in expected]
+    assert FlagValidator.invalid_lang_indices(flag_type, LANGS) == [i for i, v in enumerate(expected) if v is None]
+
+
+@pytest.mark.parametrize("value", [1, 1.5, b"en", ["en"], object()])
+def test_check_rejects_non_strings_without_raising(value) -> None:
+    """Test that values that are neither strings nor None are rejected instead of raising a TypeError.
+
+    :param value: The value of an invalid type.
+    :return: None. Asserts that the value is rejected by all checks.
+    """
+    assert FlagValidator.check_text(GlobalFlag, value) is None
+    assert FlagValidator.check_lang(GlobalFlag, value) is None
+    assert FlagValidator.is_valid_text(GlobalFlag, value) is False
+    assert FlagValidator.is_valid_lang(GlobalFlag, value) is False
+    assert FlagValidator.mask_valid_texts(GlobalFlag, ["Hello", value]) == [True, False]
+    assert FlagValidator.mask_valid_langs(GlobalFlag, ["en", value]) == [True, False]
+
+
+def test_check_invalid_flag_type() -> None:
+    """Test that a flag type that is not a type raises a TypeError.
+
+    :return: None. Asserts that a TypeError is raised by each check.
+    """
+    for check in (FlagValidator.check_text, FlagValidator.check_lang, FlagValidator.mask_valid_langs):
+        with pytest.raises(TypeError):
+            check("GlobalFlag", [])
+
+
+def test_mask_valid_langs_checks_each_distinct_tag_once() -> None:
+    """Test that the batch check of languages validates each distinct tag only once.
+
+    :return: None. Asserts the mask and the number of tag validations.
+    """
+    Controller.set_flag(GlobalFlag.VALID_LANG, True)
+    langs = ["en", "xx-invalid-tag", "en", "fr", "xx-invalid-tag"] * 100
+    with patch.object(FlagValidator, "_tag_is_valid", wraps=FlagValidator._tag_is_valid) as tag_is_valid:
+        mask = FlagValidator.mask_valid_langs(GlobalFlag, langs)
+    assert mask == [True, False, True, True, False] * 100
+    assert tag_is_valid.call_count == 3
+
+
+def test_mask_valid_langs_accepts_generators() -> None:
+    """Test that batches can be given as any iterable.
+
+    :return: None. Asserts the masks and indices computed from generators.
+    """
+    Controller.set_flag(GlobalFlag.DEFINED_TEXT, True)
+    assert FlagValidator.mask_valid_langs(GlobalFlag, (lang for lang in ["en", "fr"])) == [True, True]
+    assert FlagValidator.invalid_text_indices(GlobalFlag, (text for text in ["", "Hello", " "])) == [0, 2]
+
+
+def test_check_lang_missing_langcodes(monkeypatch) -> None:
+    """Test that a missing 'langcodes' library is handled like in validate_flags_lang.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: None. Asserts the warning and acceptance without enforcement, and the ImportError with enforcement.
+    """
+    original_import = __import__
+
+    def mocked_import(name, *args, **kwargs):
+        if name == "langcodes":
+            raise ImportError("No module named 'langcodes'")
+        return original_import(name, *args, **kwargs)
+
+    Controller.set_flag(GlobalFlag.VALID_LANG, True)
+    monkeypatch.setattr("builtins.__import__", mocked_import)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert FlagValidator.is_valid_lang(GlobalFlag, "xx-invalid-tag") is True
+    assert any("Language validation skipped" in str(warning.message) for warning in caught)
+    Controller.set_flag(GlobalFlag.ENFORCE_EXTRA_DEPEND, True)
+    with pytest.raises(ImportError, match="VALID_LANG functionality requires the 'langcodes' library"):
+        FlagValidator.is_valid_lang(GlobalFlag, "en")
@@ -0,0 +1,34 @@
+import re
+from typing import Any
+
+import pytest
+from langstring.utils.validators import TypeValidator
+
+
+@pytest.mark.parametrize("arg", [len, str.strip, lambda text: text, print, str, TypeValidator.validate_type_callable])
+def test_validate_type_callable_valid_cases(arg: Any) -> None:
+    """Test TypeValidator.validate_type_callable with callable arguments.
+
+    :param arg: The argument to check.
+    :return: None. Asserts that no TypeError is raised.
+    """
+    TypeValidator.validate_type_callable(arg)
+
+
+@pytest.mark.parametrize(
+    "arg, error_message",
+    [
+        ("strip", re.escape("Invalid argument with value 'strip'. Expected a callable, but got 'str'.")),
+        (None, re.escape("Invalid argument with value 'None'. Expected a callable, but got 'NoneType'.")),
+        (1, re.escape("Invalid argument with value '1'. Expected a callable, but got 'int'.")),
+    ],
+)
+def test_validate_type_callable_invalid_cases(arg: Any, error_message: str) -> None:
+    """Test TypeValidator.validate_type_callable with arguments that are not callable.
+
+    :param arg: The argument to check.
+    :param error_message: The expected error message.
+    :return: None. Asserts that a TypeError with the expected message is raised.
+    """
+    with pytest.raises(TypeError, match=error_message):
+        TypeValidator.validate_type_callable(arg)